@@ -0,0 +1,350 @@
+# ---------------------------------------------------------------------------------------
+# Quad_AnimTools
+# Animation helpers for the Quadruped Auto-Rig Tool
+#
+# ---------------------------------------------------------------------------------------
+# Tools that run on an animated rig instead of while building it, for example baking
+# secondary motion onto the FK controls so nothing has to simulate at playback.
+#
+# Needs NumPy (ships with mayapy 2022+, otherwise pip install it into Maya's Python).
+#
+# Import it the same way as the den_* modules:
+#     import Quad_AnimTools as quadAT
+#     importlib.reload(quadAT)
+# ---------------------------------------------------------------------------------------
+# (c) 2025 by Arrow Lyu. All rights reserved. For portfolio and educational use only.
+# ---------------------------------------------------------------------------------------
+
+
+import time
+
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+import maya.api.OpenMayaAnim as oma
+
+import Quad_BuildTools as quadBT
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def quad_requireNumpy():
+    '''raise a readable error when NumPy is missing from Maya's Python'''
+    if np is None:
+        raise RuntimeError( 'Quad_AnimTools needs NumPy, install it with: mayapy -m pip install numpy' )
+
+
+# ---------------------------------------------------------------------------------------
+# batched sampling
+# reads plugs at many frames through an MDGContext, so the scene time never changes and the
+# viewport never redraws while sampling
+
+def quad_sampleMatrices( Nodes=[], Frames=[], Attrs=('worldMatrix',), flat=False, dtype=float ):
+    '''
+    Evaluate the matrix attributes of Nodes at every frame in one pass.
+    Returns { attr: array of frames x nodes x 4 x 4 } in Maya's row-vector layout,
+    frames x nodes x 16 with flat=True.
+    '''
+    quad_requireNumpy()
+    selection = om.MSelectionList()
+    for node in Nodes:
+        selection.add( node )
+
+    Plugs = {}
+    for attr in Attrs:
+        Plugs[attr] = []
+        for index in range( selection.length() ):
+            plug = om.MFnDependencyNode( selection.getDependNode( index ) ).findPlug( attr, False )
+            if plug.isArray:
+                plug = plug.elementByLogicalIndex( 0 )
+            Plugs[attr].append( plug )
+
+    Samples = { attr: np.empty( ( len(Frames), len(Nodes), 16 ), dtype=dtype ) for attr in Attrs }
+    for f, frame in enumerate( Frames ):
+        context = om.MDGContext( om.MTime( frame, om.MTime.uiUnit() ) )
+        previous = context.makeCurrent()
+        try:
+            for attr in Attrs:
+                for n, plug in enumerate( Plugs[attr] ):
+                    Samples[attr][f, n] = list( om.MFnMatrixData( plug.asMObject() ).matrix() )
+        finally:
+            previous.makeCurrent()
+
+    if flat:
+        return Samples
+    return { attr: Samples[attr].reshape( len(Frames), len(Nodes), 4, 4 ) for attr in Attrs }
+
+
+def quad_bindJoints( registry=None ):
+    '''the registered '*_Jnt' bind joints of the rig in the scene, module by module'''
+    if registry is None:
+        registry = quadBT.quad_loadRegistry()
+    Jnts = []
+    for key in sorted( registry ):
+        Jnts += [ jnt for jnt in registry[key].get( 'BindJnts', [] ) if jnt.endswith( '_Jnt' ) and jnt not in Jnts ]
+    return Jnts
+
+
+def quad_iterJointSamples( Jnts=None, startFrame=1, endFrame=120, step=1.0, chunkFrames=500, dtype='float32' ):
+    '''
+    Sample the world matrices of Jnts (all bind joints by default) over the frame range in chunks of
+    chunkFrames, so long shots never hold more than one chunk. Yields [ Frames, Samples ] with
+    Samples as chunk frames x joints x 16. The current time is never changed.
+    '''
+    quad_requireNumpy()
+    if Jnts is None:
+        Jnts = quad_bindJoints()
+    Frames = list( np.arange( startFrame, endFrame + step*0.5, step ) )
+    for first in range( 0, len(Frames), chunkFrames ):
+        Chunk = Frames[first:first+chunkFrames]
+        yield [ Chunk, quad_sampleMatrices( Nodes=Jnts, Frames=Chunk, flat=True, dtype=dtype )['worldMatrix'] ]
+
+
+def quad_sampleJoints( Jnts=None, startFrame=1, endFrame=120, step=1.0, chunkFrames=500, dtype='float32' ):
+    '''
+    Sample the world matrices of Jnts (all bind joints by default) over the frame range.
+    Returns a frames x joints x 16 array; use quad_iterJointSamples to keep memory bounded.
+    '''
+    start = time.time()
+    Chunks = [ Samples for Frames, Samples in quad_iterJointSamples( Jnts=Jnts, startFrame=startFrame, endFrame=endFrame, step=step, chunkFrames=chunkFrames, dtype=dtype ) ]
+    Samples = np.concatenate( Chunks, axis=0 )
+    print( '========================= sampled %d joints over %d frames in %.2f sec' % ( Samples.shape[1], Samples.shape[0], time.time()-start ) )
+    return Samples
+
+
+# ---------------------------------------------------------------------------------------
+# spring chain solver
+# verlet points chase their animated position and keep the animated segment lengths, which
+# gives lag and overshoot without a hair system. All chains are integrated as one array.
+
+def quad_solveSpringChains( Targets=None, Parents=[], stiffness=0.2, damping=0.1, gravity=(0,0,0), substeps=2, fps=24.0 ):
+    '''
+    Targets are the animated positions (frames x points x 3), Parents the index of each point's
+    parent (-1 pins the point to its target). Parents must come before their children.
+    stiffness and damping are 0-1, either one value or one per point.
+    Returns the simulated positions, frames x points x 3.
+    '''
+    quad_requireNumpy()
+    Targets = np.asarray( Targets, dtype=float )
+    Parents = np.asarray( Parents, dtype=int )
+    pinned = Parents < 0
+
+    # constraints are solved root to tip one depth level at a time, every chain at once
+    Depth = np.zeros( len(Parents), dtype=int )
+    for point, parent in enumerate( Parents ):
+        if parent >= 0:
+            Depth[point] = Depth[parent] + 1
+    Levels = [ np.nonzero( Depth == depth )[0] for depth in range( 1, Depth.max()+1 ) ]
+
+    stiffness = np.asarray( stiffness, dtype=float )
+    stiffness = stiffness[:, None] if stiffness.ndim else stiffness
+    damping = np.asarray( damping, dtype=float )
+    damping = damping[:, None] if damping.ndim else damping
+    step = 1.0 / ( fps * substeps )
+    gravityStep = np.asarray( gravity, dtype=float ) * step * step
+
+    Pos = Targets[0].copy()
+    Prev = Pos.copy()
+    Result = np.empty_like( Targets )
+    Result[0] = Pos
+    for f in range( 1, len(Targets) ):
+        for sub in range( substeps ):
+            Goal = Targets[f-1] + ( Targets[f] - Targets[f-1] ) * ( ( sub + 1.0 ) / substeps )
+            Velocity = ( Pos - Prev ) * ( 1.0 - damping )
+            Prev = Pos
+            Pos = Pos + Velocity + ( Goal - Pos ) * stiffness + gravityStep
+            Pos[pinned] = Goal[pinned]
+            for Level in Levels:
+                Parent = Pos[Parents[Level]]
+                Offset = Pos[Level] - Parent
+                Length = np.linalg.norm( Offset, axis=-1, keepdims=True )
+                RestLength = np.linalg.norm( Goal[Level] - Goal[Parents[Level]], axis=-1, keepdims=True )
+                Pos[Level] = Parent + Offset * ( RestLength / np.maximum( Length, 1e-8 ) )
+        Result[f] = Pos
+    return Result
+
+
+def quad_rotationBetween( A=None, B=None ):
+    '''row-vector rotation matrices (... x 3 x 3) that turn the directions A onto B'''
+    A = A / np.maximum( np.linalg.norm( A, axis=-1, keepdims=True ), 1e-8 )
+    B = B / np.maximum( np.linalg.norm( B, axis=-1, keepdims=True ), 1e-8 )
+    Axis = np.cross( A, B )
+    sin = np.linalg.norm( Axis, axis=-1 )[..., None, None]
+    cos = np.sum( A * B, axis=-1 )[..., None, None]
+    Axis = Axis / np.maximum( sin[..., 0], 1e-8 )
+    Skew = np.zeros( A.shape[:-1] + (3, 3) )
+    Skew[..., 0, 1], Skew[..., 0, 2] = -Axis[..., 2], Axis[..., 1]
+    Skew[..., 1, 0], Skew[..., 1, 2] = Axis[..., 2], -Axis[..., 0]
+    Skew[..., 2, 0], Skew[..., 2, 1] = -Axis[..., 1], Axis[..., 0]
+    # Rodrigues gives the column-vector matrix, Maya multiplies row vectors so transpose it
+    Rotation = np.eye( 3 ) + sin * Skew + ( 1.0 - cos ) * ( Skew @ Skew )
+    return np.swapaxes( Rotation, -1, -2 )
+
+
+def quad_matrixToEuler( Rotation=None, rotateOrder=0 ):
+    '''XYZ euler angles in radians (... x 3) of row-vector rotation matrices, reordered for other rotate orders'''
+    Rotation = Rotation / np.linalg.norm( Rotation, axis=-1, keepdims=True )
+    Euler = np.stack( [ np.arctan2( Rotation[..., 1, 2], Rotation[..., 2, 2] ),
+                        np.arcsin( np.clip( -Rotation[..., 0, 2], -1.0, 1.0 ) ),
+                        np.arctan2( Rotation[..., 0, 1], Rotation[..., 0, 0] ) ], axis=-1 )
+    if rotateOrder:
+        Flat = Euler.reshape( -1, 3 )
+        for index, angles in enumerate( Flat ):
+            euler = om.MEulerRotation( angles[0], angles[1], angles[2] ).reorder( rotateOrder )
+            Flat[index] = ( euler.x, euler.y, euler.z )
+        Euler = Flat.reshape( Euler.shape )
+    return Euler
+
+
+def quad_writeTransformCurves( Ctrls=[], Frames=[], Rotates=None, Translates=None ):
+    '''
+    Replace the rotate and/or translate animation of Ctrls with one key per frame. Rotates are
+    frames x ctrls x 3 in radians, Translates frames x ctrls x 3 in centimeters, None skips them.
+    The curves are created with one MDGModifier and filled with one addKeys call each.
+    '''
+    Channels = []
+    if Rotates is not None:
+        Channels.append( ( 'rotate', Rotates, oma.MFnAnimCurve.kAnimCurveTA ) )
+    if Translates is not None:
+        Channels.append( ( 'translate', Translates, oma.MFnAnimCurve.kAnimCurveTL ) )
+    cmds.cutKey( Ctrls, attribute=[ channel+axis for channel, Values, curveType in Channels for axis in 'XYZ' ], clear=True )
+    Times = om.MTimeArray( [ om.MTime( frame, om.MTime.uiUnit() ) for frame in Frames ] )
+
+    modifier = om.MDGModifier()
+    Curves = []
+    for c, ctrl in enumerate( Ctrls ):
+        selection = om.MSelectionList()
+        selection.add( ctrl )
+        node = selection.getDependNode( 0 )
+        for channel, Values, curveType in Channels:
+            for axis, attr in enumerate( [ channel+'X', channel+'Y', channel+'Z' ] ):
+                plug = om.MFnDependencyNode( node ).findPlug( attr, False )
+                if plug.isLocked:
+                    continue
+                curveFn = oma.MFnAnimCurve()
+                curveFn.create( plug, curveType, modifier )
+                Curves.append( ( curveFn, Values, c, axis ) )
+    modifier.doIt()
+
+    for curveFn, Values, c, axis in Curves:
+        curveFn.addKeys( Times, om.MDoubleArray( Values[:, c, axis].tolist() ),
+                         oma.MFnAnimCurve.kTangentAuto, oma.MFnAnimCurve.kTangentAuto )
+    return len( Curves )
+
+
+def quad_springBake( Chains=[], startFrame=1, endFrame=120, stiffness=0.2, damping=0.1, gravity=(0,0,0), aimAxis=(1,0,0), substeps=2 ):
+    '''
+    Bake spring secondary motion onto FK chains.
+    Chains is a list of FK control lists, each ordered root to tip; the root control stays where
+    its animation puts it and every control turns to follow the lagging point after it. The
+    controls are sampled once over the frame range (including the SpaceIN motion above them), all
+    chains are integrated together and the result replaces the rotate animation of the controls.
+    Returns [ Ctrls, Eulers ] with Eulers in radians.
+    '''
+    quad_requireNumpy()
+    start = time.time()
+    Frames = list( range( int(startFrame), int(endFrame)+1 ) )
+    Ctrls = [ ctrl for Chain in Chains for ctrl in Chain ]
+    Samples = quad_sampleMatrices( Nodes=Ctrls, Frames=Frames, Attrs=( 'worldMatrix', 'matrix' ) )
+    World = Samples['worldMatrix']
+    Local = Samples['matrix']
+
+    # one point per control plus a virtual tip one segment past the last control along aimAxis
+    Targets = []
+    Parents = []
+    Segments = []
+    c = 0
+    for Chain in Chains:
+        count = len( Chain )
+        Positions = World[:, c:c+count, 3, :3]
+        Aim = np.einsum( 'i,fij->fj', np.asarray( aimAxis, dtype=float ), World[:, c+count-1, :3, :3] )
+        Aim = Aim / np.maximum( np.linalg.norm( Aim, axis=-1, keepdims=True ), 1e-8 )
+        tipLength = np.linalg.norm( Positions[:, -1] - Positions[:, -2], axis=-1, keepdims=True ) if count > 1 else 1.0
+        first = len( Parents )
+        Targets.append( np.concatenate( [ Positions, ( Positions[:, -1] + Aim * tipLength )[:, None] ], axis=1 ) )
+        Parents += [ -1 ] + [ first + index for index in range( count ) ]
+        Segments.append( ( c, first, count ) )
+        c += count
+    Targets = np.concatenate( Targets, axis=1 )
+    Sim = quad_solveSpringChains( Targets=Targets, Parents=Parents, stiffness=stiffness, damping=damping,
+                                  gravity=gravity, substeps=substeps, fps=om.MTime( 1, om.MTime.kSeconds ).asUnits( om.MTime.uiUnit() ) )
+
+    # turn every control from its animated aim onto the simulated aim, root to tip, and rebuild
+    # the local rotation under the already rotated parent
+    Eulers = np.empty( ( len(Frames), len(Ctrls), 3 ) )
+    for c, first, count in Segments:
+        newParentWorld = None
+        for j in range( count ):
+            ctrl = c + j
+            point = first + j
+            Delta = quad_rotationBetween( Targets[:, point+1] - Targets[:, point], Sim[:, point+1] - Sim[:, point] )
+            ParentWorld = np.linalg.inv( Local[:, ctrl] ) @ World[:, ctrl]
+            if newParentWorld is not None:
+                ParentWorld = ParentWorld @ np.linalg.inv( World[:, ctrl-1] ) @ newParentWorld
+            NewLocal = Local[:, ctrl].copy()
+            NewLocal[:, :3, :3] = World[:, ctrl, :3, :3] @ Delta @ np.linalg.inv( ParentWorld[:, :3, :3] )
+            newParentWorld = NewLocal @ ParentWorld
+            Eulers[:, ctrl] = quad_matrixToEuler( NewLocal[:, :3, :3], rotateOrder=cmds.getAttr( Ctrls[ctrl]+'.rotateOrder' ) )
+    Eulers = np.unwrap( Eulers, axis=0 )
+
+    curveCount = quad_writeTransformCurves( Ctrls=Ctrls, Frames=Frames, Rotates=Eulers )
+    print( '========================= spring baked %d chains, %d controls, %d frames into %d curves in %.2f sec'
+           % ( len(Chains), len(Ctrls), len(Frames), curveCount, time.time()-start ) )
+    return [ Ctrls, Eulers ]
+
+
+
+# ---------------------------------------------------------------------------------------
+# match and bake
+# puts controls of one mode (e.g. FK) onto the pose of the other (e.g. IK) over a frame range,
+# with one batched sampling pass and one curve write instead of matching frame by frame
+
+def quad_matchBake( Targets=[], Sources=[], Followers=None, startFrame=1, endFrame=120, translate=False, switch=None ):
+    '''
+    Key Targets so they follow Sources over the frame range, without changing the current time.
+    Followers are the nodes each target moves in its own chain (e.g. the FK joint under an FK
+    control), their offset to the target is kept; None means each target sits on its source.
+    Targets of a chain must be ordered root to tip. translate also keys translation.
+    switch is an optional ( plug, value ) keyed at both ends of the range, e.g. ( 'L_Leg_Ctrl.IKFK', 0 ).
+    Returns [ Rotates, Translates ], frames x targets x 3.
+    '''
+    quad_requireNumpy()
+    start = time.time()
+    Frames = list( range( int(startFrame), int(endFrame)+1 ) )
+    count = len( Targets )
+    Samples = quad_sampleMatrices( Nodes=list( Targets )+list( Sources ), Frames=Frames, Attrs=( 'worldMatrix', 'parentMatrix' ) )
+    TargetWorld = Samples['worldMatrix'][:, :count]
+    ParentWorld = Samples['parentMatrix'][:, :count]
+    SourceWorld = Samples['worldMatrix'][:, count:]
+
+    Offsets = np.broadcast_to( np.eye( 4 ), ( count, 4, 4 ) )
+    if Followers:
+        Rest = quad_sampleMatrices( Nodes=list( Targets )+list( Followers ), Frames=Frames[:1] )['worldMatrix'][0]
+        Offsets = Rest[:count] @ np.linalg.inv( Rest[count:] )
+    NewWorld = Offsets[None] @ SourceWorld
+
+    # a target under an earlier target moves with its matched pose, not its current one
+    LongNames = [ cmds.ls( target, long=True )[0] for target in Targets ]
+    Rotates = np.empty( ( len(Frames), count, 3 ) )
+    Translates = np.empty( ( len(Frames), count, 3 ) )
+    for t in range( count ):
+        NewParent = ParentWorld[:, t]
+        for a in reversed( range( t ) ):
+            if LongNames[t].startswith( LongNames[a]+'|' ):
+                NewParent = NewParent @ np.linalg.inv( TargetWorld[:, a] ) @ NewWorld[:, a]
+                break
+        Local = NewWorld[:, t] @ np.linalg.inv( NewParent )
+        Rotates[:, t] = quad_matrixToEuler( Local[:, :3, :3], rotateOrder=cmds.getAttr( Targets[t]+'.rotateOrder' ) )
+        Translates[:, t] = Local[:, 3, :3]
+    Rotates = np.unwrap( Rotates, axis=0 )
+
+    curveCount = quad_writeTransformCurves( Ctrls=Targets, Frames=Frames, Rotates=Rotates, Translates=Translates if translate else None )
+    if switch:
+        for frame in [ Frames[0], Frames[-1] ]:
+            cmds.setKeyframe( switch[0], time=frame, value=switch[1] )
+
+    print( '========================= matched %d controls over %d frames into %d curves in %.2f sec'
+           % ( count, len(Frames), curveCount, time.time()-start ) )
+    return [ Rotates, Translates ]
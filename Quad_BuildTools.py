@@ -0,0 +1,1449 @@
+# ---------------------------------------------------------------------------------------
+# Quad_BuildTools
+# Build-time helpers for the Quadruped Auto-Rig Tool
+#
+# ---------------------------------------------------------------------------------------
+# These helpers sit next to the den_* rig modules and are used by
+# Quadruped_AutoRig_Python_Tool.py while the rig is being built.
+#
+# Import it the same way as the den_* modules:
+#     import Quad_BuildTools as quadBT
+#     importlib.reload(quadBT)
+# ---------------------------------------------------------------------------------------
+# (c) 2025 by Arrow Lyu. All rights reserved. For portfolio and educational use only.
+# ---------------------------------------------------------------------------------------
+
+
+import fnmatch
+import json
+import math
+import time
+
+import maya.cmds as cmds
+import maya.mel as mel
+import maya.api.OpenMaya as om
+import maya.api.OpenMayaAnim as oma
+
+
+# ---------------------------------------------------------------------------------------
+# simulated naming scheme of the den_* builders
+# these tables only list the names this script relies on, add to them if you start
+# referencing other joints of a module
+
+# joints made by den_makeTrexHindLegRig
+TrexHindLegJoints = [ 'Hip', 'Knee', 'Hock', 'Ankle', 'Ball', 'Toe' ]
+# joints made by den_makeDogFrontLegRig
+DogFrontLegJoints = [ 'Shld', 'ShldRest', 'Elbow', 'Fknee', 'Fball', 'Ftoe' ]
+# number of twist joints den_makeTwists adds to each joint in its Joints list
+TwistJointCount = 3
+
+
+def quad_simTorsoSpaceOUTs( spineCount=3, neckCount=6 ):
+    '''return the labels of den_makeAnyTorsoRig SpaceOUTs, in the order the builder returns them'''
+    labels = [ 'Pelvis' ]
+    labels += [ 'Spine%02d' % (i+1) for i in range(spineCount) ]
+    labels += [ 'Chest' ]
+    labels += [ 'Neck%02d' % (i+1) for i in range(neckCount) ]
+    labels += [ 'Head', 'Jaw' ]
+    return labels
+
+
+def quad_simTorsoJoints( spineCount=3, neckCount=6 ):
+    '''return the joint names den_makeAnyTorsoRig makes for the given counts'''
+    Jnts = []
+    for label in quad_simTorsoSpaceOUTs( spineCount=spineCount, neckCount=neckCount ):
+        Jnts += [ label+'_Jx', label+'_Jnt' ]
+    return Jnts
+
+
+def quad_simChainJoints( prefix='', name='Tail', jointCount=8 ):
+    '''return the bind joint names of a den_makeTailRig or den_makeFKappendageRig chain'''
+    return [ prefix+name+'%02d_Jnt' % (i+1) for i in range(jointCount) ]
+
+
+def quad_simLegJoints( side='L_', Joints=TrexHindLegJoints, twistJoints=[] ):
+    '''return the rig and bind joint names of a leg rig, plus the twist joints den_makeTwists adds'''
+    Jnts = []
+    for joint in Joints:
+        Jnts += [ side+joint+'_Jx', side+joint+'_Jnt' ]
+    for joint in twistJoints:
+        Jnts += [ side+joint+'Twist%02d_Jnt' % (i+1) for i in range(TwistJointCount) ]
+    return Jnts
+
+
+def quad_simToeIKZeros( side='L_', name='Toe', toeList=['A','B','C','D'], numJnts=[4,4,4,4] ):
+    '''return the IK control zero groups den_makeToeRig makes when doIK=True'''
+    Zeros = []
+    for toe, count in zip( toeList, numJnts ):
+        Zeros += [ side+name+toe+'%02dIK_CtrlZero' % (i+1) for i in range(count) ]
+    return Zeros
+
+
+# ---------------------------------------------------------------------------------------
+# pre-flight validator
+
+def quad_validateRigConfig( config={}, sides=('L_','R_') ):
+    '''
+    Check the build configuration against the simulated naming scheme of the den_* builders.
+    Nothing is created in the scene, so this can run before the build starts.
+    Returns [ Errors, Warnings ], both lists of strings.
+    '''
+    startTime = time.time()
+    Errors = []
+    Warnings = []
+
+    spineCount = config['spineCount']
+    neckCount = config['neckCount']
+
+    # --- joint counts and secondary joints
+    for key in [ 'spineCount', 'neckCount', 'tailCount', 'whiskerCount', 'tongueCount' ]:
+        if key in config and config[key] < 1:
+            Errors.append( key+' must be at least 1, got '+str(config[key]) )
+    for key, count in [ ('spineSecondaryJoints', spineCount), ('neckSecondaryJoints', neckCount) ]:
+        for index in config.get( key, [] ):
+            if not 1 <= index <= count:
+                Errors.append( key+' has joint '+str(index)+' but there are only '+str(count) )
+    for chain in [ 'tail', 'whisker', 'tongue' ]:
+        for index in config.get( chain+'ControlJoints', () ):
+            if not 1 <= index <= config[chain+'Count']:
+                Errors.append( chain+'ControlJoints has joint '+str(index)+' but '+chain+'Count is '+str(config[chain+'Count']) )
+
+    if config.get( 'torsoMode', 'splineIK' ) not in ( 'splineIK', 'matrix' ):
+        Errors.append( 'torsoMode must be "splineIK" or "matrix", got "'+str(config['torsoMode'])+'"' )
+    if config.get( 'twistMode', 'den' ) not in ( 'den', 'matrix' ):
+        Errors.append( 'twistMode must be "den" or "matrix", got "'+str(config['twistMode'])+'"' )
+    if config.get( 'proxyMode', 'pieces' ) not in ( 'pieces', 'combined' ):
+        Errors.append( 'proxyMode must be "pieces" or "combined", got "'+str(config['proxyMode'])+'"' )
+    if config.get( 'safetyCovers', 'den' ) not in ( 'den', 'bulk', 'none' ):
+        Errors.append( 'safetyCovers must be "den", "bulk" or "none", got "'+str(config['safetyCovers'])+'"' )
+    SharedStyles = config.get( 'sharedCtrlShapes', {} )
+    if not isinstance( SharedStyles, dict ):
+        Errors.append( 'sharedCtrlShapes must map module key patterns to a control shape style' )
+    else:
+        for pattern, style in SharedStyles.items():
+            if style != 'captured' and style not in CtrlShapeLibrary:
+                Errors.append( 'sharedCtrlShapes style "'+str(style)+'" of '+pattern+' is not "captured" or one of '+', '.join( sorted( CtrlShapeLibrary ) ) )
+
+    # --- torso SpaceOUT indices
+    # labels are named for the placed pivot counts, quad_torsoSpaceOUTIndices moves them along the fitted chain
+    TorsoIndices = config.get( 'torsoSpaceOUTs', {} )
+    TorsoLabels = sorted( set( config.get( 'torsoSpaceOUTLabels', [] ) ) | set( TorsoIndices ) )
+    Expected = quad_torsoSpaceOUTIndices( spineCount=spineCount, neckCount=neckCount, Labels=TorsoLabels, placedCounts=config.get( 'torsoPivotCounts', {} ) )
+    for label in TorsoLabels:
+        if label not in Expected:
+            Errors.append( 'torsoSpaceOUTs["'+label+'"]: the torso has no '+label+' SpaceOUT with spineCount='+str(spineCount)+', neckCount='+str(neckCount) )
+        elif label in TorsoIndices and TorsoIndices[label] != Expected[label]:
+            Errors.append( 'torsoSpaceOUTs["'+label+'"] is '+str(TorsoIndices[label])+' but should be '+str(Expected[label])+' with spineCount='+str(spineCount)+', neckCount='+str(neckCount) )
+
+    # --- every joint the build will make
+    Jnts = quad_simTorsoJoints( spineCount=spineCount, neckCount=neckCount )
+    Jnts += quad_simChainJoints( name='Tail', jointCount=config.get( 'tailCount', 8 ) )
+    for side in sides:
+        Jnts += quad_simLegJoints( side=side, Joints=TrexHindLegJoints, twistJoints=config.get( 'legTwistJoints', [] ) )
+        Jnts += quad_simLegJoints( side=side, Joints=DogFrontLegJoints, twistJoints=config.get( 'frontLegTwistJoints', [] ) )
+    for joint in config.get( 'legTwistJoints', [] ):
+        if joint not in TrexHindLegJoints:
+            Errors.append( 'legTwistJoints has '+joint+' but the Trex leg has no such joint' )
+    for joint in config.get( 'frontLegTwistJoints', [] ):
+        if joint not in DogFrontLegJoints:
+            Errors.append( 'frontLegTwistJoints has '+joint+' but the dog front leg has no such joint' )
+    JntSet = set( Jnts )
+
+    # --- toe IK zero groups
+    for name, toes in sorted( config.get( 'toes', {} ).items() ):
+        if len( toes['toeList'] ) != len( toes['numJnts'] ):
+            Errors.append( name+': toeList has '+str(len(toes['toeList']))+' toes but numJnts has '+str(len(toes['numJnts'])) )
+            continue
+        for side in sides:
+            Made = quad_simToeIKZeros( side=side, name=name, toeList=toes['toeList'], numJnts=toes['numJnts'] )
+            Used = []
+            for key in [ 'ballZeros', 'toeZeros' ]:
+                for zero in toes[key]:
+                    zeroName = side+name+zero+'IK_CtrlZero'
+                    if zeroName not in Made:
+                        Errors.append( name+' '+key+': '+zeroName+' is not made by den_makeToeRig with toeList='+str(toes['toeList'])+', numJnts='+str(toes['numJnts']) )
+                    elif zeroName in Used:
+                        Errors.append( name+' '+key+': '+zeroName+' is constrained twice' )
+                    Used.append( zeroName )
+            for zeroName in Made:
+                if zeroName not in Used:
+                    Warnings.append( name+': '+zeroName+' is not in ballZeros or toeZeros and will not follow the foot' )
+            for key in [ 'ballDriver', 'toeDriver' ]:
+                if side+toes[key] not in JntSet:
+                    Errors.append( name+' '+key+': '+side+toes[key]+' is not made by any module' )
+
+    # --- add-on drivers
+    for module, driver in sorted( config.get( 'appendageDrivers', {} ).items() ):
+        if driver not in JntSet:
+            Errors.append( 'appendageDrivers["'+module+'"]: '+driver+' is not made by any module' )
+        for side in sides:
+            otherSide = sides[1] if side == sides[0] else sides[0]
+            if module.startswith( side ) and driver.startswith( otherSide ):
+                Warnings.append( 'appendageDrivers["'+module+'"]: '+side+' module follows '+otherSide+' joint '+driver )
+
+    # --- level of detail module lists
+    for key in config.get( 'lodSkeletonModules', [] ):
+        if key in config.get( 'lodBodyModules', [] ):
+            Warnings.append( 'lodBodyModules: '+key+' is also in lodSkeletonModules and will never be frozen' )
+
+    # --- report
+    elapsed = ( time.time() - startTime ) * 1000.0
+    for error in Errors:
+        print( 'ERROR: '+error )
+    for warning in Warnings:
+        print( 'WARNING: '+warning )
+    print( '========================= pre-flight check: %d errors, %d warnings in %.2f ms' % ( len(Errors), len(Warnings), elapsed ) )
+
+    return [ Errors, Warnings ]
+
+
+# ---------------------------------------------------------------------------------------
+# chain fitting
+# the spine, neck, tail, whisker and tongue pivots are placed once, for the joint counts they
+# were drawn with; a centripetal Catmull-Rom spline through those placements is resampled to
+# whatever count RigConfig asks for, so trying another count needs no re-placing by hand
+
+def quad_fitChain( Points=[], count=3 ):
+    '''
+    Fit a centripetal Catmull-Rom spline through Points and return count points along it, first
+    and last point included. The new points keep the spacing of the placed ones (a neck drawn
+    denser near the head stays denser there), and count == len(Points) returns Points unchanged.
+    '''
+    Points = [ tuple( float(v) for v in point ) for point in Points ]
+    n = len( Points )
+    if n == 0 or count < 1:
+        return []
+    if n == 1:
+        return Points * count
+    if count == n:
+        return Points
+
+    # knots at the square root of each chord length, so kinks do not overshoot or loop
+    Knots = [ 0.0 ]
+    for i in range( n-1 ):
+        chord = sum( (b-a)*(b-a) for a, b in zip( Points[i], Points[i+1] ) ) ** 0.5
+        Knots.append( Knots[-1] + max( chord ** 0.5, 1e-6 ) )
+
+    # tangent at every point (the ends follow their only chord), computed once for all samples
+    Tangents = []
+    for i in range( n ):
+        if i == 0 or i == n-1:
+            j = 0 if i == 0 else n-2
+            Tangents.append( tuple( (b-a) / (Knots[j+1]-Knots[j]) for a, b in zip( Points[j], Points[j+1] ) ) )
+            continue
+        d0 = Knots[i] - Knots[i-1]
+        d1 = Knots[i+1] - Knots[i]
+        Tangents.append( tuple( (p-a)/d0 - (b-a)/(d0+d1) + (b-p)/d1 for a, p, b in zip( Points[i-1], Points[i], Points[i+1] ) ) )
+
+    # sample k sits at the same fraction of the placed point index as it does of the new count
+    Fitted = []
+    for k in range( count ):
+        f = k * (n-1) / float(count-1) if count > 1 else (n-1) * 0.5
+        i = min( int(f), n-2 )
+        u = f - i
+        dt = Knots[i+1] - Knots[i]
+        h00 = 2*u**3 - 3*u**2 + 1
+        h10 = ( u**3 - 2*u**2 + u ) * dt
+        h01 = -2*u**3 + 3*u**2
+        h11 = ( u**3 - u**2 ) * dt
+        Fitted.append( tuple( h00*a + h10*ma + h01*b + h11*mb for a, ma, b, mb in zip( Points[i], Tangents[i], Points[i+1], Tangents[i+1] ) ) )
+    return Fitted
+
+
+def quad_fitChainPivots( prefix='', name='Tail', Points=[], count=8, anchors=(0,1) ):
+    '''
+    Place the prefix+name+NN_Piv pivots of a chain built with count joints from Points, the pivot
+    positions placed for any other count. anchors is how many points at the start and end of
+    Points belong to other pivots (Pelvis and Chest around the spine, TailEnd after the tail);
+    the fitted curve passes through them but they are not moved. Returns the pivot names.
+    '''
+    startTime = time.time()
+    first, last = anchors
+    Fitted = quad_fitChain( Points=Points, count=count+first+last )[ first:first+count ]
+    Pivs = [ prefix+name+'%02d_Piv' % (i+1) for i in range(count) ]
+    for piv, point in zip( Pivs, Fitted ):
+        cmds.xform( piv, t=point, ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
+    elapsed = ( time.time() - startTime ) * 1000.0
+    print( '========================= fitted %d %s%s pivots from %d placed in %.2f ms' % ( count, prefix, name, len(Points)-first-last, elapsed ) )
+    return Pivs
+
+
+def quad_torsoSpaceOUTIndices( spineCount=3, neckCount=6, Labels=[], placedCounts={'Spine':3, 'Neck':6} ):
+    '''
+    Return { label: index } of the den_makeAnyTorsoRig SpaceOUTs for the given counts. Labels are
+    named for the placed counts; a SpineNN or NeckNN label moves to the joint at the same place
+    along the fitted chain (Neck06 of six becomes Neck09 of ten), every other label keeps its name.
+    Labels with no matching SpaceOUT are left out for the pre-flight check to report.
+    '''
+    TorsoLabels = quad_simTorsoSpaceOUTs( spineCount=spineCount, neckCount=neckCount )
+    Counts = { 'Spine': spineCount, 'Neck': neckCount }
+    Indices = {}
+    for label in Labels:
+        target = label
+        for name, count in Counts.items():
+            placed = placedCounts.get( name, count )
+            if label.startswith( name ) and label[len(name):].isdigit() and placed != count:
+                # the chain runs from the anchor before joint 01 to the one after the last joint
+                f = int( label[len(name):] ) / float( placed+1 )
+                target = name+'%02d' % min( max( int( f*(count+1) + 0.5 ), 1 ), count )
+        if target in TorsoLabels:
+            Indices[label] = TorsoLabels.index( target )
+    return Indices
+
+
+# ---------------------------------------------------------------------------------------
+# rig output registry
+# every builder returns [ RigGrp, SpaceINs, SpaceOUTs, BindJnts, Ctrls, Guts, ... ], the registry
+# keeps those under a stable module key (e.g. 'Torso', 'L_TrexLeg', 'R_FinA') and is stored as
+# one compact JSON string on the root rig group, so post-build tools never need to scan the scene
+
+RegistryAttr = 'Rig_Registry'
+RegistryFields = [ 'RigGrp', 'SpaceINs', 'SpaceOUTs', 'BindJnts', 'Ctrls', 'Guts' ]
+
+
+def quad_registerModule( registry={}, key='', rigRet=None, extra={} ):
+    '''record the outputs of one den_* builder under key, extra values are merged into the entry'''
+    entry = registry.setdefault( key, {} )
+    if rigRet is not None:
+        for index, field in enumerate( RegistryFields ):
+            if index >= len( rigRet ):
+                break
+            value = rigRet[index]
+            if field == 'RigGrp':
+                value = value[0] if isinstance( value, (list,tuple) ) else value
+            else:
+                value = list( value ) if isinstance( value, (list,tuple) ) else [ value ]
+            entry[field] = value
+    entry.update( extra )
+    return entry
+
+
+def quad_registryNodes( registry={}, field='BindJnts', keys=None ):
+    '''return every node stored under field, for all modules or only the given keys, without duplicates'''
+    Nodes = []
+    seen = set()
+    for key in ( keys if keys is not None else registry.keys() ):
+        for node in registry[key].get( field, [] ):
+            if node not in seen:
+                seen.add( node )
+                Nodes.append( node )
+    return Nodes
+
+
+def quad_saveRegistry( rigGroup='', registry={} ):
+    '''store the registry as a locked string attribute on the root rig group'''
+    if not cmds.attributeQuery( RegistryAttr, node=rigGroup, exists=True ):
+        cmds.addAttr( rigGroup, ln=RegistryAttr, dt='string' )
+    cmds.setAttr( rigGroup+'.'+RegistryAttr, lock=False )
+    cmds.setAttr( rigGroup+'.'+RegistryAttr, json.dumps( registry, separators=(',',':'), sort_keys=True ), type='string' )
+    cmds.setAttr( rigGroup+'.'+RegistryAttr, lock=True )
+    print( '========================= saved registry of %d modules on %s' % ( len(registry), rigGroup ) )
+
+
+def quad_loadRegistry( rigGroup=None ):
+    '''read the registry back from the root rig group, finds the group by its attribute if none is given'''
+    if rigGroup is None:
+        Found = cmds.ls( '*.'+RegistryAttr, objectsOnly=True ) or []
+        if not Found:
+            raise RuntimeError( 'no rig with a '+RegistryAttr+' attribute in the scene' )
+        rigGroup = Found[0]
+    return json.loads( cmds.getAttr( rigGroup+'.'+RegistryAttr ) )
+
+
+# ---------------------------------------------------------------------------------------
+# node map
+# every node of the rig mapped to the registry key of its module, made once per build with one
+# DAG walk and one DG walk and stored next to the registry, so profiling tools never walk the graph
+
+NodeMapAttr = 'Rig_NodeMap'
+# the DG walk stops at these, they belong to the geometry or to the whole scene, not to one module
+NodeMapStopTypes = [ 'skinCluster', 'cluster', 'blendShape', 'tweak', 'groupParts', 'groupId', 'objectSet',
+                     'nucleus', 'time', 'displayLayer', 'renderLayer', 'hyperLayout', 'cacheFile' ]
+
+
+def quad_buildNodeMap( registry={} ):
+    '''
+    Map DAG nodes to the module of the rig group they live under (deepest group wins), then map the
+    DG nodes connected to them breadth first, so a utility node belongs to the nearest module.
+    Returns { node: key }.
+    '''
+    startTime = time.time()
+    NodeMap = {}
+    Groups = [ ( entry['RigGrp'], key ) for key, entry in registry.items() if 'RigGrp' in entry and cmds.objExists( entry['RigGrp'] ) ]
+    Groups.sort( key=lambda item: cmds.ls( item[0], long=True )[0].count( '|' ), reverse=True )
+    for rigGrp, key in Groups:
+        for node in cmds.ls( [ rigGrp ] + ( cmds.listRelatives( rigGrp, ad=True, fullPath=True ) or [] ) ):
+            NodeMap.setdefault( node, key )
+
+    Frontier = list( NodeMap )
+    while Frontier:
+        Pairs = cmds.listConnections( Frontier, connections=True, plugs=True, skipConversionNodes=False ) or []
+        Found = {}
+        for ownPlug, otherPlug in zip( Pairs[0::2], Pairs[1::2] ):
+            other = otherPlug.split( '.' )[0]
+            if other not in NodeMap and other not in Found:
+                Found[other] = NodeMap[ ownPlug.split( '.' )[0] ]
+        if not Found:
+            break
+        Typed = cmds.ls( list( Found ), showType=True ) or []
+        Frontier = []
+        for node, nodeType in zip( Typed[0::2], Typed[1::2] ):
+            if nodeType in NodeMapStopTypes or cmds.ls( node, dag=True ):
+                continue
+            NodeMap[node] = Found[node]
+            Frontier.append( node )
+
+    print( '========================= mapped %d nodes to %d modules in %.2f sec' % ( len(NodeMap), len(Groups), time.time()-startTime ) )
+    return NodeMap
+
+
+def quad_saveNodeMap( rigGroup='', NodeMap={} ):
+    '''store the node map as a locked string attribute on the root rig group, grouped by module'''
+    ByModule = {}
+    for node, key in NodeMap.items():
+        ByModule.setdefault( key, [] ).append( node )
+    if not cmds.attributeQuery( NodeMapAttr, node=rigGroup, exists=True ):
+        cmds.addAttr( rigGroup, ln=NodeMapAttr, dt='string' )
+    cmds.setAttr( rigGroup+'.'+NodeMapAttr, lock=False )
+    cmds.setAttr( rigGroup+'.'+NodeMapAttr, json.dumps( ByModule, separators=(',',':'), sort_keys=True ), type='string' )
+    cmds.setAttr( rigGroup+'.'+NodeMapAttr, lock=True )
+
+
+def quad_loadNodeMap( rigGroup=None ):
+    '''read the node map back from the root rig group, builds and saves it first if the build has none'''
+    if rigGroup is None:
+        Found = cmds.ls( '*.'+RegistryAttr, objectsOnly=True ) or []
+        if not Found:
+            raise RuntimeError( 'no rig with a '+RegistryAttr+' attribute in the scene' )
+        rigGroup = Found[0]
+    if not cmds.attributeQuery( NodeMapAttr, node=rigGroup, exists=True ):
+        quad_saveNodeMap( rigGroup=rigGroup, NodeMap=quad_buildNodeMap( registry=quad_loadRegistry( rigGroup=rigGroup ) ) )
+    ByModule = json.loads( cmds.getAttr( rigGroup+'.'+NodeMapAttr ) )
+    return { node: key for key, Nodes in ByModule.items() for node in Nodes }
+
+
+# ---------------------------------------------------------------------------------------
+# mirror table
+# every L_ control is paired with its R_ control (center controls with themselves) and the flip of
+# each translate and rotate axis is read once from the rest matrices, then stored next to the
+# registry, so mirroring a pose or a shot is only a lookup and a sign per channel
+
+MirrorTableAttr = 'Rig_MirrorTable'
+MirrorSides = ( 'L_', 'R_' )
+
+
+def quad_mirrorName( name='' ):
+    '''the name of the other side's partner of an L_/R_ name, the name itself when it has no side'''
+    for side, otherSide in ( MirrorSides, MirrorSides[::-1] ):
+        if name.startswith( side ):
+            return otherSide + name[len(side):]
+    return name
+
+
+def quad_mirrorSigns( matrix=[], partnerMatrix=[], tolerance=0.99 ):
+    '''
+    Translate and rotate signs that carry a local move of one control to its partner across the YZ
+    plane, from their rest world matrices (16 floats). Returns None when the partner's axes are not
+    a mirror of the control's axes (the controls are oriented differently).
+    '''
+    Signs = []
+    for axis in range( 3 ):
+        Mirrored = [ -matrix[axis*4], matrix[axis*4+1], matrix[axis*4+2] ]
+        dot = sum( a*b for a, b in zip( Mirrored, partnerMatrix[axis*4:axis*4+3] ) )
+        if abs( dot ) < tolerance:
+            return None
+        Signs.append( 1 if dot > 0.0 else -1 )
+    # with the axes flipped by S, a local rotation R mirrors to S.R.S, which negates the angle about an axis that is not flipped
+    return [ Signs, [ -sign for sign in Signs ] ]
+
+
+def quad_buildMirrorTable( registry={} ):
+    '''
+    Pair every registered control with its mirror and read the axis flips from the rest pose, the rig
+    must be at rest (right after the build). Returns { ctrl: [ partner, translateSigns, rotateSigns ] };
+    controls without a partner or with differently oriented partners are left out and reported.
+    '''
+    startTime = time.time()
+    Ctrls = [ ctrl for ctrl in quad_registryNodes( registry=registry, field='Ctrls' ) if cmds.objExists( ctrl ) ]
+    CtrlSet = set( Ctrls )
+    Matrices = { ctrl: cmds.xform( ctrl, q=True, worldSpace=True, matrix=True ) for ctrl in Ctrls }
+    MirrorTable = {}
+    Skipped = []
+    for ctrl in Ctrls:
+        partner = quad_mirrorName( ctrl )
+        if partner not in CtrlSet:
+            Skipped.append( ctrl )
+            continue
+        Signs = quad_mirrorSigns( matrix=Matrices[ctrl], partnerMatrix=Matrices[partner] )
+        if Signs is None:
+            Skipped.append( ctrl )
+            continue
+        MirrorTable[ctrl] = [ partner ] + Signs
+    for ctrl in Skipped:
+        print( 'WARNING: no mirror for '+ctrl )
+    print( '========================= mirror table of %d controls (%d skipped) in %.2f sec' % ( len(MirrorTable), len(Skipped), time.time()-startTime ) )
+    return MirrorTable
+
+
+def quad_saveMirrorTable( rigGroup='', MirrorTable={} ):
+    '''store the mirror table as a locked string attribute on the root rig group'''
+    if not cmds.attributeQuery( MirrorTableAttr, node=rigGroup, exists=True ):
+        cmds.addAttr( rigGroup, ln=MirrorTableAttr, dt='string' )
+    cmds.setAttr( rigGroup+'.'+MirrorTableAttr, lock=False )
+    cmds.setAttr( rigGroup+'.'+MirrorTableAttr, json.dumps( MirrorTable, separators=(',',':'), sort_keys=True ), type='string' )
+    cmds.setAttr( rigGroup+'.'+MirrorTableAttr, lock=True )
+
+
+def quad_loadMirrorTable( rigGroup=None ):
+    '''read the mirror table back from the root rig group, builds and saves it first if the build has none (the rig must be at rest then)'''
+    if rigGroup is None:
+        Found = cmds.ls( '*.'+RegistryAttr, objectsOnly=True ) or []
+        if not Found:
+            raise RuntimeError( 'no rig with a '+RegistryAttr+' attribute in the scene' )
+        rigGroup = Found[0]
+    if not cmds.attributeQuery( MirrorTableAttr, node=rigGroup, exists=True ):
+        quad_saveMirrorTable( rigGroup=rigGroup, MirrorTable=quad_buildMirrorTable( registry=quad_loadRegistry( rigGroup=rigGroup ) ) )
+    return json.loads( cmds.getAttr( rigGroup+'.'+MirrorTableAttr ) )
+
+
+# ---------------------------------------------------------------------------------------
+# matrix torso
+# a lighter alternative to the spline IK spine and neck: every chain joint is placed by a
+# blendMatrix between the two drivers around it and aimed at the next joint by an aimMatrix,
+# so the chain evaluates as independent matrix nodes instead of one serial spline solve
+
+def quad_chainParams( Points=[] ):
+    '''return the normalized arc-length parameter of each point along the polyline through Points'''
+    Lengths = [ 0.0 ]
+    for i in range( 1, len(Points) ):
+        Lengths.append( Lengths[-1] + ( om.MVector(Points[i]) - om.MVector(Points[i-1]) ).length() )
+    total = Lengths[-1] or 1.0
+    return [ length/total for length in Lengths ]
+
+
+def quad_projectOnChain( point=(0,0,0), Points=[] ):
+    '''return the arc-length parameter of the closest point on the polyline through Points'''
+    Params = quad_chainParams( Points=Points )
+    p = om.MVector( point )
+    best = [ None, 0.0 ]
+    for i in range( len(Points)-1 ):
+        a = om.MVector( Points[i] )
+        seg = om.MVector( Points[i+1] ) - a
+        segLength = seg.length()
+        u = 0.0 if segLength == 0.0 else min( max( ( (p-a)*seg ) / ( segLength*segLength ), 0.0 ), 1.0 )
+        dist = ( a + seg*u - p ).length()
+        if best[0] is None or dist < best[0]:
+            best = [ dist, Params[i] + ( Params[i+1]-Params[i] )*u ]
+    return best[1]
+
+
+def quad_splineDrivers( ikHandle='' ):
+    '''return the transforms that move the curve of a spline IK handle, through skinCluster or clusters'''
+    curve = cmds.ikHandle( ikHandle, q=True, curve=True )
+    Drivers = []
+    for node in cmds.listHistory( curve ) or []:
+        nodeType = cmds.nodeType( node )
+        if nodeType == 'skinCluster':
+            Drivers += cmds.skinCluster( node, q=True, influence=True ) or []
+        elif nodeType == 'cluster':
+            Drivers += cmds.listConnections( node+'.matrix', s=True, d=False ) or []
+    if not Drivers:
+        raise RuntimeError( 'cannot find what drives the curve of '+ikHandle+', it is not skinned or clustered' )
+    return list( dict.fromkeys( Drivers ) )
+
+
+def quad_makeMatrixChain( Jnts=[], Drivers=[], aimAxis=(1,0,0), upAxis=(0,1,0), name='Chain' ):
+    '''
+    Drive a joint chain from driver matrices with blendMatrix and aimMatrix nodes.
+    Incoming connections on the joints are broken, and each joint ends up with zeroed channels
+    and its local matrix connected to offsetParentMatrix (Maya 2020 and later).
+    Returns the list of utility nodes created.
+    '''
+    def worldMatrix( node ):
+        return om.MMatrix( cmds.xform( node, q=True, ws=True, m=True ) )
+
+    JntPoints = [ cmds.xform( jnt, q=True, ws=True, t=True ) for jnt in Jnts ]
+    JntParams = quad_chainParams( Points=JntPoints )
+    DriverParams = [ quad_projectOnChain( point=cmds.xform( driver, q=True, ws=True, t=True ), Points=JntPoints ) for driver in Drivers ]
+    Drivers = [ driver for param, driver in sorted( zip( DriverParams, Drivers ) ) ]
+    DriverParams = sorted( DriverParams )
+
+    Nodes = []
+    Blends = []
+    for i, jnt in enumerate( Jnts ):
+        # find the two drivers around this joint and how far it sits between them
+        t = JntParams[i]
+        lower = 0
+        while lower < len(Drivers)-2 and DriverParams[lower+1] <= t:
+            lower += 1
+        upper = min( lower+1, len(Drivers)-1 )
+        span = DriverParams[upper] - DriverParams[lower]
+        weight = 0.0 if span <= 0.0 else min( max( ( t-DriverParams[lower] )/span, 0.0 ), 1.0 )
+
+        # each driver carries the joint as if it was parented to it
+        Followers = []
+        for driver in [ Drivers[lower], Drivers[upper] ]:
+            offset = worldMatrix( jnt ) * worldMatrix( driver ).inverse()
+            mult = cmds.createNode( 'multMatrix', name=jnt+'_'+driver+'_MM' )
+            cmds.setAttr( mult+'.matrixIn[0]', list(offset), type='matrix' )
+            cmds.connectAttr( driver+'.worldMatrix[0]', mult+'.matrixIn[1]' )
+            Followers.append( mult )
+            Nodes.append( mult )
+
+        blend = cmds.createNode( 'blendMatrix', name=jnt+'_BM' )
+        cmds.connectAttr( Followers[0]+'.matrixSum', blend+'.inputMatrix' )
+        cmds.connectAttr( Followers[1]+'.matrixSum', blend+'.target[0].targetMatrix' )
+        cmds.setAttr( blend+'.target[0].weight', weight )
+        Blends.append( blend )
+        Nodes.append( blend )
+
+    Outputs = []
+    for i, jnt in enumerate( Jnts ):
+        if i < len(Jnts)-1:
+            # aim at the next joint and keep the blended up axis to carry the twist
+            aim = cmds.createNode( 'aimMatrix', name=jnt+'_AM' )
+            cmds.connectAttr( Blends[i]+'.outputMatrix', aim+'.inputMatrix' )
+            cmds.connectAttr( Blends[i+1]+'.outputMatrix', aim+'.primaryTargetMatrix' )
+            cmds.setAttr( aim+'.primaryInputAxis', *aimAxis )
+            cmds.setAttr( aim+'.primaryMode', 1 )
+            cmds.connectAttr( Blends[i]+'.outputMatrix', aim+'.secondaryTargetMatrix' )
+            cmds.setAttr( aim+'.secondaryInputAxis', *upAxis )
+            cmds.setAttr( aim+'.secondaryTargetVector', *upAxis )
+            cmds.setAttr( aim+'.secondaryMode', 2 )
+            Outputs.append( aim+'.outputMatrix' )
+            Nodes.append( aim )
+        else:
+            Outputs.append( Blends[i]+'.outputMatrix' )
+
+    for i, jnt in enumerate( Jnts ):
+        # break whatever the old setup connected to the joint
+        for attr in [ 'translate', 'rotate', 'scale', 'jointOrient' ]:
+            for plug in [ attr ] + [ attr+axis for axis in 'XYZ' ]:
+                for source in cmds.listConnections( jnt+'.'+plug, s=True, d=False, plugs=True ) or []:
+                    cmds.disconnectAttr( source, jnt+'.'+plug )
+
+        parent = ( cmds.listRelatives( jnt, parent=True, fullPath=True ) or [ None ] )[0]
+        if parent:
+            local = cmds.createNode( 'multMatrix', name=jnt+'_Local_MM' )
+            cmds.connectAttr( Outputs[i], local+'.matrixIn[0]' )
+            cmds.connectAttr( parent+'.worldInverseMatrix[0]', local+'.matrixIn[1]' )
+            cmds.connectAttr( local+'.matrixSum', jnt+'.offsetParentMatrix' )
+            Nodes.append( local )
+        else:
+            cmds.connectAttr( Outputs[i], jnt+'.offsetParentMatrix' )
+        cmds.setAttr( jnt+'.translate', 0, 0, 0 )
+        cmds.setAttr( jnt+'.rotate', 0, 0, 0 )
+        cmds.setAttr( jnt+'.jointOrient', 0, 0, 0 )
+        cmds.setAttr( jnt+'.scale', 1, 1, 1 )
+
+    print( '========================= made matrix chain '+name+' with %d joints, %d drivers, %d nodes' % ( len(Jnts), len(Drivers), len(Nodes) ) )
+    return Nodes
+
+
+def quad_makeMatrixTorso( rigGroup='', aimAxis=(1,0,0), upAxis=(0,1,0) ):
+    '''
+    Replace every spline IK chain under the torso rig group with a matrix chain driven by the
+    same transforms that move the spline curve. The IK handles are deleted.
+    Returns [ Jnts, Nodes ] for all converted chains.
+    '''
+    Handles = [ handle for handle in cmds.listRelatives( rigGroup, ad=True, type='ikHandle', fullPath=True ) or []
+                if cmds.ikHandle( handle, q=True, solver=True ) == 'ikSplineSolver' ]
+    if not Handles:
+        raise RuntimeError( 'no spline IK handles under '+rigGroup )
+
+    AllJnts = []
+    AllNodes = []
+    for handle in Handles:
+        Jnts = cmds.ikHandle( handle, q=True, jointList=True )
+        effector = cmds.ikHandle( handle, q=True, endEffector=True )
+        endJnt = ( cmds.listConnections( effector+'.translateX', s=True, d=False ) or [ None ] )[0]
+        if endJnt and endJnt not in Jnts:
+            Jnts.append( endJnt )
+        Drivers = quad_splineDrivers( ikHandle=handle )
+        cmds.delete( handle )
+        AllNodes += quad_makeMatrixChain( Jnts=Jnts, Drivers=Drivers, aimAxis=aimAxis, upAxis=upAxis, name=handle.split('|')[-1] )
+        AllJnts += Jnts
+
+    return [ AllJnts, AllNodes ]
+
+
+# ---------------------------------------------------------------------------------------
+# shared dynamics
+# den_addTailDynamics gives every chain its own nucleus, these helpers move all hair systems
+# onto one solver and add a Live/Cached/Off switch per chain on the AllCtrl, so a shot can be
+# simulated once into an nCache and played back without solving
+
+DynamicsModes = [ 'Live', 'Cached', 'Off' ]
+DynamicsModeSuffix = '_Dynamics'
+
+
+def quad_hairSystems( DynCtrl='' ):
+    '''return the hairSystem shapes behind a DynCtrl returned by den_addTailDynamics'''
+    Nodes = [ DynCtrl ] + ( cmds.listRelatives( DynCtrl, shapes=True, fullPath=True ) or [] )
+    Hairs = [ node for node in Nodes if cmds.nodeType( node ) == 'hairSystem' ]
+    if not Hairs:
+        Hairs = cmds.listConnections( Nodes, type='hairSystem', shapes=True ) or []
+    return list( dict.fromkeys( Hairs ) )
+
+
+def quad_shareNucleus( DynCtrls=[], name='Shared_Nucleus' ):
+    '''
+    Assign the hair systems of every DynCtrl to one nucleus and delete the nuclei left empty.
+    The nucleus of the first chain is kept (and renamed) so its gravity and scale settings survive.
+    Returns [ nucleus, HairSystems ].
+    '''
+    HairSystems = []
+    for DynCtrl in DynCtrls:
+        HairSystems += quad_hairSystems( DynCtrl=DynCtrl )
+    if not HairSystems:
+        raise RuntimeError( 'no hair systems found behind '+str( DynCtrls ) )
+
+    OldNuclei = list( dict.fromkeys( cmds.listConnections( HairSystems, type='nucleus' ) or [] ) )
+    if not OldNuclei:
+        raise RuntimeError( 'no nucleus connected to '+str( HairSystems ) )
+    nucleus = cmds.rename( OldNuclei[0], name )
+
+    Selection = cmds.ls( sl=True )
+    cmds.select( HairSystems, r=True )
+    mel.eval( 'assignNSolver "%s"' % nucleus )
+    if Selection:
+        cmds.select( Selection, r=True )
+    else:
+        cmds.select( cl=True )
+
+    for oldNucleus in OldNuclei[1:]:
+        if cmds.objExists( oldNucleus ) and not cmds.listConnections( oldNucleus+'.outputObjects', d=True, s=False ):
+            cmds.delete( oldNucleus )
+
+    print( '========================= %d hair systems now solved by %s' % ( len(HairSystems), nucleus ) )
+    return [ nucleus, HairSystems ]
+
+
+def quad_addDynamicsSwitch( ctrl='', key='Tail', DynCtrl='' ):
+    '''
+    Add a <key>_Dynamics enum (Live/Cached/Off) on ctrl. Off drops the hair systems to Static
+    so the chain follows its start curve, Cached is wired to the cacheFile by quad_cacheDynamics
+    once a cache exists.
+    Returns the attribute name.
+    '''
+    attr = key+DynamicsModeSuffix
+    if not cmds.attributeQuery( attr, node=ctrl, exists=True ):
+        cmds.addAttr( ctrl, ln=attr, at='enum', en=':'.join( DynamicsModes ), k=True )
+
+    # simulationMethod: 1 = Static, 3 = All Follicles
+    simCond = cmds.createNode( 'condition', name=key+'_DynSim_Cond' )
+    cmds.connectAttr( ctrl+'.'+attr, simCond+'.firstTerm' )
+    cmds.setAttr( simCond+'.secondTerm', DynamicsModes.index( 'Off' ) )
+    cmds.setAttr( simCond+'.colorIfTrueR', 1 )
+    cmds.setAttr( simCond+'.colorIfFalseR', 3 )
+    for hair in quad_hairSystems( DynCtrl=DynCtrl ):
+        cmds.connectAttr( simCond+'.outColorR', hair+'.simulationMethod', force=True )
+    return attr
+
+
+def quad_dynamicsCacheCond( ctrl='', key='Tail' ):
+    '''the condition turning the cacheFiles of a chain on in Cached mode, made with the first cache'''
+    cacheCond = key+'_DynCache_Cond'
+    if not cmds.objExists( cacheCond ):
+        cacheCond = cmds.createNode( 'condition', name=cacheCond )
+        cmds.connectAttr( ctrl+'.'+key+DynamicsModeSuffix, cacheCond+'.firstTerm' )
+        cmds.setAttr( cacheCond+'.secondTerm', DynamicsModes.index( 'Cached' ) )
+        cmds.setAttr( cacheCond+'.colorIfTrueR', 1 )
+        cmds.setAttr( cacheCond+'.colorIfFalseR', 0 )
+    return cacheCond
+
+
+def quad_cacheDynamics( ctrl='', keys=[], DynCtrls=[], startFrame=1, endFrame=120, directory='', name='' ):
+    '''
+    Simulate the shared nucleus once for all given chains into an nCache (one file per hair system)
+    and switch them to Cached. keys and DynCtrls are parallel lists, e.g. the registry keys and their
+    'DynCtrl' entries. Returns the cacheFile nodes.
+    '''
+    start = time.time()
+    ChainHairs = [ quad_hairSystems( DynCtrl=DynCtrl ) for DynCtrl in DynCtrls ]
+    cmds.select( [ hair for Hairs in ChainHairs for hair in Hairs ], r=True )
+    # doCreateNclothCache 5: range mode, start, end, distribution, refresh, dir, per geometry,
+    # name, name as prefix, action, force save, sim rate, sample rate, inherit, floats, format
+    mel.eval( 'doCreateNclothCache 5 { "2", "%d", "%d", "OneFile", "0", "%s", "1", "%s", "%d", "replace", "1", "1", "1", "0", "1", "mcx" }'
+              % ( startFrame, endFrame, directory, name or '', 1 if name else 0 ) )
+    cmds.select( cl=True )
+
+    CacheNodes = []
+    for key, Hairs in zip( keys, ChainHairs ):
+        Caches = list( dict.fromkeys( cmds.listConnections( Hairs, type='cacheFile' ) or [] ) )
+        cacheCond = quad_dynamicsCacheCond( ctrl=ctrl, key=key )
+        for cache in Caches:
+            cmds.connectAttr( cacheCond+'.outColorR', cache+'.enable', force=True )
+        CacheNodes += Caches
+        cmds.setAttr( ctrl+'.'+key+DynamicsModeSuffix, DynamicsModes.index( 'Cached' ) )
+
+    print( '========================= cached %d chains over frames %d-%d in one simulation in %.1f sec' % ( len(keys), startFrame, endFrame, time.time()-start ) )
+    return CacheNodes
+
+
+# ---------------------------------------------------------------------------------------
+# level of detail
+# one enum on the AllCtrl freezes every node of whole modules, and hides them by routing their
+# Show_Controls fan-out through the same switch. frozen is driven on each DAG node of a module
+# rather than on its group, so it is saved with the rig and needs no evaluator configuration
+
+RigLODs = [ 'Full', 'Body_Only', 'Skeleton_Only' ]
+
+
+def quad_addRigLOD( ctrl='', registry={}, skeletonKeys=[], bodyKeys=[], attr='Rig_LOD' ):
+    '''
+    Add a Full/Body_Only/Skeleton_Only enum on ctrl and wire every registered module to it.
+    Modules in skeletonKeys always evaluate, bodyKeys are frozen at Skeleton_Only and all other
+    modules below Full. A DAG node belongs to the deepest module group above it, as in
+    quad_buildNodeMap. The Base module holds the other groups and is never frozen.
+    Returns { key: condition }.
+    '''
+    if not cmds.attributeQuery( attr, node=ctrl, exists=True ):
+        cmds.addAttr( ctrl, ln=attr, at='enum', en=':'.join( RigLODs ) )
+        cmds.setAttr( ctrl+'.'+attr, cb=True )
+
+    # module of every DAG node, deepest group wins
+    Groups = [ ( entry['RigGrp'], key ) for key, entry in registry.items() if 'RigGrp' in entry and cmds.objExists( entry['RigGrp'] ) ]
+    Groups.sort( key=lambda item: cmds.ls( item[0], long=True )[0].count( '|' ), reverse=True )
+    ModuleNodes = {}
+    Owned = set()
+    for rigGrp, key in Groups:
+        for node in cmds.ls( [ rigGrp ] + ( cmds.listRelatives( rigGrp, ad=True, fullPath=True ) or [] ), long=True ):
+            if node not in Owned:
+                Owned.add( node )
+                ModuleNodes.setdefault( key, [] ).append( node )
+
+    Conds = {}
+    for key, entry in registry.items():
+        if key == 'Base' or key in skeletonKeys or 'RigGrp' not in entry:
+            continue
+        rigGrp = entry['RigGrp']
+        # last LOD at which the module still evaluates
+        lastLOD = RigLODs.index( 'Body_Only' ) if key in bodyKeys else RigLODs.index( 'Full' )
+
+        cond = cmds.createNode( 'condition', name=key+'_LOD_Cond' )
+        cmds.connectAttr( ctrl+'.'+attr, cond+'.firstTerm' )
+        cmds.setAttr( cond+'.secondTerm', lastLOD )
+        cmds.setAttr( cond+'.operation', 2 )   # greater than
+        # R: frozen, G: Show_Controls, B: visibility
+        cmds.setAttr( cond+'.colorIfTrue', 1, 0, 0 )
+        cmds.setAttr( cond+'.colorIfFalse', 0, 1, 1 )
+
+        if cmds.attributeQuery( 'Show_Controls', node=rigGrp, exists=True ):
+            Sources = cmds.listConnections( rigGrp+'.Show_Controls', s=True, d=False, plugs=True ) or []
+            if Sources:
+                cmds.connectAttr( Sources[0], cond+'.colorIfFalseG' )
+            cmds.connectAttr( cond+'.outColorG', rigGrp+'.Show_Controls', force=True )
+        for node in ModuleNodes.get( key, [] ):
+            if not cmds.listConnections( node+'.frozen', s=True, d=False ):
+                cmds.connectAttr( cond+'.outColorR', node+'.frozen' )
+        cmds.connectAttr( cond+'.outColorB', rigGrp+'.visibility', force=True )
+        Conds[key] = cond
+
+    print( '========================= %s drives %d modules, %d nodes' % ( attr, len(Conds), sum( len( ModuleNodes.get( key, [] ) ) for key in Conds ) ) )
+    return Conds
+
+
+# ---------------------------------------------------------------------------------------
+# matrix twists
+# replaces the helper network den_makeTwists builds for each joint with a swing-twist split:
+# the twist of a joint against its parent and of its child against it are read from
+# decomposeMatrix quaternions and blended along the twist joints by their position
+
+def quad_deleteDeadNodes( Nodes=[] ):
+    '''delete DG nodes and constraints that no longer drive anything, then their inputs that died with them'''
+    Deleted = []
+    Nodes = list( Nodes )
+    while Nodes:
+        node = Nodes.pop()
+        if not cmds.objExists( node ) or node in Deleted:
+            continue
+        if cmds.ls( node, dag=True ) and not cmds.ls( node, type='constraint' ):
+            continue
+        Outputs = [ plug for plug in cmds.listConnections( node, s=False, d=True, plugs=True ) or [] if not plug.endswith( '.message' ) ]
+        if cmds.ls( node, type='constraint' ):
+            Outputs = [ plug for plug in Outputs if plug.split( '.' )[0] != cmds.listRelatives( node, parent=True )[0] ]
+        if Outputs:
+            continue
+        Nodes += cmds.listConnections( node, s=True, d=False ) or []
+        cmds.delete( node )
+        Deleted.append( node )
+    return Deleted
+
+
+def quad_twistAngle( jnt='', parent='', name='' ):
+    '''
+    Make the nodes that output the twist of jnt about its X axis relative to parent, zero at the
+    current pose. Returns [ quatToEuler, Nodes ], the angle is quatToEuler.outputRotateX.
+    '''
+    bindLocal = om.MMatrix( cmds.getAttr( jnt+'.worldMatrix[0]' ) ) * om.MMatrix( cmds.getAttr( parent+'.worldInverseMatrix[0]' ) )
+    mult = cmds.createNode( 'multMatrix', name=name+'_Twist_MM' )
+    cmds.connectAttr( jnt+'.worldMatrix[0]', mult+'.matrixIn[0]' )
+    cmds.connectAttr( parent+'.worldInverseMatrix[0]', mult+'.matrixIn[1]' )
+    cmds.setAttr( mult+'.matrixIn[2]', list( bindLocal.inverse() ), type='matrix' )
+    decompose = cmds.createNode( 'decomposeMatrix', name=name+'_Twist_DM' )
+    cmds.connectAttr( mult+'.matrixSum', decompose+'.inputMatrix' )
+    # keep only the X and W of the rotation, that is the twist part of a swing-twist split
+    twistQuat = cmds.createNode( 'quatNormalize', name=name+'_Twist_QN' )
+    cmds.connectAttr( decompose+'.outputQuatX', twistQuat+'.inputQuatX' )
+    cmds.connectAttr( decompose+'.outputQuatW', twistQuat+'.inputQuatW' )
+    toEuler = cmds.createNode( 'quatToEuler', name=name+'_Twist_QE' )
+    cmds.connectAttr( twistQuat+'.outputQuat', toEuler+'.inputQuat' )
+    return [ toEuler, [ mult, decompose, twistQuat, toEuler ] ]
+
+
+def quad_makeMatrixTwists( side='L_', Joints=[], count=TwistJointCount, Ctrls=[] ):
+    '''
+    Rewire the twist joints den_makeTwists made for side+Joints. Each twist joint gets the parent
+    twist of the joint (fading out along the bone) plus the twist of the child joint (fading in),
+    weighted by where it sits between the two. The den network is disconnected and deleted, so
+    its twist controls (Ctrls, den_makeTwists return [4]) are hidden and locked.
+    Returns [ TwistJnts, Nodes ].
+    '''
+    AllJnts = []
+    AllNodes = []
+    for joint in Joints:
+        jnt = side+joint+'_Jx'
+        parent = cmds.listRelatives( jnt, parent=True )[0]
+        Children = [ child for child in cmds.listRelatives( jnt, children=True, type='joint' ) or [] if child.endswith( '_Jx' ) ]
+        if not Children:
+            raise RuntimeError( jnt+' has no child _Jx joint to take the twist from' )
+        child = Children[0]
+        TwistJnts = [ side+joint+'Twist%02d_Jnt' % (i+1) for i in range(count) ]
+
+        # clear the den network
+        Sources = []
+        for twistJnt in TwistJnts:
+            for attr in [ 'rotate', 'rotateX', 'rotateY', 'rotateZ' ]:
+                for source in cmds.listConnections( twistJnt+'.'+attr, s=True, d=False, plugs=True ) or []:
+                    cmds.disconnectAttr( source, twistJnt+'.'+attr )
+                    Sources.append( source.split( '.' )[0] )
+        quad_deleteDeadNodes( Nodes=Sources )
+
+        startAngle, StartNodes = quad_twistAngle( jnt=jnt, parent=parent, name=side+joint+'Start' )
+        endAngle, EndNodes = quad_twistAngle( jnt=child, parent=jnt, name=side+joint+'End' )
+
+        # weight of each twist joint from its position along the bone, differenced when the
+        # twist joints are chained so a child does not add its parent's twist twice
+        start = om.MVector( cmds.xform( jnt, q=True, ws=True, t=True ) )
+        bone = om.MVector( cmds.xform( child, q=True, ws=True, t=True ) ) - start
+        Weights = []
+        for twistJnt in TwistJnts:
+            along = ( om.MVector( cmds.xform( twistJnt, q=True, ws=True, t=True ) ) - start ) * bone / ( bone * bone )
+            Weights.append( min( max( along, 0.0 ), 1.0 ) )
+        StartWeights = [ weight - 1.0 for weight in Weights ]
+        EndWeights = list( Weights )
+        for i in reversed( range( 1, count ) ):
+            if cmds.listRelatives( TwistJnts[i], parent=True )[0] == TwistJnts[i-1]:
+                StartWeights[i] -= StartWeights[i-1]
+                EndWeights[i] -= EndWeights[i-1]
+
+        Nodes = StartNodes + EndNodes
+        for first in range( 0, count, 3 ):
+            Chunk = TwistJnts[first:first+3]
+            startMult = cmds.createNode( 'multiplyDivide', name=side+joint+'TwistStart%d_MD' % (first//3+1) )
+            endMult = cmds.createNode( 'multiplyDivide', name=side+joint+'TwistEnd%d_MD' % (first//3+1) )
+            add = cmds.createNode( 'plusMinusAverage', name=side+joint+'Twist%d_PMA' % (first//3+1) )
+            for axis, twistJnt in zip( 'XYZ', Chunk ):
+                index = TwistJnts.index( twistJnt )
+                cmds.connectAttr( startAngle+'.outputRotateX', startMult+'.input1'+axis )
+                cmds.setAttr( startMult+'.input2'+axis, StartWeights[index] )
+                cmds.connectAttr( endAngle+'.outputRotateX', endMult+'.input1'+axis )
+                cmds.setAttr( endMult+'.input2'+axis, EndWeights[index] )
+                cmds.connectAttr( startMult+'.output'+axis, add+'.input3D[0].input3D'+axis.lower() )
+                cmds.connectAttr( endMult+'.output'+axis, add+'.input3D[1].input3D'+axis.lower() )
+                cmds.connectAttr( add+'.output3D'+axis.lower(), twistJnt+'.rotateX', force=True )
+            Nodes += [ startMult, endMult, add ]
+
+        print( '========================= matrix twist '+side+joint+': %d joints, %d nodes' % ( count, len(Nodes) ) )
+        AllJnts += TwistJnts
+        AllNodes += Nodes
+
+    # the den twist controls drive nothing any more
+    for ctrl in cmds.ls( Ctrls, type='transform' ) or []:
+        cmds.setAttr( ctrl+'.visibility', False )
+        for attr in TransformAttrs+[ 'visibility' ]:
+            cmds.setAttr( ctrl+'.'+attr, lock=True, keyable=False, channelBox=False )
+
+    return [ AllJnts, AllNodes ]
+
+
+# ---------------------------------------------------------------------------------------
+# combined proxy geometry
+# den_connectProxyGeo leaves one '<joint>_Mesh' per bind joint, this merges them into one mesh
+# with one rigid skinCluster so the proxy layer is a single shape and a single deformer
+
+def quad_combineProxyGeo( Jnts=[], name='Proxy_Combined_Geo', parent='Proxies_Grp' ):
+    '''
+    Merge the '<joint>_Mesh' proxy of every joint into one mesh under parent, every shell skinned
+    fully to its own joint. The pieces are hidden but kept for the weight transfer.
+    Returns [ mesh, skinCluster, Jnts ] where Jnts are the joints that have a proxy.
+    '''
+    startTime = time.time()
+    Pairs = [ ( jnt, jnt.replace( '_Jnt', '_Mesh' ) ) for jnt in Jnts ]
+    Pairs = [ ( jnt, mesh ) for jnt, mesh in Pairs if mesh != jnt and cmds.objExists( mesh ) ]
+    if not Pairs:
+        raise RuntimeError( 'none of the joints has a matching _Mesh proxy' )
+
+    Copies = []
+    Counts = []
+    for jnt, mesh in Pairs:
+        copy = cmds.duplicate( mesh, name=mesh+'_Combine', rr=True )[0]
+        cmds.delete( cmds.listRelatives( copy, type='constraint', fullPath=True ) or [] )
+        for attr in [ 'tx','ty','tz','rx','ry','rz','sx','sy','sz','v' ]:
+            cmds.setAttr( copy+'.'+attr, lock=False )
+        if cmds.listRelatives( copy, parent=True ):
+            copy = cmds.parent( copy, world=True )[0]
+        Copies.append( copy )
+        Counts.append( cmds.polyEvaluate( copy, vertex=True ) )
+        cmds.setAttr( mesh+'.visibility', 0 )
+
+    mesh = cmds.polyUnite( Copies, name=name, ch=False, mergeUVSets=True )[0]
+    cmds.delete( [ copy for copy in Copies if cmds.objExists( copy ) ] )
+    if parent and cmds.objExists( parent ):
+        mesh = cmds.parent( mesh, parent )[0]
+
+    # rigid weights, the vertices of each shell are one consecutive range in polyUnite order
+    InfJnts = [ jnt for jnt, piece in Pairs ]
+    skin = cmds.skinCluster( InfJnts, mesh, tsb=True, mi=1, name=name+'_skinCluster' )[0]
+    selection = om.MSelectionList()
+    selection.add( mesh )
+    selection.add( skin )
+    meshPath = selection.getDagPath( 0 )
+    skinFn = oma.MFnSkinCluster( selection.getDependNode( 1 ) )
+    InfIndex = { path.partialPathName(): index for index, path in enumerate( skinFn.influenceObjects() ) }
+    first = 0
+    for jnt, count in zip( InfJnts, Counts ):
+        componentFn = om.MFnSingleIndexedComponent()
+        component = componentFn.create( om.MFn.kMeshVertComponent )
+        componentFn.addElements( list( range( first, first+count ) ) )
+        skinFn.setWeights( meshPath, component, om.MIntArray( [ InfIndex[ cmds.ls( jnt )[0] ] ] ), om.MDoubleArray( count, 1.0 ), True )
+        first += count
+
+    print( '========================= combined %d proxies into %s (%d vertices) in %.2f sec' % ( len(Pairs), mesh, first, time.time()-startTime ) )
+    return [ mesh, skin, InfJnts ]
+
+
+# ---------------------------------------------------------------------------------------
+# bulk safety covers
+# locks and hides the channels animators must not touch on every registered control and gut node
+# in one pass at the end of the build, instead of one den_AddSafetyCovers call per rig group
+
+TransformAttrs = [ 'translateX', 'translateY', 'translateZ', 'rotateX', 'rotateY', 'rotateZ', 'scaleX', 'scaleY', 'scaleZ' ]
+
+# each rule: the registry field it covers, fnmatch patterns of nodes it skips, the attributes it sets
+# and the lock / keyable / channel box state they get; later rules win on the same plug
+SafetyCoverRules = [
+    { 'field':'Ctrls', 'exclude':[], 'attrs':[ 'visibility' ], 'lock':True, 'keyable':False, 'channelBox':False },
+    { 'field':'Ctrls', 'exclude':[ '*All*', '*Base*' ], 'attrs':[ 'scaleX', 'scaleY', 'scaleZ' ], 'lock':True, 'keyable':False, 'channelBox':False },
+    { 'field':'Guts', 'exclude':[], 'attrs':TransformAttrs+[ 'visibility' ], 'lock':True, 'keyable':False, 'channelBox':False },
+    ]
+
+
+def quad_safetyCoverStates( registry={}, rules=SafetyCoverRules ):
+    '''resolve the rules against the registry, returns { 'node.attr': ( lock, keyable, channelBox ) } for the plugs that exist'''
+    States = {}
+    for rule in rules:
+        for node in quad_registryNodes( registry=registry, field=rule['field'] ):
+            if any( fnmatch.fnmatchcase( node, pattern ) for pattern in rule['exclude'] ) or not cmds.objExists( node ):
+                continue
+            for attr in rule['attrs']:
+                States[node+'.'+attr] = ( rule['lock'], rule['keyable'], rule['channelBox'] )
+    return States
+
+
+def quad_applySafetyCovers( registry={}, rules=SafetyCoverRules ):
+    '''
+    Apply the safety cover rules to every control and gut node of the registry in one pass. Every
+    node is looked up once and the flags are set straight on its plugs, no command per attribute.
+    Channels that are already locked stay locked. The plug flags are set through the API, outside
+    any command, so the pass can not be undone; run it at the end of a build or on a saved scene.
+    Returns the number of plugs covered.
+    '''
+    startTime = time.time()
+    States = quad_safetyCoverStates( registry=registry, rules=rules )
+    Nodes = {}
+    count = 0
+    for name, ( lock, keyable, channelBox ) in States.items():
+        node, attr = name.split( '.', 1 )
+        if node not in Nodes:
+            selection = om.MSelectionList()
+            selection.add( node )
+            Nodes[node] = om.MFnDependencyNode( selection.getDependNode( 0 ) )
+        if not Nodes[node].hasAttribute( attr ):
+            continue
+        plug = Nodes[node].findPlug( attr, False )
+        # keyable and channel box first, Maya refuses to change them on some locked plugs
+        plug.isKeyable = keyable
+        plug.isChannelBox = channelBox and not keyable
+        plug.isLocked = lock or plug.isLocked
+        count += 1
+    print( '========================= safety covers on %d plugs of %d nodes in %.2f ms' % ( count, len(Nodes), ( time.time()-startTime ) * 1000.0 ) )
+    return count
+
+
+# ---------------------------------------------------------------------------------------
+# control shapes
+# normalized CV arrays for each control style, created straight through MFnNurbsCurve with the
+# points already scaled (no curve command, no rescale afterwards); shapes of same-style controls
+# can be captured once and shared as instances, so there are fewer shape nodes to draw
+
+def quad_circleCurve( count=8 ):
+    '''a periodic cubic circle of radius 1 in the YZ plane (the den_* controls face down X)'''
+    Points = [ ( 0.0, math.cos( 2*math.pi*i/count ), math.sin( 2*math.pi*i/count ) ) for i in range( count ) ]
+    return { 'points': Points + Points[:3], 'knots': [ float(k) for k in range( -2, count+3 ) ], 'degree': 3, 'form': 'periodic' }
+
+
+def quad_polyCurve( Points=[] ):
+    '''a linear curve through Points'''
+    return { 'points': list( Points ), 'knots': [ float(k) for k in range( len(Points) ) ], 'degree': 1, 'form': 'open' }
+
+
+# every style is a list of curves, all points within radius 1
+CtrlShapeLibrary = {
+    'circle': [ quad_circleCurve() ],
+    'square': [ quad_polyCurve( [ (0,1,1), (0,1,-1), (0,-1,-1), (0,-1,1), (0,1,1) ] ) ],
+    'cube': [ quad_polyCurve( [ (-1,1,1), (1,1,1), (1,1,-1), (-1,1,-1), (-1,1,1), (-1,-1,1), (1,-1,1), (1,1,1), (1,-1,1),
+                                (1,-1,-1), (1,1,-1), (1,-1,-1), (-1,-1,-1), (-1,1,-1), (-1,-1,-1), (-1,-1,1) ] ) ],
+    'diamond': [ quad_polyCurve( [ (0,1,0), (0,0,1), (0,-1,0), (0,0,-1), (0,1,0) ] ) ],
+    'sphere': [ dict( quad_circleCurve(), points=[ (y, x, z) for x, y, z in quad_circleCurve()['points'] ] ),
+                dict( quad_circleCurve(), points=[ (y, z, x) for x, y, z in quad_circleCurve()['points'] ] ),
+                quad_circleCurve() ],
+    }
+
+
+def quad_ctrlShapes( ctrl='' ):
+    '''the nurbsCurve shapes of ctrl (intermediate shapes left out)'''
+    return cmds.listRelatives( ctrl, shapes=True, type='nurbsCurve', noIntermediate=True, fullPath=True ) or []
+
+
+def quad_captureCtrlShape( ctrl='' ):
+    '''
+    The curves of an existing control as a shape style, points divided by the control's radius.
+    Returns [ Curves, radius ], quad_makeCtrlShape with that radius gives back the same size.
+    '''
+    Curves = []
+    for shape in quad_ctrlShapes( ctrl ):
+        selection = om.MSelectionList()
+        selection.add( shape )
+        curveFn = om.MFnNurbsCurve( selection.getDagPath( 0 ) )
+        Curves.append( { 'points': [ ( p.x, p.y, p.z ) for p in curveFn.cvPositions( om.MSpace.kObject ) ],
+                         'knots': list( curveFn.knots() ), 'degree': curveFn.degree,
+                         'form': { om.MFnNurbsCurve.kOpen:'open', om.MFnNurbsCurve.kClosed:'closed' }.get( curveFn.form, 'periodic' ) } )
+    radius = max( [ sum( v*v for v in point ) ** 0.5 for curve in Curves for point in curve['points'] ] or [ 1.0 ] ) or 1.0
+    for curve in Curves:
+        curve['points'] = [ tuple( v/radius for v in point ) for point in curve['points'] ]
+    return [ Curves, radius ]
+
+
+def quad_makeCtrlShape( ctrl='', style='circle', radius=1.0, Curves=None ):
+    '''
+    Add the curves of a library style (or captured Curves) scaled by radius as shapes of ctrl,
+    each made by one MFnNurbsCurve.create call. Returns the new shape names.
+    '''
+    Curves = Curves if Curves is not None else CtrlShapeLibrary[style]
+    selection = om.MSelectionList()
+    selection.add( ctrl )
+    parent = selection.getDependNode( 0 )
+    Forms = { 'open': om.MFnNurbsCurve.kOpen, 'closed': om.MFnNurbsCurve.kClosed, 'periodic': om.MFnNurbsCurve.kPeriodic }
+    Shapes = []
+    for index, curve in enumerate( Curves ):
+        Points = om.MPointArray( [ om.MPoint( x*radius, y*radius, z*radius ) for x, y, z in curve['points'] ] )
+        curveFn = om.MFnNurbsCurve()
+        shape = curveFn.create( Points, om.MDoubleArray( curve['knots'] ), curve['degree'], Forms[curve['form']], False, False, parent )
+        shapeFn = om.MFnDagNode( shape )
+        shapeFn.setName( ctrl.split( '|' )[-1]+'Shape'+( str(index) if index else '' ) )
+        Shapes.append( shapeFn.fullPathName() )
+    return Shapes
+
+
+def quad_copyShapeOverrides( source='', Shapes=[] ):
+    '''give Shapes the visibility and drawing overrides (and their incoming connections, e.g. Ctrl_Color) of source'''
+    for attr in [ 'visibility', 'overrideEnabled', 'overrideColor', 'overrideRGBColors', 'overrideColorRGB' ]:
+        if not cmds.attributeQuery( attr, node=source, exists=True ):
+            continue
+        Inputs = cmds.listConnections( source+'.'+attr, s=True, d=False, plugs=True ) or []
+        for shape in Shapes:
+            if Inputs:
+                cmds.connectAttr( Inputs[0], shape+'.'+attr, force=True )
+            elif attr != 'overrideColorRGB':
+                cmds.setAttr( shape+'.'+attr, cmds.getAttr( source+'.'+attr ) )
+
+
+def quad_shareCtrlShapes( Ctrls=[], style='captured' ):
+    '''
+    Replace the shapes of Ctrls with one set of shapes instanced under all of them, a CtrlShapeLibrary
+    style or with 'captured' the curves of the first control, at the size of the first control.
+    Drawing overrides are taken from its old shapes. Old shapes are deleted with one MDagModifier.
+    Returns [ Shapes, deleted ].
+    '''
+    startTime = time.time()
+    Ctrls = [ ctrl for ctrl in Ctrls if cmds.objExists( ctrl ) ]
+    if not Ctrls:
+        return [ [], 0 ]
+    Curves, radius = quad_captureCtrlShape( Ctrls[0] )
+    if style != 'captured':
+        Curves = CtrlShapeLibrary[style]
+    Old = { ctrl: quad_ctrlShapes( ctrl ) for ctrl in Ctrls }
+    Shapes = quad_makeCtrlShape( ctrl=Ctrls[0], radius=radius, Curves=Curves )
+    if Old[Ctrls[0]]:
+        quad_copyShapeOverrides( source=Old[Ctrls[0]][0], Shapes=Shapes )
+
+    modifier = om.MDagModifier()
+    deleted = 0
+    for ctrl in Ctrls:
+        for shape in Old[ctrl]:
+            selection = om.MSelectionList()
+            selection.add( shape )
+            modifier.deleteNode( selection.getDependNode( 0 ) )
+            deleted += 1
+    modifier.doIt()
+
+    for ctrl in Ctrls[1:]:
+        selection = om.MSelectionList()
+        selection.add( ctrl )
+        ctrlFn = om.MFnDagNode( selection.getDependNode( 0 ) )
+        for shape in Shapes:
+            shapeSelection = om.MSelectionList()
+            shapeSelection.add( shape )
+            ctrlFn.addChild( shapeSelection.getDependNode( 0 ), om.MFnDagNode.kNextPos, True )
+    print( '========================= %d controls share %d shapes (%d deleted) in %.2f ms'
+           % ( len(Ctrls), len(Shapes), deleted, ( time.time()-startTime ) * 1000.0 ) )
+    return [ Shapes, deleted ]
+
+
+def quad_shareModuleCtrlShapes( registry={}, Styles={} ):
+    '''
+    Share control shapes across the registered modules matching the patterns of Styles (fnmatch on the
+    module key: CtrlShapeLibrary style or 'captured'), one shared set per pattern and side so L_ and R_
+    controls keep their own colors. Returns { (pattern, side): [ Shapes, deleted ] }.
+    '''
+    Shared = {}
+    for pattern, style in Styles.items():
+        Keys = [ key for key in registry if fnmatch.fnmatchcase( key, pattern ) ]
+        for side in list( MirrorSides ) + [ '' ]:
+            SideKeys = [ key for key in Keys if ( key.startswith( side ) if side else not key.startswith( MirrorSides ) ) ]
+            if SideKeys:
+                Shared[( pattern, side )] = quad_shareCtrlShapes( Ctrls=quad_registryNodes( registry=registry, field='Ctrls', keys=SideKeys ), style=style )
+    return Shared
+
+
+# ---------------------------------------------------------------------------------------
+# scene optimizer
+# post-build clean-up by graph analysis: utility nodes and constraints that drive nothing, back to back
+# unitConversion pairs that cancel out, unused orig shapes and identity transforms with nothing on them;
+# the pivot hierarchy is only needed to rebuild and goes when publishing
+
+# DG utility types the optimizer may delete when nothing downstream uses them; conditions and anim curves
+# are left alone, switches wire their outputs later (the dynamics cache) and keys belong to the user
+UtilityNodeTypes = [ 'unitConversion', 'multiplyDivide', 'plusMinusAverage', 'addDoubleLinear', 'multDoubleLinear',
+                     'reverse', 'clamp', 'setRange', 'remapValue', 'blendColors', 'blendTwoAttr', 'pairBlend', 'choice',
+                     'multMatrix', 'decomposeMatrix', 'composeMatrix', 'inverseMatrix', 'pickMatrix', 'blendMatrix', 'aimMatrix',
+                     'wtAddMatrix', 'holdMatrix', 'quatToEuler', 'eulerToQuat', 'quatSlerp', 'quatInvert', 'quatProd',
+                     'distanceBetween', 'vectorProduct', 'curveInfo', 'pointOnCurveInfo' ]
+# consumers that do not keep a node alive
+IgnoredConsumerTypes = [ 'nodeGraphEditorInfo', 'hyperLayout', 'objectSet' ]
+
+
+def quad_registryNames( value=None ):
+    '''every node name stored anywhere in a registry (entries, lists and dicts of names)'''
+    if isinstance( value, str ):
+        return [ value ]
+    Names = []
+    for item in ( value.values() if isinstance( value, dict ) else value if isinstance( value, (list,tuple) ) else [] ):
+        Names += quad_registryNames( item )
+    return Names
+
+
+def quad_optimizable( Nodes=[], Protected=set() ):
+    '''Nodes without the protected, referenced, locked and default ones'''
+    Skip = set( Protected ) | set( cmds.ls( referencedNodes=True ) or [] ) | set( cmds.ls( defaultNodes=True ) or [] )
+    return [ node for node in Nodes if node not in Skip and not cmds.lockNode( node, q=True, lock=True )[0] ]
+
+
+def quad_consumers( node='' ):
+    '''the nodes reading from node, leaving out editor bookkeeping and sets'''
+    Consumers = set( cmds.listConnections( node, s=False, d=True ) or [] )
+    Consumers.discard( node )
+    Ignored = set( cmds.ls( list( Consumers ), type=IgnoredConsumerTypes ) or [] ) if Consumers else set()
+    return Consumers - Ignored
+
+
+def quad_findDeadNodes( Protected=set() ):
+    '''
+    Utility nodes whose outputs never reach a node outside the utility network (a transform, shape,
+    deformer...). A node is live when it feeds such a node directly or feeds a live utility node.
+    '''
+    Nodes = []
+    for nodeType in UtilityNodeTypes:
+        try:
+            Nodes += cmds.ls( type=nodeType ) or []
+        except RuntimeError:
+            # type not in this Maya version
+            pass
+    Candidates = set( quad_optimizable( Nodes=list( set( Nodes ) ), Protected=Protected ) )
+
+    Live = []
+    Upstream = {}
+    for node in Candidates:
+        Consumers = quad_consumers( node )
+        if Consumers - Candidates:
+            Live.append( node )
+        for consumer in Consumers & Candidates:
+            Upstream.setdefault( consumer, [] ).append( node )
+    seen = set( Live )
+    while Live:
+        for node in Upstream.get( Live.pop(), [] ):
+            if node not in seen:
+                seen.add( node )
+                Live.append( node )
+    return sorted( Candidates - seen )
+
+
+def quad_findRedundantConstraints( Protected=set() ):
+    '''
+    Returns [ Dead, Duplicates ]: constraints that drive nothing, and pairs of constraints of the same
+    type with the same targets on the same driven node, or with the same sided targets on L_/R_ partner
+    nodes (a right side module following the left side driver; center targets like Spine03_Jnt are
+    shared by both sides on purpose). The second one is reported, not deleted.
+    '''
+    Dead = []
+    Duplicates = []
+    Seen = {}
+    for constraint in quad_optimizable( Nodes=cmds.ls( type='constraint' ) or [], Protected=Protected ):
+        Driven = sorted( quad_consumers( constraint ) )
+        if not Driven:
+            Dead.append( constraint )
+            continue
+        Targets = set( cmds.listConnections( constraint+'.target', s=True, d=False ) or [] )
+        Targets.discard( constraint )
+        signature = ( cmds.nodeType( constraint ), tuple( sorted( Targets ) ), tuple( Driven ) )
+        mirrored = signature[:2] + ( tuple( sorted( quad_mirrorName( node ) for node in Driven ) ), )
+        if signature in Seen:
+            Duplicates.append( [ Seen[signature], constraint ] )
+        elif mirrored != signature and mirrored in Seen and any( quad_mirrorName( target ) != target for target in Targets ):
+            Duplicates.append( [ Seen[mirrored], constraint ] )
+        Seen.setdefault( signature, constraint )
+    return [ Dead, Duplicates ]
+
+
+def quad_collapseUnitConversions( Protected=set() ):
+    '''connect straight through unitConversion pairs whose factors cancel out, returns the deleted nodes'''
+    Deleted = []
+    for first in quad_optimizable( Nodes=cmds.ls( type='unitConversion' ) or [], Protected=Protected ):
+        if first in Deleted or not cmds.objExists( first ):
+            continue
+        Sources = cmds.listConnections( first+'.input', s=True, d=False, plugs=True, skipConversionNodes=False ) or []
+        Next = cmds.listConnections( first+'.output', s=False, d=True, skipConversionNodes=False ) or []
+        if len( Sources ) != 1 or len( set( Next ) ) != 1 or cmds.nodeType( Next[0] ) != 'unitConversion' or Next[0] in Protected:
+            continue
+        second = Next[0]
+        if abs( cmds.getAttr( first+'.conversionFactor' ) * cmds.getAttr( second+'.conversionFactor' ) - 1.0 ) > 1e-9:
+            continue
+        Destinations = cmds.listConnections( second+'.output', s=False, d=True, plugs=True, skipConversionNodes=False ) or []
+        cmds.delete( first, second )
+        for plug in Destinations:
+            cmds.connectAttr( Sources[0], plug, force=True )
+        Deleted += [ first, second ]
+    return Deleted
+
+
+def quad_findUnusedOrigShapes( Protected=set() ):
+    '''intermediate shapes nothing reads from (orig shapes left by removed deformers)'''
+    Shapes = cmds.ls( type='shape', intermediateObjects=True, long=True ) or []
+    return [ shape for shape in quad_optimizable( Nodes=Shapes, Protected=Protected ) if not quad_consumers( shape ) ]
+
+
+def quad_findIdentityTransforms( registry={}, Protected=set() ):
+    '''
+    Plain transforms below the registered rig groups that can go without changing anything below them:
+    identity local matrix, no shapes, no connections, no extra attributes, visible and inheriting, and no
+    child name clashing under the parent. Model and layout groups outside the rig are never candidates.
+    '''
+    Groups = [ entry['RigGrp'] for entry in registry.values() if 'RigGrp' in entry and cmds.objExists( entry['RigGrp'] ) ]
+    Descendants = cmds.listRelatives( Groups, ad=True, fullPath=True ) if Groups else []
+    Candidates = cmds.ls( Descendants or [], type='transform', exactType=True, long=True ) or []
+    Found = []
+    for node in quad_optimizable( Nodes=sorted( set( Candidates ) ), Protected=Protected ):
+        if node.split( '|' )[-1] in Protected or cmds.listRelatives( node, shapes=True ) or cmds.listConnections( node ):
+            continue
+        if cmds.listAttr( node, userDefined=True ) or not cmds.getAttr( node+'.visibility' ) or not cmds.getAttr( node+'.inheritsTransform' ):
+            continue
+        selection = om.MSelectionList()
+        selection.add( node )
+        if not om.MFnTransform( selection.getDagPath( 0 ) ).transformation().asMatrix().isEquivalent( om.MMatrix.kIdentity, 1e-9 ):
+            continue
+        Parent = cmds.listRelatives( node, parent=True, fullPath=True ) or []
+        Siblings = cmds.listRelatives( Parent[0], children=True ) if Parent else cmds.ls( assemblies=True )
+        Children = cmds.listRelatives( node, children=True ) or []
+        if set( Children ) & set( Siblings or [] ):
+            continue
+        Found.append( node )
+    return Found
+
+
+def quad_deletePivots( pivotGroup='' ):
+    '''delete the pivot hierarchy, refusing when anything outside it still reads from a pivot'''
+    Nodes = set( cmds.ls( [ pivotGroup ] + ( cmds.listRelatives( pivotGroup, allDescendents=True, fullPath=True ) or [] ) ) )
+    Outside = sorted( set( consumer for node in Nodes for consumer in quad_consumers( node ) ) - Nodes )
+    if Outside:
+        raise RuntimeError( 'pivots still drive '+', '.join( Outside[:10] )+', not deleting '+pivotGroup )
+    cmds.delete( pivotGroup )
+    return len( Nodes )
+
+
+def quad_optimizeScene( registry={}, deletePivots=False ):
+    '''
+    Run every clean-up pass on the built rig. Nodes named in the registry are never touched;
+    with deletePivots the pivot group recorded as registry['Base']['PivGrp'] is deleted first.
+    Returns a report { pass: count, 'nodesBefore', 'nodesAfter', 'duplicateConstraints' }.
+    '''
+    startTime = time.time()
+    Report = { 'nodesBefore': len( cmds.ls() ) }
+    pivotGroup = registry.get( 'Base', {} ).get( 'PivGrp' )
+    pivotGroup = pivotGroup[0] if isinstance( pivotGroup, (list,tuple) ) else pivotGroup
+    Report['pivots'] = 0
+    if deletePivots and pivotGroup and cmds.objExists( pivotGroup ):
+        Report['pivots'] = quad_deletePivots( pivotGroup=pivotGroup )
+        registry['Base'].pop( 'PivGrp' )
+    Protected = set( quad_registryNames( registry ) )
+
+    Dead, Duplicates = quad_findRedundantConstraints( Protected=Protected )
+    if Dead:
+        cmds.delete( Dead )
+    Report['deadConstraints'] = len( Dead )
+    Report['duplicateConstraints'] = Duplicates
+    for first, second in Duplicates:
+        print( 'duplicate constraint: '+second+' repeats '+first )
+
+    Report['unitConversions'] = len( quad_collapseUnitConversions( Protected=Protected ) )
+
+    Shapes = quad_findUnusedOrigShapes( Protected=Protected )
+    if Shapes:
+        cmds.delete( Shapes )
+    Report['origShapes'] = len( Shapes )
+
+    # deepest first, so every removal leaves the children right under the next transform up
+    Transforms = sorted( quad_findIdentityTransforms( registry=registry, Protected=Protected ), key=lambda node: -node.count( '|' ) )
+    for node in Transforms:
+        Parent = cmds.listRelatives( node, parent=True, fullPath=True ) or []
+        Children = cmds.listRelatives( node, children=True, fullPath=True ) or []
+        if Children:
+            if Parent:
+                cmds.parent( Children, Parent[0], relative=True )
+            else:
+                cmds.parent( Children, world=True, relative=True )
+        cmds.delete( node )
+    Report['identityTransforms'] = len( Transforms )
+
+    # last, the passes above can leave more of the utility network unused
+    DeadNodes = quad_findDeadNodes( Protected=Protected )
+    if DeadNodes:
+        cmds.delete( DeadNodes )
+    Report['deadNodes'] = len( DeadNodes )
+
+    Report['nodesAfter'] = len( cmds.ls() )
+    print( '========================= optimized the scene from %d to %d nodes in %.2f sec: %s'
+           % ( Report['nodesBefore'], Report['nodesAfter'], time.time()-startTime,
+               ', '.join( '%d %s' % ( Report[key], key ) for key in [ 'pivots', 'deadConstraints', 'unitConversions', 'origShapes', 'identityTransforms', 'deadNodes' ] ) ) )
+    return Report
@@ -0,0 +1,171 @@
+# ---------------------------------------------------------------------------------------
+# Quad_CrowdClipNode
+# Clip player node for the crowd rig of the Quadruped Auto-Rig Tool
+#
+# ---------------------------------------------------------------------------------------
+# A Maya plugin with one node, quadClipPlayer, that plays a joint clip written by
+# Quad_ExportTools.quad_exportClip onto a bind skeleton: one node drives every joint of a
+# crowd instance, with its own time offset and speed. The decoded clip is kept once per file
+# and shared by every player in the scene.
+#
+# Needs NumPy (ships with mayapy 2022+, otherwise pip install it into Maya's Python).
+#
+# Load it with Quad_CrowdTools.quad_loadClipPlugin(), or:
+#     cmds.loadPlugin( 'Quad_CrowdClipNode.py' )
+# ---------------------------------------------------------------------------------------
+# (c) 2025 by Arrow Lyu. All rights reserved. For portfolio and educational use only.
+# ---------------------------------------------------------------------------------------
+
+
+import os
+
+import maya.api.OpenMaya as om
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def maya_useNewAPI():
+    '''this plugin uses the Python API 2.0'''
+    pass
+
+
+NodeName = 'quadClipPlayer'
+# an id from the range Autodesk keeps for local development, swap it for a registered one before shipping
+NodeId = om.MTypeId( 0x0007F4C1 )
+
+# decoded clips shared by every player: path -> [ modified time, fps, Quats, Translates ] (float32)
+ClipCache = {}
+
+
+def quad_quatToEuler( Quats=None ):
+    '''
+    xyz rotate order euler angles in radians (... x 3) of quaternions (x, y, z, w), for joints with
+    zero jointOrient and rotateAxis; matches the row-vector matrices the quaternions came from
+    '''
+    x, y, z, w = Quats[..., 0], Quats[..., 1], Quats[..., 2], Quats[..., 3]
+    # column-vector rotation matrix entries, R = Rz * Ry * Rx
+    r00 = 1.0 - 2.0 * ( y*y + z*z )
+    r10 = 2.0 * ( x*y + w*z )
+    r20 = 2.0 * ( x*z - w*y )
+    r21 = 2.0 * ( y*z + w*x )
+    r22 = 1.0 - 2.0 * ( x*x + y*y )
+    return np.stack( [ np.arctan2( r21, r22 ), np.arcsin( np.clip( -r20, -1.0, 1.0 ) ), np.arctan2( r10, r00 ) ], axis=-1 )
+
+
+def quad_cachedClip( path='' ):
+    '''the decoded clip at path, read again only when the file changed'''
+    modified = os.path.getmtime( path )
+    if path not in ClipCache or ClipCache[path][0] != modified:
+        import Quad_ExportTools as quadET
+        Names, Parents, Quats, Translates = quadET.quad_readClip( path )
+        with open( path, 'rb' ) as handle:
+            fps = np.frombuffer( handle.read( 10 ), dtype='<f4', count=1, offset=6 )[0]
+        ClipCache[path] = [ modified, float( fps ), Quats.astype( np.float32 ), Translates.astype( np.float32 ) ]
+    return ClipCache[path]
+
+
+def quad_samplePose( Quats=None, Translates=None, frame=0.0, cycle=True ):
+    '''local rotations (euler, radians) and translations of every joint at a fractional clip frame'''
+    frames = len( Quats )
+    if cycle:
+        frame = frame % frames
+    else:
+        frame = min( max( frame, 0.0 ), frames - 1.0 )
+    first = int( frame )
+    second = ( first + 1 ) % frames if cycle else min( first + 1, frames - 1 )
+    t = frame - first
+    # nlerp on the nearer hemisphere, close enough to slerp between neighbouring frames
+    sign = np.where( np.sum( Quats[first] * Quats[second], axis=-1, keepdims=True ) < 0.0, -1.0, 1.0 )
+    Rotation = Quats[first] * ( 1.0 - t ) + Quats[second] * sign * t
+    Rotation /= np.linalg.norm( Rotation, axis=-1, keepdims=True )
+    return [ quad_quatToEuler( Rotation ), Translates[first] * ( 1.0 - t ) + Translates[second] * t ]
+
+
+class QuadClipPlayer( om.MPxNode ):
+    '''plays one clip onto output[joint].outTranslate / outRotate, time in seconds times the clip fps, plus offset frames'''
+
+    aTime = None
+    aClipFile = None
+    aOffset = None
+    aSpeed = None
+    aCycle = None
+    aOutput = None
+    aOutTranslate = None
+    aOutRotate = None
+
+    def __init__( self ):
+        om.MPxNode.__init__( self )
+
+    @staticmethod
+    def creator():
+        return QuadClipPlayer()
+
+    @staticmethod
+    def initialize():
+        unitFn = om.MFnUnitAttribute()
+        numericFn = om.MFnNumericAttribute()
+        typedFn = om.MFnTypedAttribute()
+        compoundFn = om.MFnCompoundAttribute()
+
+        QuadClipPlayer.aTime = unitFn.create( 'time', 'tm', om.MFnUnitAttribute.kTime, 0.0 )
+        QuadClipPlayer.aClipFile = typedFn.create( 'clipFile', 'cf', om.MFnData.kString )
+        typedFn.usedAsFilename = True
+        QuadClipPlayer.aOffset = numericFn.create( 'offset', 'of', om.MFnNumericData.kDouble, 0.0 )
+        numericFn.keyable = True
+        QuadClipPlayer.aSpeed = numericFn.create( 'speed', 'sp', om.MFnNumericData.kDouble, 1.0 )
+        numericFn.keyable = True
+        QuadClipPlayer.aCycle = numericFn.create( 'cycle', 'cy', om.MFnNumericData.kBoolean, True )
+        Inputs = [ QuadClipPlayer.aTime, QuadClipPlayer.aClipFile, QuadClipPlayer.aOffset, QuadClipPlayer.aSpeed, QuadClipPlayer.aCycle ]
+
+        Children = []
+        for name, short, unit in [ ( 'outTranslate', 'otr', om.MFnUnitAttribute.kDistance ), ( 'outRotate', 'oro', om.MFnUnitAttribute.kAngle ) ]:
+            Axes = [ unitFn.create( name+axis, short+axis.lower(), unit, 0.0 ) for axis in 'XYZ' ]
+            Children.append( numericFn.create( name, short, *Axes ) )
+            numericFn.writable = False
+            numericFn.storable = False
+        QuadClipPlayer.aOutTranslate, QuadClipPlayer.aOutRotate = Children
+        QuadClipPlayer.aOutput = compoundFn.create( 'output', 'out' )
+        for child in Children:
+            compoundFn.addChild( child )
+        compoundFn.array = True
+        compoundFn.usesArrayDataBuilder = True
+        compoundFn.writable = False
+        compoundFn.storable = False
+
+        for attr in Inputs + [ QuadClipPlayer.aOutput ]:
+            QuadClipPlayer.addAttribute( attr )
+        for attr in Inputs:
+            for output in [ QuadClipPlayer.aOutput ] + Children:
+                QuadClipPlayer.attributeAffects( attr, output )
+
+    def compute( self, plug, data ):
+        if plug.attribute() not in ( QuadClipPlayer.aOutput, QuadClipPlayer.aOutTranslate, QuadClipPlayer.aOutRotate ):
+            return None
+        path = data.inputValue( QuadClipPlayer.aClipFile ).asString()
+        outputHandle = data.outputArrayValue( QuadClipPlayer.aOutput )
+        if path and os.path.isfile( path ):
+            fps, Quats, Translates = quad_cachedClip( path )[1:]
+            seconds = data.inputValue( QuadClipPlayer.aTime ).asTime().asUnits( om.MTime.kSeconds )
+            frame = seconds * fps * data.inputValue( QuadClipPlayer.aSpeed ).asDouble() + data.inputValue( QuadClipPlayer.aOffset ).asDouble()
+            Rotates, Positions = quad_samplePose( Quats=Quats, Translates=Translates, frame=frame, cycle=data.inputValue( QuadClipPlayer.aCycle ).asBool() )
+            builder = outputHandle.builder()
+            for joint in range( len( Rotates ) ):
+                element = builder.addElement( joint )
+                element.child( QuadClipPlayer.aOutTranslate ).set3Double( *[ float( value ) for value in Positions[joint] ] )
+                element.child( QuadClipPlayer.aOutRotate ).set3Double( *[ float( value ) for value in Rotates[joint] ] )
+            outputHandle.set( builder )
+        outputHandle.setAllClean()
+        data.setClean( plug )
+
+
+def initializePlugin( plugin ):
+    if np is None:
+        raise RuntimeError( 'Quad_CrowdClipNode needs NumPy, install it with: mayapy -m pip install numpy' )
+    om.MFnPlugin( plugin, 'Arrow Lyu', '1.0' ).registerNode( NodeName, NodeId, QuadClipPlayer.creator, QuadClipPlayer.initialize )
+
+
+def uninitializePlugin( plugin ):
+    om.MFnPlugin( plugin ).deregisterNode( NodeId )
@@ -0,0 +1,225 @@
+# ---------------------------------------------------------------------------------------
+# Quad_CrowdTools
+# Crowd helpers for the Quadruped Auto-Rig Tool
+#
+# ---------------------------------------------------------------------------------------
+# Makes a lightweight crowd asset from a built rig: only the bind skeleton and the skinned
+# meshes, with every joint driven by one quadClipPlayer node (Quad_CrowdClipNode plugin) that
+# plays clips written by Quad_ExportTools.quad_exportClip. Herds are made by referencing the
+# asset many times, each instance with its own clip, time offset and speed.
+#
+# Needs NumPy (ships with mayapy 2022+, otherwise pip install it into Maya's Python).
+#
+# Import it the same way as the den_* modules:
+#     import Quad_CrowdTools as quadCT
+#     importlib.reload(quadCT)
+# ---------------------------------------------------------------------------------------
+# (c) 2025 by Arrow Lyu. All rights reserved. For portfolio and educational use only.
+# ---------------------------------------------------------------------------------------
+
+
+import os
+import random
+import time
+
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+import maya.api.OpenMayaAnim as oma
+
+import Quad_BuildTools as quadBT
+import Quad_AnimTools as quadAT
+import Quad_ExportTools as quadET
+import Quad_PerfTools as quadPT
+import Quad_PublishTools as quadPB
+import Quad_CrowdClipNode as quadCN
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# crowd nodes are made under this prefix next to the full rig and renamed once the rig is gone
+CrowdPrefix = 'crowdTmp_'
+
+
+def quad_loadClipPlugin():
+    '''load the quadClipPlayer plugin that sits next to this module'''
+    path = os.path.join( os.path.dirname( os.path.abspath( __file__ ) ), 'Quad_CrowdClipNode.py' )
+    if not cmds.pluginInfo( path, q=True, loaded=True ):
+        cmds.loadPlugin( path )
+    return path
+
+
+def quad_mObject( node='' ):
+    '''the MObject of node'''
+    selection = om.MSelectionList()
+    selection.add( node )
+    return selection.getDependNode( 0 )
+
+
+def quad_skinClusterOf( geo='' ):
+    '''the skinCluster deforming geo, None when it has none'''
+    Skins = cmds.ls( cmds.listHistory( geo, pruneDagObjects=True ) or [], type='skinCluster' )
+    return Skins[0] if Skins else None
+
+
+def quad_copySkin( sourceGeo='', targetGeo='', prefix=CrowdPrefix ):
+    '''
+    Skin targetGeo (same topology as sourceGeo) to the prefixed copies of the source influences and give
+    it the source weights, read and written in one getWeights / setWeights call each. Returns the skinCluster.
+    '''
+    sourceSkin = quad_skinClusterOf( sourceGeo )
+    Influences = cmds.skinCluster( sourceSkin, q=True, influence=True )
+    Missing = [ name for name in Influences if not cmds.objExists( prefix+name ) ]
+    if Missing:
+        raise RuntimeError( sourceGeo+' is skinned to joints the crowd skeleton does not have: '+', '.join( Missing[:10] ) )
+    targetSkin = cmds.skinCluster( [ prefix+name for name in Influences ], targetGeo, toSelectedBones=True, name=prefix+sourceGeo+'_Skin' )[0]
+
+    sourceFn = oma.MFnSkinCluster( quad_mObject( sourceSkin ) )
+    targetFn = oma.MFnSkinCluster( quad_mObject( targetSkin ) )
+    sourcePath = sourceFn.getPathAtIndex( 0 )
+    targetPath = targetFn.getPathAtIndex( 0 )
+    components = om.MFnSingleIndexedComponent().create( om.MFn.kMeshVertComponent )
+    om.MFnSingleIndexedComponent( components ).setCompleteData( om.MFnMesh( sourcePath ).numVertices )
+    Weights = sourceFn.getWeights( sourcePath, components )[0]
+
+    TargetNames = [ path.partialPathName() for path in targetFn.influenceObjects() ]
+    Indices = om.MIntArray( [ TargetNames.index( prefix+path.partialPathName() ) for path in sourceFn.influenceObjects() ] )
+    targetFn.setWeights( targetPath, components, Indices, Weights, False )
+    return targetSkin
+
+
+def quad_buildCrowdAsset( rigFile=None, crowdFile='', clipFile='', Geos=[ 'Body_Geo', 'Eyes_Geo' ] ):
+    '''
+    Open the saved build rigFile (or use the open, saved scene) and turn it into a crowd asset: a copy of
+    the bind skeleton (zero jointOrient, rest pose from the rig), copies of Geos skinned to it with the
+    rig's weights, and one quadClipPlayer playing clipFile onto every joint. Everything else is deleted
+    and the asset is saved as crowdFile, so the weights are stored once for every instance referencing it.
+    The player outputs follow the joint order of clipFile, every clip given to an instance later must be
+    exported with the same joints (the default, all bind joints).
+    Returns [ crowdFile, joints, nodes ].
+    '''
+    quadAT.quad_requireNumpy()
+    startTime = time.time()
+    rigFile, rigGroup, registry = quadPB.quad_openBuild( rigFile=rigFile, publishFile=crowdFile )
+    nodesBefore = len( cmds.ls() )
+    quad_loadClipPlugin()
+
+    # the rest pose of the bind joints, in the same local space the clips are written in
+    Names = quadET.quad_readClip( clipFile )[0]
+    Jnts = [ jnt for jnt in Names if cmds.objExists( jnt ) ]
+    if len( Jnts ) != len( Names ):
+        raise RuntimeError( clipFile+' has joints the rig does not have: '+', '.join( sorted( set( Names ) - set( Jnts ) )[:10] ) )
+    Parents = quadET.quad_jointParents( Jnts=Jnts )
+    Matrices = [ om.MFnDagNode( quad_mObject( jnt ) ).getPath().inclusiveMatrix() for jnt in Jnts ]
+    World = np.array( [ [ matrix[i] for i in range( 16 ) ] for matrix in Matrices ] )[None]
+    Quats, Translates = quadET.quad_localTransforms( World=World, Parents=Parents )
+    Rotates = np.degrees( quadCN.quad_quatToEuler( Quats[0] ) )
+
+    crowdGroup = cmds.createNode( 'transform', name=CrowdPrefix+'Crowd_Grp' )
+    Depths = [ 0 ] * len( Jnts )
+    for index in range( len( Jnts ) ):
+        parent = Parents[index]
+        while parent >= 0:
+            Depths[index] += 1
+            parent = Parents[parent]
+    CrowdJnts = [ None ] * len( Jnts )
+    for index in sorted( range( len( Jnts ) ), key=lambda index: Depths[index] ):
+        parent = CrowdJnts[Parents[index]] if Parents[index] >= 0 else crowdGroup
+        CrowdJnts[index] = cmds.createNode( 'joint', name=CrowdPrefix+Jnts[index], parent=parent )
+        cmds.setAttr( CrowdJnts[index]+'.translate', *Translates[0, index] )
+        cmds.setAttr( CrowdJnts[index]+'.rotate', *Rotates[index] )
+        cmds.setAttr( CrowdJnts[index]+'.radius', cmds.getAttr( Jnts[index]+'.radius' ) )
+
+    CrowdGeos = []
+    for geo in Geos:
+        crowdGeo = cmds.duplicate( geo, name=CrowdPrefix+geo )[0]
+        cmds.delete( cmds.ls( cmds.listRelatives( crowdGeo, shapes=True, fullPath=True ) or [], intermediateObjects=True ) or [] )
+        for attr in quadBT.TransformAttrs:
+            cmds.setAttr( crowdGeo+'.'+attr, lock=False )
+        crowdGeo = cmds.parent( crowdGeo, crowdGroup )[0]
+        quad_copySkin( sourceGeo=geo, targetGeo=crowdGeo )
+        CrowdGeos.append( crowdGeo )
+
+    player = cmds.createNode( quadCN.NodeName, name=CrowdPrefix+'Crowd_ClipPlayer' )
+    cmds.setAttr( player+'.clipFile', clipFile, type='string' )
+    cmds.connectAttr( 'time1.outTime', player+'.time' )
+    for index, crowdJnt in enumerate( CrowdJnts ):
+        cmds.connectAttr( player+'.output[%d].outTranslate' % index, crowdJnt+'.translate' )
+        cmds.connectAttr( player+'.output[%d].outRotate' % index, crowdJnt+'.rotate' )
+
+    # everything but the crowd goes
+    Tops = [ top for top in cmds.ls( assemblies=True ) if top != crowdGroup and not cmds.ls( cmds.listRelatives( top, shapes=True ) or [], type='camera' ) ]
+    cmds.lockNode( Tops + ( cmds.listRelatives( Tops, allDescendents=True, fullPath=True ) or [] ), lock=False )
+    cmds.delete( Tops )
+    Dead = quadBT.quad_findDeadNodes()
+    if Dead:
+        cmds.delete( Dead )
+    quadPB.quad_stripLeftovers()
+
+    for node in sorted( cmds.ls( CrowdPrefix+'*', long=True ), key=lambda node: -node.count( '|' ) ):
+        cmds.rename( node, node.split( '|' )[-1][len( CrowdPrefix ): ] )
+    for geo in Geos:
+        for shape in cmds.listRelatives( geo, shapes=True, fullPath=True ) or []:
+            cmds.rename( shape, geo+'Shape' )
+
+    quadPB.quad_saveScene( path=crowdFile )
+    Results = [ crowdFile, len( Jnts ), len( cmds.ls() ) ]
+    print( '========================= crowd asset %s: %d joints, %d nodes (full rig %d) in %.1f sec'
+           % ( crowdFile, len( Jnts ), Results[2], nodesBefore, time.time()-startTime ) )
+    return Results
+
+
+def quad_placeCrowd( crowdFile='', count=20, ClipFiles=[], spacing=400.0, columns=5, speedRange=( 0.9, 1.1 ), seed=0, namespace='Herd' ):
+    '''
+    Reference the crowd asset count times on a jittered grid, each instance with a random clip from
+    ClipFiles (the asset's own clip when empty), a random time offset and speed. Returns the namespaces.
+    '''
+    quad_loadClipPlugin()
+    generator = random.Random( seed )
+    Namespaces = []
+    for index in range( count ):
+        name = '%s%02d' % ( namespace, index+1 )
+        cmds.file( crowdFile, reference=True, namespace=name )
+        player = name+':Crowd_ClipPlayer'
+        if ClipFiles:
+            cmds.setAttr( player+'.clipFile', generator.choice( ClipFiles ), type='string' )
+        frames = len( quadCN.quad_cachedClip( cmds.getAttr( player+'.clipFile' ) )[2] )
+        cmds.setAttr( player+'.offset', generator.uniform( 0.0, frames ) )
+        cmds.setAttr( player+'.speed', generator.uniform( *speedRange ) )
+        row, column = divmod( index, columns )
+        cmds.setAttr( name+':Crowd_Grp.translate', ( column + generator.uniform( -0.3, 0.3 ) ) * spacing, 0.0,
+                      ( row + generator.uniform( -0.3, 0.3 ) ) * spacing )
+        cmds.setAttr( name+':Crowd_Grp.rotateY', generator.uniform( -15.0, 15.0 ) )
+        Namespaces.append( name )
+    print( '========================= placed %d crowd instances of %s' % ( count, crowdFile ) )
+    return Namespaces
+
+
+def quad_crowdBenchmark( rigFile='', crowdFile='', count=20, frames=120 ):
+    '''
+    Time one full rig walking (the canned quadPT walk cycle) against count crowd instances, each in a
+    fresh scene, and compare the cost and node count per instance, without the empty scene's own nodes. Returns the results dict.
+    '''
+    Results = {}
+    # the default nodes of an empty scene are not part of either rig
+    cmds.file( new=True, force=True )
+    emptyNodes = len( cmds.ls() )
+
+    cmds.file( rigFile, open=True, force=True )
+    quadPT.quad_applyGait( registry=quadBT.quad_loadRegistry(), gait='walk', startFrame=1 )
+    quadPT.quad_timePlayback( startFrame=1, endFrame=frames, loops=1 )
+    fps = quadPT.quad_timePlayback( startFrame=1, endFrame=frames, loops=3 )[0]
+    Results['fullRig'] = { 'msPerFrame': 1000.0 / fps, 'nodes': len( cmds.ls() ) - emptyNodes }
+
+    cmds.file( new=True, force=True )
+    quad_placeCrowd( crowdFile=crowdFile, count=count )
+    quadPT.quad_timePlayback( startFrame=1, endFrame=frames, loops=1 )
+    fps = quadPT.quad_timePlayback( startFrame=1, endFrame=frames, loops=3 )[0]
+    Results['crowd'] = { 'instances': count, 'msPerFrame': 1000.0 / fps / count, 'nodes': ( len( cmds.ls() ) - emptyNodes ) / float( count ) }
+
+    print( '========================= per instance: full rig %.3f ms %d nodes, crowd %.3f ms %d nodes (%.1f%% of the cost)'
+           % ( Results['fullRig']['msPerFrame'], Results['fullRig']['nodes'], Results['crowd']['msPerFrame'], Results['crowd']['nodes'],
+               100.0 * Results['crowd']['msPerFrame'] / Results['fullRig']['msPerFrame'] ) )
+    return Results
@@ -0,0 +1,388 @@
+# ---------------------------------------------------------------------------------------
+# Quad_ExportTools
+# Export helpers for the Quadruped Auto-Rig Tool
+#
+# ---------------------------------------------------------------------------------------
+# Gets animation off the '*_Jnt' bind joints and into files for other packages, for example
+# a compact binary clip for a game engine.
+#
+# Needs NumPy (ships with mayapy 2022+, otherwise pip install it into Maya's Python).
+#
+# Import it the same way as the den_* modules:
+#     import Quad_ExportTools as quadET
+#     importlib.reload(quadET)
+# ---------------------------------------------------------------------------------------
+# (c) 2025 by Arrow Lyu. All rights reserved. For portfolio and educational use only.
+# ---------------------------------------------------------------------------------------
+
+
+import glob
+import os
+import re
+import shutil
+import struct
+import subprocess
+import sys
+import time
+
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+
+import Quad_AnimTools as quadAT
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# ---------------------------------------------------------------------------------------
+# engine clip format (little endian)
+#   header   'QCLP', uint16 version, float32 fps, uint16 joints, uint32 frames, uint32 chunks
+#   joints   per joint: uint8 name length, name, int16 parent index (-1 = root)
+#   chunks   uint32 first frame, uint16 frame count, then per joint a rotation and a translation track
+#   rotation uint16 keys, uint16 key frames (chunk relative), keys x 3 uint16 smallest-three quaternions
+#   translate float32 x 3 minimum, float32 x 3 range, uint16 keys, uint16 key frames, keys x 3 uint16
+# every chunk keys its first and last frame, so it decodes on its own
+
+ClipMagic = b'QCLP'
+ClipVersion = 1
+QuatBits = 15
+QuatRange = 1.0 / np.sqrt( 2.0 ) if np else 0.7071067811865476
+
+
+def quad_jointParents( Jnts=[] ):
+    '''index of the nearest ancestor of every joint inside Jnts, -1 when it has none'''
+    LongNames = [ cmds.ls( jnt, long=True )[0] for jnt in Jnts ]
+    Index = { name: index for index, name in enumerate( LongNames ) }
+    Parents = []
+    for name in LongNames:
+        parent = -1
+        Path = name.split( '|' )
+        for depth in range( len(Path)-1, 0, -1 ):
+            ancestor = '|'.join( Path[:depth] )
+            if ancestor in Index:
+                parent = Index[ancestor]
+                break
+        Parents.append( parent )
+    return Parents
+
+
+def quad_localTransforms( World=None, Parents=[] ):
+    '''
+    Local rotation quaternions (x, y, z, w) and translations of flat world matrices
+    (frames x joints x 16), relative to the parent joint in Parents.
+    Returns [ Quats, Translates ], frames x joints x 4 and frames x joints x 3.
+    '''
+    World = np.asarray( World, dtype=float ).reshape( World.shape[0], World.shape[1], 4, 4 )
+    Local = World.copy()
+    Parents = np.asarray( Parents )
+    child = Parents >= 0
+    Local[:, child] = World[:, child] @ np.linalg.inv( World[:, Parents[child]] )
+    Rotation = Local[..., :3, :3] / np.linalg.norm( Local[..., :3, :3], axis=-1, keepdims=True )
+    return [ quad_matrixToQuat( Rotation ), Local[..., 3, :3] ]
+
+
+def quad_matrixToQuat( Rotation=None ):
+    '''quaternions (x, y, z, w) of row-vector rotation matrices (... x 3 x 3), vectorized Shepperd method'''
+    # Maya matrices multiply row vectors, the usual formulas expect column vectors
+    R = np.swapaxes( Rotation, -1, -2 )
+    Quats = np.empty( R.shape[:-2] + (4,) )
+    trace = R[..., 0, 0] + R[..., 1, 1] + R[..., 2, 2]
+    Cases = [ trace, R[..., 0, 0], R[..., 1, 1], R[..., 2, 2] ]
+    case = np.argmax( np.stack( Cases, axis=-1 ), axis=-1 )
+
+    mask = case == 0
+    s = np.sqrt( np.maximum( trace[mask] + 1.0, 1e-12 ) ) * 2.0
+    Quats[mask] = np.stack( [ ( R[mask][:, 2, 1] - R[mask][:, 1, 2] ) / s, ( R[mask][:, 0, 2] - R[mask][:, 2, 0] ) / s,
+                              ( R[mask][:, 1, 0] - R[mask][:, 0, 1] ) / s, 0.25 * s ], axis=-1 )
+    for axis in range( 3 ):
+        mask = case == axis + 1
+        i, j, k = axis, ( axis + 1 ) % 3, ( axis + 2 ) % 3
+        Rm = R[mask]
+        s = np.sqrt( np.maximum( 1.0 + Rm[:, i, i] - Rm[:, j, j] - Rm[:, k, k], 1e-12 ) ) * 2.0
+        Values = np.empty( ( len(Rm), 4 ) )
+        Values[:, i] = 0.25 * s
+        Values[:, j] = ( Rm[:, j, i] + Rm[:, i, j] ) / s
+        Values[:, k] = ( Rm[:, k, i] + Rm[:, i, k] ) / s
+        Values[:, 3] = ( Rm[:, k, j] - Rm[:, j, k] ) / s
+        Quats[mask] = Values
+    return Quats / np.linalg.norm( Quats, axis=-1, keepdims=True )
+
+
+def quad_continuousQuats( Quats=None, previous=None ):
+    '''flip quaternions (frames x joints x 4) onto the same hemisphere as the frame before them'''
+    Quats = Quats.copy()
+    if previous is not None:
+        Quats[0] *= np.where( np.sum( Quats[0] * previous, axis=-1, keepdims=True ) < 0.0, -1.0, 1.0 )
+    for f in range( 1, len(Quats) ):
+        Quats[f] *= np.where( np.sum( Quats[f] * Quats[f-1], axis=-1, keepdims=True ) < 0.0, -1.0, 1.0 )
+    return Quats
+
+
+def quad_packQuats( Quats=None ):
+    '''
+    Smallest-three quantization of unit quaternions (... x 4) to ... x 3 uint16. The largest
+    component is dropped (made positive) and its index stored in the top bit of the first two words.
+    '''
+    largest = np.argmax( np.abs( Quats ), axis=-1 )
+    Quats = Quats * np.where( np.take_along_axis( Quats, largest[..., None], axis=-1 ) < 0.0, -1.0, 1.0 )
+    Keep = np.array( [ [ 1, 2, 3 ], [ 0, 2, 3 ], [ 0, 1, 3 ], [ 0, 1, 2 ] ] )[largest]
+    Three = np.take_along_axis( Quats, Keep, axis=-1 )
+    scale = ( 1 << QuatBits ) - 1
+    Packed = np.round( ( np.clip( Three, -QuatRange, QuatRange ) + QuatRange ) / ( 2.0 * QuatRange ) * scale ).astype( np.uint16 )
+    Packed[..., 0] |= ( ( largest >> 1 ) & 1 ).astype( np.uint16 ) << QuatBits
+    Packed[..., 1] |= ( largest & 1 ).astype( np.uint16 ) << QuatBits
+    return Packed
+
+
+def quad_unpackQuats( Packed=None ):
+    '''quaternions (... x 4) from quad_packQuats words'''
+    Packed = Packed.astype( np.uint32 )
+    largest = ( ( Packed[..., 0] >> QuatBits ) << 1 ) | ( Packed[..., 1] >> QuatBits )
+    scale = ( 1 << QuatBits ) - 1
+    Three = ( Packed & scale ) / float( scale ) * ( 2.0 * QuatRange ) - QuatRange
+    Quats = np.zeros( Packed.shape[:-1] + (4,) )
+    Keep = np.array( [ [ 1, 2, 3 ], [ 0, 2, 3 ], [ 0, 1, 3 ], [ 0, 1, 2 ] ] )[largest]
+    np.put_along_axis( Quats, Keep, Three, axis=-1 )
+    np.put_along_axis( Quats, largest[..., None], np.sqrt( np.maximum( 1.0 - np.sum( Three*Three, axis=-1 ), 0.0 ) )[..., None], axis=-1 )
+    return Quats
+
+
+def quad_reduceKeys( Values=None, tolerance=0.001 ):
+    '''
+    Keyframe reduction of one track (frames x components) by recursive splitting at the worst frame:
+    keeps the first and last frame and adds frames until linear interpolation stays within tolerance.
+    Returns the kept frame indices.
+    '''
+    Keys = [ 0, len(Values)-1 ]
+    Segments = [ ( 0, len(Values)-1 ) ] if len(Values) > 2 else []
+    while Segments:
+        first, last = Segments.pop()
+        t = ( np.arange( first+1, last ) - first ) / float( last - first )
+        Line = Values[first] + ( Values[last] - Values[first] ) * t[:, None]
+        Errors = np.max( np.abs( Values[first+1:last] - Line ), axis=-1 )
+        worst = int( np.argmax( Errors ) )
+        if Errors[worst] > tolerance:
+            split = first + 1 + worst
+            Keys.append( split )
+            if split - first > 1:
+                Segments.append( ( first, split ) )
+            if last - split > 1:
+                Segments.append( ( split, last ) )
+    return sorted( set( Keys ) )
+
+
+def quad_writeChunk( handle=None, firstFrame=0, Quats=None, Translates=None, rotateTolerance=0.0005, translateTolerance=0.01 ):
+    '''append one chunk of local transforms (frames x joints) to an open clip file, returns the number of keys written'''
+    frames, joints = Quats.shape[:2]
+    handle.write( struct.pack( '<IH', firstFrame, frames ) )
+    keyCount = 0
+    for j in range( joints ):
+        Keys = quad_reduceKeys( Values=Quats[:, j], tolerance=rotateTolerance )
+        handle.write( struct.pack( '<H', len(Keys) ) )
+        handle.write( np.asarray( Keys, dtype='<u2' ).tobytes() )
+        handle.write( quad_packQuats( Quats[Keys, j] ).astype( '<u2' ).tobytes() )
+
+        minimum = Translates[:, j].min( axis=0 )
+        extent = np.maximum( Translates[:, j].max( axis=0 ) - minimum, 1e-6 )
+        Keys = quad_reduceKeys( Values=Translates[:, j], tolerance=translateTolerance )
+        Quantized = np.round( ( Translates[Keys, j] - minimum ) / extent * 65535.0 ).astype( '<u2' )
+        handle.write( struct.pack( '<3f3fH', *( list(minimum) + list(extent) + [ len(Keys) ] ) ) )
+        handle.write( np.asarray( Keys, dtype='<u2' ).tobytes() )
+        handle.write( Quantized.tobytes() )
+        keyCount += len( Keys )
+    return keyCount
+
+
+def quad_exportClip( path='', Jnts=None, startFrame=1, endFrame=120, chunkFrames=256, rotateTolerance=0.0005, translateTolerance=0.01 ):
+    '''
+    Stream the local transforms of the bind joints over the frame range into a binary engine clip.
+    Joints are sampled chunkFrames at a time and every chunk is reduced, quantized and written
+    before the next one is sampled, so memory does not grow with the length of the shot.
+    rotateTolerance is in quaternion units (about half a radian per unit), translateTolerance in cm.
+    Returns [ path, frames, keys ].
+    '''
+    quadAT.quad_requireNumpy()
+    start = time.time()
+    if Jnts is None:
+        Jnts = quadAT.quad_bindJoints()
+    Parents = quad_jointParents( Jnts=Jnts )
+    fps = om.MTime( 1, om.MTime.kSeconds ).asUnits( om.MTime.uiUnit() )
+
+    frameCount = 0
+    chunkCount = 0
+    keyCount = 0
+    previous = None
+    with open( path, 'wb' ) as handle:
+        handle.write( ClipMagic + struct.pack( '<HfHII', ClipVersion, fps, len(Jnts), 0, 0 ) )
+        for jnt, parent in zip( Jnts, Parents ):
+            name = jnt.split( '|' )[-1].encode( 'utf-8' )
+            handle.write( struct.pack( '<B', len(name) ) + name + struct.pack( '<h', parent ) )
+
+        for Frames, World in quadAT.quad_iterJointSamples( Jnts=Jnts, startFrame=startFrame, endFrame=endFrame, chunkFrames=chunkFrames ):
+            Quats, Translates = quad_localTransforms( World=World, Parents=Parents )
+            Quats = quad_continuousQuats( Quats=Quats, previous=previous )
+            previous = Quats[-1]
+            keyCount += quad_writeChunk( handle=handle, firstFrame=frameCount, Quats=Quats, Translates=Translates,
+                                         rotateTolerance=rotateTolerance, translateTolerance=translateTolerance )
+            frameCount += len( Frames )
+            chunkCount += 1
+
+        # the frame and chunk counts are only known at the end
+        handle.seek( len(ClipMagic) + struct.calcsize( '<Hf' ) + struct.calcsize( '<H' ) )
+        handle.write( struct.pack( '<II', frameCount, chunkCount ) )
+
+    print( '========================= exported %d joints, %d frames, %d keys (%.1f%% of all samples) to %s in %.2f sec'
+           % ( len(Jnts), frameCount, keyCount, 100.0 * keyCount / max( 2 * frameCount * len(Jnts), 1 ), path, time.time()-start ) )
+    return [ path, frameCount, keyCount ]
+
+
+def quad_readClip( path='' ):
+    '''
+    Decode a clip written by quad_exportClip, for checking an export.
+    Returns [ Names, Parents, Quats, Translates ] with frames x joints x 4 and frames x joints x 3 arrays.
+    '''
+    quadAT.quad_requireNumpy()
+    with open( path, 'rb' ) as handle:
+        data = handle.read()
+    if data[:4] != ClipMagic:
+        raise RuntimeError( path+' is not a clip file' )
+    version, fps, joints, frames, chunks = struct.unpack_from( '<HfHII', data, 4 )
+    offset = 4 + struct.calcsize( '<HfHII' )
+    Names = []
+    Parents = []
+    for j in range( joints ):
+        length = data[offset]
+        Names.append( data[offset+1:offset+1+length].decode( 'utf-8' ) )
+        Parents.append( struct.unpack_from( '<h', data, offset+1+length )[0] )
+        offset += 3 + length
+
+    Quats = np.empty( ( frames, joints, 4 ) )
+    Translates = np.empty( ( frames, joints, 3 ) )
+    for chunk in range( chunks ):
+        first, count = struct.unpack_from( '<IH', data, offset )
+        offset += 6
+        Span = np.arange( count )
+        for j in range( joints ):
+            keys = struct.unpack_from( '<H', data, offset )[0]
+            Keys = np.frombuffer( data, dtype='<u2', count=keys, offset=offset+2 )
+            Packed = np.frombuffer( data, dtype='<u2', count=keys*3, offset=offset+2+keys*2 ).reshape( keys, 3 )
+            offset += 2 + keys * 8
+            Values = quad_unpackQuats( Packed )
+            # packing made the largest component positive, put the keys back on one hemisphere
+            for key in range( 1, keys ):
+                if np.dot( Values[key], Values[key-1] ) < 0.0:
+                    Values[key] *= -1.0
+            Quats[first:first+count, j] = np.stack( [ np.interp( Span, Keys, Values[:, axis] ) for axis in range( 4 ) ], axis=-1 )
+
+            Header = struct.unpack_from( '<3f3fH', data, offset )
+            minimum, extent, keys = np.array( Header[:3] ), np.array( Header[3:6] ), Header[6]
+            offset += struct.calcsize( '<3f3fH' )
+            Keys = np.frombuffer( data, dtype='<u2', count=keys, offset=offset )
+            Values = np.frombuffer( data, dtype='<u2', count=keys*3, offset=offset+keys*2 ).reshape( keys, 3 ) / 65535.0 * extent + minimum
+            offset += keys * 8
+            Translates[first:first+count, j] = np.stack( [ np.interp( Span, Keys, Values[:, axis] ) for axis in range( 3 ) ], axis=-1 )
+
+    Quats /= np.linalg.norm( Quats, axis=-1, keepdims=True )
+    return [ Names, Parents, Quats, Translates ]
+
+
+
+# ---------------------------------------------------------------------------------------
+# parallel geometry cache
+# splits the frame range into chunks and caches every chunk in its own mayapy process from the
+# saved scene, each chunk starting its simulation a pre-roll earlier so the tail and whiskers have
+# settled when its first cached frame is written, then stitches the per-frame files together
+
+def quad_mayapy():
+    '''path of the mayapy next to the running Maya'''
+    location = os.environ.get( 'MAYA_LOCATION', os.path.dirname( os.path.dirname( sys.executable ) ) )
+    return os.path.join( location, 'bin', 'mayapy.exe' if os.name == 'nt' else 'mayapy' )
+
+
+def quad_cacheChunk( sceneFile='', Geos=[], startFrame=1, endFrame=120, preRoll=0, directory='', name='' ):
+    '''
+    Worker side, runs inside mayapy: open the scene, simulate the pre-roll without caching and
+    write one cache file per frame of startFrame-endFrame for the deformed shapes of Geos, all
+    shapes in the same files. Without a pre-roll the simulation runs up from the scene's own
+    nucleus start frame.
+    '''
+    cmds.file( sceneFile, open=True, force=True )
+    cmds.evaluationManager( mode='parallel' )
+    Nuclei = cmds.ls( type='nucleus' ) or []
+    if preRoll:
+        rollStart = startFrame - preRoll
+        for nucleus in Nuclei:
+            cmds.setAttr( nucleus+'.startFrame', rollStart )
+    else:
+        rollStart = min( [ cmds.getAttr( nucleus+'.startFrame' ) for nucleus in Nuclei ] + [ startFrame ] )
+    for frame in range( int(rollStart), int(startFrame) ):
+        cmds.currentTime( frame, update=True )
+
+    Shapes = []
+    for geo in Geos:
+        Shapes += cmds.listRelatives( geo, shapes=True, noIntermediate=True, fullPath=True ) or []
+    cmds.cacheFile( fileName=name, directory=directory, points=Shapes, startTime=startFrame, endTime=endFrame,
+                    format='OneFilePerFrame', fileFormat='mcx', singleCache=True )
+
+
+def quad_stitchCaches( ChunkDirs=[], directory='', name='', startFrame=1, endFrame=120 ):
+    '''move the per-frame files of every chunk into directory and write one description for the whole range'''
+    if not os.path.isdir( directory ):
+        os.makedirs( directory )
+    for chunkDir in ChunkDirs:
+        for path in glob.glob( os.path.join( chunkDir, name+'Frame*.mc*' ) ):
+            shutil.move( path, os.path.join( directory, os.path.basename( path ) ) )
+
+    # cache times are in ticks, 6000 per second
+    ticks = 6000.0 / om.MTime( 1, om.MTime.kSeconds ).asUnits( om.MTime.uiUnit() )
+    startTick = int( round( startFrame * ticks ) )
+    endTick = int( round( endFrame * ticks ) )
+    with open( os.path.join( ChunkDirs[0], name+'.xml' ) ) as handle:
+        description = handle.read()
+    description = re.sub( r'Range="-?\d+--?\d+"', 'Range="%d-%d"' % ( startTick, endTick ), description )
+    description = re.sub( r'StartTime="-?\d+"', 'StartTime="%d"' % startTick, description )
+    description = re.sub( r'EndTime="-?\d+"', 'EndTime="%d"' % endTick, description )
+    with open( os.path.join( directory, name+'.xml' ), 'w' ) as handle:
+        handle.write( description )
+    for chunkDir in ChunkDirs:
+        shutil.rmtree( chunkDir, ignore_errors=True )
+    return os.path.join( directory, name+'.xml' )
+
+
+def quad_exportGeoCacheParallel( Geos=['Body_Geo','Eyes_Geo'], startFrame=1, endFrame=120, directory='', name='Rig_GeoCache', workers=None, preRoll=24 ):
+    '''
+    Cache the deformed Geos over the frame range with one mayapy process per chunk, run side by side.
+    The scene must be saved, every worker opens it from disk. Chunks after the first start their
+    simulation preRoll frames early; the first chunk uses the scene's own nucleus start frame.
+    Returns the path of the stitched cache description (.xml).
+    '''
+    sceneFile = cmds.file( q=True, sceneName=True )
+    if not sceneFile or cmds.file( q=True, modified=True ):
+        raise RuntimeError( 'save the scene first, the cache workers open it from disk' )
+    start = time.time()
+    workers = workers or os.cpu_count() or 1
+    frames = int(endFrame) - int(startFrame) + 1
+    size = -( -frames // workers )
+    Chunks = [ ( first, min( first+size-1, int(endFrame) ) ) for first in range( int(startFrame), int(endFrame)+1, size ) ]
+
+    env = dict( os.environ )
+    env['PYTHONPATH'] = os.pathsep.join( [ os.path.dirname( os.path.abspath( __file__ ) ), env.get( 'PYTHONPATH', '' ) ] )
+    Processes = []
+    ChunkDirs = []
+    for index, ( first, last ) in enumerate( Chunks ):
+        chunkDir = os.path.join( directory, '_chunk%02d' % index )
+        ChunkDirs.append( chunkDir )
+        code = ( 'import maya.standalone; maya.standalone.initialize(); import Quad_ExportTools as quadET; '
+                 'quadET.quad_cacheChunk( sceneFile=%r, Geos=%r, startFrame=%d, endFrame=%d, preRoll=%d, directory=%r, name=%r )'
+                 % ( sceneFile, list(Geos), first, last, preRoll if index else 0, chunkDir, name ) )
+        Processes.append( subprocess.Popen( [ quad_mayapy(), '-c', code ], env=env ) )
+
+    Failed = [ Chunks[index] for index, process in enumerate( Processes ) if process.wait() != 0 ]
+    if Failed:
+        raise RuntimeError( 'cache workers failed for frames '+str( Failed ) )
+
+    path = quad_stitchCaches( ChunkDirs=ChunkDirs, directory=directory, name=name, startFrame=startFrame, endFrame=endFrame )
+    print( '========================= cached %s over %d frames in %d chunks to %s in %.1f sec' % ( ', '.join( Geos ), frames, len(Chunks), path, time.time()-start ) )
+    return path
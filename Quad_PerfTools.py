@@ -0,0 +1,546 @@
+# ---------------------------------------------------------------------------------------
+# Quad_PerfTools
+# Performance helpers for the Quadruped Auto-Rig Tool
+#
+# ---------------------------------------------------------------------------------------
+# Timing and profiling tools that run on a built rig, used to compare rig versions and
+# build options such as RigConfig['torsoMode'].
+#
+# Import it the same way as the den_* modules:
+#     import Quad_PerfTools as quadPT
+#     importlib.reload(quadPT)
+# ---------------------------------------------------------------------------------------
+# (c) 2025 by Arrow Lyu. All rights reserved. For portfolio and educational use only.
+# ---------------------------------------------------------------------------------------
+
+
+import json
+import math
+import os
+import subprocess
+import time
+
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+
+import Quad_BuildTools as quadBT
+import Quad_ExportTools as quadET
+
+
+def quad_timePlayback( startFrame=1, endFrame=100, loops=3, refresh=False ):
+    '''
+    Step through the frame range and time the evaluation of the whole scene.
+    Returns [ fps, FrameTimes ] where FrameTimes are the seconds of each frame of the last loop.
+    '''
+    currentTime = cmds.currentTime( q=True )
+    FrameTimes = []
+    total = 0.0
+    count = 0
+    for loop in range( loops ):
+        FrameTimes = []
+        for frame in range( int(startFrame), int(endFrame)+1 ):
+            frameStart = time.perf_counter()
+            cmds.currentTime( frame, update=True )
+            if refresh:
+                cmds.refresh( force=True )
+            FrameTimes.append( time.perf_counter() - frameStart )
+        total += sum( FrameTimes )
+        count += len( FrameTimes )
+    cmds.currentTime( currentTime, update=True )
+
+    fps = count / total if total else 0.0
+    print( '========================= %d frames x %d loops: %.1f fps, slowest frame %.2f ms' % ( len(FrameTimes), loops, fps, max(FrameTimes)*1000.0 ) )
+    return [ fps, FrameTimes ]
+
+
+def quad_animateChain( Ctrls=[], startFrame=1, endFrame=100, amplitude=20.0 ):
+    '''key a simple sine wave on rotate X/Y of the given controls so a chain has something to evaluate'''
+    for i, ctrl in enumerate( Ctrls ):
+        for frame in range( int(startFrame), int(endFrame)+1 ):
+            phase = ( frame - startFrame ) / 24.0 * 2.0 * math.pi + i * 0.5
+            for attr, value in [ ('rotateX', math.sin(phase)*amplitude), ('rotateY', math.cos(phase)*amplitude*0.5) ]:
+                if cmds.getAttr( ctrl+'.'+attr, settable=True ):
+                    cmds.setKeyframe( ctrl, attribute=attr, time=frame, value=value )
+
+
+
+# ---------------------------------------------------------------------------------------
+# rig benchmark
+# canned gaits on the main controls, timed under each evaluation mode and written to JSON so
+# builds can be compared after a den_* update
+
+# phase of each leg in the cycle, duty is the part of the cycle a foot stays on the ground
+GaitCycles = {
+    'walk': { 'frames':32, 'stride':40.0, 'lift':8.0, 'bounce':2.0, 'sway':3.0, 'duty':0.65,
+              'phases':{ 'L_TrexLeg':0.0, 'L_DogFrontLeg':0.25, 'R_TrexLeg':0.5, 'R_DogFrontLeg':0.75 } },
+    'trot': { 'frames':20, 'stride':60.0, 'lift':12.0, 'bounce':4.0, 'sway':2.0, 'duty':0.5,
+              'phases':{ 'L_TrexLeg':0.0, 'R_DogFrontLeg':0.0, 'R_TrexLeg':0.5, 'L_DogFrontLeg':0.5 } },
+    'idle': { 'frames':48, 'stride':0.0, 'lift':0.0, 'bounce':1.0, 'sway':1.5, 'duty':1.0,
+              'phases':{} },
+    }
+
+EvaluationModes = [ 'serial', 'parallel', 'cached' ]
+
+
+def quad_findCtrl( registry={}, key='', token='' ):
+    '''first registered control of a module whose name contains token, None if there is none'''
+    for ctrl in registry.get( key, {} ).get( 'Ctrls', [] ):
+        if token in ctrl.split( '|' )[-1]:
+            return ctrl
+    return None
+
+
+def quad_keyCycle( node='', attr='', Values=[], startFrame=1, offset=0.0 ):
+    '''key one cycle of Values from startFrame and repeat it, offset is added every cycle (e.g. forward travel)'''
+    if not cmds.getAttr( node+'.'+attr, settable=True ):
+        return
+    for index, value in enumerate( Values ):
+        cmds.setKeyframe( node, attribute=attr, time=startFrame+index, value=value )
+    cmds.setKeyframe( node, attribute=attr, time=startFrame+len(Values), value=Values[0]+offset )
+    cmds.setInfinity( node, attribute=attr, postInfinite='cycleRelative' if offset else 'cycle' )
+
+
+def quad_applyGait( registry={}, gait='walk', startFrame=1 ):
+    '''
+    Key one cycle of a canned gait on the AllCtrl, Cog, leg IK and torso controls and cycle it.
+    The AllCtrl travels forward and the feet step back on a treadmill so they stay planted.
+    Returns the keyed controls.
+    '''
+    cycle = GaitCycles[gait]
+    frames = cycle['frames']
+    AllCtrl = registry['Base']['Ctrls'][2]
+    cogCtrl = quad_findCtrl( registry=registry, key='Base', token='Cog' )
+    TorsoCtrls = registry['Torso']['Ctrls']
+    Keyed = [ AllCtrl ] + ( [ cogCtrl ] if cogCtrl else [] ) + TorsoCtrls
+    cmds.cutKey( Keyed, clear=True )
+
+    Phases = [ index / float( frames ) for index in range( frames ) ]
+    quad_keyCycle( node=AllCtrl, attr='translateZ', Values=[ phase * cycle['stride'] for phase in Phases ], startFrame=startFrame, offset=cycle['stride'] )
+    if cogCtrl:
+        quad_keyCycle( node=cogCtrl, attr='translateY', Values=[ math.cos( phase * 4.0 * math.pi ) * cycle['bounce'] for phase in Phases ], startFrame=startFrame )
+        quad_keyCycle( node=cogCtrl, attr='rotateZ', Values=[ math.sin( phase * 2.0 * math.pi ) * cycle['sway'] for phase in Phases ], startFrame=startFrame )
+    for index, ctrl in enumerate( TorsoCtrls ):
+        quad_keyCycle( node=ctrl, attr='rotateY', Values=[ math.sin( phase * 2.0 * math.pi - index * 0.4 ) * cycle['sway'] for phase in Phases ], startFrame=startFrame )
+        quad_keyCycle( node=ctrl, attr='rotateX', Values=[ math.cos( phase * 4.0 * math.pi - index * 0.4 ) * cycle['bounce'] for phase in Phases ], startFrame=startFrame )
+
+    duty = cycle['duty']
+    for key, legPhase in sorted( cycle['phases'].items() ):
+        footCtrl = quad_findCtrl( registry=registry, key=key, token='IK' )
+        if not footCtrl:
+            print( 'WARNING: no IK control found for '+key+', skipped' )
+            continue
+        cmds.cutKey( footCtrl, clear=True )
+        Slide = []
+        Lift = []
+        for phase in Phases:
+            local = ( phase + legPhase ) % 1.0
+            if local < duty:
+                # stance: slide back as fast as the body moves forward
+                Slide.append( cycle['stride'] * ( duty * 0.5 - local ) )
+                Lift.append( 0.0 )
+            else:
+                swing = ( local - duty ) / ( 1.0 - duty )
+                Slide.append( cycle['stride'] * duty * ( swing - 0.5 ) )
+                Lift.append( math.sin( swing * math.pi ) * cycle['lift'] )
+        quad_keyCycle( node=footCtrl, attr='translateZ', Values=Slide, startFrame=startFrame )
+        quad_keyCycle( node=footCtrl, attr='translateY', Values=Lift, startFrame=startFrame )
+        Keyed.append( footCtrl )
+
+    print( '========================= applied %s cycle of %d frames to %d controls' % ( gait, frames, len(Keyed) ) )
+    return Keyed
+
+
+def quad_setEvaluationMode( mode='parallel' ):
+    '''switch to serial, parallel or cached (parallel + cached playback), returns the previous settings'''
+    previous = [ cmds.evaluationManager( q=True, mode=True )[0], cmds.evaluator( name='cache', q=True, enable=True ) ]
+    cmds.evaluationManager( mode='serial' if mode == 'serial' else 'parallel' )
+    cmds.evaluator( name='cache', enable=( mode == 'cached' ) )
+    if mode == 'cached':
+        cmds.cacheEvaluator( cacheFillMode='syncOnly' )
+    return previous
+
+
+def quad_recordProfile( startFrame=1, endFrame=100 ):
+    '''play the frame range with the Maya profiler recording, returns { node: milliseconds } of every evaluated node'''
+    cmds.profiler( reset=True )
+    cmds.profiler( sampling=True )
+    quad_timePlayback( startFrame=startFrame, endFrame=endFrame, loops=1 )
+    cmds.profiler( sampling=False )
+
+    NodeTimes = {}
+    Known = {}
+    for event in range( om.MProfiler.getEventCount() ):
+        node = om.MProfiler.getDescription( event )
+        if node not in Known:
+            Known[node] = bool( node ) and cmds.objExists( node )
+        if Known[node]:
+            NodeTimes[node] = NodeTimes.get( node, 0.0 ) + om.MProfiler.getEventDuration( event ) / 1000.0
+    return NodeTimes
+
+
+def quad_sideOfKey( key='' ):
+    '''L_, R_ or C_ from a registry key, nodes outside every module stay Other'''
+    if key == 'Other':
+        return key
+    return key[:2] if key[:2] in ( 'L_', 'R_' ) else 'C_'
+
+
+def quad_profileRig( startFrame=1, endFrame=100, NodeMap=None, top=20 ):
+    '''
+    Record the frame range and total the evaluation time per node, per module, per side, per node
+    type and per module and node type, using the node map saved with the build.
+    Every total is a list of [ name, milliseconds, node count ] sorted slowest first.
+    '''
+    if NodeMap is None:
+        NodeMap = quadBT.quad_loadNodeMap()
+    NodeTimes = quad_recordProfile( startFrame=startFrame, endFrame=endFrame )
+    Typed = cmds.ls( list( NodeTimes ), showType=True ) or []
+    NodeTypes = dict( zip( Typed[0::2], Typed[1::2] ) )
+
+    Totals = { 'modules':{}, 'sides':{}, 'nodeTypes':{}, 'moduleNodeTypes':{} }
+    for node, ms in NodeTimes.items():
+        key = NodeMap.get( node, 'Other' )
+        nodeType = NodeTypes.get( node, 'unknown' )
+        for table, name in [ ('modules',key), ('sides',quad_sideOfKey( key )), ('nodeTypes',nodeType), ('moduleNodeTypes',key+' '+nodeType) ]:
+            total = Totals[table].setdefault( name, [ name, 0.0, 0 ] )
+            total[1] += ms
+            total[2] += 1
+
+    Report = { table: sorted( Rows.values(), key=lambda row: row[1], reverse=True ) for table, Rows in Totals.items() }
+    Report['nodes'] = [ [ node, ms, 1 ] for node, ms in sorted( NodeTimes.items(), key=lambda item: item[1], reverse=True )[:top] ]
+
+    frames = float( int(endFrame) - int(startFrame) + 1 )
+    print( '========================= rig profile, ms per frame' )
+    for table in [ 'modules', 'sides', 'moduleNodeTypes' ]:
+        for name, ms, count in Report[table][:top]:
+            print( '%-16s %-40s %8.3f ms  %5d nodes' % ( table, name, ms/frames, count ) )
+    return Report
+
+
+def quad_runBenchmark( rigFile=None, outFile='', gaits=('walk','trot','idle'), modes=EvaluationModes, frames=120, minFps=24.0, top=20 ):
+    '''
+    Open the built rig (or use the open scene), apply each canned gait and time it under every
+    evaluation mode, then profile the slowest nodes and modules. The results are written to outFile
+    as JSON. Raises RuntimeError after writing when any gait and mode plays slower than minFps.
+    From a shell:
+        mayapy -c "import maya.standalone; maya.standalone.initialize(); import Quad_PerfTools as quadPT; quadPT.quad_runBenchmark( rigFile='Rimerock_Rig.mb', outFile='bench.json' )"
+    '''
+    if rigFile:
+        cmds.file( rigFile, open=True, force=True )
+    registry = quadBT.quad_loadRegistry()
+    AllCtrl = registry['Base']['Ctrls'][2]
+    # time the rig, not the deformation and drawing of the meshes
+    for attr in [ 'Show_Proxy_Geo', 'Show_Render_Geo' ]:
+        if cmds.attributeQuery( attr, node=AllCtrl, exists=True ):
+            cmds.setAttr( AllCtrl+'.'+attr, 0 )
+
+    Results = { 'scene': cmds.file( q=True, sceneName=True ), 'maya': cmds.about( version=True ),
+                'date': time.strftime( '%Y-%m-%d %H:%M:%S' ), 'frames': frames, 'minFps': minFps, 'gaits': {} }
+    Failures = []
+    startFrame = 1
+    endFrame = startFrame + frames - 1
+    for gait in gaits:
+        quad_applyGait( registry=registry, gait=gait, startFrame=startFrame )
+        GaitResults = {}
+        for mode in modes:
+            previous = quad_setEvaluationMode( mode=mode )
+            try:
+                # one pass to build the graph (and fill the cache), then the timed passes
+                quad_timePlayback( startFrame=startFrame, endFrame=endFrame, loops=1 )
+                fps, FrameTimes = quad_timePlayback( startFrame=startFrame, endFrame=endFrame, loops=3 )
+            finally:
+                cmds.evaluationManager( mode=previous[0] )
+                cmds.evaluator( name='cache', enable=previous[1] )
+            GaitResults[mode] = { 'fps': fps, 'frameTimesMs': [ round( seconds*1000.0, 3 ) for seconds in FrameTimes ] }
+            if fps < minFps:
+                Failures.append( '%s/%s: %.1f fps' % ( gait, mode, fps ) )
+        Results['gaits'][gait] = GaitResults
+
+    previous = quad_setEvaluationMode( mode='parallel' )
+    try:
+        Profile = quad_profileRig( startFrame=startFrame, endFrame=endFrame, top=top )
+        Results['slowestNodes'] = Profile['nodes']
+        Results['slowestModules'] = Profile['modules']
+        Results['slowestModuleNodeTypes'] = Profile['moduleNodeTypes'][:top]
+    finally:
+        cmds.evaluationManager( mode=previous[0] )
+        cmds.evaluator( name='cache', enable=previous[1] )
+    Results['failures'] = Failures
+
+    if outFile:
+        with open( outFile, 'w' ) as handle:
+            json.dump( Results, handle, indent=1 )
+        print( '========================= benchmark written to '+os.path.abspath( outFile ) )
+    for gait, GaitResults in Results['gaits'].items():
+        print( gait+': '+', '.join( '%s %.1f fps' % ( mode, GaitResults[mode]['fps'] ) for mode in modes ) )
+    if Failures:
+        raise RuntimeError( 'benchmark below %.1f fps: %s' % ( minFps, '; '.join( Failures ) ) )
+    return Results
+
+
+# ---------------------------------------------------------------------------------------
+# parallel evaluation audit
+# lists what keeps the rig from evaluating fully in parallel, each entry tied to the registry key
+# of the script section that built it
+
+SchedulingOverrides = [ 'nodeTypeUntrusted', 'nodeTypeGloballySerialize', 'nodeTypeSerialize' ]
+# node types handled by the dynamics evaluator instead of the regular parallel scheduling
+DynamicsNodeTypes = [ 'nucleus', 'hairSystem', 'follicle', 'nRigid', 'nCloth' ]
+
+
+def quad_schedulingOverride( nodeType='' ):
+    '''the scheduling override the evaluation manager applies to a node type, None when it runs in parallel'''
+    for flag in SchedulingOverrides:
+        result = cmds.evaluationManager( nodeType, q=True, **{ flag: True } )
+        if isinstance( result, list ):
+            result = result[0] if result else False
+        if result:
+            return flag
+    return None
+
+
+def quad_dynamicsNodeMap( registry={} ):
+    '''
+    The dynamics nodes the node map leaves out (the shared nucleus sits outside every rig group and
+    stops the DG walk): hair systems and follicles of every DynCtrl tagged with its module, each
+    nucleus with the modules it solves, and a registry nucleus nothing uses yet with Base.
+    Returns { node: module }.
+    '''
+    DynMap = {}
+    NucleusKeys = {}
+    for key, entry in registry.items():
+        if 'DynCtrl' not in entry or not cmds.objExists( entry['DynCtrl'] ):
+            continue
+        Hairs = quadBT.quad_hairSystems( DynCtrl=entry['DynCtrl'] )
+        if not Hairs:
+            continue
+        for node in cmds.ls( Hairs + ( cmds.listConnections( Hairs, type='follicle', shapes=True ) or [] ) ):
+            DynMap.setdefault( node, key )
+        for nucleus in set( cmds.listConnections( Hairs, type='nucleus' ) or [] ):
+            NucleusKeys.setdefault( nucleus, [] ).append( key )
+    for nucleus, Keys in NucleusKeys.items():
+        DynMap[nucleus] = ', '.join( sorted( Keys ) )
+    for nucleus in quadBT.quad_registryNames( [ entry.get( 'Nucleus', [] ) for entry in registry.values() ] ):
+        if cmds.objExists( nucleus ):
+            DynMap.setdefault( nucleus, 'Base' )
+    return DynMap
+
+
+def quad_auditParallel( NodeMap=None, registry=None, outFile='' ):
+    '''
+    Rebuild the parallel evaluation graph and list, for every node of the rig and the dynamics
+    nodes behind its DynCtrls: scheduling overrides (untrusted / globally serial / serial node
+    types), cycle clusters and nodes left to the dynamics evaluator. Returns { 'overrides',
+    'cycles', 'dynamics' } with [ module, node, detail ] rows, written to outFile as JSON if given.
+    '''
+    if NodeMap is None:
+        NodeMap = quadBT.quad_loadNodeMap()
+    if registry is None:
+        registry = quadBT.quad_loadRegistry()
+    NodeMap = dict( NodeMap )
+    for node, module in quad_dynamicsNodeMap( registry=registry ).items():
+        NodeMap.setdefault( node, module )
+    startTime = time.time()
+    previousMode = cmds.evaluationManager( q=True, mode=True )[0]
+    cmds.evaluationManager( mode='parallel' )
+    cmds.evaluationManager( invalidate=True )
+    cmds.currentTime( cmds.currentTime( q=True ), update=True )
+
+    Nodes = [ node for node in NodeMap if cmds.objExists( node ) ]
+    Typed = cmds.ls( Nodes, showType=True ) or []
+    NodeTypes = dict( zip( Typed[0::2], Typed[1::2] ) )
+    TypeOverrides = { nodeType: quad_schedulingOverride( nodeType=nodeType ) for nodeType in set( NodeTypes.values() ) }
+
+    Report = { 'overrides':[], 'cycles':[], 'dynamics':[] }
+    InCycle = set()
+    for node in sorted( NodeTypes ):
+        nodeType = NodeTypes[node]
+        module = NodeMap[node]
+        if TypeOverrides[nodeType]:
+            Report['overrides'].append( [ module, node, nodeType+' '+TypeOverrides[nodeType] ] )
+        if nodeType in DynamicsNodeTypes:
+            Report['dynamics'].append( [ module, node, nodeType ] )
+        if node not in InCycle:
+            Cluster = cmds.evaluationManager( q=True, cycleCluster=node ) or []
+            if len( Cluster ) > 1:
+                InCycle.update( Cluster )
+                Modules = sorted( set( NodeMap.get( member, 'Other' ) for member in Cluster ) )
+                Report['cycles'].append( [ ', '.join( Modules ), node, '%d nodes: %s' % ( len(Cluster), ' '.join( Cluster ) ) ] )
+
+    cmds.evaluationManager( mode=previousMode )
+    Report['dynamicsEvaluator'] = cmds.evaluator( name='dynamics', q=True, enable=True )
+
+    for table in [ 'overrides', 'cycles', 'dynamics' ]:
+        for module, node, detail in Report[table]:
+            print( '%-10s %-20s %-40s %s' % ( table, module, node, detail ) )
+    print( '========================= parallel audit of %d nodes: %d overrides, %d cycle clusters, %d dynamics nodes in %.2f sec'
+           % ( len(NodeTypes), len(Report['overrides']), len(Report['cycles']), len(Report['dynamics']), time.time()-startTime ) )
+    if outFile:
+        with open( outFile, 'w' ) as handle:
+            json.dump( Report, handle, indent=1 )
+    return Report
+
+
+# ---------------------------------------------------------------------------------------
+# twist benchmark
+# compares RigConfig['twistMode'] builds: nodes driving the twist joints and their profiled cost
+
+def quad_drivingNetwork( Jnts=[] ):
+    '''the DG nodes and constraints upstream of Jnts, up to the first other DAG node on every path'''
+    Network = []
+    Frontier = list( Jnts )
+    while Frontier:
+        Sources = cmds.listConnections( Frontier, s=True, d=False, skipConversionNodes=False ) or []
+        Frontier = []
+        for node in set( Sources ):
+            if node in Network or node in Jnts:
+                continue
+            if cmds.ls( node, dag=True ) and not cmds.ls( node, type='constraint' ):
+                continue
+            if cmds.nodeType( node ) == 'time':
+                continue
+            Network.append( node )
+            Frontier.append( node )
+    return Network
+
+
+def quad_twistBenchmark( keys=( 'L_LegTwist', 'R_LegTwist', 'L_FrontLegTwist', 'R_FrontLegTwist' ), startFrame=1, endFrame=120 ):
+    '''
+    Count the nodes that drive the twist joints of each module and their profiled evaluation time
+    over the frame range. Run it on a 'den' and a 'matrix' twistMode build to compare.
+    Returns { key: [ nodeCount, msPerFrame ] }.
+    '''
+    registry = quadBT.quad_loadRegistry()
+    NodeTimes = quad_recordProfile( startFrame=startFrame, endFrame=endFrame )
+    frames = float( int(endFrame) - int(startFrame) + 1 )
+    Results = {}
+    for key in keys:
+        Network = quad_drivingNetwork( Jnts=registry[key]['BindJnts'] )
+        Results[key] = [ len( Network ), sum( NodeTimes.get( node, 0.0 ) for node in Network ) / frames ]
+        print( '%-18s %4d nodes  %7.3f ms per frame' % ( key, Results[key][0], Results[key][1] ) )
+    print( '========================= twist total: %d nodes, %.3f ms per frame'
+           % ( sum( result[0] for result in Results.values() ), sum( result[1] for result in Results.values() ) ) )
+    return Results
+
+
+# ---------------------------------------------------------------------------------------
+# safety cover benchmark
+# compares RigConfig['safetyCovers']: one den_AddSafetyCovers call per rig group against the
+# single quadBT.quad_applySafetyCovers pass over the registry
+
+def quad_safetyCoverBenchmark( denCovers=None, sceneFile=None, registry=None ):
+    '''
+    Time both safety cover paths, each on its own fresh copy of a scratch build made with
+    RigConfig['safetyCovers'] 'none' (sceneFile, the open scene if not given). denCovers is
+    den_AddSafetyCovers (passed in, the den_* modules are not imported here), run once for every
+    registered rig group. The scene is opened again before each path, so neither path finds the
+    flags already set. Returns { 'den': sec, 'bulk': sec }.
+    '''
+    if sceneFile is None:
+        sceneFile = cmds.file( q=True, sceneName=True )
+    if not sceneFile:
+        raise RuntimeError( 'save the scratch build first, both paths start from the saved file' )
+
+    Results = {}
+    cmds.file( sceneFile, open=True, force=True )
+    if registry is None:
+        registry = quadBT.quad_loadRegistry()
+    Groups = []
+    for key in sorted( registry ):
+        rigGrp = registry[key].get( 'RigGrp' )
+        if key != 'Base' and rigGrp and rigGrp not in Groups and cmds.objExists( rigGrp ):
+            Groups.append( rigGrp )
+    start = time.time()
+    for rigGrp in Groups:
+        denCovers( rigGroup=rigGrp )
+    Results['den'] = time.time() - start
+
+    cmds.file( sceneFile, open=True, force=True )
+    start = time.time()
+    quadBT.quad_applySafetyCovers( registry=registry )
+    Results['bulk'] = time.time() - start
+
+    print( '========================= safety covers: den %.3f sec (%d calls), bulk %.3f sec (1 pass), %.1fx'
+           % ( Results['den'], len(Groups), Results['bulk'], Results['den'] / max( Results['bulk'], 1e-6 ) ) )
+    return Results
+
+
+# ---------------------------------------------------------------------------------------
+# scene optimizer report
+# saves the rig before and after quadBT.quad_optimizeScene and opens both copies in a fresh mayapy,
+# so node count, file size, load time and memory are compared on the same machine
+
+def quad_loadWorker( path='', reference=False ):
+    '''
+    Worker side, runs inside mayapy: open path (or reference it into an empty scene, the way animators
+    load the rig) and print its load time, memory and node count as JSON
+    '''
+    before = cmds.memory( heapMemory=True, megaByte=True )
+    start = time.time()
+    if reference:
+        cmds.file( path, reference=True, namespace='rig' )
+    else:
+        cmds.file( path, open=True, force=True )
+    seconds = time.time() - start
+    print( 'QUAD_LOAD '+json.dumps( { 'seconds': seconds, 'memoryMB': cmds.memory( heapMemory=True, megaByte=True ) - before,
+                                      'nodes': len( cmds.ls() ) } ) )
+
+
+def quad_measureSceneFile( path='', reference=False ):
+    '''open (or reference) path in a new mayapy and return { 'fileMB', 'seconds', 'memoryMB', 'nodes' }'''
+    env = dict( os.environ )
+    env['PYTHONPATH'] = os.pathsep.join( [ os.path.dirname( os.path.abspath( __file__ ) ), env.get( 'PYTHONPATH', '' ) ] )
+    code = ( 'import maya.standalone; maya.standalone.initialize(); import Quad_PerfTools as quadPT; '
+             'quadPT.quad_loadWorker( path=%r, reference=%r )' % ( path, reference ) )
+    output = subprocess.run( [ quadET.quad_mayapy(), '-c', code ], env=env, stdout=subprocess.PIPE, universal_newlines=True, check=True ).stdout
+    Results = json.loads( [ line for line in output.splitlines() if line.startswith( 'QUAD_LOAD ' ) ][-1][len( 'QUAD_LOAD ' ):] )
+    Results['fileMB'] = os.path.getsize( path ) / 1048576.0
+    return Results
+
+
+def quad_optimizeReport( directory='', name='Rig', deletePivots=True, registry=None ):
+    '''
+    Export the scene, run quadBT.quad_optimizeScene on it, export again and measure both files.
+    The optimization stays in the open scene. Returns { 'before', 'after', 'optimize' }.
+    '''
+    if registry is None:
+        registry = quadBT.quad_loadRegistry()
+    if not os.path.isdir( directory ):
+        os.makedirs( directory )
+    Results = {}
+    for stage in [ 'before', 'after' ]:
+        if stage == 'after':
+            Results['optimize'] = quadBT.quad_optimizeScene( registry=registry, deletePivots=deletePivots )
+            # the saved registry and node map still name the deleted nodes
+            for rigGroup in ( cmds.ls( '*.'+quadBT.RegistryAttr, objectsOnly=True ) or [] )[:1]:
+                quadBT.quad_saveRegistry( rigGroup=rigGroup, registry=registry )
+                quadBT.quad_saveNodeMap( rigGroup=rigGroup, NodeMap=quadBT.quad_buildNodeMap( registry=registry ) )
+        path = os.path.join( directory, name+'_'+stage+'.mb' )
+        cmds.file( path, exportAll=True, type='mayaBinary', force=True )
+        Results[stage] = quad_measureSceneFile( path=path )
+
+    print( '========================= scene optimizer report' )
+    for key, label in [ ( 'nodes', 'nodes' ), ( 'fileMB', 'file MB' ), ( 'seconds', 'load sec' ), ( 'memoryMB', 'memory MB' ) ]:
+        print( '%-10s %10.2f -> %10.2f' % ( label, Results['before'][key], Results['after'][key] ) )
+    return Results
+
+
+def quad_checkDuplicateConstraints():
+    '''
+    Regression case for the duplicate constraint report, in a new scene: L_ and R_ SpaceIN groups both
+    constrained to one L_ joint (the R_FinF driver mistake) must come back as one duplicate pair.
+    Returns the pairs, raises RuntimeError when the report misses them.
+    '''
+    cmds.file( new=True, force=True )
+    cmds.select( clear=True )
+    driver = cmds.joint( name='L_Hip_Jx', position=( 10.0, 100.0, 0.0 ) )
+    Driven = []
+    for side, x in zip( quadBT.MirrorSides, ( 10.0, -10.0 ) ):
+        Driven.append( cmds.group( empty=True, world=True, name=side+'FinF_SpaceIN' ) )
+        cmds.xform( Driven[-1], ws=True, t=( x, 120.0, 0.0 ) )
+        cmds.parentConstraint( driver, Driven[-1], mo=True )
+    Duplicates = quadBT.quad_findRedundantConstraints()[1]
+    if len( Duplicates ) != 1:
+        raise RuntimeError( 'expected one duplicate pair for '+' and '.join( Driven )+', the report found '+str( Duplicates ) )
+    print( '========================= duplicate constraint report ok: '+' repeats '.join( Duplicates[0][::-1] ) )
+    return Duplicates
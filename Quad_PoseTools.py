@@ -0,0 +1,315 @@
+# ---------------------------------------------------------------------------------------
+# Quad_PoseTools
+# Pose helpers for the Quadruped Auto-Rig Tool
+#
+# ---------------------------------------------------------------------------------------
+# A pose library keyed to the rig's registered controls, so the many fins, crests and toes
+# can be posed again in one go instead of by hand.
+#
+# Needs NumPy (ships with mayapy 2022+, otherwise pip install it into Maya's Python).
+#
+# Import it the same way as the den_* modules:
+#     import Quad_PoseTools as quadPO
+#     importlib.reload(quadPO)
+# ---------------------------------------------------------------------------------------
+# (c) 2025 by Arrow Lyu. All rights reserved. For portfolio and educational use only.
+# ---------------------------------------------------------------------------------------
+
+
+import fnmatch
+import os
+import struct
+import time
+
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+
+import Quad_BuildTools as quadBT
+import Quad_AnimTools as quadAT
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# ---------------------------------------------------------------------------------------
+# pose library format (little endian), one file per library
+#   header   'QPOS', uint16 version, uint32 channels, uint32 poses
+#   channels per channel: uint16 name length, 'Ctrl.attr' name, uint8 name length, module key
+#   poses    per pose: uint8 name length, name, channels x float32 in internal units (cm, radians)
+# a channel a pose does not store is NaN, so partial poses share the same index
+
+PoseMagic = b'QPOS'
+PoseVersion = 1
+
+
+def quad_poseChannels( registry=None ):
+    '''
+    The keyable, unlocked scalar channels of every registered control.
+    Returns [ Channels, Keys ], 'Ctrl.attr' names and the module key of each.
+    '''
+    if registry is None:
+        registry = quadBT.quad_loadRegistry()
+    Channels = []
+    Keys = []
+    Seen = set()
+    for key in sorted( registry ):
+        for ctrl in registry[key].get( 'Ctrls', [] ):
+            if ctrl in Seen or not cmds.objExists( ctrl ):
+                continue
+            Seen.add( ctrl )
+            for attr in cmds.listAttr( ctrl, keyable=True, unlocked=True, scalar=True ) or []:
+                Channels.append( ctrl+'.'+attr )
+                Keys.append( key )
+    return [ Channels, Keys ]
+
+
+def quad_channelPlugs( Channels=[] ):
+    '''MPlugs of Channels, None for the ones missing from the scene; every node is looked up once'''
+    Nodes = {}
+    Plugs = []
+    for channel in Channels:
+        node, attr = channel.split( '.', 1 )
+        if node not in Nodes:
+            selection = om.MSelectionList()
+            try:
+                selection.add( node )
+                Nodes[node] = om.MFnDependencyNode( selection.getDependNode( 0 ) )
+            except RuntimeError:
+                Nodes[node] = None
+        try:
+            Plugs.append( Nodes[node].findPlug( attr, False ) if Nodes[node] else None )
+        except RuntimeError:
+            Plugs.append( None )
+    return Plugs
+
+
+def quad_readPoseLibrary( path='' ):
+    '''Returns [ Channels, Keys, Poses ] of a library file, Poses as { name: float32 array }; empty if the file does not exist'''
+    quadAT.quad_requireNumpy()
+    if not os.path.exists( path ):
+        return [ [], [], {} ]
+    with open( path, 'rb' ) as handle:
+        data = handle.read()
+    if data[:4] != PoseMagic:
+        raise RuntimeError( path+' is not a pose library' )
+    version, channels, poses = struct.unpack_from( '<HII', data, 4 )
+    offset = 4 + struct.calcsize( '<HII' )
+    Channels = []
+    Keys = []
+    for c in range( channels ):
+        length = struct.unpack_from( '<H', data, offset )[0]
+        Channels.append( data[offset+2:offset+2+length].decode( 'utf-8' ) )
+        offset += 2 + length
+        length = data[offset]
+        Keys.append( data[offset+1:offset+1+length].decode( 'utf-8' ) )
+        offset += 1 + length
+    Poses = {}
+    for p in range( poses ):
+        length = data[offset]
+        name = data[offset+1:offset+1+length].decode( 'utf-8' )
+        offset += 1 + length
+        Poses[name] = np.frombuffer( data, dtype='<f4', count=channels, offset=offset ).copy()
+        offset += channels * 4
+    return [ Channels, Keys, Poses ]
+
+
+def quad_writePoseLibrary( path='', Channels=[], Keys=[], Poses={} ):
+    '''write a whole library file, Poses as { name: array of len(Channels) }'''
+    with open( path, 'wb' ) as handle:
+        handle.write( PoseMagic + struct.pack( '<HII', PoseVersion, len(Channels), len(Poses) ) )
+        for channel, key in zip( Channels, Keys ):
+            channel = channel.encode( 'utf-8' )
+            key = key.encode( 'utf-8' )
+            handle.write( struct.pack( '<H', len(channel) ) + channel + struct.pack( '<B', len(key) ) + key )
+        for name in sorted( Poses ):
+            label = name.encode( 'utf-8' )
+            handle.write( struct.pack( '<B', len(label) ) + label )
+            handle.write( np.asarray( Poses[name], dtype='<f4' ).tobytes() )
+    return path
+
+
+def quad_poseMask( Channels=[], Keys=[], modules=None, ctrls=None ):
+    '''
+    Boolean mask over Channels for a partial pose. modules and ctrls are lists of fnmatch patterns
+    on the module keys and control names, e.g. modules=['L_Fin[A-I]'] for every L_ side fin;
+    None for both keeps everything.
+    '''
+    Mask = np.ones( len(Channels), dtype=bool )
+    if modules is not None:
+        Mask &= np.array( [ any( fnmatch.fnmatchcase( key, pattern ) for pattern in modules ) for key in Keys ], dtype=bool )
+    if ctrls is not None:
+        Mask &= np.array( [ any( fnmatch.fnmatchcase( channel.split( '.' )[0], pattern ) for pattern in ctrls ) for channel in Channels ], dtype=bool )
+    return Mask
+
+
+def quad_capturePose( Channels=[] ):
+    '''current values of Channels as a float32 array in internal units, NaN for channels missing from the scene'''
+    quadAT.quad_requireNumpy()
+    return np.array( [ plug.asDouble() if plug is not None else np.nan for plug in quad_channelPlugs( Channels ) ], dtype='float32' )
+
+
+def quad_savePose( path='', name='', registry=None, modules=None, ctrls=None ):
+    '''
+    Add the current pose of the rig in the scene to the library file (made if needed) under name,
+    replacing a pose of the same name. modules/ctrls store a partial pose, see quad_poseMask.
+    New controls are added to the library index, older poses leave them out.
+    Returns the number of channels stored.
+    '''
+    quadAT.quad_requireNumpy()
+    Channels, Keys, Poses = quad_readPoseLibrary( path=path )
+    RigChannels, RigKeys = quad_poseChannels( registry=registry )
+    Index = { channel: c for c, channel in enumerate( Channels ) }
+    Added = [ ( channel, key ) for channel, key in zip( RigChannels, RigKeys ) if channel not in Index ]
+    if Added:
+        Channels = Channels + [ channel for channel, key in Added ]
+        Keys = Keys + [ key for channel, key in Added ]
+        Poses = { pose: np.concatenate( [ Values, np.full( len(Added), np.nan, dtype='float32' ) ] ) for pose, Values in Poses.items() }
+
+    Values = np.full( len(Channels), np.nan, dtype='float32' )
+    Captured = quad_capturePose( Channels=RigChannels )
+    Mask = quad_poseMask( Channels=RigChannels, Keys=RigKeys, modules=modules, ctrls=ctrls )
+    Index = { channel: c for c, channel in enumerate( Channels ) }
+    Positions = np.array( [ Index[channel] for channel in RigChannels ], dtype=int )
+    Values[Positions[Mask]] = Captured[Mask]
+    Poses[name] = Values
+    quad_writePoseLibrary( path=path, Channels=Channels, Keys=Keys, Poses=Poses )
+    print( '========================= saved pose %s (%d channels) to %s' % ( name, int( Mask.sum() ), path ) )
+    return int( Mask.sum() )
+
+
+def quad_setChannels( Plugs=[], Values=[] ):
+    '''set every plug to its value with one MDGModifier, skipping missing and locked plugs; returns [ modifier, count ]'''
+    modifier = om.MDGModifier()
+    count = 0
+    for plug, value in zip( Plugs, list( Values ) ):
+        if plug is None or plug.isLocked:
+            continue
+        modifier.newPlugValueDouble( plug, float( value ) )
+        count += 1
+    modifier.doIt()
+    return [ modifier, count ]
+
+
+def quad_applyPose( path='', name='', modules=None, ctrls=None, blend=1.0, mirror=False, Library=None ):
+    '''
+    Put the rig in the scene into a pose of the library file with one MDGModifier.
+    modules/ctrls apply only part of the pose (see quad_poseMask), blend mixes from the current
+    pose (0) to the stored one (1), mirror applies the pose flipped to the other side (the mask then
+    picks the channels that receive it). Library is an already read [ Channels, Keys, Poses ] to skip
+    reading the file. Returns [ modifier, channels ]; modifier.undoIt() puts the old pose back.
+    '''
+    quadAT.quad_requireNumpy()
+    start = time.time()
+    Channels, Keys, Poses = Library if Library is not None else quad_readPoseLibrary( path=path )
+    if name not in Poses:
+        raise RuntimeError( 'pose '+name+' is not in '+str( path ) )
+    Values = Poses[name].astype( float )
+    if mirror:
+        Source, Signs = quad_mirrorChannelMap( Channels=Channels )
+        Values = Values[Source] * Signs
+    Mask = quad_poseMask( Channels=Channels, Keys=Keys, modules=modules, ctrls=ctrls ) & ~np.isnan( Values )
+    Plugs = quad_channelPlugs( [ channel for channel, use in zip( Channels, Mask ) if use ] )
+    Values = Values[Mask]
+    if blend != 1.0:
+        Current = np.array( [ plug.asDouble() if plug is not None else 0.0 for plug in Plugs ] )
+        Values = Current + ( Values - Current ) * blend
+
+    modifier, count = quad_setChannels( Plugs=Plugs, Values=Values )
+    print( '========================= applied pose %s to %d channels in %.2f ms' % ( name, count, ( time.time()-start ) * 1000.0 ) )
+    return [ modifier, count ]
+
+
+# ---------------------------------------------------------------------------------------
+# mirroring
+# uses the mirror table cached on the rig (quadBT.quad_loadMirrorTable): each channel takes the
+# value of the same channel on the partner control times the flip sign of its axis
+
+MirrorAxes = { 'translateX':(1,0), 'translateY':(1,1), 'translateZ':(1,2), 'rotateX':(2,0), 'rotateY':(2,1), 'rotateZ':(2,2) }
+
+
+def quad_mirrorChannelMap( Channels=[], MirrorTable=None ):
+    '''
+    For every channel the index of the channel its mirrored value comes from, and the sign to apply.
+    Channels of controls without a mirror keep their own value. Returns [ Source, Signs ] arrays, so a
+    whole pose or a whole frames x channels block is mirrored with Values[..., Source] * Signs.
+    '''
+    if MirrorTable is None:
+        MirrorTable = quadBT.quad_loadMirrorTable()
+    Index = { channel: c for c, channel in enumerate( Channels ) }
+    Source = np.arange( len(Channels) )
+    Signs = np.ones( len(Channels) )
+    for c, channel in enumerate( Channels ):
+        ctrl, attr = channel.split( '.', 1 )
+        if ctrl not in MirrorTable:
+            continue
+        entry = MirrorTable[ctrl]
+        partnerChannel = entry[0]+'.'+attr
+        if partnerChannel not in Index:
+            continue
+        Source[c] = Index[partnerChannel]
+        if attr in MirrorAxes:
+            field, axis = MirrorAxes[attr]
+            Signs[c] = entry[field][axis]
+    return [ Source, Signs ]
+
+
+def quad_mirrorPose( registry=None, modules=None, ctrls=None, MirrorTable=None ):
+    '''
+    Mirror the current pose of the rig in the scene with one capture and one MDGModifier.
+    modules/ctrls pick the channels that receive the mirrored values (see quad_poseMask), e.g.
+    modules=['R_*'] copies the L_ side onto the R_ side. Returns [ modifier, channels ].
+    '''
+    quadAT.quad_requireNumpy()
+    start = time.time()
+    Channels, Keys = quad_poseChannels( registry=registry )
+    Source, Signs = quad_mirrorChannelMap( Channels=Channels, MirrorTable=MirrorTable )
+    Values = quad_capturePose( Channels=Channels ).astype( float )[Source] * Signs
+    Mask = quad_poseMask( Channels=Channels, Keys=Keys, modules=modules, ctrls=ctrls ) & ~np.isnan( Values )
+    Plugs = quad_channelPlugs( [ channel for channel, use in zip( Channels, Mask ) if use ] )
+    modifier, count = quad_setChannels( Plugs=Plugs, Values=Values[Mask] )
+    print( '========================= mirrored %d channels in %.2f ms' % ( count, ( time.time()-start ) * 1000.0 ) )
+    return [ modifier, count ]
+
+
+def quad_mirrorAnimation( registry=None, MirrorTable=None ):
+    '''
+    Mirror the animation of every control: each animation curve is moved onto the mirrored channel
+    with one MDGModifier, and all curves that need their values negated are flipped by one scaleKey
+    call (tangents included). Channels without a curve take the mirrored static value.
+    Returns the number of curves moved.
+    '''
+    quadAT.quad_requireNumpy()
+    start = time.time()
+    Channels, Keys = quad_poseChannels( registry=registry )
+    Source, Signs = quad_mirrorChannelMap( Channels=Channels, MirrorTable=MirrorTable )
+    Plugs = quad_channelPlugs( Channels )
+    Curves = []
+    for plug in Plugs:
+        source = plug.source() if plug is not None else None
+        Curves.append( source if source is not None and not source.isNull and source.node().hasFn( om.MFn.kAnimCurve ) else None )
+    Values = quad_capturePose( Channels=Channels ).astype( float )
+
+    modifier = om.MDGModifier()
+    for plug, curve in zip( Plugs, Curves ):
+        if curve is not None and not plug.isLocked:
+            modifier.disconnect( curve, plug )
+    Flip = []
+    moved = 0
+    for c, plug in enumerate( Plugs ):
+        if plug is None or plug.isLocked:
+            continue
+        curve = Curves[Source[c]]
+        if curve is not None:
+            modifier.connect( curve, plug )
+            if Signs[c] < 0.0:
+                Flip.append( om.MFnDependencyNode( curve.node() ).name() )
+            moved += 1
+        elif not np.isnan( Values[Source[c]] ):
+            modifier.newPlugValueDouble( plug, Values[Source[c]] * Signs[c] )
+    modifier.doIt()
+    if Flip:
+        cmds.scaleKey( Flip, valueScale=-1.0, valuePivot=0.0 )
+    print( '========================= mirrored %d curves (%d negated) in %.2f ms' % ( moved, len(Flip), ( time.time()-start ) * 1000.0 ) )
+    return moved
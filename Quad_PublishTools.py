@@ -0,0 +1,409 @@
+# ---------------------------------------------------------------------------------------
+# Quad_PublishTools
+# Publish helpers for the Quadruped Auto-Rig Tool
+#
+# ---------------------------------------------------------------------------------------
+# Turns a built rig scene into the animation rig file animators reference: everything that is
+# only needed to rebuild is stripped, the rig hierarchy is locked, and the reference load time
+# and memory of both files are logged for every release.
+#
+# Import it the same way as the den_* modules:
+#     import Quad_PublishTools as quadPB
+#     importlib.reload(quadPB)
+# ---------------------------------------------------------------------------------------
+# (c) 2025 by Arrow Lyu. All rights reserved. For portfolio and educational use only.
+# ---------------------------------------------------------------------------------------
+
+
+import fnmatch
+import json
+import os
+import time
+
+import maya.cmds as cmds
+import maya.mel as mel
+import maya.api.OpenMaya as om
+
+import Quad_BuildTools as quadBT
+import Quad_PerfTools as quadPT
+
+
+# node types an animation rig never needs: leftovers of missing plugins, bind poses and node editor tabs
+StripNodeTypes = [ 'unknown', 'unknownDag', 'unknownTransform', 'dagPose', 'nodeGraphEditorInfo' ]
+
+
+def quad_stripHistory( registry={} ):
+    '''
+    Delete the construction history of the control curves and bake the non-deformer history of the
+    meshes into them (skinClusters and other deformers stay). Returns [ ctrls, meshes ] cleaned.
+    '''
+    Ctrls = []
+    for ctrl in quadBT.quad_registryNodes( registry=registry, field='Ctrls' ):
+        for shape in ( quadBT.quad_ctrlShapes( ctrl ) if cmds.objExists( ctrl ) else [] ):
+            History = cmds.listHistory( shape, pruneDagObjects=True ) or []
+            if History and not cmds.ls( History, type='geometryFilter' ):
+                cmds.delete( shape, constructionHistory=True )
+                Ctrls.append( ctrl )
+
+    Referenced = set( cmds.ls( referencedNodes=True ) or [] )
+    Meshes = [ mesh for mesh in cmds.ls( type='mesh', noIntermediate=True ) or [] if mesh not in Referenced
+               and cmds.listHistory( mesh, pruneDagObjects=True ) ]
+    if Meshes:
+        cmds.bakePartialHistory( Meshes, prePostDeformers=True )
+    return [ sorted( set( Ctrls ) ), Meshes ]
+
+
+def quad_stripLeftovers():
+    '''delete StripNodeTypes, unused shading nodes and the requirements of unknown plugins, returns the count of nodes removed'''
+    before = len( cmds.ls() )
+    Nodes = [ node for node in cmds.ls( type=StripNodeTypes ) or [] if not cmds.lockNode( node, q=True, lock=True )[0] ]
+    if Nodes:
+        cmds.delete( Nodes )
+    mel.eval( 'MLdeleteUnused' )
+    for plugin in cmds.unknownPlugin( q=True, list=True ) or []:
+        cmds.unknownPlugin( plugin, remove=True )
+    return before - len( cmds.ls() )
+
+
+def quad_lockHierarchy( rigGroup='' ):
+    '''lock the root rig group and every DAG node below it, so they can't be deleted, renamed or reparented'''
+    Nodes = [ rigGroup ] + ( cmds.listRelatives( rigGroup, allDescendents=True, fullPath=True ) or [] )
+    cmds.lockNode( Nodes, lock=True )
+    return len( Nodes )
+
+
+def quad_stripRig( rigGroup='', registry={} ):
+    '''
+    Everything a publish removes: quadBT.quad_optimizeScene with the pivot hierarchy, control and mesh
+    history, leftovers and unused shading nodes, then the registry and node map are saved again.
+    Returns { 'optimize', 'strip' } counts.
+    '''
+    Report = { 'optimize': quadBT.quad_optimizeScene( registry=registry, deletePivots=True ) }
+    Report['optimize'].pop( 'duplicateConstraints' )
+    Ctrls, Meshes = quad_stripHistory( registry=registry )
+    Report['strip'] = { 'ctrlHistory': len( Ctrls ), 'meshHistory': len( Meshes ), 'leftovers': quad_stripLeftovers() }
+
+    # the saved registry and node map still name the deleted nodes
+    quadBT.quad_saveRegistry( rigGroup=rigGroup, registry=registry )
+    quadBT.quad_saveNodeMap( rigGroup=rigGroup, NodeMap=quadBT.quad_buildNodeMap( registry=registry ) )
+    return Report
+
+
+def quad_openBuild( rigFile=None, publishFile='' ):
+    '''open rigFile (or check the open scene is saved), returns [ rigFile, rigGroup, registry ]'''
+    if rigFile:
+        cmds.file( rigFile, open=True, force=True )
+    rigFile = cmds.file( q=True, sceneName=True )
+    if not rigFile or cmds.file( q=True, modified=True ):
+        raise RuntimeError( 'save the built rig first, it stays untouched and is measured against the publish' )
+    if os.path.abspath( rigFile ) == os.path.abspath( publishFile ):
+        raise RuntimeError( 'the publish must not overwrite the built rig '+rigFile )
+    rigGroup = cmds.ls( '*.'+quadBT.RegistryAttr, objectsOnly=True )[0]
+    return [ rigFile, rigGroup, quadBT.quad_loadRegistry( rigGroup=rigGroup ) ]
+
+
+def quad_saveScene( path='' ):
+    '''save the open scene as path, binary unless path ends in .ma (binary parses faster when referenced)'''
+    directory = os.path.dirname( os.path.abspath( path ) )
+    if not os.path.isdir( directory ):
+        os.makedirs( directory )
+    cmds.file( rename=path )
+    cmds.file( save=True, force=True, type='mayaAscii' if path.endswith( '.ma' ) else 'mayaBinary' )
+
+
+def quad_appendLog( logFile='', Entry={} ):
+    '''append Entry to the JSON list in logFile'''
+    Log = []
+    if os.path.isfile( logFile ):
+        with open( logFile ) as handle:
+            Log = json.load( handle )
+    Log.append( Entry )
+    with open( logFile, 'w' ) as handle:
+        json.dump( Log, handle, indent=1 )
+
+
+def quad_publishRig( rigFile=None, publishFile='', release='', logFile=None, measure=True ):
+    '''
+    Open rigFile (or use the open, saved scene), strip it down to an animation rig and save it as publishFile.
+    quadBT.quad_optimizeScene removes dead nodes and the pivot hierarchy, then history, leftovers and
+    unused shading nodes go, the registry is saved again and the rig hierarchy is locked.
+    With measure, both files are referenced into a fresh mayapy and their load time and memory are
+    appended to logFile (publish_log.json next to publishFile) under the release label.
+    From a shell:
+        mayapy -c "import maya.standalone; maya.standalone.initialize(); import Quad_PublishTools as quadPB; quadPB.quad_publishRig( rigFile='Rimerock_Rig.mb', publishFile='publish/Rimerock_Anim.mb', release='v012' )"
+    '''
+    startTime = time.time()
+    rigFile, rigGroup, registry = quad_openBuild( rigFile=rigFile, publishFile=publishFile )
+    Entry = { 'release': release, 'date': time.strftime( '%Y-%m-%d %H:%M:%S' ), 'maya': cmds.about( version=True ),
+              'rigFile': rigFile, 'publishFile': os.path.abspath( publishFile ) }
+    Entry.update( quad_stripRig( rigGroup=rigGroup, registry=registry ) )
+    Entry['locked'] = quad_lockHierarchy( rigGroup=rigGroup )
+    quad_saveScene( path=publishFile )
+    print( '========================= published %s in %.1f sec' % ( publishFile, time.time()-startTime ) )
+
+    if measure:
+        Entry['rig'] = quadPT.quad_measureSceneFile( path=rigFile, reference=True )
+        Entry['publish'] = quadPT.quad_measureSceneFile( path=publishFile, reference=True )
+        quad_appendLog( logFile=logFile or os.path.join( os.path.dirname( os.path.abspath( publishFile ) ), 'publish_log.json' ), Entry=Entry )
+        print( '========================= reference load, built rig -> published (%s)' % ( release or 'no release label' ) )
+        for key, label in [ ( 'nodes', 'nodes' ), ( 'fileMB', 'file MB' ), ( 'seconds', 'load sec' ), ( 'memoryMB', 'memory MB' ) ]:
+            print( '%-10s %10.2f -> %10.2f' % ( label, Entry['rig'][key], Entry['publish'][key] ) )
+    return Entry
+
+
+# ---------------------------------------------------------------------------------------
+# split publish
+# the core rig (base, torso, tail, legs, toes, eyes, head parts) in one file and every appendage family
+# in its own file; a package only attaches to the core by name: its groups go back under their core
+# groups, every SpaceIN follows a named SpaceOUT of the core registry, and core controls drive its
+# display attributes (Show_Controls, Rig_LOD...)
+
+# package name: registry keys (fnmatch) of the modules it holds
+AppendagePackages = {
+    'Fins': [ '?_Fin[A-I]' ],
+    'Crests': [ 'Crest?', 'Chinfin', '?_Headfin' ],
+    'ArmSpikes': [ '?_FinArm?' ],
+    'LegSpikes': [ '?_FinLeg?' ],
+    'Whiskers': [ '?_Whisker' ],
+    }
+
+
+def quad_packageKeys( registry={}, Patterns=[] ):
+    '''registry keys matching any of Patterns'''
+    return sorted( key for key in registry if any( fnmatch.fnmatchcase( key, pattern ) for pattern in Patterns ) )
+
+
+def quad_namedSpaceOUTs( registry={} ):
+    '''{ label: node } of every NamedSpaceOUTs entry in the registry'''
+    Named = {}
+    for entry in registry.values():
+        Named.update( entry.get( 'NamedSpaceOUTs', {} ) )
+    return Named
+
+
+def quad_packageNodes( registry={}, keys=[] ):
+    '''
+    Every node of the modules in keys: their rig groups with everything below, the proxy pieces their
+    bind joints drive, and the DG nodes that only feed those. Returns [ Tops, Nodes ].
+    '''
+    Tops = [ registry[key]['RigGrp'] for key in keys if cmds.objExists( registry[key].get( 'RigGrp', '' ) ) ]
+    Inside = set( cmds.ls( Tops + ( cmds.listRelatives( Tops, allDescendents=True, fullPath=True ) or [] ) ) )
+    for jnt in quadBT.quad_registryNodes( registry=registry, field='BindJnts', keys=keys ):
+        for consumer in ( quadBT.quad_consumers( jnt ) if cmds.objExists( jnt ) else [] ):
+            for driven in ( quadBT.quad_consumers( consumer ) if cmds.ls( consumer, type='constraint' ) else [ consumer ] ):
+                if driven not in Inside and cmds.listRelatives( driven, shapes=True, type='mesh' ):
+                    Tops.append( driven )
+                    Inside |= set( cmds.ls( [ driven ] + ( cmds.listRelatives( driven, allDescendents=True, fullPath=True ) or [] ) ) )
+
+    # grow into the DG nodes nothing but the package reads from
+    Dag = set( cmds.ls( dag=True ) or [] )
+    Queue = list( Inside )
+    while Queue:
+        for node in cmds.listConnections( Queue.pop(), s=True, d=False, skipConversionNodes=False ) or []:
+            if node not in Inside and node not in Dag and quadBT.quad_consumers( node ) <= Inside:
+                Inside.add( node )
+                Queue.append( node )
+    return [ Tops, sorted( Inside ) ]
+
+
+def quad_detachSpaceINs( registry={}, keys=[] ):
+    '''
+    Take the SpaceIN constraints of the modules in keys off. Returns [ spaceIN, driver, offset ] rows,
+    offset being the SpaceIN world matrix in the space of its driver (16 floats).
+    '''
+    Rows = []
+    for spaceIN in quadBT.quad_registryNodes( registry=registry, field='SpaceINs', keys=keys ):
+        Constraints = list( set( cmds.listConnections( spaceIN, s=True, d=False, type='constraint' ) or [] ) )
+        Drivers = set()
+        for constraint in Constraints:
+            Drivers |= set( cmds.listConnections( constraint+'.target', s=True, d=False ) or [] ) - set( [ constraint, spaceIN ] )
+        if not Drivers:
+            continue
+        if len( Drivers ) > 1:
+            raise RuntimeError( spaceIN+' follows '+', '.join( sorted( Drivers ) )+', a package SpaceIN can only attach to one SpaceOUT' )
+        driver = Drivers.pop()
+        offset = om.MMatrix( cmds.xform( spaceIN, q=True, ws=True, matrix=True ) ) * om.MMatrix( cmds.xform( driver, q=True, ws=True, matrix=True ) ).inverse()
+        cmds.delete( Constraints )
+        Rows.append( [ spaceIN, driver, [ offset.getElement( row, column ) for row in range(4) for column in range(4) ] ] )
+    return Rows
+
+
+def quad_boundaryConnections( Nodes=[] ):
+    '''
+    Returns [ Incoming, Outgoing ], [ source plug, destination plug ] pairs between Nodes and the rest of the
+    scene. Connections from default nodes (time1...) are left out, every scene has its own.
+    '''
+    Inside = set( Nodes ) | set( cmds.ls( defaultNodes=True ) or [] )
+    Incoming = []
+    Outgoing = []
+    for node in Nodes:
+        Pairs = cmds.listConnections( node, s=True, d=False, connections=True, plugs=True, skipConversionNodes=False ) or []
+        for destination, source in zip( Pairs[0::2], Pairs[1::2] ):
+            if source.split( '.' )[0] not in Inside:
+                Incoming.append( [ source, destination ] )
+        Pairs = cmds.listConnections( node, s=False, d=True, connections=True, plugs=True, skipConversionNodes=False ) or []
+        for source, destination in zip( Pairs[0::2], Pairs[1::2] ):
+            consumer = destination.split( '.' )[0]
+            if consumer not in Inside and not cmds.ls( consumer, type=quadBT.IgnoredConsumerTypes ):
+                Outgoing.append( [ source, destination ] )
+    return [ Incoming, Outgoing ]
+
+
+def quad_unlockPlugs( Plugs=[] ):
+    '''unlock Plugs, a plug locked in a referenced file can't be unlocked to connect it on load'''
+    for plug in Plugs:
+        if cmds.getAttr( plug, lock=True ):
+            cmds.setAttr( plug, lock=False )
+
+
+def quad_splitPublish( rigFile=None, directory='', name='Rig', Packages=AppendagePackages, release='', logFile=None, measure=True ):
+    '''
+    Publish the rig as a core file plus one file per appendage package, all stripped like quad_publishRig.
+    Writes <name>_Core.mb, <name>_<package>.mb and <name>_packages.json (files, module keys and the named
+    attachments: core parent groups, SpaceOUT labels with the SpaceIN offsets, core control attributes).
+    Every SpaceIN driver becomes a NamedSpaceOUTs entry of the core registry (the torso ones keep their
+    labels, other drivers are added to Base under their own name). Raises RuntimeError when a package has
+    any other connection to the core, e.g. a core deformer reading from it (the combined proxy, use
+    RigConfig['proxyMode'] 'pieces', or render geometry skinned to fin joints).
+    '''
+    startTime = time.time()
+    coreFile = os.path.join( directory, name+'_Core.mb' )
+    rigFile, rigGroup, registry = quad_openBuild( rigFile=rigFile, publishFile=coreFile )
+    Entry = { 'release': release, 'date': time.strftime( '%Y-%m-%d %H:%M:%S' ), 'maya': cmds.about( version=True ),
+              'rigFile': rigFile, 'publishFile': os.path.abspath( coreFile ), 'packages': {} }
+    Entry.update( quad_stripRig( rigGroup=rigGroup, registry=registry ) )
+
+    PackageKeys = dict( ( package, quad_packageKeys( registry=registry, Patterns=Packages[package] ) ) for package in Packages )
+    AllPackageKeys = set( key for keys in PackageKeys.values() for key in keys )
+    CoreCtrls = set( quadBT.quad_registryNodes( registry=registry, field='Ctrls', keys=[ key for key in registry if key not in AllPackageKeys ] ) )
+    GroupKeys = dict( ( entry['RigGrp'], key ) for key, entry in registry.items() if 'RigGrp' in entry and key not in AllPackageKeys )
+
+    Manifest = { 'core': os.path.basename( coreFile ), 'packages': {} }
+    Split = []
+    for package in sorted( Packages ):
+        keys = PackageKeys[package]
+        if not keys:
+            continue
+        Spaces = []
+        for spaceIN, driver, offset in quad_detachSpaceINs( registry=registry, keys=keys ):
+            Labels = dict( ( node, label ) for label, node in quad_namedSpaceOUTs( registry=registry ).items() )
+            if driver not in Labels:
+                registry.setdefault( 'Base', {} ).setdefault( 'NamedSpaceOUTs', {} )[driver] = driver
+                Labels[driver] = driver
+            Spaces.append( [ spaceIN, Labels[driver], offset ] )
+        Tops, Nodes = quad_packageNodes( registry=registry, keys=keys )
+        Parents = []
+        for top in Tops:
+            parent = ( cmds.listRelatives( top, parent=True ) or [ None ] )[0]
+            if parent:
+                Parents.append( [ top, GroupKeys.get( parent, parent ) ] )
+
+        Incoming, Outgoing = quad_boundaryConnections( Nodes=Nodes )
+        Controls = [ [ source, destination ] for source, destination in Incoming if source.split( '.' )[0] in CoreCtrls ]
+        Loose = [ pair for pair in Incoming + Outgoing if pair not in Controls ]
+        Deformers = sorted( set( cmds.ls( [ destination.split( '.' )[0] for source, destination in Outgoing ], type='geometryFilter' ) or [] ) )
+        if Deformers:
+            raise RuntimeError( package+' drives deformers of the core rig ('+', '.join( Deformers )+'), it can not be split off' )
+        if Loose:
+            raise RuntimeError( package+' has connections to the core that are not named attachments: '
+                                +', '.join( source+' -> '+destination for source, destination in Loose[:10] ) )
+        quad_unlockPlugs( [ destination for source, destination in Controls ] + [ spaceIN+'.'+attr for spaceIN, label, offset in Spaces for attr in quadBT.TransformAttrs ] )
+
+        packageFile = os.path.join( directory, name+'_'+package+'.mb' )
+        cmds.lockNode( Nodes, lock=False )
+        # the tops stay unlocked, they are parented under the core on load
+        Below = cmds.listRelatives( Tops, allDescendents=True, fullPath=True ) or []
+        if Below:
+            cmds.lockNode( Below, lock=True )
+        # only the package nodes, connections to anything else are left out of the file
+        cmds.select( Nodes, replace=True, noExpand=True )
+        cmds.file( packageFile, exportSelected=True, force=True, type='mayaBinary', constructionHistory=False, channels=True,
+                   constraints=True, expressions=True, shader=True, preserveReferences=False )
+        Manifest['packages'][package] = { 'file': os.path.basename( packageFile ), 'keys': keys, 'registry': { key: registry[key] for key in keys },
+                                          'parents': Parents, 'spaces': Spaces, 'controls': Controls }
+        Split.append( [ package, keys, Nodes ] )
+        print( '========================= %s: %d modules, %d nodes, attached to %s' % ( package, len(keys), len(Nodes), ', '.join( sorted( set( label for spaceIN, label, offset in Spaces ) ) ) ) )
+
+    # take the packages out of the core
+    for package, keys, Nodes in Split:
+        cmds.lockNode( Nodes, lock=False )
+        cmds.delete( [ node for node in Nodes if cmds.objExists( node ) ] )
+        for key in keys:
+            registry.pop( key )
+    Dead = quadBT.quad_findDeadNodes( Protected=set( quadBT.quad_registryNames( registry ) ) )
+    if Dead:
+        cmds.delete( Dead )
+    quadBT.quad_saveRegistry( rigGroup=rigGroup, registry=registry )
+    quadBT.quad_saveNodeMap( rigGroup=rigGroup, NodeMap=quadBT.quad_buildNodeMap( registry=registry ) )
+    quadBT.quad_saveMirrorTable( rigGroup=rigGroup, MirrorTable=quadBT.quad_buildMirrorTable( registry=registry ) )
+    Entry['locked'] = quad_lockHierarchy( rigGroup=rigGroup )
+    quad_saveScene( path=coreFile )
+    with open( os.path.join( directory, name+'_packages.json' ), 'w' ) as handle:
+        json.dump( Manifest, handle, indent=1 )
+    print( '========================= split publish of %s into a core and %d packages in %.1f sec' % ( rigFile, len(Split), time.time()-startTime ) )
+
+    if measure:
+        Entry['rig'] = quadPT.quad_measureSceneFile( path=rigFile, reference=True )
+        Entry['publish'] = quadPT.quad_measureSceneFile( path=coreFile, reference=True )
+        for package in Manifest['packages']:
+            Entry['packages'][package] = quadPT.quad_measureSceneFile( path=os.path.join( directory, Manifest['packages'][package]['file'] ), reference=True )
+        quad_appendLog( logFile=logFile or os.path.join( directory, 'publish_log.json' ), Entry=Entry )
+        print( '========================= reference load sec: built rig %.2f, core %.2f, %s'
+               % ( Entry['rig']['seconds'], Entry['publish']['seconds'],
+                   ', '.join( '%s %.2f' % ( package, Results['seconds'] ) for package, Results in sorted( Entry['packages'].items() ) ) ) )
+    return Entry
+
+
+def quad_namespaced( plug='', namespace='' ):
+    '''plug (or node) name with every DAG path part in namespace'''
+    node, dot, attr = plug.partition( '.' )
+    return '|'.join( namespace+':'+part if part else '' for part in node.split( '|' ) ) + dot + attr
+
+
+def quad_loadPackage( manifestFile='', package='', namespace='' ):
+    '''
+    Shot side: reference one package next to the referenced core rig (in namespace) and attach it by name:
+    its groups go under their core groups, every SpaceIN is constrained to the SpaceOUT of that label in
+    the core registry, at the offset it had in the build, and the core controls drive its display
+    attributes. The package goes into namespace_package. Returns the reference node.
+    '''
+    with open( manifestFile ) as handle:
+        Manifest = json.load( handle )
+    Info = Manifest['packages'][package]
+    Found = cmds.ls( namespace+':*.'+quadBT.RegistryAttr, objectsOnly=True ) or []
+    if not Found:
+        raise RuntimeError( 'no core rig in namespace '+namespace )
+    registry = quadBT.quad_loadRegistry( rigGroup=Found[0] )
+    Named = quad_namedSpaceOUTs( registry=registry )
+    Missing = sorted( set( label for spaceIN, label, offset in Info['spaces'] ) - set( Named ) )
+    if Missing:
+        raise RuntimeError( 'the core rig in '+namespace+' has no SpaceOUT named '+', '.join( Missing ) )
+
+    packageNamespace = namespace+'_'+package
+    path = os.path.join( os.path.dirname( os.path.abspath( manifestFile ) ), Info['file'] )
+    Nodes = cmds.file( path, reference=True, namespace=packageNamespace, returnNewNodes=True )
+    for top, parent in Info['parents']:
+        parent = registry[parent]['RigGrp'] if parent in registry else parent
+        cmds.parent( quad_namespaced( top, packageNamespace ), quad_namespaced( parent, namespace ), relative=True )
+    for spaceIN, label, offset in Info['spaces']:
+        driver = quad_namespaced( Named[label], namespace )
+        spaceIN = quad_namespaced( spaceIN, packageNamespace )
+        world = om.MMatrix( offset ) * om.MMatrix( cmds.xform( driver, q=True, ws=True, matrix=True ) )
+        cmds.xform( spaceIN, ws=True, matrix=[ world.getElement( row, column ) for row in range(4) for column in range(4) ] )
+        cmds.parentConstraint( driver, spaceIN, mo=True )
+        cmds.scaleConstraint( driver, spaceIN, mo=True )
+    for source, destination in Info['controls']:
+        cmds.connectAttr( quad_namespaced( source, namespace ), quad_namespaced( destination, packageNamespace ), force=True )
+    print( '========================= loaded %s (%d modules) into %s' % ( package, len( Info['keys'] ), packageNamespace ) )
+    return cmds.referenceQuery( Nodes[0], referenceNode=True )
+
+
+def quad_unloadPackage( manifestFile='', package='', namespace='' ):
+    '''Shot side: remove the reference of a package loaded with quad_loadPackage, its constraints and connections go with it'''
+    with open( manifestFile ) as handle:
+        Manifest = json.load( handle )
+    path = os.path.join( os.path.dirname( os.path.abspath( manifestFile ) ), Manifest['packages'][package]['file'] )
+    for reference in cmds.file( q=True, reference=True ) or []:
+        if os.path.normpath( reference.split( '{' )[0] ) == os.path.normpath( path ) and \
+           cmds.file( reference, q=True, namespace=True ) == namespace+'_'+package:
+            cmds.file( reference, removeReference=True )
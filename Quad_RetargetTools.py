@@ -0,0 +1,306 @@
+# ---------------------------------------------------------------------------------------
+# Quad_RetargetTools
+# Retargeting helpers for the Quadruped Auto-Rig Tool
+#
+# ---------------------------------------------------------------------------------------
+# Moves control animation between creatures built with this tool, even when their neck,
+# spine, tail, whisker or toe counts differ. Numbered control chains are matched by their
+# place along the chain, leg IK moves are scaled by the leg length of each creature.
+#
+# Needs NumPy (ships with mayapy 2022+, otherwise pip install it into Maya's Python).
+#
+# Import it the same way as the den_* modules:
+#     import Quad_RetargetTools as quadRT
+#     importlib.reload(quadRT)
+# ---------------------------------------------------------------------------------------
+# (c) 2025 by Arrow Lyu. All rights reserved. For portfolio and educational use only.
+# ---------------------------------------------------------------------------------------
+
+
+import os
+import re
+import subprocess
+import time
+
+import maya.cmds as cmds
+
+import Quad_BuildTools as quadBT
+import Quad_AnimTools as quadAT
+import Quad_ExportTools as quadET
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# joints measured for the leg length of each leg module, root to ball
+LegLengthJoints = {
+    'TrexLeg': [ 'Hip', 'Knee', 'Hock', 'Ankle', 'Ball' ],
+    'DogFrontLeg': [ 'Shld', 'Elbow', 'Fknee', 'Fball' ],
+    }
+# modules whose translation follows the size of the body (the average hind leg ratio)
+BodyModules = [ 'Base', 'Torso' ]
+
+
+# ---------------------------------------------------------------------------------------
+# quaternion math
+# quaternions are (x, y, z, w) like Quad_ExportTools, every function works on whole arrays of
+# frames x controls at once
+
+def quad_quatSlerp( A=None, B=None, t=0.0 ):
+    '''spherical interpolation from quaternions A to B (... x 4) by t (broadcast against ...), shortest path'''
+    t = np.asarray( t, dtype=float )[..., None]
+    dot = np.sum( A * B, axis=-1, keepdims=True )
+    B = np.where( dot < 0.0, -B, B )
+    theta = np.arccos( np.clip( np.abs( dot ), 0.0, 1.0 ) )
+    sin = np.sin( theta )
+    small = sin < 1e-6
+    safeSin = np.where( small, 1.0, sin )
+    weightA = np.where( small, 1.0 - t, np.sin( ( 1.0 - t ) * theta ) / safeSin )
+    weightB = np.where( small, t, np.sin( t * theta ) / safeSin )
+    Quats = weightA * A + weightB * B
+    return Quats / np.linalg.norm( Quats, axis=-1, keepdims=True )
+
+
+def quad_quatPower( Quats=None, power=1.0 ):
+    '''scale the rotation angle of quaternions (... x 4) by power, keeping the axis'''
+    Identity = np.zeros_like( Quats )
+    Identity[..., 3] = 1.0
+    return quad_quatSlerp( Identity, Quats, power )
+
+
+def quad_quatToMatrix( Quats=None ):
+    '''row-vector rotation matrices (... x 3 x 3) of quaternions (... x 4)'''
+    x, y, z, w = Quats[..., 0], Quats[..., 1], Quats[..., 2], Quats[..., 3]
+    Rotation = np.stack( [ np.stack( [ 1.0 - 2.0*(y*y + z*z), 2.0*(x*y - z*w), 2.0*(x*z + y*w) ], axis=-1 ),
+                           np.stack( [ 2.0*(x*y + z*w), 1.0 - 2.0*(x*x + z*z), 2.0*(y*z - x*w) ], axis=-1 ),
+                           np.stack( [ 2.0*(x*z - y*w), 2.0*(y*z + x*w), 1.0 - 2.0*(x*x + y*y) ], axis=-1 ) ], axis=-2 )
+    # the formula above is for column vectors, Maya multiplies row vectors
+    return np.swapaxes( Rotation, -1, -2 )
+
+
+# ---------------------------------------------------------------------------------------
+# chain matching
+# controls whose names differ only in a two-digit index (Tail01.., L_Whisker01.., L_ToeA01..)
+# form a chain; chains of different lengths are matched by the arc-length parameter of each
+# control, and the rotations in between are slerped
+
+def quad_chainGroups( Ctrls=[] ):
+    '''{ pattern: [ ctrls ] } of the numbered chains in Ctrls, every chain ordered root to tip'''
+    Groups = {}
+    for ctrl in Ctrls:
+        if re.search( r'\d\d', ctrl ):
+            Groups.setdefault( re.sub( r'\d\d', '##', ctrl ), [] ).append( ctrl )
+    return { pattern: sorted( Chain ) for pattern, Chain in Groups.items() }
+
+
+def quad_arcParams( Positions=None ):
+    '''normalized arc-length parameter of each point (points x 3) along the polyline through them, and the length'''
+    Lengths = np.concatenate( [ [ 0.0 ], np.cumsum( np.linalg.norm( np.diff( Positions, axis=0 ), axis=-1 ) ) ] )
+    total = Lengths[-1]
+    return [ Lengths / total if total > 0.0 else np.linspace( 0.0, 1.0, len(Lengths) ), total ]
+
+
+def quad_resampleChain( Quats=None, Translates=None, SourceParams=[], TargetParams=[] ):
+    '''
+    Resample a chain's local rotations (frames x sources x 4) and translations (frames x sources x 3)
+    onto controls at TargetParams, all frames in one pass. The rotation angle of every control is
+    scaled by sources/targets so the chain curls by the same total amount at any length.
+    Returns [ Quats, Translates ], frames x targets x 4 and frames x targets x 3.
+    '''
+    SourceParams = np.asarray( SourceParams, dtype=float )
+    TargetParams = np.asarray( TargetParams, dtype=float )
+    if len( SourceParams ) == 1:
+        Index = np.zeros( len(TargetParams), dtype=int )
+        return [ Quats[:, Index], Translates[:, Index] ]
+    Index = np.clip( np.searchsorted( SourceParams, TargetParams, side='right' ) - 1, 0, len(SourceParams)-2 )
+    u = np.clip( ( TargetParams - SourceParams[Index] ) / np.maximum( SourceParams[Index+1] - SourceParams[Index], 1e-8 ), 0.0, 1.0 )
+    Resampled = quad_quatSlerp( Quats[:, Index], Quats[:, Index+1], u[None] )
+    if len( SourceParams ) != len( TargetParams ):
+        Resampled = quad_quatPower( Resampled, len(SourceParams) / float( len(TargetParams) ) )
+    Moved = Translates[:, Index] + ( Translates[:, Index+1] - Translates[:, Index] ) * u[None, :, None]
+    return [ Resampled, Moved ]
+
+
+def quad_legLengths( registry={}, frame=None ):
+    '''{ module key: length } of every leg module in the registry, measured from its bind joints at frame (current frame if None)'''
+    if frame is None:
+        frame = cmds.currentTime( q=True )
+    Legs = {}
+    for key in registry:
+        for name, Joints in LegLengthJoints.items():
+            side = key[:-len(name)]
+            if key.endswith( name ) and all( cmds.objExists( side+joint+'_Jnt' ) for joint in Joints ):
+                Legs[key] = [ side+joint+'_Jnt' for joint in Joints ]
+    if not Legs:
+        return {}
+    Jnts = [ jnt for key in sorted( Legs ) for jnt in Legs[key] ]
+    Positions = quadAT.quad_sampleMatrices( Nodes=Jnts, Frames=[ frame ] )['worldMatrix'][0, :, 3, :3]
+    Lengths = {}
+    first = 0
+    for key in sorted( Legs ):
+        count = len( Legs[key] )
+        Lengths[key] = float( np.sum( np.linalg.norm( np.diff( Positions[first:first+count], axis=0 ), axis=-1 ) ) )
+        first += count
+    return Lengths
+
+
+# ---------------------------------------------------------------------------------------
+# retargeting
+
+def quad_sampleMotion( registry=None, startFrame=1, endFrame=120 ):
+    '''
+    Read the control animation of the rig in the scene over the frame range in one sampling pass.
+    Returns a motion dict: Frames, Ctrls, Keys (module key of each control), Quats and Translates
+    (frames x ctrls, local), Positions (world position of each control on the first frame) and
+    LegLengths (measured on the first frame).
+    '''
+    quadAT.quad_requireNumpy()
+    start = time.time()
+    if registry is None:
+        registry = quadBT.quad_loadRegistry()
+    Ctrls = []
+    Keys = []
+    for key in sorted( registry ):
+        for ctrl in registry[key].get( 'Ctrls', [] ):
+            if ctrl not in Ctrls and cmds.objExists( ctrl ):
+                Ctrls.append( ctrl )
+                Keys.append( key )
+    Frames = list( range( int(startFrame), int(endFrame)+1 ) )
+    Samples = quadAT.quad_sampleMatrices( Nodes=Ctrls, Frames=Frames, Attrs=( 'matrix', 'worldMatrix' ) )
+    Local = Samples['matrix']
+    Rotation = Local[..., :3, :3] / np.linalg.norm( Local[..., :3, :3], axis=-1, keepdims=True )
+    Motion = { 'Frames': Frames, 'Ctrls': Ctrls, 'Keys': Keys,
+               'Quats': quadET.quad_continuousQuats( Quats=quadET.quad_matrixToQuat( Rotation ) ),
+               'Translates': Local[..., 3, :3],
+               'Positions': Samples['worldMatrix'][0, :, 3, :3],
+               'LegLengths': quad_legLengths( registry=registry, frame=Frames[0] ) }
+    print( '========================= sampled %d controls over %d frames in %.2f sec' % ( len(Ctrls), len(Frames), time.time()-start ) )
+    return Motion
+
+
+def quad_retargetMotion( Motion={}, registry=None, startFrame=None ):
+    '''
+    Key the controls of the rig in the scene with a motion from quad_sampleMotion (usually sampled
+    on another creature). Controls with the same name are copied, numbered chains are resampled by
+    arc length, leg module translations are scaled by the leg length ratio and Base/Torso ones by the
+    average hind leg ratio. The target rig should be in its rest pose. startFrame moves the motion,
+    None keeps its frames. Returns [ Ctrls, Rotates, Translates ], rotations in radians.
+    '''
+    quadAT.quad_requireNumpy()
+    start = time.time()
+    if registry is None:
+        registry = quadBT.quad_loadRegistry()
+    Frames = Motion['Frames']
+    if startFrame is not None:
+        Frames = [ frame - Frames[0] + startFrame for frame in Frames ]
+    SourceIndex = { ctrl: index for index, ctrl in enumerate( Motion['Ctrls'] ) }
+
+    Legs = quad_legLengths( registry=registry )
+    Ratios = { key: length / Motion['LegLengths'][key] for key, length in Legs.items() if Motion['LegLengths'].get( key ) }
+    Hind = [ ratio for key, ratio in Ratios.items() if key.endswith( 'TrexLeg' ) ]
+    bodyRatio = sum( Hind ) / len( Hind ) if Hind else 1.0
+
+    Ctrls = []
+    QuatBlocks = []
+    TranslateBlocks = []
+    chainCount = 0
+    for key in sorted( registry ):
+        TargetCtrls = [ ctrl for ctrl in registry[key].get( 'Ctrls', [] ) if ctrl not in Ctrls and cmds.objExists( ctrl ) ]
+        SourceCtrls = [ ctrl for ctrl, sourceKey in zip( Motion['Ctrls'], Motion['Keys'] ) if sourceKey == key ]
+        if not TargetCtrls or not SourceCtrls:
+            continue
+        ratio = Ratios.get( key, bodyRatio if key in BodyModules else 1.0 )
+        SourceGroups = quad_chainGroups( SourceCtrls )
+        Chained = []
+        for pattern, Chain in sorted( quad_chainGroups( TargetCtrls ).items() ):
+            if pattern not in SourceGroups:
+                continue
+            Source = [ SourceIndex[ctrl] for ctrl in SourceGroups[pattern] ]
+            SourceParams, sourceLength = quad_arcParams( Motion['Positions'][Source] )
+            TargetPositions = np.array( [ cmds.xform( ctrl, q=True, worldSpace=True, translation=True ) for ctrl in Chain ] )
+            TargetParams, targetLength = quad_arcParams( TargetPositions )
+            Quats, Translates = quad_resampleChain( Quats=Motion['Quats'][:, Source], Translates=Motion['Translates'][:, Source],
+                                                    SourceParams=SourceParams, TargetParams=TargetParams )
+            chainRatio = targetLength / sourceLength if sourceLength > 0.0 else ratio
+            Ctrls += Chain
+            QuatBlocks.append( Quats )
+            TranslateBlocks.append( Translates * chainRatio )
+            Chained += Chain
+            chainCount += 1
+        Same = [ ctrl for ctrl in TargetCtrls if ctrl not in Chained and ctrl in SourceIndex ]
+        if Same:
+            Source = [ SourceIndex[ctrl] for ctrl in Same ]
+            Ctrls += Same
+            QuatBlocks.append( Motion['Quats'][:, Source] )
+            TranslateBlocks.append( Motion['Translates'][:, Source] * ratio )
+    if not Ctrls:
+        raise RuntimeError( 'no control of the rig in the scene matches the motion' )
+
+    Rotation = quad_quatToMatrix( np.concatenate( QuatBlocks, axis=1 ) )
+    Translates = np.concatenate( TranslateBlocks, axis=1 )
+    Rotates = np.empty( Translates.shape )
+    for c, ctrl in enumerate( Ctrls ):
+        Rotates[:, c] = quadAT.quad_matrixToEuler( Rotation[:, c], rotateOrder=cmds.getAttr( ctrl+'.rotateOrder' ) )
+    Rotates = np.unwrap( Rotates, axis=0 )
+
+    curveCount = quadAT.quad_writeTransformCurves( Ctrls=Ctrls, Frames=Frames, Rotates=Rotates, Translates=Translates )
+    print( '========================= retargeted %d controls (%d chains resampled) over %d frames into %d curves in %.2f sec'
+           % ( len(Ctrls), chainCount, len(Frames), curveCount, time.time()-start ) )
+    return [ Ctrls, Rotates, Translates ]
+
+
+# ---------------------------------------------------------------------------------------
+# motion library
+# every animation scene of a library is retargeted in its own mayapy process from disk, the
+# files are dealt out to one worker per CPU core
+
+def quad_retargetFile( sourceFile='', targetRigFile='', outFile='', startFrame=None, endFrame=None ):
+    '''
+    Worker side, runs inside mayapy: sample the control animation of sourceFile (its playback range
+    if no frames are given), open targetRigFile, retarget onto it and save the result as outFile.
+    '''
+    cmds.file( sourceFile, open=True, force=True )
+    startFrame = cmds.playbackOptions( q=True, min=True ) if startFrame is None else startFrame
+    endFrame = cmds.playbackOptions( q=True, max=True ) if endFrame is None else endFrame
+    Motion = quad_sampleMotion( startFrame=startFrame, endFrame=endFrame )
+
+    cmds.file( targetRigFile, open=True, force=True )
+    quad_retargetMotion( Motion=Motion )
+    cmds.playbackOptions( min=startFrame, max=endFrame )
+    cmds.file( rename=outFile )
+    cmds.file( save=True, force=True, type='mayaAscii' if outFile.lower().endswith( '.ma' ) else 'mayaBinary' )
+    return outFile
+
+
+def quad_retargetLibrary( SourceFiles=[], targetRigFile='', directory='', workers=None ):
+    '''
+    Retarget every animation scene in SourceFiles onto targetRigFile with a pool of mayapy processes,
+    each saving its results into directory under the source file name.
+    Returns the paths of the retargeted scenes.
+    '''
+    start = time.time()
+    if not os.path.isdir( directory ):
+        os.makedirs( directory )
+    workers = min( workers or os.cpu_count() or 1, len(SourceFiles) ) or 1
+    Jobs = [ ( sourceFile, os.path.join( directory, os.path.basename( sourceFile ) ) ) for sourceFile in SourceFiles ]
+    Batches = [ Jobs[index::workers] for index in range( workers ) ]
+
+    env = dict( os.environ )
+    env['PYTHONPATH'] = os.pathsep.join( [ os.path.dirname( os.path.abspath( __file__ ) ), env.get( 'PYTHONPATH', '' ) ] )
+    Processes = []
+    for Batch in Batches:
+        code = ( 'import maya.standalone; maya.standalone.initialize(); import Quad_RetargetTools as quadRT\n'
+                 'for sourceFile, outFile in %r:\n'
+                 '    quadRT.quad_retargetFile( sourceFile=sourceFile, targetRigFile=%r, outFile=outFile )\n'
+                 % ( Batch, targetRigFile ) )
+        Processes.append( subprocess.Popen( [ quadET.quad_mayapy(), '-c', code ], env=env ) )
+
+    Failed = [ sourceFile for Batch, process in zip( Batches, Processes ) if process.wait() != 0 for sourceFile, outFile in Batch ]
+    if Failed:
+        raise RuntimeError( 'retarget workers failed on a batch with '+', '.join( Failed ) )
+
+    OutFiles = [ outFile for sourceFile, outFile in Jobs ]
+    print( '========================= retargeted %d scenes onto %s with %d workers in %.1f sec' % ( len(OutFiles), targetRigFile, workers, time.time()-start ) )
+    return OutFiles
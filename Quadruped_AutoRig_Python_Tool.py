@@ -13,8 +13,9 @@
 # This tool is flexible and can be adapted to any four-legged creature.
 #
 # How to Use:
-# 1. Customize the joint count for neck, spine, or tail as needed.
-# 2. Manually place the locators to match your character’s proportions.
+# 1. Customize the joint count for neck, spine, or tail as needed (in RigConfig below).
+# 2. Manually place the locators to match your character’s proportions (chains placed for one
+#    joint count are fitted to any other count, so only place them once).
 # 3. Select which modules to add or remove.
 # 4. Run the script and start painting weights.
 #
@@ -63,6 +64,10 @@ import den_AutoRigTools_v12 as denAR
 importlib.reload(denAR)
 print(denAR.__file__)
 
+import Quad_BuildTools as quadBT
+importlib.reload(quadBT)
+print(quadBT.__file__)
+
 
 # ---------------------------------------------------------------------------------------
 # Start
@@ -76,6 +81,121 @@ denUt.den_DiagPause( seconds=0.01 )
 rigName = 'Rimerock'
 
 
+# ---------------------------------------------------------------------------------------
+# build configuration
+# joint counts, toe lists and the joints each add-on follows are kept here, so the builders
+# below and the pre-flight check read the same values
+
+RigConfig = {
+    # torso, tail, whisker and tongue joint counts
+    'spineCount': 3,
+    'spineSecondaryJoints': [],
+    'neckCount': 6,
+    'neckSecondaryJoints': [4],
+    'tailCount': 8,
+    'tailControlJoints': (1,4,8),
+    'whiskerCount': 8,
+    'whiskerControlJoints': (1,4,8),
+    'tongueCount': 8,
+    'tongueControlJoints': (1,4,8),
+
+    # 'splineIK' keeps the den_makeAnyTorsoRig spline IK spine and neck,
+    # 'matrix' swaps them for lighter blendMatrix/aimMatrix chains driven by the same controls (Maya 2020+)
+    'torsoMode': 'splineIK',
+
+    # 'pieces' keeps one proxy mesh per bind joint as den_connectProxyGeo makes them,
+    # 'combined' merges them into one rigidly skinned mesh (one shape, one deformer) and hides the pieces
+    'proxyMode': 'pieces',
+
+    # 'den' runs den_AddSafetyCovers on every rig group as it is built, 'bulk' locks and hides the
+    # channels of all controls and guts in one pass at the end from quadBT.SafetyCoverRules,
+    # 'none' leaves them open (the scratch build of the Safety Cover Benchmark section)
+    'safetyCovers': 'den',
+
+    # registry modules (fnmatch on the key) whose controls drop their own curves for one shared set of
+    # shapes per side, at the size of the first control: a quadBT.CtrlShapeLibrary style, or 'captured'
+    # for the first control's own curves, e.g. { '*FinArm?':'captured', '*FinLeg?':'diamond' };
+    # empty keeps every den_* control shape
+    'sharedCtrlShapes': {},
+
+    # True runs quadBT.quad_optimizeScene at the end of the build: dead utility nodes and constraints,
+    # cancelling unitConversion pairs, unused orig shapes and empty identity transforms are removed
+    # (the pivots stay for rebuilding, see the Scene Optimizer section)
+    'optimizeScene': False,
+
+    # the spine and neck pivots below are placed for these counts, other counts are fitted from them
+    'torsoPivotCounts': { 'Spine':3, 'Neck':6 },
+    # torso SpaceOUTs we connect to, named for the placed counts; their indices (RigConfig['torsoSpaceOUTs'])
+    # are generated below, a NeckNN label moves to the joint at the same place along a longer or shorter neck
+    'torsoSpaceOUTLabels': [ 'Pelvis', 'Chest', 'Neck01', 'Neck02', 'Neck03', 'Neck04', 'Neck05', 'Neck06', 'Head', 'Jaw' ],
+
+    # twist joints for hind legs and front legs
+    'legTwistJoints': ['Hip','Knee','Hock'],
+    'frontLegTwistJoints': ['Shld','Elbow','Fknee'],
+    # 'den' keeps the den_makeTwists helper network, 'matrix' rewires the same twist joints with a
+    # decomposeMatrix/quaternion swing-twist split (compare both with the Twist Benchmark section)
+    'twistMode': 'den',
+
+    # edit here to customize number of digits and fingers
+    # ballZeros follow the ball joint, toeZeros follow the toe joint
+    'toes': {
+        'Toe': { 'toeList':['A','B','C','D'], 'numJnts':[4,4,4,4],
+                 'ballDriver':'Ball_Jnt', 'ballZeros':['A01','D01'],
+                 'toeDriver':'Toe_Jnt', 'toeZeros':['A02','A03','A04', 'B01','B02','B03','B04', 'C01','C02','C03','C04', 'D02','D03','D04'] },
+        'Ftoe': { 'toeList':['A','B','C','D','E'], 'numJnts':[3,4,4,4,4],
+                  'ballDriver':'Fball_Jnt', 'ballZeros':['A01','E01'],
+                  'toeDriver':'Ftoe_Jx', 'toeZeros':['A02','A03', 'B01','B02','B03','B04', 'C01','C02','C03','C04', 'D01','D02','D03','D04', 'E02','E03','E04'] },
+        },
+
+    # the joint each spike follows
+    'appendageDrivers': {
+        'L_FinA':'L_ShldRest_Jx', 'R_FinA':'R_ShldRest_Jx',
+        'L_FinB':'L_ShldRest_Jx', 'R_FinB':'R_ShldRest_Jx',
+        'L_FinC':'L_ShldRest_Jx', 'R_FinC':'R_ShldRest_Jx',
+        'L_FinD':'Spine03_Jnt', 'R_FinD':'Spine03_Jnt',
+        'L_FinE':'Spine02_Jnt', 'R_FinE':'Spine02_Jnt',
+        'L_FinF':'L_Hip_Jx', 'R_FinF':'R_Hip_Jx',
+        'L_FinG':'Tail01_Jnt', 'R_FinG':'Tail01_Jnt',
+        'L_FinH':'Tail02_Jnt', 'R_FinH':'Tail02_Jnt',
+        'L_FinI':'Tail03_Jnt', 'R_FinI':'Tail03_Jnt',
+        'L_FinArmA':'L_Elbow_Jx', 'R_FinArmA':'R_Elbow_Jx',
+        'L_FinArmB':'L_Elbow_Jx', 'R_FinArmB':'R_Elbow_Jx',
+        'L_FinArmC':'L_Elbow_Jx', 'R_FinArmC':'R_Elbow_Jx',
+        'L_FinArmD':'L_Elbow_Jx', 'R_FinArmD':'R_Elbow_Jx',
+        'L_FinLegA':'L_Hip_Jx', 'R_FinLegA':'R_Hip_Jx',
+        'L_FinLegB':'L_Hip_Jx', 'R_FinLegB':'R_Hip_Jx',
+        'L_FinLegC':'L_Hip_Jx', 'R_FinLegC':'R_Hip_Jx',
+        'L_FinLegD':'L_Knee_Jx', 'R_FinLegD':'R_Knee_Jx',
+        'L_FinLegE':'L_Knee_Jx', 'R_FinLegE':'R_Knee_Jx',
+        'L_FinLegF':'L_Knee_Jx', 'R_FinLegF':'R_Knee_Jx',
+        'L_FinLegG':'L_Hock_Jnt', 'R_FinLegG':'R_Hock_Jnt',
+        },
+
+    # level of detail switch on the AllCtrl (Full / Body_Only / Skeleton_Only)
+    # skeleton modules always evaluate, body modules are frozen at Skeleton_Only,
+    # every other module (fins, crests, spikes, whiskers, helpers...) is frozen below Full
+    'lodSkeletonModules': [ 'Torso', 'Tail', 'L_TrexLeg', 'R_TrexLeg', 'L_DogFrontLeg', 'R_DogFrontLeg' ],
+    'lodBodyModules': [ 'L_LegTwist', 'R_LegTwist', 'L_Toe', 'R_Toe', 'L_FrontLegTwist', 'R_FrontLegTwist', 'L_Ftoe', 'R_Ftoe',
+                        'L_Ear', 'R_Ear', 'Horn', 'L_Eye', 'R_Eye' ],
+    }
+
+RigConfig['torsoSpaceOUTs'] = quadBT.quad_torsoSpaceOUTIndices( spineCount=RigConfig['spineCount'], neckCount=RigConfig['neckCount'], Labels=RigConfig['torsoSpaceOUTLabels'], placedCounts=RigConfig['torsoPivotCounts'] )
+print( RigConfig['torsoSpaceOUTs'] )
+
+# ---------------------------------------------------------------------------------------
+# pre-flight check
+# simulates the naming of every den_* builder and checks the configuration above, stop here
+# before anything is built if a name or index is wrong
+
+PreflightRet = quadBT.quad_validateRigConfig( config=RigConfig )
+if PreflightRet[0]:
+    raise RuntimeError( 'pre-flight check found '+str(len(PreflightRet[0]))+' errors, fix RigConfig before building' )
+
+# every module's SpaceINs, SpaceOUTs, BindJnts, Ctrls and Guts are recorded here by name,
+# and saved on the root rig group at the end of the build for post-build tools
+RigRegistry = {}
+
+
 # ---------------------------------------------------------------------------------------
 # make base pivot for master rig group
 
@@ -92,6 +212,7 @@ cmds.xform( 'Cog_Piv', t=( 0.0, 120.00702247157264, -5.048634273151116 ), ro=( 0
 
 BaseRigRet = denBR.den_makeBaseRig(label=rigName,ctrlRadius=150.0)
 print( BaseRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='Base', rigRet=BaseRigRet, extra={ 'PivGrp':RootPivGrp } )
 # capture the master rig group in a variable, RootRigGrp will contain all other smaller rig groups 
 RootRigGrp = BaseRigRet[0]; print( RootRigGrp )
 # capture spaceIn, spaceOUT, BindJoints, Controls, and Guts in 5 variables
@@ -114,7 +235,7 @@ cmds.connectAttr( AllCtrl+'.Show_Render_Geo', 'Render_Grp.visibility' )
 # ---------------------------------------------------------------------------------------
 # make any-torso pivot
 
-TorsoPivRet = denAR.den_makeAnyTorsoPivs( prefix='', radius=5.0, spineCount=3, neckCount=6, dpTime=0.01 )
+TorsoPivRet = denAR.den_makeAnyTorsoPivs( prefix='', radius=5.0, spineCount=RigConfig['spineCount'], neckCount=RigConfig['neckCount'], dpTime=0.01 )
 print( TorsoPivRet )
 
 # capture all pivots in a variable
@@ -124,29 +245,38 @@ TorsoPivGrp = TorsoPivRet
 cmds.parent( TorsoPivGrp, RootPivGrp ) 
 
 # position torso pivots
-cmds.xform( 'Spine01_Piv', t=( 0.0, 133.25360534938514, -49.29973644608609 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
-cmds.xform( 'Spine02_Piv', t=( 0.0, 130.10030622113092, -22.885349571582843 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
-cmds.xform( 'Spine03_Piv', t=( 0.0, 124.60231328074619, 8.663615384691786 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
-cmds.xform( 'Neck01_Piv', t=( 0.0, 143.34632132305936, 73.57294986173603 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
-cmds.xform( 'Neck02_Piv', t=( 0.0, 162.10635480630066, 99.91028076083076 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
-cmds.xform( 'Neck03_Piv', t=( 0.0, 178.7424559716574, 117.00434284660463 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
-cmds.xform( 'Neck04_Piv', t=( 0.0, 195.18059911506734, 141.16029203095454 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
-cmds.xform( 'Neck05_Piv', t=( 0.0, 207.86811314571392, 165.95032123872315 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
-cmds.xform( 'Neck06_Piv', t=( 0.0, 209.58951328713806, 196.49836424943382 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
+# the spine and neck pivots are placed for RigConfig['torsoPivotCounts'] joints and fitted to the
+# spineCount/neckCount in RigConfig, the curve runs through Pelvis..Chest and Chest..Head
+SpinePivPoints = [
+    ( 0.0, 133.25360534938514, -49.29973644608609 ),
+    ( 0.0, 130.10030622113092, -22.885349571582843 ),
+    ( 0.0, 124.60231328074619, 8.663615384691786 ),
+    ]
+NeckPivPoints = [
+    ( 0.0, 143.34632132305936, 73.57294986173603 ),
+    ( 0.0, 162.10635480630066, 99.91028076083076 ),
+    ( 0.0, 178.7424559716574, 117.00434284660463 ),
+    ( 0.0, 195.18059911506734, 141.16029203095454 ),
+    ( 0.0, 207.86811314571392, 165.95032123872315 ),
+    ( 0.0, 209.58951328713806, 196.49836424943382 ),
+    ]
 cmds.xform( 'Pelvis_Piv', t=( 0.0, 133.39426932604795, -87.36977679246662 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
 cmds.xform( 'Chest_Piv', t=( 0.0, 128.5279535441665, 46.64251001336936 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
 cmds.xform( 'Head_Piv', t=( 0.0, 208.03742911780915, 223.37096545059103 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
 cmds.xform( 'HeadEnd_Piv', t=( 0.0, 200.1864811785, 245.74096939071057 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
 cmds.xform( 'Jaw_Piv', t=( 0.0, 201.66972992782308, 213.44114471371418 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
 cmds.xform( 'JawEnd_Piv', t=( 0.0, 175.77796616967277, 231.79762889869127 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
+quadBT.quad_fitChainPivots( name='Spine', Points=[ cmds.xform( 'Pelvis_Piv', q=True, t=True ) ]+SpinePivPoints+[ cmds.xform( 'Chest_Piv', q=True, t=True ) ], count=RigConfig['spineCount'], anchors=(1,1) )
+quadBT.quad_fitChainPivots( name='Neck', Points=[ cmds.xform( 'Chest_Piv', q=True, t=True ) ]+NeckPivPoints+[ cmds.xform( 'Head_Piv', q=True, t=True ) ], count=RigConfig['neckCount'], anchors=(1,1) )
 
 
 
 # ---------------------------------------------------------------------------------------
 # make any-torso rig 
 
-TorsoRigRet = denAR.den_makeAnyTorsoRig( prefix='', radius=5.0, ctrlRadius=(40.0,55.0,25.0,5.0), displayLocalAxis=False, spineCount=3, spineSecondaryJoints=[], neckCount=6, neckSecondaryJoints=[4], spineAxisOrient='yup', jawAxisOrient='yup', dpTime=0.01 )
+TorsoRigRet = denAR.den_makeAnyTorsoRig( prefix='', radius=5.0, ctrlRadius=(40.0,55.0,25.0,5.0), displayLocalAxis=False, spineCount=RigConfig['spineCount'], spineSecondaryJoints=RigConfig['spineSecondaryJoints'], neckCount=RigConfig['neckCount'], neckSecondaryJoints=RigConfig['neckSecondaryJoints'], spineAxisOrient='yup', jawAxisOrient='yup', dpTime=0.01 )
 print( TorsoRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='Torso', rigRet=TorsoRigRet )
 
 # capture the rig group in a variable
 TorsoRigGrp = TorsoRigRet[0]; print( TorsoRigGrp )
@@ -159,13 +289,22 @@ TorsoGutsALL = TorsoRigRet[5]; print( TorsoGutsALL )
 
 # make new variables for later connecting attributes
 TorsoSpaceIN = TorsoSpaceINs[0]; print( TorsoSpaceIN )
-PelvisSpaceOUT = TorsoSpaceOUTs[0]; print( PelvisSpaceOUT )
+PelvisSpaceOUT = TorsoSpaceOUTs[RigConfig['torsoSpaceOUTs']['Pelvis']]; print( PelvisSpaceOUT )
 
-#### ======== NEED TO EDIT THIS IF YOU CHANGED THE NUMBER OF NECK/SPINE JOINTS ======== ####
-# i changed the number in [] since the torso spine number is changed by -2
-ChestSpaceOUT = TorsoSpaceOUTs[4]; print( ChestSpaceOUT )
-HeadSpaceOUT = TorsoSpaceOUTs[11]; print( HeadSpaceOUT )
-JawSpaceOUT = TorsoSpaceOUTs[12]; print( JawSpaceOUT )
+# the indices in RigConfig['torsoSpaceOUTs'] are generated from the neck/spine joint counts
+ChestSpaceOUT = TorsoSpaceOUTs[RigConfig['torsoSpaceOUTs']['Chest']]; print( ChestSpaceOUT )
+HeadSpaceOUT = TorsoSpaceOUTs[RigConfig['torsoSpaceOUTs']['Head']]; print( HeadSpaceOUT )
+JawSpaceOUT = TorsoSpaceOUTs[RigConfig['torsoSpaceOUTs']['Jaw']]; print( JawSpaceOUT )
+
+# also record every torso SpaceOUT by its label (Pelvis, Spine01.., Chest, Neck01.., Head, Jaw)
+TorsoLabels = quadBT.quad_simTorsoSpaceOUTs( spineCount=RigConfig['spineCount'], neckCount=RigConfig['neckCount'] )
+quadBT.quad_registerModule( registry=RigRegistry, key='Torso', extra={ 'NamedSpaceOUTs':dict( zip( TorsoLabels, TorsoSpaceOUTs ) ) } )
+
+# swap the spline IK spine and neck for matrix chains if asked for
+if RigConfig['torsoMode'] == 'matrix':
+    TorsoMatrixRet = quadBT.quad_makeMatrixTorso( rigGroup=TorsoRigGrp )
+    print( TorsoMatrixRet )
+    quadBT.quad_registerModule( registry=RigRegistry, key='Torso', extra={ 'MatrixNodes':TorsoMatrixRet[1] } )
 
 # connect to geometry
 #denUt.den_connectBoxGeo( Jnts=TorsoBindJnts ) # include this if you use box geometry
@@ -182,7 +321,7 @@ cmds.parentConstraint( CogSpaceOUT, TorsoSpaceIN, mo=True )
 cmds.scaleConstraint( CogSpaceOUT, TorsoSpaceIN, mo=True )
 
 # add safetycovers and etc.
-denUt.den_AddSafetyCovers( rigGroup=TorsoRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=TorsoRigGrp[0] )
 
 # connect controls visibility attribute to the AllCtrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', TorsoRigGrp[0]+'.Show_Controls' )
@@ -196,30 +335,35 @@ print( '========================= made torso rig' )
 # ---------------------------------------------------------------------------------------
 # make Sluggy tail pivots
 
-TailPivRet = denSR.den_makeTailPivs( prefix='', name='Tail', jointCount=8, radius=5 )
+TailPivRet = denSR.den_makeTailPivs( prefix='', name='Tail', jointCount=RigConfig['tailCount'], radius=5 )
 # capture all pivots in a variable
 TailPivGrp = TailPivRet
 # parent pivots under root pivot group
 cmds.parent( TailPivGrp, RootPivGrp )
 
 # position tail pivots
-cmds.xform( 'Tail01_Piv', t=( 0.0, 119.52014336654541, -118.37164764355575 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
-cmds.xform( 'Tail02_Piv', t=( 0.0, 112.6407078190961, -165.33433306014513 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
-cmds.xform( 'Tail03_Piv', t=( 0.0, 111.20437116299254, -222.21161026868324 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
-cmds.xform( 'Tail04_Piv', t=( 0.0, 109.97711594117408, -277.93971238744916 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
-cmds.xform( 'Tail05_Piv', t=( 0.0, 109.01820146227057, -336.8335338539647 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
-cmds.xform( 'Tail06_Piv', t=( 0.0, 108.23519864274955, -393.2815444034674 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
-cmds.xform( 'Tail07_Piv', t=( 0.0, 108.22145235236398, -448.22708709896 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
-cmds.xform( 'Tail08_Piv', t=( 0.0, 108.39554250459224, -508.6147507816687 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
+# placed for 8 joints and fitted to RigConfig['tailCount'], the curve ends at TailEnd_Piv
+TailPivPoints = [
+    ( 0.0, 119.52014336654541, -118.37164764355575 ),
+    ( 0.0, 112.6407078190961, -165.33433306014513 ),
+    ( 0.0, 111.20437116299254, -222.21161026868324 ),
+    ( 0.0, 109.97711594117408, -277.93971238744916 ),
+    ( 0.0, 109.01820146227057, -336.8335338539647 ),
+    ( 0.0, 108.23519864274955, -393.2815444034674 ),
+    ( 0.0, 108.22145235236398, -448.22708709896 ),
+    ( 0.0, 108.39554250459224, -508.6147507816687 ),
+    ]
 cmds.xform( 'TailEnd_Piv', t=( 0.0, 107.37561547162288, -598.2196188438623 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
+quadBT.quad_fitChainPivots( prefix='', name='Tail', Points=TailPivPoints+[ cmds.xform( 'TailEnd_Piv', q=True, t=True ) ], count=RigConfig['tailCount'], anchors=(0,1) )
 
 
 
 # ---------------------------------------------------------------------------------------
 # make Sluggy tail rig (for full IK/FK blendable tail)
 
-TailRigRet = denSR.den_makeTailRig( prefix='', name='Tail', jointCount=8, radius=5, ctrlRadius=22.0, controlJoints=(1,4,8), dpTime=0.01  )
+TailRigRet = denSR.den_makeTailRig( prefix='', name='Tail', jointCount=RigConfig['tailCount'], radius=5, ctrlRadius=22.0, controlJoints=RigConfig['tailControlJoints'], dpTime=0.01  )
 print( TailRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='Tail', rigRet=TailRigRet )
 
 # capture the rig group in a variable
 TailRigGrp = TailRigRet[0]; print( TailRigGrp )
@@ -251,6 +395,7 @@ cmds.scaleConstraint( PelvisSpaceOUT, TailSpaceIN, mo=True )
 
 TailDynRet = denSR.den_addTailDynamics( prefix='', name='Tail', TailRigGrp=TailRigGrp, TailSpaceIN=TailSpaceIN, TailHandles=TailHandles, TailBindJnts=TailBindJnts, dpTime=0.01 )
 print( TailDynRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='Tail', extra={ 'DynCtrl':TailDynRet[0] } )
 
 # capture the rig dynamics group in a variable
 TailDynCtrl = TailDynRet[0]; print( TailDynCtrl )
@@ -262,7 +407,7 @@ cmds.setAttr( TailDynCtrl+'.bendResistance', 20 )
 cmds.setAttr( TailDynCtrl+'.startCurveAttract', 0.01 )
 
 # add safetycovers and etc.
-denUt.den_AddSafetyCovers( rigGroup=TailRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=TailRigGrp[0] )
 
 # connect controls visibility attribute to the AllCtrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', TailRigGrp[0]+'.Show_Controls' )
@@ -342,6 +487,7 @@ denUt.den_DiagPause( seconds=0.01 )
 # create rig for the Left -------
 L_LegRigRet = denTR.den_makeTrexHindLegRig( side='L_', prefix='', name='TrexLeg', radius=5.0, ctrlRadius=15.0, displayLocalAxis=False )
 print( L_LegRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='L_TrexLeg', rigRet=L_LegRigRet )
 # capture the rig group in a variable
 L_LegRigGrp = L_LegRigRet[0]; print( L_LegRigGrp )
 # capture spaceIn, spaceOUT, BindJoints, Controls, and Guts in 5 variables
@@ -375,6 +521,7 @@ cmds.scaleConstraint( AllSpaceOUT, L_LegAllSpaceIN, mo=True )
 # create rig for the Right -------
 R_LegRigRet = denTR.den_makeTrexHindLegRig( side='R_', prefix='', name='TrexLeg', radius=5.0, ctrlRadius=15.0, displayLocalAxis=False )
 print( R_LegRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='R_TrexLeg', rigRet=R_LegRigRet )
 # capture the rig group in a variable
 R_LegRigGrp = R_LegRigRet[0]; print( R_LegRigGrp )
 # capture spaceIn, spaceOUT, BindJoints, Controls, and Guts in 5 variables
@@ -407,8 +554,12 @@ cmds.scaleConstraint( AllSpaceOUT, R_LegAllSpaceIN, mo=True )
 ######## -------------------------------------
 # Add Left leg twist
 
-L_LegTwistRigRet = denBR.den_makeTwists( side='L_', radius=1.997, Joints=['Hip','Knee','Hock'], ctrlPos=(0,0,10), ctrlUpVec=(0,0,1), displayLocalAxis=False )
+L_LegTwistRigRet = denBR.den_makeTwists( side='L_', radius=1.997, Joints=RigConfig['legTwistJoints'], ctrlPos=(0,0,10), ctrlUpVec=(0,0,1), displayLocalAxis=False )
 print( L_LegTwistRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='L_LegTwist', rigRet=L_LegTwistRigRet )
+if RigConfig['twistMode'] == 'matrix':
+    L_LegTwistMatrixRet = quadBT.quad_makeMatrixTwists( side='L_', Joints=RigConfig['legTwistJoints'], Ctrls=L_LegTwistRigRet[4] )
+    quadBT.quad_registerModule( registry=RigRegistry, key='L_LegTwist', extra={ 'MatrixNodes':L_LegTwistMatrixRet[1] } )
 L_LegTwistBindJnts = L_LegTwistRigRet[3]; print( L_LegTwistBindJnts )
 L_LegTwistCtrlsALL = L_LegTwistRigRet[4]; print( L_LegTwistCtrlsALL )
 
@@ -420,8 +571,12 @@ print('========================= made L_ leg twists')
 ######## -------------------------------------
 # Add Right leg twist
 
-R_LegTwistRigRet = denBR.den_makeTwists( side='R_', radius=1.997, Joints=['Hip','Knee','Hock'], ctrlPos=(0,0,10), ctrlUpVec=(0,0,1), displayLocalAxis=False )
+R_LegTwistRigRet = denBR.den_makeTwists( side='R_', radius=1.997, Joints=RigConfig['legTwistJoints'], ctrlPos=(0,0,10), ctrlUpVec=(0,0,1), displayLocalAxis=False )
 print( R_LegTwistRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='R_LegTwist', rigRet=R_LegTwistRigRet )
+if RigConfig['twistMode'] == 'matrix':
+    R_LegTwistMatrixRet = quadBT.quad_makeMatrixTwists( side='R_', Joints=RigConfig['legTwistJoints'], Ctrls=R_LegTwistRigRet[4] )
+    quadBT.quad_registerModule( registry=RigRegistry, key='R_LegTwist', extra={ 'MatrixNodes':R_LegTwistMatrixRet[1] } )
 R_LegTwistBindJnts = R_LegTwistRigRet[3]; print( R_LegTwistBindJnts )
 R_LegTwistCtrlsALL = R_LegTwistRigRet[4]; print( R_LegTwistCtrlsALL )
 
@@ -431,13 +586,13 @@ denUt.den_connectProxyGeo( Jnts=R_LegTwistBindJnts )
 print('========================= made R_ leg twists')
 
 
-denUt.den_AddSafetyCovers( rigGroup=L_LegRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=L_LegRigGrp[0] )
 
 
 # -------------------------------------
 # For Left side leg
 # add safetycovers and etc.
-denUt.den_AddSafetyCovers( rigGroup=L_LegRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=L_LegRigGrp[0] )
 
 # connect controls visibility attribute to the AllCtrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', L_LegRigGrp[0]+'.Show_Controls' )
@@ -449,7 +604,7 @@ cmds.connectAttr( AllCtrl+'.Left_Color', L_LegRigGrp[0]+'.Ctrl_Color' )
 # -------------------------------------
 # For Right side leg
 # add safetycovers and etc.
-denUt.den_AddSafetyCovers( rigGroup=R_LegRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=R_LegRigGrp[0] )
 
 # connect controls visibility attribute to the AllCtrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', R_LegRigGrp[0]+'.Show_Controls' )
@@ -463,10 +618,10 @@ cmds.connectAttr( AllCtrl+'.Right_Color', R_LegRigGrp[0]+'.Ctrl_Color' )
 ######## ============================= TOE =========================================
 # make Auto toe pivot
 
-L_ToesPivGrp = denTR.den_makeToePivs( side='L_', name='Toe', toeList=['A','B','C','D'], numJnts=[4,4,4,4], radius=2.0, footPos=(5,0,-25) )
+L_ToesPivGrp = denTR.den_makeToePivs( side='L_', name='Toe', toeList=RigConfig['toes']['Toe']['toeList'], numJnts=RigConfig['toes']['Toe']['numJnts'], radius=2.0, footPos=(5,0,-25) )
 L_ToesPivGrp = cmds.parent( L_ToesPivGrp, RootPivGrp )
 
-R_ToesPivGrp = denTR.den_makeToePivs( side='R_', name='Toe', toeList=['A','B','C','D'], numJnts=[4,4,4,4], radius=2.0, footPos=(-5,0,-25) )
+R_ToesPivGrp = denTR.den_makeToePivs( side='R_', name='Toe', toeList=RigConfig['toes']['Toe']['toeList'], numJnts=RigConfig['toes']['Toe']['numJnts'], radius=2.0, footPos=(-5,0,-25) )
 R_ToesPivGrp = cmds.parent( R_ToesPivGrp, RootPivGrp )
 
 # position pivots
@@ -530,8 +685,9 @@ cmds.xform( 'R_ToeA01_Piv', t=( 22.683780066625005, 16.455804225501264, -92.8391
 # make Auto toe rig
 
 # create left toe rig
-L_ToeRigRet = denTR.den_makeToeRig(side='L_', name='Toe', toeList=['A','B','C','D'], radius=3, doIK=True )
+L_ToeRigRet = denTR.den_makeToeRig(side='L_', name='Toe', toeList=RigConfig['toes']['Toe']['toeList'], radius=3, doIK=True )
 print( L_ToeRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='L_Toe', rigRet=L_ToeRigRet )
 L_ToeRigGrp = L_ToeRigRet[0]; print( L_ToeRigGrp )
 L_ToeSpaceINs = L_ToeRigRet[1]; print( L_ToeSpaceINs )
 L_ToeSpaceOUTs = L_ToeRigRet[2]; print( L_ToeSpaceOUTs )
@@ -550,8 +706,9 @@ cmds.parentConstraint( L_AnkleSpaceOUT, L_ToesSpaceIN, mo=True )
 cmds.scaleConstraint( L_AnkleSpaceOUT, L_ToesSpaceIN, mo=True )
 
 # create right toe rig
-R_ToeRigRet = denTR.den_makeToeRig(side='R_', name='Toe', toeList=['A','B','C','D'], radius=3, doIK=True )
+R_ToeRigRet = denTR.den_makeToeRig(side='R_', name='Toe', toeList=RigConfig['toes']['Toe']['toeList'], radius=3, doIK=True )
 print( R_ToeRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='R_Toe', rigRet=R_ToeRigRet )
 R_ToeRigGrp = R_ToeRigRet[0]; print( R_ToeRigGrp )
 R_ToeSpaceINs = R_ToeRigRet[1]; print( R_ToeSpaceINs )
 R_ToeSpaceOUTs = R_ToeRigRet[2]; print( R_ToeSpaceOUTs )
@@ -572,39 +729,32 @@ cmds.scaleConstraint( R_AnkleSpaceOUT, R_ToesSpaceIN, mo=True )
 
 # set toe ik
 # L
-ballToeZeros = [ 'L_ToeA01IK_CtrlZero', 'L_ToeD01IK_CtrlZero', ]
+ballToeZeros = [ 'L_Toe'+zero+'IK_CtrlZero' for zero in RigConfig['toes']['Toe']['ballZeros'] ]
 for ballToeZero in ballToeZeros:
     print( ballToeZero )
-    cmds.parentConstraint( 'L_Ball_Jnt', ballToeZero, mo=True )
+    cmds.parentConstraint( 'L_'+RigConfig['toes']['Toe']['ballDriver'], ballToeZero, mo=True )
 
-# edit here to customize number of digits and fingers
-toeToeZeros = [ 'L_ToeA02IK_CtrlZero', 'L_ToeA03IK_CtrlZero', 'L_ToeA04IK_CtrlZero' ]
-toeToeZeros += [ 'L_ToeB01IK_CtrlZero', 'L_ToeB02IK_CtrlZero', 'L_ToeB03IK_CtrlZero', 'L_ToeB04IK_CtrlZero' ]
-toeToeZeros += [ 'L_ToeC01IK_CtrlZero', 'L_ToeC02IK_CtrlZero', 'L_ToeC03IK_CtrlZero', 'L_ToeC04IK_CtrlZero' ]
-toeToeZeros += [ 'L_ToeD02IK_CtrlZero', 'L_ToeD03IK_CtrlZero', 'L_ToeD04IK_CtrlZero' ]
+toeToeZeros = [ 'L_Toe'+zero+'IK_CtrlZero' for zero in RigConfig['toes']['Toe']['toeZeros'] ]
 
 for toeToeZero in toeToeZeros:
     print( toeToeZero )
-    cmds.parentConstraint( 'L_Toe_Jnt', toeToeZero, mo=True )
+    cmds.parentConstraint( 'L_'+RigConfig['toes']['Toe']['toeDriver'], toeToeZero, mo=True )
 
 
 # R
-ballToeZeros = [ 'R_ToeA01IK_CtrlZero', 'R_ToeD01IK_CtrlZero', ]
+ballToeZeros = [ 'R_Toe'+zero+'IK_CtrlZero' for zero in RigConfig['toes']['Toe']['ballZeros'] ]
 for ballToeZero in ballToeZeros:
     print( ballToeZero )
-    cmds.parentConstraint( 'R_Ball_Jnt', ballToeZero, mo=True )
+    cmds.parentConstraint( 'R_'+RigConfig['toes']['Toe']['ballDriver'], ballToeZero, mo=True )
 
-toeToeZeros = [ 'R_ToeA02IK_CtrlZero', 'R_ToeA03IK_CtrlZero', 'R_ToeA04IK_CtrlZero' ]
-toeToeZeros += [ 'R_ToeB01IK_CtrlZero', 'R_ToeB02IK_CtrlZero', 'R_ToeB03IK_CtrlZero', 'R_ToeB04IK_CtrlZero' ]
-toeToeZeros += [ 'R_ToeC01IK_CtrlZero', 'R_ToeC02IK_CtrlZero', 'R_ToeC03IK_CtrlZero', 'R_ToeC04IK_CtrlZero' ]
-toeToeZeros += [ 'R_ToeD02IK_CtrlZero', 'R_ToeD03IK_CtrlZero', 'R_ToeD04IK_CtrlZero' ]
+toeToeZeros = [ 'R_Toe'+zero+'IK_CtrlZero' for zero in RigConfig['toes']['Toe']['toeZeros'] ]
 
 for toeToeZero in toeToeZeros:
     print( toeToeZero )
-    cmds.parentConstraint( 'R_Toe_Jnt', toeToeZero, mo=True )
+    cmds.parentConstraint( 'R_'+RigConfig['toes']['Toe']['toeDriver'], toeToeZero, mo=True )
 
 # clean up
-denUt.den_AddSafetyCovers( rigGroup=L_ToeRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=L_ToeRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', L_ToeRigGrp[0]+'.Show_Controls' )
@@ -613,7 +763,7 @@ cmds.connectAttr( AllCtrl+'.Bone_Draw_Style', L_ToeRigGrp[0]+'.Bone_Draw_Style'
 cmds.connectAttr( AllCtrl+'.Left_Color', L_ToeRigGrp[0]+'.Ctrl_Color' )
 
 
-denUt.den_AddSafetyCovers( rigGroup=R_ToeRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=R_ToeRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', R_ToeRigGrp[0]+'.Show_Controls' )
@@ -696,6 +846,7 @@ denUt.den_DiagPause( seconds=0.01 )
 # make Left side rig -------
 L_FlegRigRet = denAR.den_makeDogFrontLegRig( side='L_', name='DogFrontLeg', radius=5.0, ctrlRadius=15.0, displayLocalAxis=False )
 print( L_FlegRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='L_DogFrontLeg', rigRet=L_FlegRigRet )
 # capture the rig group in a variable
 L_FlegRigGrp = L_FlegRigRet[0]; print( L_FlegRigGrp )
 # capture spaceIn, spaceOUT, BindJoints, Controls, and Guts in 5 variables
@@ -730,6 +881,7 @@ cmds.scaleConstraint( AllSpaceOUT, L_FlegAllSpaceIN, mo=True )
 # make Right side rig -------
 R_FlegRigRet = denAR.den_makeDogFrontLegRig( side='R_', name='DogFrontLeg', radius=5.0, ctrlRadius=15.0, displayLocalAxis=False )
 print( R_FlegRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='R_DogFrontLeg', rigRet=R_FlegRigRet )
 # capture the rig group in a variable
 R_FlegRigGrp = R_FlegRigRet[0]; print( R_FlegRigGrp )
 # capture spaceIn, spaceOUT, BindJoints, Controls, and Guts in 5 variables
@@ -762,8 +914,12 @@ cmds.scaleConstraint( AllSpaceOUT, R_FlegAllSpaceIN, mo=True )
 ############ -----------------------------
 # add twist to front legs
 
-L_LegTwistRigRet = denBR.den_makeTwists( side='L_', radius=1.997, Joints=['Shld','Elbow','Fknee'], ctrlPos=(0,0,10), ctrlUpVec=(0,0,1), displayLocalAxis=False )
+L_LegTwistRigRet = denBR.den_makeTwists( side='L_', radius=1.997, Joints=RigConfig['frontLegTwistJoints'], ctrlPos=(0,0,10), ctrlUpVec=(0,0,1), displayLocalAxis=False )
 print( L_LegTwistRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='L_FrontLegTwist', rigRet=L_LegTwistRigRet )
+if RigConfig['twistMode'] == 'matrix':
+    L_FrontLegTwistMatrixRet = quadBT.quad_makeMatrixTwists( side='L_', Joints=RigConfig['frontLegTwistJoints'], Ctrls=L_LegTwistRigRet[4] )
+    quadBT.quad_registerModule( registry=RigRegistry, key='L_FrontLegTwist', extra={ 'MatrixNodes':L_FrontLegTwistMatrixRet[1] } )
 L_LegTwistBindJnts = L_LegTwistRigRet[3]; print( L_LegTwistBindJnts )
 L_LegTwistCtrlsALL = L_LegTwistRigRet[4]; print( L_LegTwistCtrlsALL )
 
@@ -773,8 +929,12 @@ denUt.den_connectProxyGeo( Jnts=L_LegTwistBindJnts )
 print('========================= made L_ leg twists')
 
 
-R_LegTwistRigRet = denBR.den_makeTwists( side='R_', radius=1.997, Joints=['Shld','Elbow','Fknee'], ctrlPos=(0,0,10), ctrlUpVec=(0,0,1), displayLocalAxis=False )
+R_LegTwistRigRet = denBR.den_makeTwists( side='R_', radius=1.997, Joints=RigConfig['frontLegTwistJoints'], ctrlPos=(0,0,10), ctrlUpVec=(0,0,1), displayLocalAxis=False )
 print( R_LegTwistRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='R_FrontLegTwist', rigRet=R_LegTwistRigRet )
+if RigConfig['twistMode'] == 'matrix':
+    R_FrontLegTwistMatrixRet = quadBT.quad_makeMatrixTwists( side='R_', Joints=RigConfig['frontLegTwistJoints'], Ctrls=R_LegTwistRigRet[4] )
+    quadBT.quad_registerModule( registry=RigRegistry, key='R_FrontLegTwist', extra={ 'MatrixNodes':R_FrontLegTwistMatrixRet[1] } )
 R_LegTwistBindJnts = R_LegTwistRigRet[3]; print( R_LegTwistBindJnts )
 R_LegTwistCtrlsALL = R_LegTwistRigRet[4]; print( R_LegTwistCtrlsALL )
 
@@ -788,7 +948,7 @@ print('========================= made R_ leg twists')
 # ---------------------------------------
 # For Left side:
 # add safty covers and etc.
-denUt.den_AddSafetyCovers( rigGroup=L_FlegRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=L_FlegRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', L_FlegRigGrp[0]+'.Show_Controls' )
@@ -799,7 +959,7 @@ cmds.connectAttr( AllCtrl+'.Left_Color', L_FlegRigGrp[0]+'.Ctrl_Color' )
 # ---------------------------------------
 # For Right side:
 # add safty covers and etc.
-denUt.den_AddSafetyCovers( rigGroup=R_FlegRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=R_FlegRigGrp[0] )
 
 # connect controls visibility attribute to the AllCtrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', R_FlegRigGrp[0]+'.Show_Controls' )
@@ -814,10 +974,10 @@ cmds.connectAttr( AllCtrl+'.Right_Color', R_FlegRigGrp[0]+'.Ctrl_Color' )
 ############ ---------------------------------------------------------------------------------------
 # make fingers pivots using auto toe piv
 
-L_FtoesPivGrp = denTR.den_makeToePivs( side='L_', name='Ftoe', toeList=['A','B','C','D','E'], numJnts=[3,4,4,4,4], radius=3, footPos=(5,0,25) )
+L_FtoesPivGrp = denTR.den_makeToePivs( side='L_', name='Ftoe', toeList=RigConfig['toes']['Ftoe']['toeList'], numJnts=RigConfig['toes']['Ftoe']['numJnts'], radius=3, footPos=(5,0,25) )
 L_FtoesPivGrp = cmds.parent( L_FtoesPivGrp, RootPivGrp )
 
-R_FtoesPivGrp = denTR.den_makeToePivs( side='R_', name='Ftoe', toeList=['A','B','C','D','E'], numJnts=[3,4,4,4,4], radius=3, footPos=(-5,0,25) )
+R_FtoesPivGrp = denTR.den_makeToePivs( side='R_', name='Ftoe', toeList=RigConfig['toes']['Ftoe']['toeList'], numJnts=RigConfig['toes']['Ftoe']['numJnts'], radius=3, footPos=(-5,0,25) )
 R_FtoesPivGrp = cmds.parent( R_FtoesPivGrp, RootPivGrp )
 
 # positon pivots
@@ -890,8 +1050,9 @@ cmds.xform( 'R_FtoeD01_Piv', t=( 36.4455469454202, 16.725960185053225, 72.869963
 # ---------------------------------------------------------------------------------------
 # make finger rig using Auto toe rig 
 # L
-L_FtoeRigRet = denTR.den_makeToeRig(side='L_', name='Ftoe', toeList=['A','B','C','D','E'], radius=2, doIK=True )
+L_FtoeRigRet = denTR.den_makeToeRig(side='L_', name='Ftoe', toeList=RigConfig['toes']['Ftoe']['toeList'], radius=2, doIK=True )
 print( L_FtoeRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='L_Ftoe', rigRet=L_FtoeRigRet )
 L_FtoeRigGrp = L_FtoeRigRet[0]; print( L_FtoeRigGrp )
 L_FtoeSpaceINs = L_FtoeRigRet[1]; print( L_FtoeSpaceINs )
 L_FtoeSpaceOUTs = L_FtoeRigRet[2]; print( L_FtoeSpaceOUTs )
@@ -910,24 +1071,21 @@ cmds.parentConstraint( L_AnkleSpaceOUT, L_FtoesSpaceIN )
 cmds.scaleConstraint( L_AnkleSpaceOUT, L_FtoesSpaceIN )
 
 # set ik for fingers
-ballToeZeros = [ 'L_FtoeA01IK_CtrlZero', 'L_FtoeE01IK_CtrlZero', ]
+ballToeZeros = [ 'L_Ftoe'+zero+'IK_CtrlZero' for zero in RigConfig['toes']['Ftoe']['ballZeros'] ]
 for ballToeZero in ballToeZeros:
     print( ballToeZero )
-    cmds.parentConstraint( 'L_Fball_Jnt', ballToeZero, mo=True )
+    cmds.parentConstraint( 'L_'+RigConfig['toes']['Ftoe']['ballDriver'], ballToeZero, mo=True )
 
-toeToeZeros = [ 'L_FtoeA02IK_CtrlZero', 'L_FtoeA03IK_CtrlZero' ]
-toeToeZeros += [ 'L_FtoeB01IK_CtrlZero', 'L_FtoeB02IK_CtrlZero', 'L_FtoeB03IK_CtrlZero', 'L_FtoeB04IK_CtrlZero' ]
-toeToeZeros += [ 'L_FtoeC01IK_CtrlZero', 'L_FtoeC02IK_CtrlZero', 'L_FtoeC03IK_CtrlZero', 'L_FtoeC04IK_CtrlZero' ]
-toeToeZeros += [ 'L_FtoeD01IK_CtrlZero', 'L_FtoeD02IK_CtrlZero', 'L_FtoeD03IK_CtrlZero', 'L_FtoeD04IK_CtrlZero' ]
-toeToeZeros += [ 'L_FtoeE02IK_CtrlZero', 'L_FtoeE03IK_CtrlZero', 'L_FtoeE04IK_CtrlZero' ]
+toeToeZeros = [ 'L_Ftoe'+zero+'IK_CtrlZero' for zero in RigConfig['toes']['Ftoe']['toeZeros'] ]
 
 for toeToeZero in toeToeZeros:
     print( toeToeZero )
-    cmds.parentConstraint( 'L_Ftoe_Jx', toeToeZero, mo=True )
+    cmds.parentConstraint( 'L_'+RigConfig['toes']['Ftoe']['toeDriver'], toeToeZero, mo=True )
 
 # R
-R_FtoeRigRet = denTR.den_makeToeRig(side='R_', name='Ftoe', toeList=['A','B','C','D','E'], radius=2, doIK=True )
+R_FtoeRigRet = denTR.den_makeToeRig(side='R_', name='Ftoe', toeList=RigConfig['toes']['Ftoe']['toeList'], radius=2, doIK=True )
 print( R_FtoeRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='R_Ftoe', rigRet=R_FtoeRigRet )
 R_FtoeRigGrp = R_FtoeRigRet[0]; print( R_FtoeRigGrp )
 R_FtoeSpaceINs = R_FtoeRigRet[1]; print( R_FtoeSpaceINs )
 R_FtoeSpaceOUTs = R_FtoeRigRet[2]; print( R_FtoeSpaceOUTs )
@@ -946,23 +1104,19 @@ cmds.parentConstraint( R_AnkleSpaceOUT, R_FtoesSpaceIN )
 cmds.scaleConstraint( R_AnkleSpaceOUT, R_FtoesSpaceIN )
 
 # set ik for fingers
-ballToeZeros = [ 'R_FtoeA01IK_CtrlZero', 'R_FtoeE01IK_CtrlZero', ]
+ballToeZeros = [ 'R_Ftoe'+zero+'IK_CtrlZero' for zero in RigConfig['toes']['Ftoe']['ballZeros'] ]
 for ballToeZero in ballToeZeros:
     print( ballToeZero )
-    cmds.parentConstraint( 'R_Fball_Jnt', ballToeZero, mo=True )
+    cmds.parentConstraint( 'R_'+RigConfig['toes']['Ftoe']['ballDriver'], ballToeZero, mo=True )
 
-toeToeZeros = [ 'R_FtoeA02IK_CtrlZero', 'R_FtoeA03IK_CtrlZero' ]
-toeToeZeros += [ 'R_FtoeB01IK_CtrlZero', 'R_FtoeB02IK_CtrlZero', 'R_FtoeB03IK_CtrlZero', 'R_FtoeB04IK_CtrlZero' ]
-toeToeZeros += [ 'R_FtoeC01IK_CtrlZero', 'R_FtoeC02IK_CtrlZero', 'R_FtoeC03IK_CtrlZero', 'R_FtoeC04IK_CtrlZero' ]
-toeToeZeros += [ 'R_FtoeD01IK_CtrlZero', 'R_FtoeD02IK_CtrlZero', 'R_FtoeD03IK_CtrlZero', 'R_FtoeD04IK_CtrlZero' ]
-toeToeZeros += [ 'R_FtoeE02IK_CtrlZero', 'R_FtoeE03IK_CtrlZero', 'R_FtoeE04IK_CtrlZero' ]
+toeToeZeros = [ 'R_Ftoe'+zero+'IK_CtrlZero' for zero in RigConfig['toes']['Ftoe']['toeZeros'] ]
 
 for toeToeZero in toeToeZeros:
     print( toeToeZero )
-    cmds.parentConstraint( 'R_Ftoe_Jx', toeToeZero, mo=True )
+    cmds.parentConstraint( 'R_'+RigConfig['toes']['Ftoe']['toeDriver'], toeToeZero, mo=True )
 
 # clean ups
-denUt.den_AddSafetyCovers( rigGroup=L_FtoeRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=L_FtoeRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', L_FtoeRigGrp[0]+'.Show_Controls' )
@@ -971,7 +1125,7 @@ cmds.connectAttr( AllCtrl+'.Bone_Draw_Style', L_FtoeRigGrp[0]+'.Bone_Draw_Style'
 cmds.connectAttr( AllCtrl+'.Left_Color', L_FtoeRigGrp[0]+'.Ctrl_Color' )
 
 
-denUt.den_AddSafetyCovers( rigGroup=R_FtoeRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=R_FtoeRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', R_FtoeRigGrp[0]+'.Show_Controls' )
@@ -1019,6 +1173,7 @@ cmds.xform( 'R_Ear03_Piv', t=( 27.083168737038456, 211.10234921423893, 207.68825
 # L
 L_EarRigRet = denAR.den_makeFKappendageRig( side='L_', name='Ear', jointCount=3, radius=2, ctrlRadius=6.0, secondaryAxisOrient='zup' )
 print( L_EarRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='L_Ear', rigRet=L_EarRigRet )
 L_EarRigGrp = L_EarRigRet[0]; print( L_EarRigGrp )
 L_EarSpaceIN = L_EarRigRet[1][0]; print( L_EarSpaceIN )
 L_EarBindJnts = L_EarRigRet[3]; print( L_EarBindJnts )
@@ -1031,7 +1186,7 @@ L_EarRigGrp = cmds.parent( L_EarRigGrp, RootRigGrp )
 L_EarSpaceConstraint = cmds.parentConstraint( HeadSpaceOUT, L_EarSpaceIN, mo=True  )
 L_EarSpaceScaleConstraint = cmds.scaleConstraint( HeadSpaceOUT, L_EarSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=L_EarRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=L_EarRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', L_EarRigGrp[0]+'.Show_Controls' )
@@ -1042,6 +1197,7 @@ cmds.connectAttr( AllCtrl+'.Left_Color', L_EarRigGrp[0]+'.Ctrl_Color' )
 # R
 R_EarRigRet = denAR.den_makeFKappendageRig( side='R_', name='Ear', jointCount=3, radius=2, ctrlRadius=6.0, secondaryAxisOrient='zup' )
 print( R_EarRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='R_Ear', rigRet=R_EarRigRet )
 R_EarRigGrp = R_EarRigRet[0]; print( R_EarRigGrp )
 R_EarSpaceIN = R_EarRigRet[1][0]; print( R_EarSpaceIN )
 R_EarBindJnts = R_EarRigRet[3]; print( R_EarBindJnts )
@@ -1054,7 +1210,7 @@ R_EarRigGrp = cmds.parent( R_EarRigGrp, RootRigGrp )
 R_EarSpaceConstraint = cmds.parentConstraint( HeadSpaceOUT, R_EarSpaceIN, mo=True  )
 R_EarSpaceScaleConstraint = cmds.scaleConstraint( HeadSpaceOUT, R_EarSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=R_EarRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=R_EarRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', R_EarRigGrp[0]+'.Show_Controls' )
@@ -1085,6 +1241,7 @@ cmds.xform( 'HornEnd_Piv', t=( 4.400000095367432, 268.0982666015625, 175.0975189
 
 HornRigRet = denAR.den_makeFKappendageRig( side='', name='Horn', jointCount=1, radius=2, ctrlRadius=6.0, secondaryAxisOrient='zup' )
 print( HornRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='Horn', rigRet=HornRigRet )
 HornRigGrp = HornRigRet[0]; print( HornRigGrp )
 HornSpaceIN = HornRigRet[1][0]; print( HornSpaceIN )
 HornBindJnts = HornRigRet[3]; print( HornBindJnts )
@@ -1097,7 +1254,7 @@ HornRigGrp = cmds.parent( HornRigGrp, RootRigGrp )
 HornSpaceConstraint = cmds.parentConstraint( HeadSpaceOUT, HornSpaceIN, mo=True  )
 HornSpaceScaleConstraint = cmds.scaleConstraint( HeadSpaceOUT, HornSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=HornRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=HornRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', HornRigGrp[0]+'.Show_Controls' )
@@ -1128,6 +1285,7 @@ cmds.xform( 'CrestAEnd_Piv', t=( 0.0, 238.36009543722264, 224.43159532897656 ),
 
 CrestARigRet = denAR.den_makeFKappendageRig( side='', name='CrestA', jointCount=1, radius=2, ctrlRadius=18, secondaryAxisOrient='zup' )
 print( CrestARigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='CrestA', rigRet=CrestARigRet )
 CrestARigGrp = CrestARigRet[0]; print( CrestARigGrp )
 CrestASpaceIN = CrestARigRet[1][0]; print( CrestASpaceIN )
 CrestABindJnts = CrestARigRet[3]; print( CrestABindJnts )
@@ -1140,7 +1298,7 @@ CrestARigGrp = cmds.parent( CrestARigGrp, RootRigGrp )
 CrestASpaceConstraint = cmds.parentConstraint( HeadSpaceOUT, CrestASpaceIN, mo=True  )
 CrestASpaceScaleConstraint = cmds.scaleConstraint( HeadSpaceOUT, CrestASpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=CrestARigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=CrestARigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', CrestARigGrp[0]+'.Show_Controls' )
@@ -1171,6 +1329,7 @@ cmds.xform( 'CrestBEnd_Piv', t=( 0.0, 251.13203655337531, 198.7168240158694 ), r
 
 CrestBRigRet = denAR.den_makeFKappendageRig( side='', name='CrestB', jointCount=1, radius=2, ctrlRadius=18, secondaryAxisOrient='zup' )
 print( CrestBRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='CrestB', rigRet=CrestBRigRet )
 CrestBRigGrp = CrestBRigRet[0]; print( CrestBRigGrp )
 CrestBSpaceIN = CrestBRigRet[1][0]; print( CrestBSpaceIN )
 CrestBBindJnts = CrestBRigRet[3]; print( CrestBBindJnts )
@@ -1180,13 +1339,13 @@ denUt.den_connectProxyGeo( Jnts=CrestBBindJnts )
 
 CrestBRigGrp = cmds.parent( CrestBRigGrp, RootRigGrp )
 
-Neck06Space_OUT = TorsoSpaceOUTs[10]; print( Neck06Space_OUT )
+Neck06Space_OUT = TorsoSpaceOUTs[RigConfig['torsoSpaceOUTs']['Neck06']]; print( Neck06Space_OUT )
 
 
 CrestBSpaceConstraint = cmds.parentConstraint( Neck06Space_OUT, CrestBSpaceIN, mo=True  )
 CrestBSpaceScaleConstraint = cmds.scaleConstraint( Neck06Space_OUT, CrestBSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=CrestBRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=CrestBRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', CrestBRigGrp[0]+'.Show_Controls' )
@@ -1215,6 +1374,7 @@ cmds.xform( 'CrestCEnd_Piv', t=( 0.0, 245.246660618359, 148.3589301441691 ), ro=
 
 CrestCRigRet = denAR.den_makeFKappendageRig( side='', name='CrestC', jointCount=1, radius=2, ctrlRadius=18, secondaryAxisOrient='zup' )
 print( CrestCRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='CrestC', rigRet=CrestCRigRet )
 CrestCRigGrp = CrestCRigRet[0]; print( CrestCRigGrp )
 CrestCSpaceIN = CrestCRigRet[1][0]; print( CrestCSpaceIN )
 CrestCBindJnts = CrestCRigRet[3]; print( CrestCBindJnts )
@@ -1224,12 +1384,12 @@ denUt.den_connectProxyGeo( Jnts=CrestCBindJnts )
 
 CrestCRigGrp = cmds.parent( CrestCRigGrp, RootRigGrp )
 
-Neck05Space_OUT = TorsoSpaceOUTs[9]; print( Neck05Space_OUT )
+Neck05Space_OUT = TorsoSpaceOUTs[RigConfig['torsoSpaceOUTs']['Neck05']]; print( Neck05Space_OUT )
 
 CrestCSpaceConstraint = cmds.parentConstraint( Neck05Space_OUT, CrestCSpaceIN, mo=True  )
 CrestCSpaceScaleConstraint = cmds.scaleConstraint( Neck05Space_OUT, CrestCSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=CrestCRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=CrestCRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', CrestCRigGrp[0]+'.Show_Controls' )
@@ -1258,6 +1418,7 @@ cmds.xform( 'CrestDEnd_Piv', t=( 0.0, 221.7341138772685, 119.59203364579565 ), r
 
 CrestDRigRet = denAR.den_makeFKappendageRig( side='', name='CrestD', jointCount=1, radius=2, ctrlRadius=18, secondaryAxisOrient='zup' )
 print( CrestDRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='CrestD', rigRet=CrestDRigRet )
 CrestDRigGrp = CrestDRigRet[0]; print( CrestDRigGrp )
 CrestDSpaceIN = CrestDRigRet[1][0]; print( CrestDSpaceIN )
 CrestDBindJnts = CrestDRigRet[3]; print( CrestDBindJnts )
@@ -1267,12 +1428,12 @@ denUt.den_connectProxyGeo( Jnts=CrestDBindJnts )
 
 CrestDRigGrp = cmds.parent( CrestDRigGrp, RootRigGrp )
 
-Neck04Space_OUT = TorsoSpaceOUTs[8]; print( Neck04Space_OUT )
+Neck04Space_OUT = TorsoSpaceOUTs[RigConfig['torsoSpaceOUTs']['Neck04']]; print( Neck04Space_OUT )
 
 CrestDSpaceConstraint = cmds.parentConstraint( Neck04Space_OUT, CrestDSpaceIN, mo=True  )
 CrestDSpaceScaleConstraint = cmds.scaleConstraint( Neck04Space_OUT, CrestDSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=CrestDRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=CrestDRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', CrestDRigGrp[0]+'.Show_Controls' )
@@ -1301,6 +1462,7 @@ cmds.xform( 'CrestEEnd_Piv', t=( 0.0, 197.40894132581855, 107.98864673906954 ),
 
 CrestERigRet = denAR.den_makeFKappendageRig( side='', name='CrestE', jointCount=1, radius=2, ctrlRadius=18, secondaryAxisOrient='zup' )
 print( CrestERigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='CrestE', rigRet=CrestERigRet )
 CrestERigGrp = CrestERigRet[0]; print( CrestERigGrp )
 CrestESpaceIN = CrestERigRet[1][0]; print( CrestESpaceIN )
 CrestEBindJnts = CrestERigRet[3]; print( CrestEBindJnts )
@@ -1310,12 +1472,12 @@ denUt.den_connectProxyGeo( Jnts=CrestEBindJnts )
 
 CrestERigGrp = cmds.parent( CrestERigGrp, RootRigGrp )
 
-Neck03Space_OUT = TorsoSpaceOUTs[7]; print( Neck03Space_OUT )
+Neck03Space_OUT = TorsoSpaceOUTs[RigConfig['torsoSpaceOUTs']['Neck03']]; print( Neck03Space_OUT )
 
 CrestESpaceConstraint = cmds.parentConstraint( Neck03Space_OUT, CrestESpaceIN, mo=True  )
 CrestESpaceScaleConstraint = cmds.scaleConstraint( Neck03Space_OUT, CrestESpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=CrestERigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=CrestERigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', CrestERigGrp[0]+'.Show_Controls' )
@@ -1346,6 +1508,7 @@ cmds.xform( 'Chinfin_upPiv', t=( 32.245715552903015, 175.42310364825838, 208.672
 
 ChinfinRigRet = denAR.den_makeFKappendageRig( side='', name='Chinfin', jointCount=2, radius=2, ctrlRadius=6.0, secondaryAxisOrient='zup' )
 print( ChinfinRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='Chinfin', rigRet=ChinfinRigRet )
 ChinfinRigGrp = ChinfinRigRet[0]; print( ChinfinRigGrp )
 ChinfinSpaceIN = ChinfinRigRet[1][0]; print( ChinfinSpaceIN )
 ChinfinBindJnts = ChinfinRigRet[3]; print( ChinfinBindJnts )
@@ -1358,7 +1521,7 @@ ChinfinRigGrp = cmds.parent( ChinfinRigGrp, RootRigGrp )
 ChinfinSpaceConstraint = cmds.parentConstraint( JawSpaceOUT, ChinfinSpaceIN, mo=True  )
 ChinfinSpaceScaleConstraint = cmds.scaleConstraint( JawSpaceOUT, ChinfinSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=ChinfinRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=ChinfinRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', ChinfinRigGrp[0]+'.Show_Controls' )
@@ -1400,6 +1563,7 @@ cmds.xform( 'R_Headfin02_Piv', t=( 17.49462740839529, 195.31730446452215, 203.53
 # L
 L_HeadfinRigRet = denAR.den_makeFKappendageRig( side='L_', name='Headfin', jointCount=3, radius=2, ctrlRadius=6.0, secondaryAxisOrient='zup' )
 print( L_HeadfinRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='L_Headfin', rigRet=L_HeadfinRigRet )
 L_HeadfinRigGrp = L_HeadfinRigRet[0]; print( L_HeadfinRigGrp )
 L_HeadfinSpaceIN = L_HeadfinRigRet[1][0]; print( L_HeadfinSpaceIN )
 L_HeadfinBindJnts = L_HeadfinRigRet[3]; print( L_HeadfinBindJnts )
@@ -1412,7 +1576,7 @@ L_HeadfinRigGrp = cmds.parent( L_HeadfinRigGrp, RootRigGrp )
 L_HeadfinSpaceConstraint = cmds.parentConstraint( HeadSpaceOUT, L_HeadfinSpaceIN, mo=True  )
 L_HeadfinSpaceScaleConstraint = cmds.scaleConstraint( HeadSpaceOUT, L_HeadfinSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=L_HeadfinRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=L_HeadfinRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', L_HeadfinRigGrp[0]+'.Show_Controls' )
@@ -1423,6 +1587,7 @@ cmds.connectAttr( AllCtrl+'.Left_Color', L_HeadfinRigGrp[0]+'.Ctrl_Color' )
 # R
 R_HeadfinRigRet = denAR.den_makeFKappendageRig( side='R_', name='Headfin', jointCount=3, radius=2, ctrlRadius=6.0, secondaryAxisOrient='zup' )
 print( R_HeadfinRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='R_Headfin', rigRet=R_HeadfinRigRet )
 R_HeadfinRigGrp = R_HeadfinRigRet[0]; print( R_HeadfinRigGrp )
 R_HeadfinSpaceIN = R_HeadfinRigRet[1][0]; print( R_HeadfinSpaceIN )
 R_HeadfinBindJnts = R_HeadfinRigRet[3]; print( R_HeadfinBindJnts )
@@ -1435,7 +1600,7 @@ R_HeadfinRigGrp = cmds.parent( R_HeadfinRigGrp, RootRigGrp )
 R_HeadfinSpaceConstraint = cmds.parentConstraint( HeadSpaceOUT, R_HeadfinSpaceIN, mo=True  )
 R_HeadfinSpaceScaleConstraint = cmds.scaleConstraint( HeadSpaceOUT, R_HeadfinSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=R_HeadfinRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=R_HeadfinRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', R_HeadfinRigGrp[0]+'.Show_Controls' )
@@ -1477,6 +1642,7 @@ cmds.xform( 'R_FinAEnd_Piv', t=( 33.47648453401122, 124.18687637155124, 89.88583
 # L
 L_FinARigRet = denAR.den_makeFKappendageRig( side='L_', name='FinA', jointCount=1, radius=2, ctrlRadius=30.0, secondaryAxisOrient='zup' )
 print( L_FinARigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='L_FinA', rigRet=L_FinARigRet )
 L_FinARigGrp = L_FinARigRet[0]; print( L_FinARigGrp )
 L_FinASpaceIN = L_FinARigRet[1][0]; print( L_FinASpaceIN )
 L_FinABindJnts = L_FinARigRet[3]; print( L_FinABindJnts )
@@ -1488,10 +1654,10 @@ L_FinARigGrp = cmds.parent( L_FinARigGrp, RootRigGrp )
 
 
 
-L_FinASpaceConstraint = cmds.parentConstraint( 'L_ShldRest_Jx', L_FinASpaceIN, mo=True  )
-L_FinASpaceScaleConstraint = cmds.scaleConstraint( 'L_ShldRest_Jx', L_FinASpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
+L_FinASpaceConstraint = cmds.parentConstraint( RigConfig['appendageDrivers']['L_FinA'], L_FinASpaceIN, mo=True  )
+L_FinASpaceScaleConstraint = cmds.scaleConstraint( RigConfig['appendageDrivers']['L_FinA'], L_FinASpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=L_FinARigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=L_FinARigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', L_FinARigGrp[0]+'.Show_Controls' )
@@ -1502,6 +1668,7 @@ cmds.connectAttr( AllCtrl+'.Left_Color', L_FinARigGrp[0]+'.Ctrl_Color' )
 # R
 R_FinARigRet = denAR.den_makeFKappendageRig( side='R_', name='FinA', jointCount=1, radius=2, ctrlRadius=30.0, secondaryAxisOrient='zup' )
 print( R_FinARigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='R_FinA', rigRet=R_FinARigRet )
 R_FinARigGrp = R_FinARigRet[0]; print( R_FinARigGrp )
 R_FinASpaceIN = R_FinARigRet[1][0]; print( R_FinASpaceIN )
 R_FinABindJnts = R_FinARigRet[3]; print( R_FinABindJnts )
@@ -1511,10 +1678,10 @@ denUt.den_connectProxyGeo( Jnts=R_FinABindJnts )
 
 R_FinARigGrp = cmds.parent( R_FinARigGrp, RootRigGrp )
 
-R_FinASpaceConstraint = cmds.parentConstraint( 'R_ShldRest_Jx', R_FinASpaceIN, mo=True  )
-R_FinASpaceScaleConstraint = cmds.scaleConstraint( 'R_ShldRest_Jx', R_FinASpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
+R_FinASpaceConstraint = cmds.parentConstraint( RigConfig['appendageDrivers']['R_FinA'], R_FinASpaceIN, mo=True  )
+R_FinASpaceScaleConstraint = cmds.scaleConstraint( RigConfig['appendageDrivers']['R_FinA'], R_FinASpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=R_FinARigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=R_FinARigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', R_FinARigGrp[0]+'.Show_Controls' )
@@ -1551,6 +1718,7 @@ cmds.xform( 'R_FinBEnd_Piv', t=( 25.871, 201.62561347664717, 72.12149077353344 )
 # L
 L_FinBRigRet = denAR.den_makeFKappendageRig( side='L_', name='FinB', jointCount=1, radius=2, ctrlRadius=30.0, secondaryAxisOrient='zup' )
 print( L_FinBRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='L_FinB', rigRet=L_FinBRigRet )
 L_FinBRigGrp = L_FinBRigRet[0]; print( L_FinBRigGrp )
 L_FinBSpaceIN = L_FinBRigRet[1][0]; print( L_FinBSpaceIN )
 L_FinBBindJnts = L_FinBRigRet[3]; print( L_FinBBindJnts )
@@ -1561,10 +1729,10 @@ denUt.den_connectProxyGeo( Jnts=L_FinBBindJnts )
 L_FinBRigGrp = cmds.parent( L_FinBRigGrp, RootRigGrp )
 
 
-L_FinBSpaceConstraint = cmds.parentConstraint( 'L_ShldRest_Jx', L_FinBSpaceIN, mo=True  )
-L_FinBSpaceScaleConstraint = cmds.scaleConstraint( 'L_ShldRest_Jx', L_FinBSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
+L_FinBSpaceConstraint = cmds.parentConstraint( RigConfig['appendageDrivers']['L_FinB'], L_FinBSpaceIN, mo=True  )
+L_FinBSpaceScaleConstraint = cmds.scaleConstraint( RigConfig['appendageDrivers']['L_FinB'], L_FinBSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=L_FinBRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=L_FinBRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', L_FinBRigGrp[0]+'.Show_Controls' )
@@ -1575,6 +1743,7 @@ cmds.connectAttr( AllCtrl+'.Left_Color', L_FinBRigGrp[0]+'.Ctrl_Color' )
 # R
 R_FinBRigRet = denAR.den_makeFKappendageRig( side='R_', name='FinB', jointCount=1, radius=2, ctrlRadius=30.0, secondaryAxisOrient='zup' )
 print( R_FinBRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='R_FinB', rigRet=R_FinBRigRet )
 R_FinBRigGrp = R_FinBRigRet[0]; print( R_FinBRigGrp )
 R_FinBSpaceIN = R_FinBRigRet[1][0]; print( R_FinBSpaceIN )
 R_FinBBindJnts = R_FinBRigRet[3]; print( R_FinBBindJnts )
@@ -1584,10 +1753,10 @@ denUt.den_connectProxyGeo( Jnts=R_FinBBindJnts )
 
 R_FinBRigGrp = cmds.parent( R_FinBRigGrp, RootRigGrp )
 
-R_FinBSpaceConstraint = cmds.parentConstraint( 'R_ShldRest_Jx', R_FinBSpaceIN, mo=True  )
-R_FinBSpaceScaleConstraint = cmds.scaleConstraint( 'R_ShldRest_Jx', R_FinBSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
+R_FinBSpaceConstraint = cmds.parentConstraint( RigConfig['appendageDrivers']['R_FinB'], R_FinBSpaceIN, mo=True  )
+R_FinBSpaceScaleConstraint = cmds.scaleConstraint( RigConfig['appendageDrivers']['R_FinB'], R_FinBSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=R_FinBRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=R_FinBRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', R_FinBRigGrp[0]+'.Show_Controls' )
@@ -1623,6 +1792,7 @@ cmds.xform( 'R_FinCEnd_Piv', t=( 25.871, 208.21305415413931, 12.634905261634763
 # L
 L_FinCRigRet = denAR.den_makeFKappendageRig( side='L_', name='FinC', jointCount=1, radius=2, ctrlRadius=30.0, secondaryAxisOrient='zup' )
 print( L_FinCRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='L_FinC', rigRet=L_FinCRigRet )
 L_FinCRigGrp = L_FinCRigRet[0]; print( L_FinCRigGrp )
 L_FinCSpaceIN = L_FinCRigRet[1][0]; print( L_FinCSpaceIN )
 L_FinCBindJnts = L_FinCRigRet[3]; print( L_FinCBindJnts )
@@ -1633,10 +1803,10 @@ denUt.den_connectProxyGeo( Jnts=L_FinCBindJnts )
 L_FinCRigGrp = cmds.parent( L_FinCRigGrp, RootRigGrp )
 
 
-L_FinCSpaceConstraint = cmds.parentConstraint( 'L_ShldRest_Jx', L_FinCSpaceIN, mo=True  )
-L_FinCSpaceScaleConstraint = cmds.scaleConstraint( 'L_ShldRest_Jx', L_FinCSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
+L_FinCSpaceConstraint = cmds.parentConstraint( RigConfig['appendageDrivers']['L_FinC'], L_FinCSpaceIN, mo=True  )
+L_FinCSpaceScaleConstraint = cmds.scaleConstraint( RigConfig['appendageDrivers']['L_FinC'], L_FinCSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=L_FinCRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=L_FinCRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', L_FinCRigGrp[0]+'.Show_Controls' )
@@ -1647,6 +1817,7 @@ cmds.connectAttr( AllCtrl+'.Left_Color', L_FinCRigGrp[0]+'.Ctrl_Color' )
 # R
 R_FinCRigRet = denAR.den_makeFKappendageRig( side='R_', name='FinC', jointCount=1, radius=2, ctrlRadius=30.0, secondaryAxisOrient='zup' )
 print( R_FinCRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='R_FinC', rigRet=R_FinCRigRet )
 R_FinCRigGrp = R_FinCRigRet[0]; print( R_FinCRigGrp )
 R_FinCSpaceIN = R_FinCRigRet[1][0]; print( R_FinCSpaceIN )
 R_FinCBindJnts = R_FinCRigRet[3]; print( R_FinCBindJnts )
@@ -1656,10 +1827,10 @@ denUt.den_connectProxyGeo( Jnts=R_FinCBindJnts )
 
 R_FinCRigGrp = cmds.parent( R_FinCRigGrp, RootRigGrp )
 
-R_FinCSpaceConstraint = cmds.parentConstraint( 'R_ShldRest_Jx', R_FinCSpaceIN, mo=True  )
-R_FinCSpaceScaleConstraint = cmds.scaleConstraint( 'R_ShldRest_Jx', R_FinCSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
+R_FinCSpaceConstraint = cmds.parentConstraint( RigConfig['appendageDrivers']['R_FinC'], R_FinCSpaceIN, mo=True  )
+R_FinCSpaceScaleConstraint = cmds.scaleConstraint( RigConfig['appendageDrivers']['R_FinC'], R_FinCSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=R_FinCRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=R_FinCRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', R_FinCRigGrp[0]+'.Show_Controls' )
@@ -1696,6 +1867,7 @@ cmds.xform( 'R_FinDEnd_Piv', t=( 12.405443781820207, 182.29944876140755, -15.174
 # L
 L_FinDRigRet = denAR.den_makeFKappendageRig( side='L_', name='FinD', jointCount=1, radius=2, ctrlRadius=30.0, secondaryAxisOrient='zup' )
 print( L_FinDRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='L_FinD', rigRet=L_FinDRigRet )
 L_FinDRigGrp = L_FinDRigRet[0]; print( L_FinDRigGrp )
 L_FinDSpaceIN = L_FinDRigRet[1][0]; print( L_FinDSpaceIN )
 L_FinDBindJnts = L_FinDRigRet[3]; print( L_FinDBindJnts )
@@ -1706,10 +1878,10 @@ denUt.den_connectProxyGeo( Jnts=L_FinDBindJnts )
 L_FinDRigGrp = cmds.parent( L_FinDRigGrp, RootRigGrp )
 
 
-L_FinDSpaceConstraint = cmds.parentConstraint( 'Spine03_Jnt', L_FinDSpaceIN, mo=True  )
-L_FinDSpaceScaleConstraint = cmds.scaleConstraint( 'Spine03_Jnt', L_FinDSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
+L_FinDSpaceConstraint = cmds.parentConstraint( RigConfig['appendageDrivers']['L_FinD'], L_FinDSpaceIN, mo=True  )
+L_FinDSpaceScaleConstraint = cmds.scaleConstraint( RigConfig['appendageDrivers']['L_FinD'], L_FinDSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=L_FinDRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=L_FinDRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', L_FinDRigGrp[0]+'.Show_Controls' )
@@ -1720,6 +1892,7 @@ cmds.connectAttr( AllCtrl+'.Left_Color', L_FinDRigGrp[0]+'.Ctrl_Color' )
 # R
 R_FinDRigRet = denAR.den_makeFKappendageRig( side='R_', name='FinD', jointCount=1, radius=2, ctrlRadius=30.0, secondaryAxisOrient='zup' )
 print( R_FinDRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='R_FinD', rigRet=R_FinDRigRet )
 R_FinDRigGrp = R_FinDRigRet[0]; print( R_FinDRigGrp )
 R_FinDSpaceIN = R_FinDRigRet[1][0]; print( R_FinDSpaceIN )
 R_FinDBindJnts = R_FinDRigRet[3]; print( R_FinDBindJnts )
@@ -1729,10 +1902,10 @@ denUt.den_connectProxyGeo( Jnts=R_FinDBindJnts )
 
 R_FinDRigGrp = cmds.parent( R_FinDRigGrp, RootRigGrp )
 
-R_FinDSpaceConstraint = cmds.parentConstraint( 'Spine03_Jnt', R_FinDSpaceIN, mo=True  )
-R_FinDSpaceScaleConstraint = cmds.scaleConstraint( 'Spine03_Jnt', R_FinDSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
+R_FinDSpaceConstraint = cmds.parentConstraint( RigConfig['appendageDrivers']['R_FinD'], R_FinDSpaceIN, mo=True  )
+R_FinDSpaceScaleConstraint = cmds.scaleConstraint( RigConfig['appendageDrivers']['R_FinD'], R_FinDSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=R_FinDRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=R_FinDRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', R_FinDRigGrp[0]+'.Show_Controls' )
@@ -1767,6 +1940,7 @@ cmds.xform( 'R_FinEEnd_Piv', t=( 11.774640517479927, 163.28847214257055, -29.028
 # L
 L_FinERigRet = denAR.den_makeFKappendageRig( side='L_', name='FinE', jointCount=1, radius=2, ctrlRadius=30.0, secondaryAxisOrient='zup' )
 print( L_FinERigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='L_FinE', rigRet=L_FinERigRet )
 L_FinERigGrp = L_FinERigRet[0]; print( L_FinERigGrp )
 L_FinESpaceIN = L_FinERigRet[1][0]; print( L_FinESpaceIN )
 L_FinEBindJnts = L_FinERigRet[3]; print( L_FinEBindJnts )
@@ -1777,10 +1951,10 @@ denUt.den_connectProxyGeo( Jnts=L_FinEBindJnts )
 L_FinERigGrp = cmds.parent( L_FinERigGrp, RootRigGrp )
 
 
-L_FinESpaceConstraint = cmds.parentConstraint( 'Spine02_Jnt', L_FinESpaceIN, mo=True  )
-L_FinESpaceScaleConstraint = cmds.scaleConstraint( 'Spine02_Jnt', L_FinESpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
+L_FinESpaceConstraint = cmds.parentConstraint( RigConfig['appendageDrivers']['L_FinE'], L_FinESpaceIN, mo=True  )
+L_FinESpaceScaleConstraint = cmds.scaleConstraint( RigConfig['appendageDrivers']['L_FinE'], L_FinESpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=L_FinERigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=L_FinERigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', L_FinERigGrp[0]+'.Show_Controls' )
@@ -1791,6 +1965,7 @@ cmds.connectAttr( AllCtrl+'.Left_Color', L_FinERigGrp[0]+'.Ctrl_Color' )
 # R
 R_FinERigRet = denAR.den_makeFKappendageRig( side='R_', name='FinE', jointCount=1, radius=2, ctrlRadius=30.0, secondaryAxisOrient='zup' )
 print( R_FinERigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='R_FinE', rigRet=R_FinERigRet )
 R_FinERigGrp = R_FinERigRet[0]; print( R_FinERigGrp )
 R_FinESpaceIN = R_FinERigRet[1][0]; print( R_FinESpaceIN )
 R_FinEBindJnts = R_FinERigRet[3]; print( R_FinEBindJnts )
@@ -1800,10 +1975,10 @@ denUt.den_connectProxyGeo( Jnts=R_FinEBindJnts )
 
 R_FinERigGrp = cmds.parent( R_FinERigGrp, RootRigGrp )
 
-R_FinESpaceConstraint = cmds.parentConstraint( 'Spine02_Jnt', R_FinESpaceIN, mo=True  )
-R_FinESpaceScaleConstraint = cmds.scaleConstraint( 'Spine02_Jnt', R_FinESpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
+R_FinESpaceConstraint = cmds.parentConstraint( RigConfig['appendageDrivers']['R_FinE'], R_FinESpaceIN, mo=True  )
+R_FinESpaceScaleConstraint = cmds.scaleConstraint( RigConfig['appendageDrivers']['R_FinE'], R_FinESpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=R_FinERigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=R_FinERigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', R_FinERigGrp[0]+'.Show_Controls' )
@@ -1839,6 +2014,7 @@ cmds.xform( 'R_FinFEnd_Piv', t=( 7.598, 163.28847214257055, -100.45853540777551
 # L
 L_FinFRigRet = denAR.den_makeFKappendageRig( side='L_', name='FinF', jointCount=1, radius=2, ctrlRadius=24.0, secondaryAxisOrient='zup' )
 print( L_FinFRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='L_FinF', rigRet=L_FinFRigRet )
 L_FinFRigGrp = L_FinFRigRet[0]; print( L_FinFRigGrp )
 L_FinFSpaceIN = L_FinFRigRet[1][0]; print( L_FinFSpaceIN )
 L_FinFBindJnts = L_FinFRigRet[3]; print( L_FinFBindJnts )
@@ -1849,10 +2025,10 @@ denUt.den_connectProxyGeo( Jnts=L_FinFBindJnts )
 L_FinFRigGrp = cmds.parent( L_FinFRigGrp, RootRigGrp )
 
 
-L_FinFSpaceConstraint = cmds.parentConstraint( 'L_Hip_Jx', L_FinFSpaceIN, mo=True  )
-L_FinFSpaceScaleConstraint = cmds.scaleConstraint( 'L_Hip_Jx', L_FinFSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
+L_FinFSpaceConstraint = cmds.parentConstraint( RigConfig['appendageDrivers']['L_FinF'], L_FinFSpaceIN, mo=True  )
+L_FinFSpaceScaleConstraint = cmds.scaleConstraint( RigConfig['appendageDrivers']['L_FinF'], L_FinFSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=L_FinFRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=L_FinFRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', L_FinFRigGrp[0]+'.Show_Controls' )
@@ -1863,6 +2039,7 @@ cmds.connectAttr( AllCtrl+'.Left_Color', L_FinFRigGrp[0]+'.Ctrl_Color' )
 # R
 R_FinFRigRet = denAR.den_makeFKappendageRig( side='R_', name='FinF', jointCount=1, radius=2, ctrlRadius=24.0, secondaryAxisOrient='zup' )
 print( R_FinFRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='R_FinF', rigRet=R_FinFRigRet )
 R_FinFRigGrp = R_FinFRigRet[0]; print( R_FinFRigGrp )
 R_FinFSpaceIN = R_FinFRigRet[1][0]; print( R_FinFSpaceIN )
 R_FinFBindJnts = R_FinFRigRet[3]; print( R_FinFBindJnts )
@@ -1872,10 +2049,10 @@ denUt.den_connectProxyGeo( Jnts=R_FinFBindJnts )
 
 R_FinFRigGrp = cmds.parent( R_FinFRigGrp, RootRigGrp )
 
-R_FinFSpaceConstraint = cmds.parentConstraint( 'L_Hip_Jx', R_FinFSpaceIN, mo=True  )
-R_FinFSpaceScaleConstraint = cmds.scaleConstraint( 'L_Hip_Jx', R_FinFSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
+R_FinFSpaceConstraint = cmds.parentConstraint( RigConfig['appendageDrivers']['R_FinF'], R_FinFSpaceIN, mo=True  )
+R_FinFSpaceScaleConstraint = cmds.scaleConstraint( RigConfig['appendageDrivers']['R_FinF'], R_FinFSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=R_FinFRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=R_FinFRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', R_FinFRigGrp[0]+'.Show_Controls' )
@@ -1913,6 +2090,7 @@ cmds.xform( 'R_FinG_upPiv', t=( 98.37742281117772, 138.9450824205818, -137.71562
 # L
 L_FinGRigRet = denAR.den_makeFKappendageRig( side='L_', name='FinG', jointCount=1, radius=2, ctrlRadius=24.0, secondaryAxisOrient='zup' )
 print( L_FinGRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='L_FinG', rigRet=L_FinGRigRet )
 L_FinGRigGrp = L_FinGRigRet[0]; print( L_FinGRigGrp )
 L_FinGSpaceIN = L_FinGRigRet[1][0]; print( L_FinGSpaceIN )
 L_FinGBindJnts = L_FinGRigRet[3]; print( L_FinGBindJnts )
@@ -1923,10 +2101,10 @@ denUt.den_connectProxyGeo( Jnts=L_FinGBindJnts )
 L_FinGRigGrp = cmds.parent( L_FinGRigGrp, RootRigGrp )
 
 
-L_FinGSpaceConstraint = cmds.parentConstraint( 'Tail01_Jnt', L_FinGSpaceIN, mo=True  )
-L_FinGSpaceScaleConstraint = cmds.scaleConstraint( 'Tail01_Jnt', L_FinGSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
+L_FinGSpaceConstraint = cmds.parentConstraint( RigConfig['appendageDrivers']['L_FinG'], L_FinGSpaceIN, mo=True  )
+L_FinGSpaceScaleConstraint = cmds.scaleConstraint( RigConfig['appendageDrivers']['L_FinG'], L_FinGSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=L_FinGRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=L_FinGRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', L_FinGRigGrp[0]+'.Show_Controls' )
@@ -1937,6 +2115,7 @@ cmds.connectAttr( AllCtrl+'.Left_Color', L_FinGRigGrp[0]+'.Ctrl_Color' )
 # R
 R_FinGRigRet = denAR.den_makeFKappendageRig( side='R_', name='FinG', jointCount=1, radius=2, ctrlRadius=24.0, secondaryAxisOrient='zup' )
 print( R_FinGRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='R_FinG', rigRet=R_FinGRigRet )
 R_FinGRigGrp = R_FinGRigRet[0]; print( R_FinGRigGrp )
 R_FinGSpaceIN = R_FinGRigRet[1][0]; print( R_FinGSpaceIN )
 R_FinGBindJnts = R_FinGRigRet[3]; print( R_FinGBindJnts )
@@ -1946,10 +2125,10 @@ denUt.den_connectProxyGeo( Jnts=R_FinGBindJnts )
 
 R_FinGRigGrp = cmds.parent( R_FinGRigGrp, RootRigGrp )
 
-R_FinGSpaceConstraint = cmds.parentConstraint( 'Tail01_Jnt', R_FinGSpaceIN, mo=True  )
-R_FinGSpaceScaleConstraint = cmds.scaleConstraint( 'Tail01_Jnt', R_FinGSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
+R_FinGSpaceConstraint = cmds.parentConstraint( RigConfig['appendageDrivers']['R_FinG'], R_FinGSpaceIN, mo=True  )
+R_FinGSpaceScaleConstraint = cmds.scaleConstraint( RigConfig['appendageDrivers']['R_FinG'], R_FinGSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=R_FinGRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=R_FinGRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', R_FinGRigGrp[0]+'.Show_Controls' )
@@ -1989,6 +2168,7 @@ cmds.xform( 'R_FinHEnd_Piv', t=( 7.598, 144.5391575953395, -206.00467602115208 )
 # L
 L_FinHRigRet = denAR.den_makeFKappendageRig( side='L_', name='FinH', jointCount=1, radius=2, ctrlRadius=24.0, secondaryAxisOrient='zup' )
 print( L_FinHRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='L_FinH', rigRet=L_FinHRigRet )
 L_FinHRigGrp = L_FinHRigRet[0]; print( L_FinHRigGrp )
 L_FinHSpaceIN = L_FinHRigRet[1][0]; print( L_FinHSpaceIN )
 L_FinHBindJnts = L_FinHRigRet[3]; print( L_FinHBindJnts )
@@ -1999,10 +2179,10 @@ denUt.den_connectProxyGeo( Jnts=L_FinHBindJnts )
 L_FinHRigGrp = cmds.parent( L_FinHRigGrp, RootRigGrp )
 
 
-L_FinHSpaceConstraint = cmds.parentConstraint( 'Tail02_Jnt', L_FinHSpaceIN, mo=True  )
-L_FinHSpaceScaleConstraint = cmds.scaleConstraint( 'Tail02_Jnt', L_FinHSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
+L_FinHSpaceConstraint = cmds.parentConstraint( RigConfig['appendageDrivers']['L_FinH'], L_FinHSpaceIN, mo=True  )
+L_FinHSpaceScaleConstraint = cmds.scaleConstraint( RigConfig['appendageDrivers']['L_FinH'], L_FinHSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=L_FinHRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=L_FinHRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', L_FinHRigGrp[0]+'.Show_Controls' )
@@ -2013,6 +2193,7 @@ cmds.connectAttr( AllCtrl+'.Left_Color', L_FinHRigGrp[0]+'.Ctrl_Color' )
 # R
 R_FinHRigRet = denAR.den_makeFKappendageRig( side='R_', name='FinH', jointCount=1, radius=2, ctrlRadius=24.0, secondaryAxisOrient='zup' )
 print( R_FinHRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='R_FinH', rigRet=R_FinHRigRet )
 R_FinHRigGrp = R_FinHRigRet[0]; print( R_FinHRigGrp )
 R_FinHSpaceIN = R_FinHRigRet[1][0]; print( R_FinHSpaceIN )
 R_FinHBindJnts = R_FinHRigRet[3]; print( R_FinHBindJnts )
@@ -2022,10 +2203,10 @@ denUt.den_connectProxyGeo( Jnts=R_FinHBindJnts )
 
 R_FinHRigGrp = cmds.parent( R_FinHRigGrp, RootRigGrp )
 
-R_FinHSpaceConstraint = cmds.parentConstraint( 'Tail02_Jnt', R_FinHSpaceIN, mo=True  )
-R_FinHSpaceScaleConstraint = cmds.scaleConstraint( 'Tail02_Jnt', R_FinHSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
+R_FinHSpaceConstraint = cmds.parentConstraint( RigConfig['appendageDrivers']['R_FinH'], R_FinHSpaceIN, mo=True  )
+R_FinHSpaceScaleConstraint = cmds.scaleConstraint( RigConfig['appendageDrivers']['R_FinH'], R_FinHSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=R_FinHRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=R_FinHRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', R_FinHRigGrp[0]+'.Show_Controls' )
@@ -2061,6 +2242,7 @@ cmds.xform( 'R_FinIEnd_Piv', t=( 4.991302649067998, 133.42692645525378, -249.146
 # L
 L_FinIRigRet = denAR.den_makeFKappendageRig( side='L_', name='FinI', jointCount=1, radius=2, ctrlRadius=24.0, secondaryAxisOrient='zup' )
 print( L_FinIRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='L_FinI', rigRet=L_FinIRigRet )
 L_FinIRigGrp = L_FinIRigRet[0]; print( L_FinIRigGrp )
 L_FinISpaceIN = L_FinIRigRet[1][0]; print( L_FinISpaceIN )
 L_FinIBindJnts = L_FinIRigRet[3]; print( L_FinIBindJnts )
@@ -2071,10 +2253,10 @@ denUt.den_connectProxyGeo( Jnts=L_FinIBindJnts )
 L_FinIRigGrp = cmds.parent( L_FinIRigGrp, RootRigGrp )
 
 
-L_FinISpaceConstraint = cmds.parentConstraint( 'Tail03_Jnt', L_FinISpaceIN, mo=True  )
-L_FinISpaceScaleConstraint = cmds.scaleConstraint( 'Tail03_Jnt', L_FinISpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
+L_FinISpaceConstraint = cmds.parentConstraint( RigConfig['appendageDrivers']['L_FinI'], L_FinISpaceIN, mo=True  )
+L_FinISpaceScaleConstraint = cmds.scaleConstraint( RigConfig['appendageDrivers']['L_FinI'], L_FinISpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=L_FinIRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=L_FinIRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', L_FinIRigGrp[0]+'.Show_Controls' )
@@ -2085,6 +2267,7 @@ cmds.connectAttr( AllCtrl+'.Left_Color', L_FinIRigGrp[0]+'.Ctrl_Color' )
 # R
 R_FinIRigRet = denAR.den_makeFKappendageRig( side='R_', name='FinI', jointCount=1, radius=2, ctrlRadius=24.0, secondaryAxisOrient='zup' )
 print( R_FinIRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='R_FinI', rigRet=R_FinIRigRet )
 R_FinIRigGrp = R_FinIRigRet[0]; print( R_FinIRigGrp )
 R_FinISpaceIN = R_FinIRigRet[1][0]; print( R_FinISpaceIN )
 R_FinIBindJnts = R_FinIRigRet[3]; print( R_FinIBindJnts )
@@ -2094,10 +2277,10 @@ denUt.den_connectProxyGeo( Jnts=R_FinIBindJnts )
 
 R_FinIRigGrp = cmds.parent( R_FinIRigGrp, RootRigGrp )
 
-R_FinISpaceConstraint = cmds.parentConstraint( 'Tail03_Jnt', R_FinISpaceIN, mo=True  )
-R_FinISpaceScaleConstraint = cmds.scaleConstraint( 'Tail03_Jnt', R_FinISpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
+R_FinISpaceConstraint = cmds.parentConstraint( RigConfig['appendageDrivers']['R_FinI'], R_FinISpaceIN, mo=True  )
+R_FinISpaceScaleConstraint = cmds.scaleConstraint( RigConfig['appendageDrivers']['R_FinI'], R_FinISpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=R_FinIRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=R_FinIRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', R_FinIRigGrp[0]+'.Show_Controls' )
@@ -2133,6 +2316,7 @@ cmds.xform( 'R_FinArmAEnd_Piv', t=( 41.991, 89.19853841279061, 14.88693458147705
 # L
 L_FinArmARigRet = denAR.den_makeFKappendageRig( side='L_', name='FinArmA', jointCount=1, radius=2, ctrlRadius=10.0, secondaryAxisOrient='zup' )
 print( L_FinArmARigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='L_FinArmA', rigRet=L_FinArmARigRet )
 L_FinArmARigGrp = L_FinArmARigRet[0]; print( L_FinArmARigGrp )
 L_FinArmASpaceIN = L_FinArmARigRet[1][0]; print( L_FinArmASpaceIN )
 L_FinArmABindJnts = L_FinArmARigRet[3]; print( L_FinArmABindJnts )
@@ -2143,10 +2327,10 @@ denUt.den_connectProxyGeo( Jnts=L_FinArmABindJnts )
 L_FinArmARigGrp = cmds.parent( L_FinArmARigGrp, RootRigGrp )
 
 
-L_FinArmASpaceConstraint = cmds.parentConstraint( 'L_Elbow_Jx', L_FinArmASpaceIN, mo=True  )
-L_FinArmASpaceScaleConstraint = cmds.scaleConstraint( 'L_Elbow_Jx', L_FinArmASpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
+L_FinArmASpaceConstraint = cmds.parentConstraint( RigConfig['appendageDrivers']['L_FinArmA'], L_FinArmASpaceIN, mo=True  )
+L_FinArmASpaceScaleConstraint = cmds.scaleConstraint( RigConfig['appendageDrivers']['L_FinArmA'], L_FinArmASpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=L_FinArmARigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=L_FinArmARigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', L_FinArmARigGrp[0]+'.Show_Controls' )
@@ -2157,6 +2341,7 @@ cmds.connectAttr( AllCtrl+'.Left_Color', L_FinArmARigGrp[0]+'.Ctrl_Color' )
 # R
 R_FinArmARigRet = denAR.den_makeFKappendageRig( side='R_', name='FinArmA', jointCount=1, radius=2, ctrlRadius=10.0, secondaryAxisOrient='zup' )
 print( R_FinArmARigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='R_FinArmA', rigRet=R_FinArmARigRet )
 R_FinArmARigGrp = R_FinArmARigRet[0]; print( R_FinArmARigGrp )
 R_FinArmASpaceIN = R_FinArmARigRet[1][0]; print( R_FinArmASpaceIN )
 R_FinArmABindJnts = R_FinArmARigRet[3]; print( R_FinArmABindJnts )
@@ -2166,10 +2351,10 @@ denUt.den_connectProxyGeo( Jnts=R_FinArmABindJnts )
 
 R_FinArmARigGrp = cmds.parent( R_FinArmARigGrp, RootRigGrp )
 
-R_FinArmASpaceConstraint = cmds.parentConstraint( 'R_Elbow_Jx', R_FinArmASpaceIN, mo=True  )
-R_FinArmASpaceScaleConstraint = cmds.scaleConstraint( 'R_Elbow_Jx', R_FinArmASpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
+R_FinArmASpaceConstraint = cmds.parentConstraint( RigConfig['appendageDrivers']['R_FinArmA'], R_FinArmASpaceIN, mo=True  )
+R_FinArmASpaceScaleConstraint = cmds.scaleConstraint( RigConfig['appendageDrivers']['R_FinArmA'], R_FinArmASpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=R_FinArmARigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=R_FinArmARigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', R_FinArmARigGrp[0]+'.Show_Controls' )
@@ -2204,6 +2389,7 @@ cmds.xform( 'R_FinArmBEnd_Piv', t=( 41.991, 78.93945113900746, 13.10643183148163
 # L
 L_FinArmBRigRet = denAR.den_makeFKappendageRig( side='L_', name='FinArmB', jointCount=1, radius=2, ctrlRadius=10.0, secondaryAxisOrient='zup' )
 print( L_FinArmBRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='L_FinArmB', rigRet=L_FinArmBRigRet )
 L_FinArmBRigGrp = L_FinArmBRigRet[0]; print( L_FinArmBRigGrp )
 L_FinArmBSpaceIN = L_FinArmBRigRet[1][0]; print( L_FinArmBSpaceIN )
 L_FinArmBBindJnts = L_FinArmBRigRet[3]; print( L_FinArmBBindJnts )
@@ -2214,10 +2400,10 @@ denUt.den_connectProxyGeo( Jnts=L_FinArmBBindJnts )
 L_FinArmBRigGrp = cmds.parent( L_FinArmBRigGrp, RootRigGrp )
 
 
-L_FinArmBSpaceConstraint = cmds.parentConstraint( 'L_Elbow_Jx', L_FinArmBSpaceIN, mo=True  )
-L_FinArmBSpaceScaleConstraint = cmds.scaleConstraint( 'L_Elbow_Jx', L_FinArmBSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
+L_FinArmBSpaceConstraint = cmds.parentConstraint( RigConfig['appendageDrivers']['L_FinArmB'], L_FinArmBSpaceIN, mo=True  )
+L_FinArmBSpaceScaleConstraint = cmds.scaleConstraint( RigConfig['appendageDrivers']['L_FinArmB'], L_FinArmBSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=L_FinArmBRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=L_FinArmBRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', L_FinArmBRigGrp[0]+'.Show_Controls' )
@@ -2228,6 +2414,7 @@ cmds.connectAttr( AllCtrl+'.Left_Color', L_FinArmBRigGrp[0]+'.Ctrl_Color' )
 # R
 R_FinArmBRigRet = denAR.den_makeFKappendageRig( side='R_', name='FinArmB', jointCount=1, radius=2, ctrlRadius=10.0, secondaryAxisOrient='zup' )
 print( R_FinArmBRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='R_FinArmB', rigRet=R_FinArmBRigRet )
 R_FinArmBRigGrp = R_FinArmBRigRet[0]; print( R_FinArmBRigGrp )
 R_FinArmBSpaceIN = R_FinArmBRigRet[1][0]; print( R_FinArmBSpaceIN )
 R_FinArmBBindJnts = R_FinArmBRigRet[3]; print( R_FinArmBBindJnts )
@@ -2237,10 +2424,10 @@ denUt.den_connectProxyGeo( Jnts=R_FinArmBBindJnts )
 
 R_FinArmBRigGrp = cmds.parent( R_FinArmBRigGrp, RootRigGrp )
 
-R_FinArmBSpaceConstraint = cmds.parentConstraint( 'R_Elbow_Jx', R_FinArmBSpaceIN, mo=True  )
-R_FinArmBSpaceScaleConstraint = cmds.scaleConstraint( 'R_Elbow_Jx', R_FinArmBSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
+R_FinArmBSpaceConstraint = cmds.parentConstraint( RigConfig['appendageDrivers']['R_FinArmB'], R_FinArmBSpaceIN, mo=True  )
+R_FinArmBSpaceScaleConstraint = cmds.scaleConstraint( RigConfig['appendageDrivers']['R_FinArmB'], R_FinArmBSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=R_FinArmBRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=R_FinArmBRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', R_FinArmBRigGrp[0]+'.Show_Controls' )
@@ -2276,6 +2463,7 @@ cmds.xform( 'R_FinArmCEnd_Piv', t=( 41.991, 57.66625395177407, 23.63106622937603
 # L
 L_FinArmCRigRet = denAR.den_makeFKappendageRig( side='L_', name='FinArmC', jointCount=1, radius=2, ctrlRadius=10.0, secondaryAxisOrient='zup' )
 print( L_FinArmCRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='L_FinArmC', rigRet=L_FinArmCRigRet )
 L_FinArmCRigGrp = L_FinArmCRigRet[0]; print( L_FinArmCRigGrp )
 L_FinArmCSpaceIN = L_FinArmCRigRet[1][0]; print( L_FinArmCSpaceIN )
 L_FinArmCBindJnts = L_FinArmCRigRet[3]; print( L_FinArmCBindJnts )
@@ -2286,10 +2474,10 @@ denUt.den_connectProxyGeo( Jnts=L_FinArmCBindJnts )
 L_FinArmCRigGrp = cmds.parent( L_FinArmCRigGrp, RootRigGrp )
 
 
-L_FinArmCSpaceConstraint = cmds.parentConstraint( 'L_Elbow_Jx', L_FinArmCSpaceIN, mo=True  )
-L_FinArmCSpaceScaleConstraint = cmds.scaleConstraint( 'L_Elbow_Jx', L_FinArmCSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
+L_FinArmCSpaceConstraint = cmds.parentConstraint( RigConfig['appendageDrivers']['L_FinArmC'], L_FinArmCSpaceIN, mo=True  )
+L_FinArmCSpaceScaleConstraint = cmds.scaleConstraint( RigConfig['appendageDrivers']['L_FinArmC'], L_FinArmCSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=L_FinArmCRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=L_FinArmCRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', L_FinArmCRigGrp[0]+'.Show_Controls' )
@@ -2300,6 +2488,7 @@ cmds.connectAttr( AllCtrl+'.Left_Color', L_FinArmCRigGrp[0]+'.Ctrl_Color' )
 # R
 R_FinArmCRigRet = denAR.den_makeFKappendageRig( side='R_', name='FinArmC', jointCount=1, radius=2, ctrlRadius=10.0, secondaryAxisOrient='zup' )
 print( R_FinArmCRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='R_FinArmC', rigRet=R_FinArmCRigRet )
 R_FinArmCRigGrp = R_FinArmCRigRet[0]; print( R_FinArmCRigGrp )
 R_FinArmCSpaceIN = R_FinArmCRigRet[1][0]; print( R_FinArmCSpaceIN )
 R_FinArmCBindJnts = R_FinArmCRigRet[3]; print( R_FinArmCBindJnts )
@@ -2309,10 +2498,10 @@ denUt.den_connectProxyGeo( Jnts=R_FinArmCBindJnts )
 
 R_FinArmCRigGrp = cmds.parent( R_FinArmCRigGrp, RootRigGrp )
 
-R_FinArmCSpaceConstraint = cmds.parentConstraint( 'R_Elbow_Jx', R_FinArmCSpaceIN, mo=True  )
-R_FinArmCSpaceScaleConstraint = cmds.scaleConstraint( 'R_Elbow_Jx', R_FinArmCSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
+R_FinArmCSpaceConstraint = cmds.parentConstraint( RigConfig['appendageDrivers']['R_FinArmC'], R_FinArmCSpaceIN, mo=True  )
+R_FinArmCSpaceScaleConstraint = cmds.scaleConstraint( RigConfig['appendageDrivers']['R_FinArmC'], R_FinArmCSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=R_FinArmCRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=R_FinArmCRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', R_FinArmCRigGrp[0]+'.Show_Controls' )
@@ -2347,6 +2536,7 @@ cmds.xform( 'R_FinArmDEnd_Piv', t=( 38.794431411872274, 38.124506090547804, 44.1
 # L
 L_FinArmDRigRet = denAR.den_makeFKappendageRig( side='L_', name='FinArmD', jointCount=1, radius=2, ctrlRadius=10.0, secondaryAxisOrient='zup' )
 print( L_FinArmDRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='L_FinArmD', rigRet=L_FinArmDRigRet )
 L_FinArmDRigGrp = L_FinArmDRigRet[0]; print( L_FinArmDRigGrp )
 L_FinArmDSpaceIN = L_FinArmDRigRet[1][0]; print( L_FinArmDSpaceIN )
 L_FinArmDBindJnts = L_FinArmDRigRet[3]; print( L_FinArmDBindJnts )
@@ -2357,10 +2547,10 @@ denUt.den_connectProxyGeo( Jnts=L_FinArmDBindJnts )
 L_FinArmDRigGrp = cmds.parent( L_FinArmDRigGrp, RootRigGrp )
 
 
-L_FinArmDSpaceConstraint = cmds.parentConstraint( 'L_Elbow_Jx', L_FinArmDSpaceIN, mo=True  )
-L_FinArmDSpaceScaleConstraint = cmds.scaleConstraint( 'L_Elbow_Jx', L_FinArmDSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
+L_FinArmDSpaceConstraint = cmds.parentConstraint( RigConfig['appendageDrivers']['L_FinArmD'], L_FinArmDSpaceIN, mo=True  )
+L_FinArmDSpaceScaleConstraint = cmds.scaleConstraint( RigConfig['appendageDrivers']['L_FinArmD'], L_FinArmDSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=L_FinArmDRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=L_FinArmDRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', L_FinArmDRigGrp[0]+'.Show_Controls' )
@@ -2371,6 +2561,7 @@ cmds.connectAttr( AllCtrl+'.Left_Color', L_FinArmDRigGrp[0]+'.Ctrl_Color' )
 # R
 R_FinArmDRigRet = denAR.den_makeFKappendageRig( side='R_', name='FinArmD', jointCount=1, radius=2, ctrlRadius=10.0, secondaryAxisOrient='zup' )
 print( R_FinArmDRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='R_FinArmD', rigRet=R_FinArmDRigRet )
 R_FinArmDRigGrp = R_FinArmDRigRet[0]; print( R_FinArmDRigGrp )
 R_FinArmDSpaceIN = R_FinArmDRigRet[1][0]; print( R_FinArmDSpaceIN )
 R_FinArmDBindJnts = R_FinArmDRigRet[3]; print( R_FinArmDBindJnts )
@@ -2380,10 +2571,10 @@ denUt.den_connectProxyGeo( Jnts=R_FinArmDBindJnts )
 
 R_FinArmDRigGrp = cmds.parent( R_FinArmDRigGrp, RootRigGrp )
 
-R_FinArmDSpaceConstraint = cmds.parentConstraint( 'R_Elbow_Jx', R_FinArmDSpaceIN, mo=True  )
-R_FinArmDSpaceScaleConstraint = cmds.scaleConstraint( 'R_Elbow_Jx', R_FinArmDSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
+R_FinArmDSpaceConstraint = cmds.parentConstraint( RigConfig['appendageDrivers']['R_FinArmD'], R_FinArmDSpaceIN, mo=True  )
+R_FinArmDSpaceScaleConstraint = cmds.scaleConstraint( RigConfig['appendageDrivers']['R_FinArmD'], R_FinArmDSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=R_FinArmDRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=R_FinArmDRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', R_FinArmDRigGrp[0]+'.Show_Controls' )
@@ -2420,6 +2611,7 @@ cmds.xform( 'R_FinLegAEnd_Piv', t=( 27.136206755660226, 129.09937431490292, -126
 # L
 L_FinLegARigRet = denAR.den_makeFKappendageRig( side='L_', name='FinLegA', jointCount=1, radius=2, ctrlRadius=10.0, secondaryAxisOrient='zup' )
 print( L_FinLegARigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='L_FinLegA', rigRet=L_FinLegARigRet )
 L_FinLegARigGrp = L_FinLegARigRet[0]; print( L_FinLegARigGrp )
 L_FinLegASpaceIN = L_FinLegARigRet[1][0]; print( L_FinLegASpaceIN )
 L_FinLegABindJnts = L_FinLegARigRet[3]; print( L_FinLegABindJnts )
@@ -2430,10 +2622,10 @@ denUt.den_connectProxyGeo( Jnts=L_FinLegABindJnts )
 L_FinLegARigGrp = cmds.parent( L_FinLegARigGrp, RootRigGrp )
 
 
-L_FinLegASpaceConstraint = cmds.parentConstraint( 'L_Hip_Jx', L_FinLegASpaceIN, mo=True  )
-L_FinLegASpaceScaleConstraint = cmds.scaleConstraint( 'L_Hip_Jx', L_FinLegASpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
+L_FinLegASpaceConstraint = cmds.parentConstraint( RigConfig['appendageDrivers']['L_FinLegA'], L_FinLegASpaceIN, mo=True  )
+L_FinLegASpaceScaleConstraint = cmds.scaleConstraint( RigConfig['appendageDrivers']['L_FinLegA'], L_FinLegASpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=L_FinLegARigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=L_FinLegARigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', L_FinLegARigGrp[0]+'.Show_Controls' )
@@ -2444,6 +2636,7 @@ cmds.connectAttr( AllCtrl+'.Left_Color', L_FinLegARigGrp[0]+'.Ctrl_Color' )
 # R
 R_FinLegARigRet = denAR.den_makeFKappendageRig( side='R_', name='FinLegA', jointCount=1, radius=2, ctrlRadius=10.0, secondaryAxisOrient='zup' )
 print( R_FinLegARigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='R_FinLegA', rigRet=R_FinLegARigRet )
 R_FinLegARigGrp = R_FinLegARigRet[0]; print( R_FinLegARigGrp )
 R_FinLegASpaceIN = R_FinLegARigRet[1][0]; print( R_FinLegASpaceIN )
 R_FinLegABindJnts = R_FinLegARigRet[3]; print( R_FinLegABindJnts )
@@ -2453,10 +2646,10 @@ denUt.den_connectProxyGeo( Jnts=R_FinLegABindJnts )
 
 R_FinLegARigGrp = cmds.parent( R_FinLegARigGrp, RootRigGrp )
 
-R_FinLegASpaceConstraint = cmds.parentConstraint( 'R_Hip_Jx', R_FinLegASpaceIN, mo=True  )
-R_FinLegASpaceScaleConstraint = cmds.scaleConstraint( 'R_Hip_Jx', R_FinLegASpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
+R_FinLegASpaceConstraint = cmds.parentConstraint( RigConfig['appendageDrivers']['R_FinLegA'], R_FinLegASpaceIN, mo=True  )
+R_FinLegASpaceScaleConstraint = cmds.scaleConstraint( RigConfig['appendageDrivers']['R_FinLegA'], R_FinLegASpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=R_FinLegARigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=R_FinLegARigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', R_FinLegARigGrp[0]+'.Show_Controls' )
@@ -2491,6 +2684,7 @@ cmds.xform( 'R_FinLegBEnd_Piv', t=( 35.713814445591616, 96.28604989223572, -119.
 # L
 L_FinLegBRigRet = denAR.den_makeFKappendageRig( side='L_', name='FinLegB', jointCount=1, radius=2, ctrlRadius=10.0, secondaryAxisOrient='zup' )
 print( L_FinLegBRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='L_FinLegB', rigRet=L_FinLegBRigRet )
 L_FinLegBRigGrp = L_FinLegBRigRet[0]; print( L_FinLegBRigGrp )
 L_FinLegBSpaceIN = L_FinLegBRigRet[1][0]; print( L_FinLegBSpaceIN )
 L_FinLegBBindJnts = L_FinLegBRigRet[3]; print( L_FinLegBBindJnts )
@@ -2501,10 +2695,10 @@ denUt.den_connectProxyGeo( Jnts=L_FinLegBBindJnts )
 L_FinLegBRigGrp = cmds.parent( L_FinLegBRigGrp, RootRigGrp )
 
 
-L_FinLegBSpaceConstraint = cmds.parentConstraint( 'L_Hip_Jx', L_FinLegBSpaceIN, mo=True  )
-L_FinLegBSpaceScaleConstraint = cmds.scaleConstraint( 'L_Hip_Jx', L_FinLegBSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
+L_FinLegBSpaceConstraint = cmds.parentConstraint( RigConfig['appendageDrivers']['L_FinLegB'], L_FinLegBSpaceIN, mo=True  )
+L_FinLegBSpaceScaleConstraint = cmds.scaleConstraint( RigConfig['appendageDrivers']['L_FinLegB'], L_FinLegBSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=L_FinLegBRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=L_FinLegBRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', L_FinLegBRigGrp[0]+'.Show_Controls' )
@@ -2515,6 +2709,7 @@ cmds.connectAttr( AllCtrl+'.Left_Color', L_FinLegBRigGrp[0]+'.Ctrl_Color' )
 # R
 R_FinLegBRigRet = denAR.den_makeFKappendageRig( side='R_', name='FinLegB', jointCount=1, radius=2, ctrlRadius=10.0, secondaryAxisOrient='zup' )
 print( R_FinLegBRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='R_FinLegB', rigRet=R_FinLegBRigRet )
 R_FinLegBRigGrp = R_FinLegBRigRet[0]; print( R_FinLegBRigGrp )
 R_FinLegBSpaceIN = R_FinLegBRigRet[1][0]; print( R_FinLegBSpaceIN )
 R_FinLegBBindJnts = R_FinLegBRigRet[3]; print( R_FinLegBBindJnts )
@@ -2524,10 +2719,10 @@ denUt.den_connectProxyGeo( Jnts=R_FinLegBBindJnts )
 
 R_FinLegBRigGrp = cmds.parent( R_FinLegBRigGrp, RootRigGrp )
 
-R_FinLegBSpaceConstraint = cmds.parentConstraint( 'R_Hip_Jx', R_FinLegBSpaceIN, mo=True  )
-R_FinLegBSpaceScaleConstraint = cmds.scaleConstraint( 'R_Hip_Jx', R_FinLegBSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
+R_FinLegBSpaceConstraint = cmds.parentConstraint( RigConfig['appendageDrivers']['R_FinLegB'], R_FinLegBSpaceIN, mo=True  )
+R_FinLegBSpaceScaleConstraint = cmds.scaleConstraint( RigConfig['appendageDrivers']['R_FinLegB'], R_FinLegBSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=R_FinLegBRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=R_FinLegBRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', R_FinLegBRigGrp[0]+'.Show_Controls' )
@@ -2562,6 +2757,7 @@ cmds.xform( 'R_FinLegCEnd_Piv', t=( 38.91599990973296, 83.78272521842423, -103.2
 # L
 L_FinLegCRigRet = denAR.den_makeFKappendageRig( side='L_', name='FinLegC', jointCount=1, radius=2, ctrlRadius=10.0, secondaryAxisOrient='zup' )
 print( L_FinLegCRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='L_FinLegC', rigRet=L_FinLegCRigRet )
 L_FinLegCRigGrp = L_FinLegCRigRet[0]; print( L_FinLegCRigGrp )
 L_FinLegCSpaceIN = L_FinLegCRigRet[1][0]; print( L_FinLegCSpaceIN )
 L_FinLegCBindJnts = L_FinLegCRigRet[3]; print( L_FinLegCBindJnts )
@@ -2572,10 +2768,10 @@ denUt.den_connectProxyGeo( Jnts=L_FinLegCBindJnts )
 L_FinLegCRigGrp = cmds.parent( L_FinLegCRigGrp, RootRigGrp )
 
 
-L_FinLegCSpaceConstraint = cmds.parentConstraint( 'L_Hip_Jx', L_FinLegCSpaceIN, mo=True  )
-L_FinLegCSpaceScaleConstraint = cmds.scaleConstraint( 'L_Hip_Jx', L_FinLegCSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
+L_FinLegCSpaceConstraint = cmds.parentConstraint( RigConfig['appendageDrivers']['L_FinLegC'], L_FinLegCSpaceIN, mo=True  )
+L_FinLegCSpaceScaleConstraint = cmds.scaleConstraint( RigConfig['appendageDrivers']['L_FinLegC'], L_FinLegCSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=L_FinLegCRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=L_FinLegCRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', L_FinLegCRigGrp[0]+'.Show_Controls' )
@@ -2586,6 +2782,7 @@ cmds.connectAttr( AllCtrl+'.Left_Color', L_FinLegCRigGrp[0]+'.Ctrl_Color' )
 # R
 R_FinLegCRigRet = denAR.den_makeFKappendageRig( side='R_', name='FinLegC', jointCount=1, radius=2, ctrlRadius=10.0, secondaryAxisOrient='zup' )
 print( R_FinLegCRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='R_FinLegC', rigRet=R_FinLegCRigRet )
 R_FinLegCRigGrp = R_FinLegCRigRet[0]; print( R_FinLegCRigGrp )
 R_FinLegCSpaceIN = R_FinLegCRigRet[1][0]; print( R_FinLegCSpaceIN )
 R_FinLegCBindJnts = R_FinLegCRigRet[3]; print( R_FinLegCBindJnts )
@@ -2595,10 +2792,10 @@ denUt.den_connectProxyGeo( Jnts=R_FinLegCBindJnts )
 
 R_FinLegCRigGrp = cmds.parent( R_FinLegCRigGrp, RootRigGrp )
 
-R_FinLegCSpaceConstraint = cmds.parentConstraint( 'R_Hip_Jx', R_FinLegCSpaceIN, mo=True  )
-R_FinLegCSpaceScaleConstraint = cmds.scaleConstraint( 'R_Hip_Jx', R_FinLegCSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
+R_FinLegCSpaceConstraint = cmds.parentConstraint( RigConfig['appendageDrivers']['R_FinLegC'], R_FinLegCSpaceIN, mo=True  )
+R_FinLegCSpaceScaleConstraint = cmds.scaleConstraint( RigConfig['appendageDrivers']['R_FinLegC'], R_FinLegCSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=R_FinLegCRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=R_FinLegCRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', R_FinLegCRigGrp[0]+'.Show_Controls' )
@@ -2632,6 +2829,7 @@ cmds.xform( 'R_FinLegDEnd_Piv', t=( 39.732904165190696, 81.18554831886911, -97.1
 # L
 L_FinLegDRigRet = denAR.den_makeFKappendageRig( side='L_', name='FinLegD', jointCount=1, radius=2, ctrlRadius=10.0, secondaryAxisOrient='zup' )
 print( L_FinLegDRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='L_FinLegD', rigRet=L_FinLegDRigRet )
 L_FinLegDRigGrp = L_FinLegDRigRet[0]; print( L_FinLegDRigGrp )
 L_FinLegDSpaceIN = L_FinLegDRigRet[1][0]; print( L_FinLegDSpaceIN )
 L_FinLegDBindJnts = L_FinLegDRigRet[3]; print( L_FinLegDBindJnts )
@@ -2642,10 +2840,10 @@ denUt.den_connectProxyGeo( Jnts=L_FinLegDBindJnts )
 L_FinLegDRigGrp = cmds.parent( L_FinLegDRigGrp, RootRigGrp )
 
 
-L_FinLegDSpaceConstraint = cmds.parentConstraint( 'L_Knee_Jx', L_FinLegDSpaceIN, mo=True  )
-L_FinLegDSpaceScaleConstraint = cmds.scaleConstraint( 'L_Knee_Jx', L_FinLegDSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
+L_FinLegDSpaceConstraint = cmds.parentConstraint( RigConfig['appendageDrivers']['L_FinLegD'], L_FinLegDSpaceIN, mo=True  )
+L_FinLegDSpaceScaleConstraint = cmds.scaleConstraint( RigConfig['appendageDrivers']['L_FinLegD'], L_FinLegDSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=L_FinLegDRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=L_FinLegDRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', L_FinLegDRigGrp[0]+'.Show_Controls' )
@@ -2656,6 +2854,7 @@ cmds.connectAttr( AllCtrl+'.Left_Color', L_FinLegDRigGrp[0]+'.Ctrl_Color' )
 # R
 R_FinLegDRigRet = denAR.den_makeFKappendageRig( side='R_', name='FinLegD', jointCount=1, radius=2, ctrlRadius=10.0, secondaryAxisOrient='zup' )
 print( R_FinLegDRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='R_FinLegD', rigRet=R_FinLegDRigRet )
 R_FinLegDRigGrp = R_FinLegDRigRet[0]; print( R_FinLegDRigGrp )
 R_FinLegDSpaceIN = R_FinLegDRigRet[1][0]; print( R_FinLegDSpaceIN )
 R_FinLegDBindJnts = R_FinLegDRigRet[3]; print( R_FinLegDBindJnts )
@@ -2665,10 +2864,10 @@ denUt.den_connectProxyGeo( Jnts=R_FinLegDBindJnts )
 
 R_FinLegDRigGrp = cmds.parent( R_FinLegDRigGrp, RootRigGrp )
 
-R_FinLegDSpaceConstraint = cmds.parentConstraint( 'R_Knee_Jx', R_FinLegDSpaceIN, mo=True  )
-R_FinLegDSpaceScaleConstraint = cmds.scaleConstraint( 'R_Knee_Jx', R_FinLegDSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
+R_FinLegDSpaceConstraint = cmds.parentConstraint( RigConfig['appendageDrivers']['R_FinLegD'], R_FinLegDSpaceIN, mo=True  )
+R_FinLegDSpaceScaleConstraint = cmds.scaleConstraint( RigConfig['appendageDrivers']['R_FinLegD'], R_FinLegDSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=R_FinLegDRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=R_FinLegDRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', R_FinLegDRigGrp[0]+'.Show_Controls' )
@@ -2703,6 +2902,7 @@ cmds.xform( 'R_FinLegEEnd_Piv', t=( 39.732904165190696, 74.15997998678674, -107.
 # L
 L_FinLegERigRet = denAR.den_makeFKappendageRig( side='L_', name='FinLegE', jointCount=1, radius=2, ctrlRadius=10.0, secondaryAxisOrient='zup' )
 print( L_FinLegERigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='L_FinLegE', rigRet=L_FinLegERigRet )
 L_FinLegERigGrp = L_FinLegERigRet[0]; print( L_FinLegERigGrp )
 L_FinLegESpaceIN = L_FinLegERigRet[1][0]; print( L_FinLegESpaceIN )
 L_FinLegEBindJnts = L_FinLegERigRet[3]; print( L_FinLegEBindJnts )
@@ -2713,10 +2913,10 @@ denUt.den_connectProxyGeo( Jnts=L_FinLegEBindJnts )
 L_FinLegERigGrp = cmds.parent( L_FinLegERigGrp, RootRigGrp )
 
 
-L_FinLegESpaceConstraint = cmds.parentConstraint( 'L_Knee_Jx', L_FinLegESpaceIN, mo=True  )
-L_FinLegESpaceScaleConstraint = cmds.scaleConstraint( 'L_Knee_Jx', L_FinLegESpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
+L_FinLegESpaceConstraint = cmds.parentConstraint( RigConfig['appendageDrivers']['L_FinLegE'], L_FinLegESpaceIN, mo=True  )
+L_FinLegESpaceScaleConstraint = cmds.scaleConstraint( RigConfig['appendageDrivers']['L_FinLegE'], L_FinLegESpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=L_FinLegERigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=L_FinLegERigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', L_FinLegERigGrp[0]+'.Show_Controls' )
@@ -2727,6 +2927,7 @@ cmds.connectAttr( AllCtrl+'.Left_Color', L_FinLegERigGrp[0]+'.Ctrl_Color' )
 # R
 R_FinLegERigRet = denAR.den_makeFKappendageRig( side='R_', name='FinLegE', jointCount=1, radius=2, ctrlRadius=10.0, secondaryAxisOrient='zup' )
 print( R_FinLegERigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='R_FinLegE', rigRet=R_FinLegERigRet )
 R_FinLegERigGrp = R_FinLegERigRet[0]; print( R_FinLegERigGrp )
 R_FinLegESpaceIN = R_FinLegERigRet[1][0]; print( R_FinLegESpaceIN )
 R_FinLegEBindJnts = R_FinLegERigRet[3]; print( R_FinLegEBindJnts )
@@ -2736,10 +2937,10 @@ denUt.den_connectProxyGeo( Jnts=R_FinLegEBindJnts )
 
 R_FinLegERigGrp = cmds.parent( R_FinLegERigGrp, RootRigGrp )
 
-R_FinLegESpaceConstraint = cmds.parentConstraint( 'R_Knee_Jx', R_FinLegESpaceIN, mo=True  )
-R_FinLegESpaceScaleConstraint = cmds.scaleConstraint( 'R_Knee_Jx', R_FinLegESpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
+R_FinLegESpaceConstraint = cmds.parentConstraint( RigConfig['appendageDrivers']['R_FinLegE'], R_FinLegESpaceIN, mo=True  )
+R_FinLegESpaceScaleConstraint = cmds.scaleConstraint( RigConfig['appendageDrivers']['R_FinLegE'], R_FinLegESpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=R_FinLegERigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=R_FinLegERigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', R_FinLegERigGrp[0]+'.Show_Controls' )
@@ -2773,6 +2974,7 @@ cmds.xform( 'R_FinLegFEnd_Piv', t=( 33.84040018092608, 65.9349243784952, -123.47
 # L
 L_FinLegFRigRet = denAR.den_makeFKappendageRig( side='L_', name='FinLegF', jointCount=1, radius=2, ctrlRadius=10.0, secondaryAxisOrient='zup' )
 print( L_FinLegFRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='L_FinLegF', rigRet=L_FinLegFRigRet )
 L_FinLegFRigGrp = L_FinLegFRigRet[0]; print( L_FinLegFRigGrp )
 L_FinLegFSpaceIN = L_FinLegFRigRet[1][0]; print( L_FinLegFSpaceIN )
 L_FinLegFBindJnts = L_FinLegFRigRet[3]; print( L_FinLegFBindJnts )
@@ -2783,10 +2985,10 @@ denUt.den_connectProxyGeo( Jnts=L_FinLegFBindJnts )
 L_FinLegFRigGrp = cmds.parent( L_FinLegFRigGrp, RootRigGrp )
 
 
-L_FinLegFSpaceConstraint = cmds.parentConstraint( 'L_Knee_Jx', L_FinLegFSpaceIN, mo=True  )
-L_FinLegFSpaceScaleConstraint = cmds.scaleConstraint( 'L_Knee_Jx', L_FinLegFSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
+L_FinLegFSpaceConstraint = cmds.parentConstraint( RigConfig['appendageDrivers']['L_FinLegF'], L_FinLegFSpaceIN, mo=True  )
+L_FinLegFSpaceScaleConstraint = cmds.scaleConstraint( RigConfig['appendageDrivers']['L_FinLegF'], L_FinLegFSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=L_FinLegFRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=L_FinLegFRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', L_FinLegFRigGrp[0]+'.Show_Controls' )
@@ -2797,6 +2999,7 @@ cmds.connectAttr( AllCtrl+'.Left_Color', L_FinLegFRigGrp[0]+'.Ctrl_Color' )
 # R
 R_FinLegFRigRet = denAR.den_makeFKappendageRig( side='R_', name='FinLegF', jointCount=1, radius=2, ctrlRadius=10.0, secondaryAxisOrient='zup' )
 print( R_FinLegFRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='R_FinLegF', rigRet=R_FinLegFRigRet )
 R_FinLegFRigGrp = R_FinLegFRigRet[0]; print( R_FinLegFRigGrp )
 R_FinLegFSpaceIN = R_FinLegFRigRet[1][0]; print( R_FinLegFSpaceIN )
 R_FinLegFBindJnts = R_FinLegFRigRet[3]; print( R_FinLegFBindJnts )
@@ -2806,10 +3009,10 @@ denUt.den_connectProxyGeo( Jnts=R_FinLegFBindJnts )
 
 R_FinLegFRigGrp = cmds.parent( R_FinLegFRigGrp, RootRigGrp )
 
-R_FinLegFSpaceConstraint = cmds.parentConstraint( 'R_Knee_Jx', R_FinLegFSpaceIN, mo=True  )
-R_FinLegFSpaceScaleConstraint = cmds.scaleConstraint( 'R_Knee_Jx', R_FinLegFSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
+R_FinLegFSpaceConstraint = cmds.parentConstraint( RigConfig['appendageDrivers']['R_FinLegF'], R_FinLegFSpaceIN, mo=True  )
+R_FinLegFSpaceScaleConstraint = cmds.scaleConstraint( RigConfig['appendageDrivers']['R_FinLegF'], R_FinLegFSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=R_FinLegFRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=R_FinLegFRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', R_FinLegFRigGrp[0]+'.Show_Controls' )
@@ -2844,6 +3047,7 @@ cmds.xform( 'R_FinLegGEnd_Piv', t=( 33.84040018092608, 47.256807270494946, -134.
 # L
 L_FinLegGRigRet = denAR.den_makeFKappendageRig( side='L_', name='FinLegG', jointCount=1, radius=2, ctrlRadius=10.0, secondaryAxisOrient='zup' )
 print( L_FinLegGRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='L_FinLegG', rigRet=L_FinLegGRigRet )
 L_FinLegGRigGrp = L_FinLegGRigRet[0]; print( L_FinLegGRigGrp )
 L_FinLegGSpaceIN = L_FinLegGRigRet[1][0]; print( L_FinLegGSpaceIN )
 L_FinLegGBindJnts = L_FinLegGRigRet[3]; print( L_FinLegGBindJnts )
@@ -2854,10 +3058,10 @@ denUt.den_connectProxyGeo( Jnts=L_FinLegGBindJnts )
 L_FinLegGRigGrp = cmds.parent( L_FinLegGRigGrp, RootRigGrp )
 
 
-L_FinLegGSpaceConstraint = cmds.parentConstraint( 'L_Hock_Jnt', L_FinLegGSpaceIN, mo=True  )
-L_FinLegGSpaceScaleConstraint = cmds.scaleConstraint( 'L_Hock_Jnt', L_FinLegGSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
+L_FinLegGSpaceConstraint = cmds.parentConstraint( RigConfig['appendageDrivers']['L_FinLegG'], L_FinLegGSpaceIN, mo=True  )
+L_FinLegGSpaceScaleConstraint = cmds.scaleConstraint( RigConfig['appendageDrivers']['L_FinLegG'], L_FinLegGSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=L_FinLegGRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=L_FinLegGRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', L_FinLegGRigGrp[0]+'.Show_Controls' )
@@ -2868,6 +3072,7 @@ cmds.connectAttr( AllCtrl+'.Left_Color', L_FinLegGRigGrp[0]+'.Ctrl_Color' )
 # R
 R_FinLegGRigRet = denAR.den_makeFKappendageRig( side='R_', name='FinLegG', jointCount=1, radius=2, ctrlRadius=10.0, secondaryAxisOrient='zup' )
 print( R_FinLegGRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='R_FinLegG', rigRet=R_FinLegGRigRet )
 R_FinLegGRigGrp = R_FinLegGRigRet[0]; print( R_FinLegGRigGrp )
 R_FinLegGSpaceIN = R_FinLegGRigRet[1][0]; print( R_FinLegGSpaceIN )
 R_FinLegGBindJnts = R_FinLegGRigRet[3]; print( R_FinLegGBindJnts )
@@ -2877,10 +3082,10 @@ denUt.den_connectProxyGeo( Jnts=R_FinLegGBindJnts )
 
 R_FinLegGRigGrp = cmds.parent( R_FinLegGRigGrp, RootRigGrp )
 
-R_FinLegGSpaceConstraint = cmds.parentConstraint( 'R_Hock_Jnt', R_FinLegGSpaceIN, mo=True  )
-R_FinLegGSpaceScaleConstraint = cmds.scaleConstraint( 'R_Hock_Jnt', R_FinLegGSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
+R_FinLegGSpaceConstraint = cmds.parentConstraint( RigConfig['appendageDrivers']['R_FinLegG'], R_FinLegGSpaceIN, mo=True  )
+R_FinLegGSpaceScaleConstraint = cmds.scaleConstraint( RigConfig['appendageDrivers']['R_FinLegG'], R_FinLegGSpaceIN, mo=True  ) # need this because parentConstraint only does Translate/Rotate
 
-denUt.den_AddSafetyCovers( rigGroup=R_FinLegGRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=R_FinLegGRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', R_FinLegGRigGrp[0]+'.Show_Controls' )
@@ -2915,6 +3120,7 @@ cmds.xform( 'R_Eye_Piv', t=( 6.485136625973131, 207.31325998101738, 226.21829151
 # L
 L_EyeRigRet = denBR.den_makeEyeRig( side='L_', name='Eye', radius=1, ctrlRadius=20.0, displayLocalAxis=False )
 print( L_EyeRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='L_Eye', rigRet=L_EyeRigRet )
 L_EyeRigGrp = L_EyeRigRet[0]; print( L_EyeRigGrp )
 L_EyeSpaceINs = L_EyeRigRet[1]; print( L_EyeSpaceINs )
 L_EyeSpaceOUTs = L_EyeRigRet[2]; print( L_EyeSpaceOUTs )
@@ -2928,6 +3134,7 @@ L_EyeRigGrp = cmds.parent( L_EyeRigGrp, RootRigGrp )
 # R
 R_EyeRigRet = denBR.den_makeEyeRig( side='R_', name='Eye', radius=1, ctrlRadius=20.0, displayLocalAxis=False )
 print( R_EyeRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='R_Eye', rigRet=R_EyeRigRet )
 R_EyeRigGrp = R_EyeRigRet[0]; print( R_EyeRigGrp )
 R_EyeSpaceINs = R_EyeRigRet[1]; print( R_EyeSpaceINs )
 R_EyeSpaceOUTs = R_EyeRigRet[2]; print( R_EyeSpaceOUTs )
@@ -2944,7 +3151,7 @@ denUt.den_connectProxyGeo( Jnts=L_EyeBindJnts+R_EyeBindJnts )
 cmds.parentConstraint( HeadSpaceOUT, L_EyeHeadSpaceIN, mo=True )
 cmds.parentConstraint( HeadSpaceOUT, R_EyeHeadSpaceIN, mo=True )
 
-denUt.den_AddSafetyCovers( rigGroup=L_EyeRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=L_EyeRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', L_EyeRigGrp[0]+'.Show_Controls' )
@@ -2952,7 +3159,7 @@ cmds.connectAttr( AllCtrl+'.Show_Guts', L_EyeRigGrp[0]+'.Show_Guts' )
 cmds.connectAttr( AllCtrl+'.Bone_Draw_Style', L_EyeRigGrp[0]+'.Bone_Draw_Style' )
 cmds.connectAttr( AllCtrl+'.Left_Color', L_EyeRigGrp[0]+'.Ctrl_Color' )
 
-denUt.den_AddSafetyCovers( rigGroup=R_EyeRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=R_EyeRigGrp[0] )
 
 # connect Controls visibility to the All_Ctrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', R_EyeRigGrp[0]+'.Show_Controls' )
@@ -2966,47 +3173,54 @@ cmds.connectAttr( AllCtrl+'.Right_Color', R_EyeRigGrp[0]+'.Ctrl_Color' )
 # ---------------------------------------------------------------------------------------
 # make whisker using Sluggy tail pivots
 
-WhiskerPivRet = denSR.den_makeTailPivs( prefix='L_', name='Whisker', jointCount=8, radius=1 )
+WhiskerPivRet = denSR.den_makeTailPivs( prefix='L_', name='Whisker', jointCount=RigConfig['whiskerCount'], radius=1 )
 # capture all pivots in a variable
 WhiskerPivGrp = WhiskerPivRet
 # parent pivots under root pivot group
 cmds.parent( WhiskerPivGrp, RootPivGrp )
 
-
-cmds.xform( 'L_Whisker01_Piv', t=( 3.7940426227946817, 204.5701924483856, 239.5730556888628 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
-cmds.xform( 'L_Whisker02_Piv', t=( 9.488205971788558, 204.5701924483856, 239.55465592434342 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
-cmds.xform( 'L_Whisker03_Piv', t=( 15.826084072302145, 204.5701924483856, 239.57043003642528 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
-cmds.xform( 'L_Whisker04_Piv', t=( 22.140609558228242, 204.5701924483856, 239.57141847854453 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
-cmds.xform( 'L_Whisker05_Piv', t=( 28.49071219833399, 204.5701924483856, 239.5878049510801 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
-cmds.xform( 'L_Whisker06_Piv', t=( 34.80348175936142, 204.5701924483856, 239.57794573074622 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
-cmds.xform( 'L_Whisker07_Piv', t=( 41.1530485750239, 204.5701924483856, 239.57888230004193 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
-cmds.xform( 'L_Whisker08_Piv', t=( 47.465655571882586, 204.5701924483856, 239.56493619063363 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
+# placed for 8 joints and fitted to RigConfig['whiskerCount'], the curve ends at L_WhiskerEnd_Piv
+L_WhiskerPivPoints = [
+    ( 3.7940426227946817, 204.5701924483856, 239.5730556888628 ),
+    ( 9.488205971788558, 204.5701924483856, 239.55465592434342 ),
+    ( 15.826084072302145, 204.5701924483856, 239.57043003642528 ),
+    ( 22.140609558228242, 204.5701924483856, 239.57141847854453 ),
+    ( 28.49071219833399, 204.5701924483856, 239.5878049510801 ),
+    ( 34.80348175936142, 204.5701924483856, 239.57794573074622 ),
+    ( 41.1530485750239, 204.5701924483856, 239.57888230004193 ),
+    ( 47.465655571882586, 204.5701924483856, 239.56493619063363 ),
+    ]
 cmds.xform( 'L_WhiskerEnd_Piv', t=( 53.833936042219115, 204.5701924483856, 239.59446480963325 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
+quadBT.quad_fitChainPivots( prefix='L_', name='Whisker', Points=L_WhiskerPivPoints+[ cmds.xform( 'L_WhiskerEnd_Piv', q=True, t=True ) ], count=RigConfig['whiskerCount'], anchors=(0,1) )
 
 
-WhiskerPivRet = denSR.den_makeTailPivs( prefix='R_', name='Whisker', jointCount=8, radius=1 )
+WhiskerPivRet = denSR.den_makeTailPivs( prefix='R_', name='Whisker', jointCount=RigConfig['whiskerCount'], radius=1 )
 # capture all pivots in a variable
 WhiskerPivGrp = WhiskerPivRet
 # parent pivots under root pivot group
 cmds.parent( WhiskerPivGrp, RootPivGrp )
 
 # position tail pivots
-
-cmds.xform( 'R_Whisker01_Piv', t=( -3.7940426227946817, 204.5701924483856, 239.5730556888628 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
-cmds.xform( 'R_Whisker02_Piv', t=( -9.488205971788558, 204.5701924483856, 239.55465592434342 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
-cmds.xform( 'R_Whisker03_Piv', t=( -15.826084072302145, 204.5701924483856, 239.57043003642528 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
-cmds.xform( 'R_Whisker04_Piv', t=( -22.140609558228242, 204.5701924483856, 239.57141847854453 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
-cmds.xform( 'R_Whisker05_Piv', t=( -28.49071219833399, 204.5701924483856, 239.5878049510801 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
-cmds.xform( 'R_Whisker06_Piv', t=( -34.80348175936142, 204.5701924483856, 239.57794573074622 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
-cmds.xform( 'R_Whisker07_Piv', t=( -41.1530485750239, 204.5701924483856, 239.57888230004193 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
-cmds.xform( 'R_Whisker08_Piv', t=( -47.465655571882586, 204.5701924483856, 239.56493619063363 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
+# placed for 8 joints and fitted to RigConfig['whiskerCount'], the curve ends at R_WhiskerEnd_Piv
+R_WhiskerPivPoints = [
+    ( -3.7940426227946817, 204.5701924483856, 239.5730556888628 ),
+    ( -9.488205971788558, 204.5701924483856, 239.55465592434342 ),
+    ( -15.826084072302145, 204.5701924483856, 239.57043003642528 ),
+    ( -22.140609558228242, 204.5701924483856, 239.57141847854453 ),
+    ( -28.49071219833399, 204.5701924483856, 239.5878049510801 ),
+    ( -34.80348175936142, 204.5701924483856, 239.57794573074622 ),
+    ( -41.1530485750239, 204.5701924483856, 239.57888230004193 ),
+    ( -47.465655571882586, 204.5701924483856, 239.56493619063363 ),
+    ]
 cmds.xform( 'R_WhiskerEnd_Piv', t=( -53.833936042219115, 204.5701924483856, 239.59446480963325 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
+quadBT.quad_fitChainPivots( prefix='R_', name='Whisker', Points=R_WhiskerPivPoints+[ cmds.xform( 'R_WhiskerEnd_Piv', q=True, t=True ) ], count=RigConfig['whiskerCount'], anchors=(0,1) )
 
 # LLLLLLLLLLLLL ---------------------------------------------------------------------------------------
 # make whisker using  Sluggy tail rig (for full IK/FK blendable tail)
 
-L_WhiskerRigRet = denSR.den_makeTailRig( prefix='L_', name='Whisker', jointCount=8, radius=1, ctrlRadius=1.0, controlJoints=(1,4,8), dpTime=0.01  )
+L_WhiskerRigRet = denSR.den_makeTailRig( prefix='L_', name='Whisker', jointCount=RigConfig['whiskerCount'], radius=1, ctrlRadius=1.0, controlJoints=RigConfig['whiskerControlJoints'], dpTime=0.01  )
 print( L_WhiskerRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='L_Whisker', rigRet=L_WhiskerRigRet )
 
 
 # capture the rig group in a variable
@@ -3038,6 +3252,7 @@ cmds.scaleConstraint( HeadSpaceOUT, L_WhiskerSpaceIN, mo=True )
 
 L_WhiskerDynRet = denSR.den_addTailDynamics( prefix='L_', name='Whisker', TailRigGrp=L_WhiskerRigGrp, TailSpaceIN=L_WhiskerSpaceIN, TailHandles=L_WhiskerHandles, TailBindJnts=L_WhiskerBindJnts, dpTime=0.01 )
 print( L_WhiskerDynRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='L_Whisker', extra={ 'DynCtrl':L_WhiskerDynRet[0] } )
 
 # capture the rig dynamics group in a variable
 L_WhiskerDynCtrl = L_WhiskerDynRet[0]; print( L_WhiskerDynCtrl )
@@ -3049,7 +3264,7 @@ cmds.setAttr( L_WhiskerDynCtrl+'.bendResistance', 20 )
 cmds.setAttr( L_WhiskerDynCtrl+'.startCurveAttract', 0.01 )
 
 # add safetycovers and etc.
-denUt.den_AddSafetyCovers( rigGroup=L_WhiskerRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=L_WhiskerRigGrp[0] )
 
 # connect controls visibility attribute to the AllCtrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', L_WhiskerRigGrp[0]+'.Show_Controls' )
@@ -3062,8 +3277,9 @@ cmds.connectAttr( AllCtrl+'.Left_Color', L_WhiskerRigGrp[0]+'.Ctrl_Color' )
 # RRRRRRRRRRRRR ---------------------------------------------------------------------------------------
 # make whisker using  Sluggy tail rig (for full IK/FK blendable tail)
 
-R_WhiskerRigRet = denSR.den_makeTailRig( prefix='R_', name='Whisker', jointCount=8, radius=1, ctrlRadius=1.0, controlJoints=(1,4,8), dpTime=0.01  )
+R_WhiskerRigRet = denSR.den_makeTailRig( prefix='R_', name='Whisker', jointCount=RigConfig['whiskerCount'], radius=1, ctrlRadius=1.0, controlJoints=RigConfig['whiskerControlJoints'], dpTime=0.01  )
 print( R_WhiskerRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='R_Whisker', rigRet=R_WhiskerRigRet )
 
 # capture the rig group in a variable
 R_WhiskerRigGrp = R_WhiskerRigRet[0]; print( R_WhiskerRigGrp )
@@ -3094,6 +3310,7 @@ cmds.scaleConstraint( HeadSpaceOUT, R_WhiskerSpaceIN, mo=True )
 
 R_WhiskerDynRet = denSR.den_addTailDynamics( prefix='R_', name='Whisker', TailRigGrp=R_WhiskerRigGrp, TailSpaceIN=R_WhiskerSpaceIN, TailHandles=R_WhiskerHandles, TailBindJnts=R_WhiskerBindJnts, dpTime=0.01 )
 print( R_WhiskerDynRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='R_Whisker', extra={ 'DynCtrl':R_WhiskerDynRet[0] } )
 
 # capture the rig dynamics group in a variable
 R_WhiskerDynCtrl = R_WhiskerDynRet[0]; print( R_WhiskerDynCtrl )
@@ -3105,7 +3322,7 @@ cmds.setAttr( R_WhiskerDynCtrl+'.bendResistance', 20 )
 cmds.setAttr( R_WhiskerDynCtrl+'.startCurveAttract', 0.01 )
 
 # add safetycovers and etc.
-denUt.den_AddSafetyCovers( rigGroup=R_WhiskerRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=R_WhiskerRigGrp[0] )
 
 # connect controls visibility attribute to the AllCtrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', R_WhiskerRigGrp[0]+'.Show_Controls' )
@@ -3117,29 +3334,34 @@ cmds.connectAttr( AllCtrl+'.Right_Color', R_WhiskerRigGrp[0]+'.Ctrl_Color' )
 ######## ============================= TONGUE =========================================
 # ---------------------------------------------------------------------------------------
 # make Sluggy tail pivots
-TonguePivRet = denSR.den_makeTailPivs( prefix='', name='Tongue', jointCount=8, radius=1 )
+TonguePivRet = denSR.den_makeTailPivs( prefix='', name='Tongue', jointCount=RigConfig['tongueCount'], radius=1 )
 # capture all pivots in a variable
 TonguePivGrp = TonguePivRet
 # parent pivots under root pivot group
 cmds.parent( TonguePivGrp, RootPivGrp )
 
 # position tail pivots
-cmds.xform( 'Tongue01_Piv', t=( 0.0, 192.26641677024722, 221.58356827195422 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
-cmds.xform( 'Tongue02_Piv', t=( 0.0, 192.8057524676036, 225.30424001995908 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
-cmds.xform( 'Tongue03_Piv', t=( 0.0, 193.07542031628182, 229.22683237538777 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
-cmds.xform( 'Tongue04_Piv', t=( 0.0, 193.04171183519705, 233.97319271192725 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
-cmds.xform( 'Tongue05_Piv', t=( 0.0, 192.8057524676036, 239.4512307520541 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
-cmds.xform( 'Tongue06_Piv', t=( 0.0, 192.5360846189254, 244.2424038829195 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
-cmds.xform( 'Tongue07_Piv', t=( 0.0, 192.26641677024716, 249.46394753511947 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
-cmds.xform( 'Tongue08_Piv', t=( 0.0, 192.26641677024716, 253.9600622421747 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
+# placed for 8 joints and fitted to RigConfig['tongueCount'], the curve ends at TongueEnd_Piv
+TonguePivPoints = [
+    ( 0.0, 192.26641677024722, 221.58356827195422 ),
+    ( 0.0, 192.8057524676036, 225.30424001995908 ),
+    ( 0.0, 193.07542031628182, 229.22683237538777 ),
+    ( 0.0, 193.04171183519705, 233.97319271192725 ),
+    ( 0.0, 192.8057524676036, 239.4512307520541 ),
+    ( 0.0, 192.5360846189254, 244.2424038829195 ),
+    ( 0.0, 192.26641677024716, 249.46394753511947 ),
+    ( 0.0, 192.26641677024716, 253.9600622421747 ),
+    ]
 cmds.xform( 'TongueEnd_Piv', t=( 0.0, 192.26641677024716, 258.1290010186599 ), ro=( 0.0, 0.0, 0.0 ), s=( 1.0, 1.0, 1.0 ) )
+quadBT.quad_fitChainPivots( prefix='', name='Tongue', Points=TonguePivPoints+[ cmds.xform( 'TongueEnd_Piv', q=True, t=True ) ], count=RigConfig['tongueCount'], anchors=(0,1) )
 
 
 # ---------------------------------------------------------------------------------------
 # make Sluggy tail rig (for full IK/FK blendable tail)
 
-TongueRigRet = denSR.den_makeTailRig( prefix='', name='Tongue', jointCount=8, radius=1, ctrlRadius=2.0, controlJoints=(1,4,8), dpTime=0.01  )
+TongueRigRet = denSR.den_makeTailRig( prefix='', name='Tongue', jointCount=RigConfig['tongueCount'], radius=1, ctrlRadius=2.0, controlJoints=RigConfig['tongueControlJoints'], dpTime=0.01  )
 print( TongueRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='Tongue', rigRet=TongueRigRet )
 
 # capture the rig group in a variable
 TongueRigGrp = TongueRigRet[0]; print( TongueRigGrp )
@@ -3170,6 +3392,7 @@ cmds.scaleConstraint( HeadSpaceOUT, TongueSpaceIN, mo=True )
 
 TongueDynRet = denSR.den_addTailDynamics( prefix='', name='Tongue', TailRigGrp=TongueRigGrp, TailSpaceIN=TongueSpaceIN, TailHandles=TongueHandles, TailBindJnts=TongueBindJnts, dpTime=0.01 )
 print( TongueDynRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='Tongue', extra={ 'DynCtrl':TongueDynRet[0] } )
 
 # capture the rig dynamics group in a variable
 TongueDynCtrl = TongueDynRet[0]; print( TongueDynCtrl )
@@ -3181,7 +3404,7 @@ cmds.setAttr( TongueDynCtrl+'.bendResistance', 20 )
 cmds.setAttr( TongueDynCtrl+'.startCurveAttract', 0.01 )
 
 # add safetycovers and etc.
-denUt.den_AddSafetyCovers( rigGroup=TongueRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=TongueRigGrp[0] )
 
 # connect controls visibility attribute to the AllCtrl
 cmds.connectAttr( AllCtrl+'.Show_Controls', TongueRigGrp[0]+'.Show_Controls' )
@@ -3189,6 +3412,18 @@ cmds.connectAttr( AllCtrl+'.Show_Guts', TongueRigGrp[0]+'.Show_Guts' )
 cmds.connectAttr( AllCtrl+'.Bone_Draw_Style', TongueRigGrp[0]+'.Bone_Draw_Style' )
 cmds.connectAttr( AllCtrl+'.Center_Color', TongueRigGrp[0]+'.Ctrl_Color' )
 
+# ---------------------------------------------------------------------------------------
+# shared dynamics: solve tail, whiskers and tongue with one nucleus and give each chain a
+# Live/Cached/Off switch on the AllCtrl (e.g. Tail_Dynamics). Cache a shot with the
+# 'Dynamics Cache' section at the end of this script.
+
+DynKeys = [ 'Tail', 'L_Whisker', 'R_Whisker', 'Tongue' ]
+SharedNucleusRet = quadBT.quad_shareNucleus( DynCtrls=[ RigRegistry[key]['DynCtrl'] for key in DynKeys ], name=rigName+'_Nucleus' )
+print( SharedNucleusRet )
+for key in DynKeys:
+    quadBT.quad_addDynamicsSwitch( ctrl=AllCtrl, key=key, DynCtrl=RigRegistry[key]['DynCtrl'] )
+RigRegistry['Base']['Nucleus'] = SharedNucleusRet[0]
+
 # ---------------------------------------------------------------------------------------
 #########################
 # ===================================================================================================
@@ -3217,16 +3452,17 @@ L_HipTwist03_Jnt_SpaceOUT = denUt.den_AddSpaceOUTs(Jnts=['L_HipTwist03_Jnt'])
 R_HipTwist03_Jnt_SpaceOUT = denUt.den_AddSpaceOUTs(Jnts=['R_HipTwist03_Jnt'])
 Spine02_Jnt_SpaceOUT = denUt.den_AddSpaceOUTs(Jnts=['Spine02_Jnt'])
 
-Chest_SpaceOUT = TorsoSpaceOUTs[4]
-Neck01_SpaceOUT = TorsoSpaceOUTs[5]
-Neck02_SpaceOUT = TorsoSpaceOUTs[6]
-Neck03_SpaceOUT = TorsoSpaceOUTs[7]
-Jaw_SpaceOUT = TorsoSpaceOUTs[12]
+Chest_SpaceOUT = TorsoSpaceOUTs[RigConfig['torsoSpaceOUTs']['Chest']]
+Neck01_SpaceOUT = TorsoSpaceOUTs[RigConfig['torsoSpaceOUTs']['Neck01']]
+Neck02_SpaceOUT = TorsoSpaceOUTs[RigConfig['torsoSpaceOUTs']['Neck02']]
+Neck03_SpaceOUT = TorsoSpaceOUTs[RigConfig['torsoSpaceOUTs']['Neck03']]
+Jaw_SpaceOUT = TorsoSpaceOUTs[RigConfig['torsoSpaceOUTs']['Jaw']]
 
 
 # make L thigh helper
 L_ThighHelpRigRet = denBR.den_makeHalfMuscleRig( side='L_', prefix='', name='ThighHelp', radius=3.0 )
 print( L_ThighHelpRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='L_ThighHelp', rigRet=L_ThighHelpRigRet )
 L_ThighHelpRigGrp = L_ThighHelpRigRet[0]; print( L_ThighHelpRigGrp )
 L_ThighHelpSpaceINs = L_ThighHelpRigRet[1]; print( L_ThighHelpSpaceINs )
 L_ThighHelpSpaceOUTs = L_ThighHelpRigRet[2]; print( L_ThighHelpSpaceOUTs )
@@ -3248,7 +3484,7 @@ cmds.scaleConstraint( L_HipTwist03_Jnt_SpaceOUT, L_ThighHelpTipSpaceIN, mo=True
 #
 print (L_ThighHelpRigGrp)
 # connect Controls visibility to the All_Ctrl
-denUt.den_AddSafetyCovers( rigGroup=L_ThighHelpRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=L_ThighHelpRigGrp[0] )
 #
 # connect stretchable display proxy to proxy visibility on all control
 cmds.connectAttr( AllCtrl+'.Show_Proxy_Geo', 'L_ThighHelp_DispMesh.visibility', force=True, lock=True )
@@ -3261,6 +3497,7 @@ cmds.connectAttr( AllCtrl+'.Bone_Draw_Style', L_ThighHelpRigGrp[0]+'.Bone_Draw_S
 # make R thigh helper
 R_ThighHelpRigRet = denBR.den_makeHalfMuscleRig( side='R_', prefix='', name='ThighHelp', radius=2.0 )
 print( R_ThighHelpRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='R_ThighHelp', rigRet=R_ThighHelpRigRet )
 R_ThighHelpRigGrp = R_ThighHelpRigRet[0]; print( R_ThighHelpRigGrp )
 R_ThighHelpSpaceINs = R_ThighHelpRigRet[1]; print( R_ThighHelpSpaceINs )
 R_ThighHelpSpaceOUTs = R_ThighHelpRigRet[2]; print( R_ThighHelpSpaceOUTs )
@@ -3281,7 +3518,7 @@ cmds.scaleConstraint( Spine02_Jnt_SpaceOUT, R_ThighHelpRootSpaceIN, mo=True )
 cmds.scaleConstraint( R_HipTwist03_Jnt_SpaceOUT, R_ThighHelpTipSpaceIN, mo=True )
 #
 # connect Controls visibility to the All_Ctrl
-denUt.den_AddSafetyCovers( rigGroup=R_ThighHelpRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=R_ThighHelpRigGrp[0] )
 #
 # connect stretchable display proxy to proxy visibility on all control
 cmds.connectAttr( AllCtrl+'.Show_Proxy_Geo', 'R_ThighHelp_DispMesh.visibility', force=True, lock=True )
@@ -3305,6 +3542,7 @@ cmds.xform( 'ThroatTip_Piv', t=( 0.0, 182.33348670684632, 218.33059227533076 ),
 
 ThroatRigRet = denBR.den_makeHalfMuscleRig( side='', prefix='', name='Throat', radius=2.0 )
 print( ThroatRigRet )
+quadBT.quad_registerModule( registry=RigRegistry, key='Throat', rigRet=ThroatRigRet )
 ThroatRigGrp = ThroatRigRet[0]; print( ThroatRigGrp )
 ThroatSpaceINs = ThroatRigRet[1]; print( ThroatSpaceINs )
 ThroatSpaceOUTs = ThroatRigRet[2]; print( ThroatSpaceOUTs )
@@ -3324,7 +3562,7 @@ cmds.scaleConstraint( Neck03_SpaceOUT, ThroatRootSpaceIN, mo=True )
 cmds.scaleConstraint( Jaw_SpaceOUT, ThroatTipSpaceIN, mo=True )
 #
 # connect Controls visibility to the All_Ctrl
-denUt.den_AddSafetyCovers( rigGroup=ThroatRigGrp[0] )
+if RigConfig['safetyCovers'] == 'den': denUt.den_AddSafetyCovers( rigGroup=ThroatRigGrp[0] )
 #
 # connect stretchable display proxy to proxy visibility on all control
 cmds.connectAttr( AllCtrl+'.Show_Proxy_Geo', 'Throat_DispMesh.visibility', force=True, lock=True )
@@ -3335,6 +3573,48 @@ cmds.connectAttr( AllCtrl+'.Show_Guts', ThroatRigGrp[0]+'.Show_Guts' )
 cmds.connectAttr( AllCtrl+'.Bone_Draw_Style', ThroatRigGrp[0]+'.Bone_Draw_Style' )
 
 
+# ---------------------------------------------------------------------------------------
+# combined proxy: one mesh and one skinCluster instead of a proxy piece per joint,
+# still under Proxies_Grp so Show_Proxy_Geo toggles it, the pieces stay for the weight transfer
+if RigConfig['proxyMode'] == 'combined':
+    ProxyRet = quadBT.quad_combineProxyGeo( Jnts=quadBT.quad_registryNodes( registry=RigRegistry, field='BindJnts' ), name='Proxy_Combined_Geo', parent='Proxies_Grp' )
+    print( ProxyRet )
+    RigRegistry['Base']['ProxyGeo'] = ProxyRet[:2]
+
+
+# ---------------------------------------------------------------------------------------
+# same-style controls sharing one set of curve shapes (instanced), fewer shapes to create and draw
+if RigConfig['sharedCtrlShapes']:
+    quadBT.quad_shareModuleCtrlShapes( registry=RigRegistry, Styles=RigConfig['sharedCtrlShapes'] )
+
+
+# ---------------------------------------------------------------------------------------
+# safety covers for the whole rig in one pass, when they were not added group by group
+if RigConfig['safetyCovers'] == 'bulk':
+    quadBT.quad_applySafetyCovers( registry=RigRegistry )
+
+
+# ---------------------------------------------------------------------------------------
+# level of detail: Rig_LOD on the AllCtrl freezes and hides whole module groups for blocking passes
+RigLODRet = quadBT.quad_addRigLOD( ctrl=AllCtrl, registry=RigRegistry, skeletonKeys=RigConfig['lodSkeletonModules'], bodyKeys=RigConfig['lodBodyModules'] )
+print( RigLODRet )
+
+
+# ---------------------------------------------------------------------------------------
+# remove what the build left behind, before the registry and node map are saved
+if RigConfig['optimizeScene']:
+    quadBT.quad_optimizeScene( registry=RigRegistry )
+
+
+# ---------------------------------------------------------------------------------------
+# save the rig registry on the root rig group, so post-build tools can look nodes up by module
+quadBT.quad_saveRegistry( rigGroup=RootRigGrp, registry=RigRegistry )
+# map every rig node to its module once, for the profiling tools
+quadBT.quad_saveNodeMap( rigGroup=RootRigGrp, NodeMap=quadBT.quad_buildNodeMap( registry=RigRegistry ) )
+# pair every L_/R_ control and read its axis flips from the rest pose, for mirroring poses and shots
+quadBT.quad_saveMirrorTable( rigGroup=RootRigGrp, MirrorTable=quadBT.quad_buildMirrorTable( registry=RigRegistry ) )
+
+
 
 '''
 #################################
@@ -3354,7 +3634,9 @@ cmds.connectAttr( AllCtrl+'.Bone_Draw_Style', ThroatRigGrp[0]+'.Bone_Draw_Style'
 # -------------------------------------------------------------------------------------------
 # set up the body point weighting
 
-BindJoints = cmds.ls( '*_Jnt' )
+# read the bind joints from the rig registry instead of searching the whole scene for '*_Jnt'
+RigRegistry = quadBT.quad_loadRegistry()
+BindJoints = quadBT.quad_registryNodes( registry=RigRegistry, field='BindJnts' )
 Meshes = [s.replace('_Jnt', '_Mesh') for s in BindJoints] # only includes joints with matching proxy meshes
 
 for number, node in enumerate(BindJoints):
@@ -3386,7 +3668,7 @@ for number, node in enumerate(BindJoints):
 
 ######## ============================= apply skin weight for eyes =========================================
 # Bind both eyeballs to the render geo rig
-EyeBindJoints = cmds.ls( '*_Eye_Jnt' )
+EyeBindJoints = quadBT.quad_registryNodes( registry=RigRegistry, field='BindJnts', keys=['L_Eye','R_Eye'] )
 print(EyeBindJoints)
 # Bind weight for both eyeballs
 EyesSkinClust = cmds.skinCluster( 'Eyes_Geo', EyeBindJoints, tsb=True, name='Eyes_Geo_skinCluster', mi=1 )[0]
@@ -3397,3 +3679,388 @@ EyesSkinClust = cmds.skinCluster( 'Eyes_Geo', EyeBindJoints, tsb=True, name='Eye
 # -------------------------------------------------------------------------------------------
 #################################
 '''
+
+
+
+'''
+# ===================================================================================================
+# ---------------------------- Torso Benchmark ----------------------------
+# Use this section to compare RigConfig['torsoMode'] = 'splineIK' against 'matrix'.
+# Build the rig once per torso mode and neck length you want to compare (for example neckCount 4, 6
+# and 10), run this section in each scene, and compare the printed fps.
+# ===================================================================================================
+
+import Quad_PerfTools as quadPT
+importlib.reload(quadPT)
+
+RigRegistry = quadBT.quad_loadRegistry()
+AllCtrl = RigRegistry['Base']['Ctrls'][2]
+
+# key a simple wave on the torso controls so the spine and neck have something to evaluate
+quadPT.quad_animateChain( Ctrls=RigRegistry['Torso']['Ctrls'], startFrame=1, endFrame=120 )
+
+# hide the geometry so the timing is the rig evaluation, not drawing
+cmds.setAttr( AllCtrl+'.Show_Proxy_Geo', 0 )
+cmds.setAttr( AllCtrl+'.Show_Render_Geo', 0 )
+
+TorsoBenchRet = quadPT.quad_timePlayback( startFrame=1, endFrame=120, loops=5 )
+print( 'torso matrix nodes:', len( RigRegistry['Torso'].get( 'MatrixNodes', [] ) ), 'torso joints:', len( RigRegistry['Torso']['BindJnts'] ), 'fps: %.1f' % TorsoBenchRet[0] )
+'''
+
+
+
+'''
+# ===================================================================================================
+# ---------------------------- Rig Benchmark ----------------------------
+# Run this on a saved build after updating any den_* module. It keys canned walk, trot and idle cycles
+# on the AllCtrl, Cog, leg IK and torso controls, times them under serial, parallel and cached
+# evaluation, lists the slowest nodes and modules, and writes everything to a JSON file next to the
+# scene. Compare the JSON files of two builds; the run raises an error below minFps.
+# ===================================================================================================
+
+import os
+import Quad_PerfTools as quadPT
+importlib.reload(quadPT)
+
+BenchFile = os.path.splitext( cmds.file( q=True, sceneName=True ) )[0]+'_bench.json'
+RigBenchRet = quadPT.quad_runBenchmark( outFile=BenchFile, frames=120, minFps=24.0 )
+'''
+
+
+
+'''
+# ===================================================================================================
+# ---------------------------- Rig Profile ----------------------------
+# Plays the current animation with the Maya profiler recording and prints the cost per module
+# (e.g. L_FinA), per side and per module and node type (e.g. "L_FinA parentConstraint"). Nodes are
+# mapped to modules by the node map saved on the root rig group at the end of the build.
+# ===================================================================================================
+
+import Quad_PerfTools as quadPT
+importlib.reload(quadPT)
+
+RigProfileRet = quadPT.quad_profileRig( startFrame=cmds.playbackOptions( q=True, min=True ), endFrame=cmds.playbackOptions( q=True, max=True ) )
+'''
+
+
+
+'''
+# ===================================================================================================
+# ---------------------------- Parallel Evaluation Audit ----------------------------
+# Run after a build. Lists every rig node whose type is untrusted or serialized, every cycle cluster
+# and the hair dynamics nodes, each with the module (script section) that created it. Likely sources
+# are den_addTailDynamics (Tail, L_/R_Whisker, Tongue), den_AddSafetyCovers and the half muscle
+# helpers (L_/R_ThighHelp, Throat).
+# ===================================================================================================
+
+import Quad_PerfTools as quadPT
+importlib.reload(quadPT)
+
+ParallelAuditRet = quadPT.quad_auditParallel()
+'''
+
+
+
+'''
+# ===================================================================================================
+# ---------------------------- Twist Benchmark ----------------------------
+# Build the rig once with RigConfig['twistMode'] = 'den' and once with 'matrix', animate the legs
+# (or apply a gait with quadPT.quad_applyGait) and run this section in both scenes. It prints the
+# number of nodes driving each module's twist joints and their evaluation time per frame.
+# ===================================================================================================
+
+import Quad_PerfTools as quadPT
+importlib.reload(quadPT)
+
+quadPT.quad_applyGait( registry=quadBT.quad_loadRegistry(), gait='walk' )
+TwistBenchRet = quadPT.quad_twistBenchmark( startFrame=1, endFrame=120 )
+'''
+
+
+
+'''
+# ===================================================================================================
+# ---------------------------- Safety Cover Benchmark ----------------------------
+# Build and save a scratch rig with RigConfig['safetyCovers'] 'none' first. Times den_AddSafetyCovers
+# once per rig group (the 'den' path) against the single quadBT.quad_applySafetyCovers pass ('bulk'),
+# each on a freshly opened copy of the saved scratch scene.
+# ===================================================================================================
+
+import Quad_PerfTools as quadPT
+importlib.reload(quadPT)
+
+SafetyBenchRet = quadPT.quad_safetyCoverBenchmark( denCovers=denUt.den_AddSafetyCovers )
+'''
+
+
+
+'''
+# ===================================================================================================
+# ---------------------------- Scene Optimizer ----------------------------
+# Run on a built rig. Exports it, removes dead and redundant nodes and the pivot hierarchy with
+# quadBT.quad_optimizeScene, exports again and opens both copies in mayapy to compare node count,
+# file size, load time and memory. The optimization stays in the open scene, save it under a new name.
+# ===================================================================================================
+
+import os
+import Quad_PerfTools as quadPT
+importlib.reload(quadPT)
+
+OptimizeDir = os.path.join( cmds.workspace( q=True, rootDirectory=True ), 'scenes', 'optimize' )
+OptimizeRet = quadPT.quad_optimizeReport( directory=OptimizeDir, name='Rig', deletePivots=True )
+
+# regression case for the duplicate constraint report (opens a new scene, save the rig first)
+DuplicateCheckRet = quadPT.quad_checkDuplicateConstraints()
+'''
+
+
+
+'''
+# ===================================================================================================
+# ---------------------------- Publish ----------------------------
+# Run on the saved build scene (or from a shell with mayapy, see quadPB.quad_publishRig). Saves the
+# animation rig animators reference: optimized, pivots, history and leftovers stripped, hierarchy
+# locked. The reference load time and memory of the build and the publish go into publish_log.json
+# under the release label. The open scene becomes the published file, reopen the build to keep working.
+# ===================================================================================================
+
+import os
+import Quad_PublishTools as quadPB
+importlib.reload(quadPB)
+
+PublishFile = os.path.join( cmds.workspace( q=True, rootDirectory=True ), 'scenes', 'publish', 'Rig_Anim.mb' )
+PublishRet = quadPB.quad_publishRig( publishFile=PublishFile, release='v001' )
+'''
+
+
+
+'''
+# ===================================================================================================
+# ---------------------------- Split Publish ----------------------------
+# Like Publish, but the core rig (base, torso, tail, legs, toes, eyes, head parts) and every appendage
+# family of quadPB.AppendagePackages (fins, crests, arm spikes, leg spikes, whiskers) go into their own
+# files, with a manifest of the named SpaceOUT each package attaches to on load. Build with RigConfig['proxyMode']
+# 'pieces', a combined proxy reads from every joint and keeps the packages from splitting off.
+# ===================================================================================================
+
+import os
+import Quad_PublishTools as quadPB
+importlib.reload(quadPB)
+
+SplitDir = os.path.join( cmds.workspace( q=True, rootDirectory=True ), 'scenes', 'publish' )
+SplitRet = quadPB.quad_splitPublish( directory=SplitDir, name='Rig', release='v001' )
+
+# in a shot: reference Rig_Core.mb (namespace 'Rig' here), then only the packages the shot needs
+PackageManifest = os.path.join( SplitDir, 'Rig_packages.json' )
+quadPB.quad_loadPackage( manifestFile=PackageManifest, package='Fins', namespace='Rig' )
+quadPB.quad_loadPackage( manifestFile=PackageManifest, package='Whiskers', namespace='Rig' )
+# and drop one again
+quadPB.quad_unloadPackage( manifestFile=PackageManifest, package='Whiskers', namespace='Rig' )
+'''
+
+
+
+'''
+# ===================================================================================================
+# ---------------------------- Dynamics Cache ----------------------------
+# Run this in the shot scene once the animation is final. Every dynamic chain is simulated once into
+# an nCache next to the scene and its <key>_Dynamics switch on the AllCtrl is set to Cached.
+# Set a switch back to Live to re-simulate that chain, or to Off to skip it entirely.
+# ===================================================================================================
+
+import os
+
+RigRegistry = quadBT.quad_loadRegistry()
+AllCtrl = RigRegistry['Base']['Ctrls'][2]
+DynKeys = [ key for key in RigRegistry if 'DynCtrl' in RigRegistry[key] ]
+
+startFrame = cmds.playbackOptions( q=True, min=True )
+endFrame = cmds.playbackOptions( q=True, max=True )
+CacheDir = os.path.join( os.path.dirname( cmds.file( q=True, sceneName=True ) ), 'cache', 'nCache' )
+
+DynCacheRet = quadBT.quad_cacheDynamics( ctrl=AllCtrl, keys=DynKeys, DynCtrls=[ RigRegistry[key]['DynCtrl'] for key in DynKeys ],
+                                         startFrame=startFrame, endFrame=endFrame, directory=CacheDir.replace( '\\', '/' ), name='' )
+print( DynCacheRet )
+'''
+
+
+
+'''
+# ===================================================================================================
+# ---------------------------- Spring Bake ----------------------------
+# Run this in the shot scene instead of (or next to) the Dynamics Cache when a chain only needs lag
+# and overshoot. The FK controls of each chain are sampled over the playback range, solved together
+# with a NumPy spring solver and their rotate animation is replaced with the baked keys.
+# Tail and whiskers must be switched to FK, and set their <key>_Dynamics switch to Off.
+# ===================================================================================================
+
+import Quad_AnimTools as quadAT
+importlib.reload(quadAT)
+
+RigRegistry = quadBT.quad_loadRegistry()
+SpringKeys = [ 'Tail', 'L_Whisker', 'R_Whisker', 'L_Ear', 'R_Ear' ]
+
+# den_makeTailRig also returns IK controls, keep only the FK ones for those chains
+SpringChains = [ [ ctrl for ctrl in RigRegistry[key]['Ctrls'] if 'FK' in ctrl ] or RigRegistry[key]['Ctrls'] for key in SpringKeys ]
+
+SpringBakeRet = quadAT.quad_springBake( Chains=SpringChains, startFrame=cmds.playbackOptions( q=True, min=True ), endFrame=cmds.playbackOptions( q=True, max=True ),
+                                        stiffness=0.2, damping=0.1 )
+'''
+
+
+
+'''
+# ===================================================================================================
+# ---------------------------- IK/FK Match Bake ----------------------------
+# Puts the FK controls of a chain on its current pose (e.g. while it is animated in IK) for the whole
+# playback range, in one pass and without stepping the time slider. Afterwards switch the chain to FK.
+# Edit MatchKey for other chains; for the legs pass the leg's FK controls and its _Jx joints.
+# ===================================================================================================
+
+import Quad_AnimTools as quadAT
+importlib.reload(quadAT)
+
+RigRegistry = quadBT.quad_loadRegistry()
+MatchKey = 'Tail'
+MatchTargets = [ ctrl for ctrl in RigRegistry[MatchKey]['Ctrls'] if 'FK' in ctrl ]
+MatchSources = RigRegistry[MatchKey]['BindJnts'][:len( MatchTargets )]
+
+MatchBakeRet = quadAT.quad_matchBake( Targets=MatchTargets, Sources=MatchSources, startFrame=cmds.playbackOptions( q=True, min=True ), endFrame=cmds.playbackOptions( q=True, max=True ) )
+
+'''
+
+
+
+'''
+# ===================================================================================================
+# ---------------------------- Engine Clip Export ----------------------------
+# Streams the local transforms of every '*_Jnt' bind joint over the playback range into a compact
+# binary clip (smallest-three quaternions, quantized translations, reduced keys) next to the scene.
+# Memory use stays the same for any shot length. quadET.quad_readClip decodes a clip to check it.
+# ===================================================================================================
+
+import os
+import Quad_ExportTools as quadET
+importlib.reload(quadET)
+
+ClipFile = os.path.splitext( cmds.file( q=True, sceneName=True ) )[0]+'.qclp'
+ClipExportRet = quadET.quad_exportClip( path=ClipFile, startFrame=cmds.playbackOptions( q=True, min=True ), endFrame=cmds.playbackOptions( q=True, max=True ),
+                                        chunkFrames=256, rotateTolerance=0.0005, translateTolerance=0.01 )
+'''
+
+
+
+'''
+# ===================================================================================================
+# ---------------------------- Parallel Geometry Cache ----------------------------
+# Caches the deformed Body_Geo and Eyes_Geo for lighting. The playback range is split into one chunk
+# per CPU core, each chunk is cached by its own mayapy process from the saved scene, and the chunks are
+# stitched into one cache. Every chunk after the first simulates 24 frames of pre-roll first so the
+# tail, whiskers and tongue have settled. Save the scene before running this.
+# ===================================================================================================
+
+import os
+import Quad_ExportTools as quadET
+importlib.reload(quadET)
+
+GeoCacheDir = os.path.join( os.path.dirname( cmds.file( q=True, sceneName=True ) ), 'cache', 'geoCache' )
+GeoCacheRet = quadET.quad_exportGeoCacheParallel( Geos=['Body_Geo','Eyes_Geo'], startFrame=cmds.playbackOptions( q=True, min=True ), endFrame=cmds.playbackOptions( q=True, max=True ),
+                                                  directory=GeoCacheDir, name=os.path.splitext( os.path.basename( cmds.file( q=True, sceneName=True ) ) )[0]+'_GeoCache', preRoll=24 )
+'''
+
+
+
+'''
+# ===================================================================================================
+# ---------------------------- Motion Retarget ----------------------------
+# Moves control animation from one creature built with this tool onto another, even when their neck,
+# spine, tail, whisker or toe counts differ. Open the target rig in its rest pose and run the first part
+# with RetargetSourceFile; run the library part instead to retarget a whole folder of animation scenes
+# with one mayapy process per CPU core (nothing has to be open for that).
+# ===================================================================================================
+
+import os
+import Quad_RetargetTools as quadRT
+importlib.reload(quadRT)
+
+# one scene: sample the source shot, then open the target rig and key its controls
+RetargetSourceFile = 'scenes/Rimerock_Walk.mb'
+RetargetTargetFile = cmds.file( q=True, sceneName=True )
+cmds.file( RetargetSourceFile, open=True, force=True )
+RetargetMotion = quadRT.quad_sampleMotion( startFrame=cmds.playbackOptions( q=True, min=True ), endFrame=cmds.playbackOptions( q=True, max=True ) )
+cmds.file( RetargetTargetFile, open=True, force=True )
+RetargetRet = quadRT.quad_retargetMotion( Motion=RetargetMotion )
+
+# a whole motion library
+RetargetLibraryDir = os.path.join( cmds.workspace( q=True, rootDirectory=True ), 'scenes', 'motionLibrary' )
+RetargetLibraryRet = quadRT.quad_retargetLibrary( SourceFiles=sorted( os.path.join( RetargetLibraryDir, name ) for name in os.listdir( RetargetLibraryDir ) if name.endswith( ('.ma','.mb') ) ),
+                                                  targetRigFile=cmds.file( q=True, sceneName=True ), directory=os.path.join( RetargetLibraryDir, 'retargeted' ) )
+'''
+
+
+
+'''
+# ===================================================================================================
+# ---------------------------- Pose Library ----------------------------
+# Stores poses of the rig's controls in one binary file per library and puts them back with one
+# MDGModifier. modules picks part of the rig by module key (e.g. ['L_Fin[A-I]'] for every L_ side fin,
+# ['*Toe','*Ftoe'] for all toes), blend mixes from the current pose. Keep the modifier to undo a pose.
+# ===================================================================================================
+
+import os
+import Quad_PoseTools as quadPO
+importlib.reload(quadPO)
+
+PoseLibraryFile = os.path.join( cmds.workspace( q=True, rootDirectory=True ), 'data', 'Rig_Poses.qpos' )
+
+# save the current pose, the whole rig or only some modules
+quadPO.quad_savePose( path=PoseLibraryFile, name='FinsFlared_L', modules=['L_Fin[A-I]'] )
+quadPO.quad_savePose( path=PoseLibraryFile, name='Rest' )
+
+# apply a pose, or part of it
+PoseModifier = quadPO.quad_applyPose( path=PoseLibraryFile, name='FinsFlared_L' )[0]
+PoseModifier = quadPO.quad_applyPose( path=PoseLibraryFile, name='Rest', modules=['*Toe','*Ftoe'], blend=0.5 )[0]
+#PoseModifier.undoIt()
+
+# mirroring uses the mirror table saved on the rig: a stored pose flipped onto the R_ fins,
+# the current L_ side copied onto the R_ side, and the whole shot mirrored
+PoseModifier = quadPO.quad_applyPose( path=PoseLibraryFile, name='FinsFlared_L', modules=['R_Fin[A-I]'], mirror=True )[0]
+PoseModifier = quadPO.quad_mirrorPose( modules=['R_*'] )[0]
+quadPO.quad_mirrorAnimation()
+'''
+
+
+
+'''
+# ===================================================================================================
+# ---------------------------- Crowd ----------------------------
+# A crowd asset for herd shots: only the bind skeleton and the skinned meshes, every joint driven by one
+# quadClipPlayer node (Quad_CrowdClipNode.py plugin, next to the other modules) playing baked clips
+# written with quadET.quad_exportClip. Export the clips from animated shots first, build the asset from
+# the saved build scene, then reference it as often as the shot needs, each with its own clip, offset
+# and speed. The benchmark compares one walking full rig with the crowd instances.
+# ===================================================================================================
+
+import os
+import Quad_ExportTools as quadET
+importlib.reload(quadET)
+import Quad_CrowdTools as quadCT
+importlib.reload(quadCT)
+
+CrowdDir = os.path.join( cmds.workspace( q=True, rootDirectory=True ), 'scenes', 'crowd' )
+CrowdClips = [ os.path.join( CrowdDir, clip ) for clip in [ 'Walk.qclp', 'Trot.qclp', 'Graze.qclp' ] ]
+
+# in each animated shot, bake the bind joints to a clip
+quadET.quad_exportClip( path=CrowdClips[0], startFrame=1, endFrame=48 )
+
+# from the saved build scene, the open scene becomes the crowd asset
+CrowdRet = quadCT.quad_buildCrowdAsset( crowdFile=os.path.join( CrowdDir, 'Rig_Crowd.mb' ), clipFile=CrowdClips[0] )
+
+# in the herd shot
+HerdRet = quadCT.quad_placeCrowd( crowdFile=os.path.join( CrowdDir, 'Rig_Crowd.mb' ), count=30, ClipFiles=CrowdClips, seed=7 )
+cmds.setAttr( HerdRet[0]+':Crowd_ClipPlayer.offset', 12.0 )
+
+# cost per instance against the full rig (the saved build scene)
+CrowdBenchRet = quadCT.quad_crowdBenchmark( rigFile=os.path.join( cmds.workspace( q=True, rootDirectory=True ), 'scenes', 'Rig_Build.mb' ),
+                                            crowdFile=os.path.join( CrowdDir, 'Rig_Crowd.mb' ), count=30 )
+'''